@@ -15,6 +15,9 @@ from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
 from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
 from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
 from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel
 
 from sqlmodel import SQLModel
 import asyncio
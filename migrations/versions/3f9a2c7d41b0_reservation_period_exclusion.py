@@ -0,0 +1,46 @@
+"""reservation period exclusion
+
+Revision ID: 3f9a2c7d41b0
+Revises: 1cafbbac75cd
+Create Date: 2025-07-20 10:12:03.418220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9a2c7d41b0'
+down_revision: Union[str, None] = '1cafbbac75cd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree_gist permite combinar igualdad sobre texto con && sobre rangos en un mismo indice GiST
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "ALTER TABLE reservation ADD COLUMN period tsrange "
+        "GENERATED ALWAYS AS (tsrange(reservation_date + date_start, reservation_date + date_end, '[)')) STORED"
+    )
+    # Solo las reservas activas ocupan la mesa y el horario del cliente
+    op.execute(
+        "ALTER TABLE reservation ADD CONSTRAINT reservation_table_no_overlap "
+        "EXCLUDE USING gist (restaurant_id WITH =, table_number_id WITH =, period WITH &&) "
+        "WHERE (status IN ('pendiente', 'confirmada'))"
+    )
+    op.execute(
+        "ALTER TABLE reservation ADD CONSTRAINT reservation_client_no_overlap "
+        "EXCLUDE USING gist (client_id WITH =, period WITH &&) "
+        "WHERE (status IN ('pendiente', 'confirmada'))"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE reservation DROP CONSTRAINT IF EXISTS reservation_client_no_overlap")
+    op.execute("ALTER TABLE reservation DROP CONSTRAINT IF EXISTS reservation_table_no_overlap")
+    op.drop_column('reservation', 'period')
@@ -0,0 +1,31 @@
+"""reservation active partial index
+
+Revision ID: a4e8c2f6d1b3
+Revises: f3c7a1e9b2d6
+Create Date: 2025-08-11 10:03:27.482916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e8c2f6d1b3'
+down_revision: Union[str, None] = 'f3c7a1e9b2d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_reservation_active_end', 'reservation', ['status', 'reservation_date', 'date_end'], unique=False,
+        postgresql_where=sa.text("status IN ('pendiente', 'confirmada')")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reservation_active_end', table_name='reservation', postgresql_where=sa.text("status IN ('pendiente', 'confirmada')"))
@@ -0,0 +1,41 @@
+"""dish search indexes
+
+Revision ID: b5f2d8e4a9c1
+Revises: e8a1f4c6d9b2
+Create Date: 2025-08-21 12:06:33.570192
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5f2d8e4a9c1'
+down_revision: Union[str, None] = 'e8a1f4c6d9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm aporta similarity() y el operador % para buscar con errores de escritura
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Pesos de ts_rank_cd: nombre A, categoria B, descripcion C
+    op.execute(
+        "ALTER TABLE dishes ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(category, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+        ") STORED"
+    )
+    op.execute("CREATE INDEX ix_dishes_search_vector ON dishes USING gin (search_vector)")
+    op.execute("CREATE INDEX ix_dishes_name_trgm ON dishes USING gin (name gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_dishes_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_dishes_search_vector")
+    op.drop_column('dishes', 'search_vector')
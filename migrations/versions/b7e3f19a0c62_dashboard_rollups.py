@@ -0,0 +1,76 @@
+"""dashboard rollups
+
+Revision ID: b7e3f19a0c62
+Revises: 8c41d2e7a5f3
+Create Date: 2025-07-28 11:12:40.183904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel.sql.sqltypes
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f19a0c62'
+down_revision: Union[str, None] = '8c41d2e7a5f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('reservation_day_rollup',
+    sa.Column('restaurant_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('reservations', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('restaurant_id', 'day', 'status')
+    )
+    op.create_index(op.f('ix_reservation_day_rollup_day'), 'reservation_day_rollup', ['day'], unique=False)
+    op.create_table('table_day_rollup',
+    sa.Column('restaurant_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('table_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('reservations', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('restaurant_id', 'day', 'table_id')
+    )
+    op.create_index(op.f('ix_table_day_rollup_day'), 'table_day_rollup', ['day'], unique=False)
+    op.create_table('dish_day_rollup',
+    sa.Column('restaurant_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('dish_id', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('preorders', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('restaurant_id', 'day', 'dish_id')
+    )
+    op.create_index(op.f('ix_dish_day_rollup_day'), 'dish_day_rollup', ['day'], unique=False)
+
+    # Relleno inicial desde el historial (equivale a rebuild_rollups)
+    op.execute("""
+        INSERT INTO reservation_day_rollup (restaurant_id, day, status, reservations)
+        SELECT restaurant_id, reservation_date, status, count(*)
+        FROM reservation GROUP BY restaurant_id, reservation_date, status
+    """)
+    op.execute("""
+        INSERT INTO table_day_rollup (restaurant_id, day, table_id, reservations)
+        SELECT restaurant_id, reservation_date, table_number_id, count(*)
+        FROM reservation WHERE status IN ('pendiente', 'confirmada')
+        GROUP BY restaurant_id, reservation_date, table_number_id
+    """)
+    op.execute("""
+        INSERT INTO dish_day_rollup (restaurant_id, day, dish_id, preorders)
+        SELECT r.restaurant_id, r.reservation_date, a.dish_id, count(*)
+        FROM reservation r JOIN reservation_dish_association a ON a.reservation_id = r.id
+        GROUP BY r.restaurant_id, r.reservation_date, a.dish_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_dish_day_rollup_day'), table_name='dish_day_rollup')
+    op.drop_table('dish_day_rollup')
+    op.drop_index(op.f('ix_table_day_rollup_day'), table_name='table_day_rollup')
+    op.drop_table('table_day_rollup')
+    op.drop_index(op.f('ix_reservation_day_rollup_day'), table_name='reservation_day_rollup')
+    op.drop_table('reservation_day_rollup')
@@ -0,0 +1,31 @@
+"""dish search trigram fields
+
+Revision ID: c4e9a2f7b3d6
+Revises: f3b8d1c6a7e4
+Create Date: 2025-08-27 12:06:51.730214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e9a2f7b3d6'
+down_revision: Union[str, None] = 'f3b8d1c6a7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Erratas en categoria (%) y descripcion (<%), como ya se hacia con el nombre
+    op.execute("CREATE INDEX ix_dishes_category_trgm ON dishes USING gin (category gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_dishes_description_trgm ON dishes USING gin (description gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_dishes_description_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_dishes_category_trgm")
@@ -0,0 +1,29 @@
+"""dish menu index
+
+Revision ID: c9d4e2a7b1f5
+Revises: a4e8c2f6d1b3
+Create Date: 2025-08-14 09:18:52.730641
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d4e2a7b1f5'
+down_revision: Union[str, None] = 'a4e8c2f6d1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Platos de un menu sin recorrer dishes: carga de AvailableDishIdsCache y join desde menus
+    op.create_index(op.f('ix_dishes_menu_id'), 'dishes', ['menu_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_dishes_menu_id'), table_name='dishes')
@@ -0,0 +1,28 @@
+"""table restaurant index
+
+Revision ID: d2a8c5e1f7b4
+Revises: b7e3f19a0c62
+Create Date: 2025-07-29 16:03:22.641907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a8c5e1f7b4'
+down_revision: Union[str, None] = 'b7e3f19a0c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_table_restaurant_id'), 'table', ['restaurant_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_table_restaurant_id'), table_name='table')
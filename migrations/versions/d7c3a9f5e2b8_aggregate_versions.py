@@ -0,0 +1,31 @@
+"""aggregate versions
+
+Revision ID: d7c3a9f5e2b8
+Revises: b5f2d8e4a9c1
+Create Date: 2025-08-25 17:44:09.128476
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7c3a9f5e2b8'
+down_revision: Union[str, None] = 'b5f2d8e4a9c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Marcas de version para los ETag de menus y restaurantes
+    op.add_column('menus', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('restaurant', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('restaurant', 'version')
+    op.drop_column('menus', 'version')
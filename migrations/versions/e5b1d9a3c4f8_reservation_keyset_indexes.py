@@ -0,0 +1,30 @@
+"""reservation keyset indexes
+
+Revision ID: e5b1d9a3c4f8
+Revises: d2a8c5e1f7b4
+Create Date: 2025-07-31 10:27:51.904316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b1d9a3c4f8'
+down_revision: Union[str, None] = 'd2a8c5e1f7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_reservation_date_id', 'reservation', ['reservation_date', 'id'], unique=False)
+    op.create_index('ix_reservation_restaurant_date_id', 'reservation', ['restaurant_id', 'reservation_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reservation_restaurant_date_id', table_name='reservation')
+    op.drop_index('ix_reservation_date_id', table_name='reservation')
@@ -0,0 +1,29 @@
+"""reservation dish dish index
+
+Revision ID: e8a1f4c6d9b2
+Revises: c9d4e2a7b1f5
+Create Date: 2025-08-18 15:27:40.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a1f4c6d9b2'
+down_revision: Union[str, None] = 'c9d4e2a7b1f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # La PK (reservation_id, dish_id) no sirve para buscar por plato
+    op.create_index('ix_reservation_dish_dish_id', 'reservation_dish_association', ['dish_id', 'reservation_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reservation_dish_dish_id', table_name='reservation_dish_association')
@@ -0,0 +1,43 @@
+"""table rollup occupancy
+
+Revision ID: f3b8d1c6a7e4
+Revises: d7c3a9f5e2b8
+Create Date: 2025-08-27 10:21:37.402915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b8d1c6a7e4'
+down_revision: Union[str, None] = 'd7c3a9f5e2b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # La mesa sigue ocupada ese dia cuando la reserva se completa o no se presenta: solo cancelar la libera
+    op.execute("LOCK TABLE reservation IN SHARE MODE")
+    op.execute("DELETE FROM table_day_rollup")
+    op.execute("""
+        INSERT INTO table_day_rollup (restaurant_id, day, table_id, reservations)
+        SELECT restaurant_id, reservation_date, table_number_id, count(*)
+        FROM reservation WHERE status <> 'cancelada'
+        GROUP BY restaurant_id, reservation_date, table_number_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("LOCK TABLE reservation IN SHARE MODE")
+    op.execute("DELETE FROM table_day_rollup")
+    op.execute("""
+        INSERT INTO table_day_rollup (restaurant_id, day, table_id, reservations)
+        SELECT restaurant_id, reservation_date, table_number_id, count(*)
+        FROM reservation WHERE status IN ('pendiente', 'confirmada')
+        GROUP BY restaurant_id, reservation_date, table_number_id
+    """)
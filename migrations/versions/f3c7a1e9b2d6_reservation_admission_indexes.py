@@ -0,0 +1,32 @@
+"""reservation admission indexes
+
+Revision ID: f3c7a1e9b2d6
+Revises: e5b1d9a3c4f8
+Create Date: 2025-08-04 09:12:40.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7a1e9b2d6'
+down_revision: Union[str, None] = 'e5b1d9a3c4f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_reservation_table_date', 'reservation', ['restaurant_id', 'table_number_id', 'reservation_date'], unique=False)
+    op.create_index('ix_reservation_client_date', 'reservation', ['client_id', 'reservation_date'], unique=False)
+    op.create_index(op.f('ix_menus_restaurant_id'), 'menus', ['restaurant_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_menus_restaurant_id'), table_name='menus')
+    op.drop_index('ix_reservation_client_date', table_name='reservation')
+    op.drop_index('ix_reservation_table_date', table_name='reservation')
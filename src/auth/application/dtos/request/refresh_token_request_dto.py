@@ -0,0 +1,4 @@
+class RefreshTokenRequestDto:
+
+    def __init__(self, refresh_token: str):
+        self.refresh_token = refresh_token
@@ -0,0 +1,10 @@
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+
+class PrincipalResponseDto:
+    """
+    Lo minimo que necesita la verificacion de roles: sin nombre ni hash de contraseña.
+    """
+    def __init__(self, user_id: str, email: str, role: UserRoleEnum):
+        self.user_id = user_id
+        self.email = email
+        self.role = role
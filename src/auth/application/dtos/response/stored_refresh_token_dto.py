@@ -0,0 +1,14 @@
+from datetime import datetime
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+
+class StoredRefreshTokenDto:
+
+    def __init__(self, token_hash: str, family_id: str, user_id: str, email: str, role: UserRoleEnum, expires_at: datetime, used: bool, revoked: bool):
+        self.token_hash = token_hash
+        self.family_id = family_id
+        self.user_id = user_id
+        self.email = email
+        self.role = role
+        self.expires_at = expires_at
+        self.used = used
+        self.revoked = revoked
@@ -1,5 +1,6 @@
 
 class UserLoginResponseDto:
     
-    def __init__(self, token: str):
-        self.token = token
\ No newline at end of file
+    def __init__(self, token: str, refresh_token: str):
+        self.token = token
+        self.refresh_token = refresh_token
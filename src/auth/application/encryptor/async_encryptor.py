@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from src.common.utils import Result
+
+class IAsyncEncryptor(ABC):
+
+    @abstractmethod
+    async def encrypt(self, plain_data: str) -> Result[str]:
+        pass
+
+    @abstractmethod
+    async def verify_password(self, plain_data: str, hashed_data: str) -> Result[bool]:
+        pass
@@ -0,0 +1,6 @@
+from src.common.application import ApplicationException, ExceptionApplicationType
+
+class InvalidRefreshTokenException(ApplicationException):
+
+    def __init__(self):
+        super().__init__("Invalid or expired refresh token", ExceptionApplicationType.UNAUTHORIZED)
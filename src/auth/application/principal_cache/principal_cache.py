@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
+
+class IPrincipalCache(ABC):
+
+    @abstractmethod
+    def get(self, email: str) -> Optional[PrincipalResponseDto]:
+        pass
+
+    @abstractmethod
+    def put(self, principal: PrincipalResponseDto, expires_at: float) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self, email: str) -> None:
+        pass
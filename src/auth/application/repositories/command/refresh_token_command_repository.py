@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from src.common.utils import Result
+
+class IRefreshTokenCommandRepository(ABC):
+
+    @abstractmethod
+    async def save(self, token_hash: str, family_id: str, user_id: str, expires_at: datetime) -> Result[None]:
+        pass
+
+    @abstractmethod
+    async def mark_used(self, token_hash: str) -> Result[bool]:
+        pass
+
+    @abstractmethod
+    async def revoke_family(self, family_id: str, until: datetime) -> Result[None]:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from src.auth.application.dtos.response.stored_refresh_token_dto import StoredRefreshTokenDto
+from src.common.utils import Result
+
+class IRefreshTokenQueryRepository(ABC):
+
+    @abstractmethod
+    async def get_by_hash(self, token_hash: str) -> Result[StoredRefreshTokenDto]:
+        pass
+
+    @abstractmethod
+    async def get_revoked_sessions(self) -> Result[list[tuple[str, datetime]]]:
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from src.common.utils import Result
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
 from src.auth.domain.aggregate.user import User
 
 class IUserQueryRepository(ABC):
@@ -17,4 +18,8 @@ class IUserQueryRepository(ABC):
 
     @abstractmethod
     async def exists_user_by_email(self, email: str) -> Result[bool]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_principal(self, email: str) -> Result[PrincipalResponseDto]:
+        pass
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from src.common.application import IService, ITokenGenerator, IUnitOfWork
+from src.common.utils import Result
+from ..dtos.request.refresh_token_request_dto import RefreshTokenRequestDto
+from ..dtos.response.stored_refresh_token_dto import StoredRefreshTokenDto
+from ..dtos.response.user_login_response_dto import UserLoginResponseDto
+from ..exceptions.invalid_refresh_token_exception import InvalidRefreshTokenException
+from ..repositories.command.refresh_token_command_repository import IRefreshTokenCommandRepository
+from ..repositories.query.refresh_token_query_repository import IRefreshTokenQueryRepository
+
+class RefreshTokenService(IService[RefreshTokenRequestDto, UserLoginResponseDto]):
+
+    def __init__(self, refresh_token_query_repository: IRefreshTokenQueryRepository, refresh_token_command_repository: IRefreshTokenCommandRepository, token_generator: ITokenGenerator, unit_of_work: IUnitOfWork):
+        super().__init__()
+        self.refresh_token_query_repository = refresh_token_query_repository
+        self.refresh_token_command_repository = refresh_token_command_repository
+        self.token_generator = token_generator
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, value: RefreshTokenRequestDto) -> Result[UserLoginResponseDto]:
+        # Un HMAC y una busqueda por clave primaria en lugar de verificar la contraseña con bcrypt
+        token_hash = self.token_generator.hash_refresh_token(value.refresh_token)
+        stored = await self.refresh_token_query_repository.get_by_hash(token_hash)
+
+        if (stored.is_error):
+            return Result.fail(stored.error)
+
+        current = stored.value
+
+        if current.revoked or current.expires_at <= datetime.now(timezone.utc):
+            return Result.fail(InvalidRefreshTokenException())
+
+        if current.used:
+            return await self._revoke(current)
+
+        consumed = await self.refresh_token_command_repository.mark_used(token_hash)
+
+        if (consumed.is_error):
+            return Result.fail(consumed.error)
+
+        # Otra peticion lo consumio entre la lectura y el UPDATE
+        if not consumed.value:
+            return await self._revoke(current)
+
+        token = self.token_generator.generate_token({"sub": current.email, "sid": current.family_id}, current.role)
+        refresh_token, expires_at = self.token_generator.generate_refresh_token()
+
+        saved = await self.refresh_token_command_repository.save(
+            token_hash=self.token_generator.hash_refresh_token(refresh_token),
+            family_id=current.family_id,
+            user_id=current.user_id,
+            expires_at=expires_at
+        )
+
+        if (saved.is_error):
+            return Result.fail(saved.error)
+
+        return Result.success(UserLoginResponseDto(token=token, refresh_token=refresh_token))
+
+    async def _revoke(self, current: StoredRefreshTokenDto) -> Result[UserLoginResponseDto]:
+        # Reutilizar un refresh token ya rotado indica robo: se revoca toda la sesion.
+        # Se confirma aqui porque el error devuelto hace que el decorador deshaga la transaccion
+        until = self.token_generator.revoke_session(current.family_id)
+        revoked = await self.refresh_token_command_repository.revoke_family(current.family_id, until)
+
+        if (revoked.is_error):
+            return Result.fail(revoked.error)
+
+        committed = await self.unit_of_work.commit()
+
+        if (committed.is_error):
+            return Result.fail(committed.error)
+
+        return Result.fail(InvalidRefreshTokenException())
@@ -1,19 +1,22 @@
-from src.common.application import IService
+from src.common.application import IService, IIdGenerator
 from src.common.utils import Result
 from ..repositories.query.user_query_repository import IUserQueryRepository
+from ..repositories.command.refresh_token_command_repository import IRefreshTokenCommandRepository
 from ..dtos.request.user_login_request_dto import UserLoginRequestDto
 from ..dtos.response.user_login_response_dto import UserLoginResponseDto
-from ..encryptor.encryptor import IEncryptor
+from ..encryptor.async_encryptor import IAsyncEncryptor
 from ..exceptions.invalid_credentials_exception import InvalidCredentialsException
 from src.common.application import ITokenGenerator
 
 class UserLoginService(IService[UserLoginRequestDto, UserLoginResponseDto]):
 
-    def __init__(self, user_query_repository: IUserQueryRepository, encryptor: IEncryptor, token_generator: ITokenGenerator):
+    def __init__(self, user_query_repository: IUserQueryRepository, encryptor: IAsyncEncryptor, token_generator: ITokenGenerator, refresh_token_repository: IRefreshTokenCommandRepository, id_generator: IIdGenerator):
         super().__init__()
         self.user_query_repository = user_query_repository
         self.encryptor = encryptor
         self.token_generator = token_generator
+        self.refresh_token_repository = refresh_token_repository
+        self.id_generator = id_generator
 
     async def execute(self, value: UserLoginRequestDto) -> Result[UserLoginResponseDto]:
         
@@ -22,13 +25,32 @@ class UserLoginService(IService[UserLoginRequestDto, UserLoginResponseDto]):
         if (user.is_error):
             return Result.fail(user.error)
 
-        if (self.encryptor.verify_password(value.password, user.value.password.password) != True):
+        verified = await self.encryptor.verify_password(value.password, user.value.password.password)
+
+        if (verified.is_error):
+            return Result.fail(verified.error)
+
+        if (verified.value != True):
             return Result.fail(InvalidCredentialsException())
 
-        token = self.token_generator.generate_token({"sub": user.value.email.email}, user.value.role.role)
+        # Cada login abre una sesion nueva; sus refresh tokens rotan dentro de la misma familia
+        session_id = self.id_generator.generate_id()
+        token = self.token_generator.generate_token({"sub": user.value.email.email, "sid": session_id}, user.value.role.role)
+        refresh_token, expires_at = self.token_generator.generate_refresh_token()
+
+        saved = await self.refresh_token_repository.save(
+            token_hash=self.token_generator.hash_refresh_token(refresh_token),
+            family_id=session_id,
+            user_id=user.value.id.user_id,
+            expires_at=expires_at
+        )
+
+        if (saved.is_error):
+            return Result.fail(saved.error)
         
         response = UserLoginResponseDto(
-            token=token
+            token=token,
+            refresh_token=refresh_token
         )
 
         return Result.success(response)
@@ -3,7 +3,7 @@ from src.common.utils import Result
 from ..dtos.request.user_register_request_dto import UserRegisterRequestDto
 from ..repositories.query.user_query_repository import IUserQueryRepository
 from ..repositories.command.user_command_repository import IUserCommandRepository
-from ..encryptor.encryptor import IEncryptor
+from ..encryptor.async_encryptor import IAsyncEncryptor
 from ..exceptions.user_already_exists_exception import UserAlreadyExistsException
 from src.auth.domain.aggregate.user import User
 from src.auth.domain.aggregate.user import UserEmailVo
@@ -15,7 +15,7 @@ from src.auth.domain.enum.user_role_enum import UserRoleEnum
 
 class UserRegisterService(IService[UserRegisterRequestDto, None]):
 
-    def __init__(self, user_query_repository: IUserQueryRepository, user_command_repository: IUserCommandRepository, encryptor: IEncryptor, id_generator: IIdGenerator):
+    def __init__(self, user_query_repository: IUserQueryRepository, user_command_repository: IUserCommandRepository, encryptor: IAsyncEncryptor, id_generator: IIdGenerator):
         super().__init__()
         self.user_query_repository = user_query_repository
         self.user_command_repository = user_command_repository
@@ -33,13 +33,16 @@ class UserRegisterService(IService[UserRegisterRequestDto, None]):
         
         user_id = self.id_generator.generate_id()
 
-        password_hashed = self.encryptor.encrypt(value.password)
+        password_hashed = await self.encryptor.encrypt(value.password)
+
+        if (password_hashed.is_error):
+            return Result.fail(password_hashed.error)
 
         new_user = User(
             UserIdVo(user_id),
             UserEmailVo(value.email),
             UserNameVo(value.name),
-            UserPasswordVo(password_hashed),
+            UserPasswordVo(password_hashed.value),
             UserRoleVo(UserRoleEnum.CLIENT)
         )
 
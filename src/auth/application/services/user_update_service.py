@@ -3,7 +3,8 @@ from src.common.utils import Result
 from ..dtos.request.user_update_request_dto import UserUpdateRequestDto
 from ..repositories.query.user_query_repository import IUserQueryRepository
 from ..repositories.command.user_command_repository import IUserCommandRepository
-from ..encryptor.encryptor import IEncryptor
+from ..encryptor.async_encryptor import IAsyncEncryptor
+from ..principal_cache.principal_cache import IPrincipalCache
 from src.common.utils import Result
 from src.auth.domain.value_objects.user_email_vo import UserEmailVo
 from src.auth.domain.value_objects.user_name_vo import UserNameVo
@@ -12,11 +13,12 @@ from ..exceptions.user_already_exists_exception import UserAlreadyExistsExceptio
 
 class UserUpdateService(IService[UserUpdateRequestDto, None]):
 
-    def __init__(self, user_query_repository: IUserQueryRepository, user_command_repository: IUserCommandRepository, encryptor: IEncryptor):
+    def __init__(self, user_query_repository: IUserQueryRepository, user_command_repository: IUserCommandRepository, encryptor: IAsyncEncryptor, principal_cache: IPrincipalCache):
         super().__init__()
         self.user_query_repository = user_query_repository
         self.user_command_repository = user_command_repository
         self.encryptor = encryptor
+        self.principal_cache = principal_cache
 
     async def execute(self, value: UserUpdateRequestDto) -> Result[None]:
         user = await self.user_query_repository.get_by_id(value.id)
@@ -25,6 +27,7 @@ class UserUpdateService(IService[UserUpdateRequestDto, None]):
             return Result.fail(user.error)
         
         user_updated = user.value
+        previous_email = user_updated.email.email
 
         if value.email:
             user_finded = await self.user_query_repository.exists_user_by_email(value.email)
@@ -41,12 +44,20 @@ class UserUpdateService(IService[UserUpdateRequestDto, None]):
             user_updated.update_name(UserNameVo(value.name))
 
         if value.password:
-            password_encrypted = self.encryptor.encrypt(value.password)
-            user_updated.update_password(UserPasswordVo(password_encrypted))
+            password_encrypted = await self.encryptor.encrypt(value.password)
+
+            if (password_encrypted.is_error):
+                return Result.fail(password_encrypted.error)
+
+            user_updated.update_password(UserPasswordVo(password_encrypted.value))
 
         save = await self.user_command_repository.update(user_updated)
 
         if (save.is_error):
             return Result.fail(save.error)
+
+        # El token sigue vigente: la proxima peticion debe volver a cargar email, rol y contraseña
+        self.principal_cache.invalidate(previous_email)
+        self.principal_cache.invalidate(user_updated.email.email)
         
         return Result.success(None)
\ No newline at end of file
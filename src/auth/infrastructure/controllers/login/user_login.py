@@ -2,13 +2,16 @@ from fastapi import FastAPI, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 from src.auth.application.services.user_login_service import UserLoginService
 from src.auth.infrastructure.repositories.query.orm_user_query_repository import OrmUserQueryRepository
-from src.auth.infrastructure.encryptor.bcrypt_encryptor import BcryptEncryptor
-from src.common.infrastructure import JwtGenerator, GetPostgresqlSession
+from src.auth.infrastructure.repositories.command.orm_refresh_token_command_repository import OrmRefreshTokenCommandRepository
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
+from src.common.infrastructure import JwtGenerator, GetPostgresqlSession, UuidGenerator
 from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
 from src.auth.application.dtos.request.user_login_request_dto import UserLoginRequestDto
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from ...routers.auth_router import auth_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 class UserLoginController:
     def __init__(self, app: FastAPI):
@@ -17,17 +20,21 @@ class UserLoginController:
         app.include_router(auth_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        user_query_repository = OrmUserQueryRepository(postgres_session)
-        encryptor = BcryptEncryptor()
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        user_query_repository = uow.repository(OrmUserQueryRepository)
+        refresh_token_repository = uow.repository(OrmRefreshTokenCommandRepository)
+        encryptor = PooledBcryptEncryptor()
         jwt_generator = JwtGenerator()
 
         user_login_service = UserLoginService(
             user_query_repository=user_query_repository,
             encryptor=encryptor,
-            token_generator=jwt_generator
+            token_generator=jwt_generator,
+            refresh_token_repository=refresh_token_repository,
+            id_generator=UuidGenerator()
         )
 
-        return user_login_service
+        return UnitOfWorkDecorator(user_login_service, uow)
 
     def setup_routes(self):
         @auth_router.post(
@@ -39,9 +46,9 @@ class UserLoginController:
                 "- email\n"
                 "- password\n"
             ),
-            response_description="Devuelve el token JWT"
+            response_description="Devuelve el token JWT y el refresh token"
         )
-        async def login(form_data: OAuth2PasswordRequestForm = Depends(), login_service: UserLoginService = Depends(self.get_service)):
+        async def login(form_data: OAuth2PasswordRequestForm = Depends(), login_service: UnitOfWorkDecorator = Depends(self.get_service)):
             if login_service is None:
                 raise RuntimeError("UserLoginService not initialized. Did you forget to call init()?")
 
@@ -54,5 +61,6 @@ class UserLoginController:
 
             return {
                 "access_token": response.value.token,
+                "refresh_token": response.value.refresh_token,
                 "token_type": "bearer"
             }
\ No newline at end of file
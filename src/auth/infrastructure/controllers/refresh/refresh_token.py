@@ -0,0 +1,57 @@
+from fastapi import FastAPI, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.application.dtos.request.refresh_token_request_dto import RefreshTokenRequestDto
+from src.auth.application.services.refresh_token_service import RefreshTokenService
+from src.auth.infrastructure.repositories.command.orm_refresh_token_command_repository import OrmRefreshTokenCommandRepository
+from src.auth.infrastructure.repositories.query.orm_refresh_token_query_repository import OrmRefreshTokenQueryRepository
+from src.common.application import ExceptionDecorator
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure import JwtGenerator, GetPostgresqlSession
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from ...dtos.request.refresh_token_request_inf_dto import RefreshTokenRequestInfDto
+from ...routers.auth_router import auth_router
+
+class RefreshTokenController:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.setup_routes()
+        app.include_router(auth_router)
+
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())) -> UnitOfWorkDecorator:
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+
+        refresh_token_service = RefreshTokenService(
+            refresh_token_query_repository=uow.repository(OrmRefreshTokenQueryRepository),
+            refresh_token_command_repository=uow.repository(OrmRefreshTokenCommandRepository),
+            token_generator=JwtGenerator(),
+            unit_of_work=uow
+        )
+
+        return UnitOfWorkDecorator(refresh_token_service, uow)
+
+    def setup_routes(self):
+        @auth_router.post(
+            "/refresh",
+            status_code=status.HTTP_200_OK,
+            summary="Refresh the session tokens",
+            description=(
+                "Renueva la sesion con:\n"
+                "- refresh_token\n"
+                "El refresh token usado deja de ser valido; reutilizarlo revoca la sesion completa.\n"
+            ),
+            response_description="Devuelve un token JWT y un refresh token nuevos"
+        )
+        async def refresh(body: RefreshTokenRequestInfDto, refresh_service: UnitOfWorkDecorator = Depends(self.get_service)):
+
+            service = ExceptionDecorator(refresh_service, FastApiErrorHandler())
+
+            response = await service.execute(RefreshTokenRequestDto(
+                refresh_token=body.refresh_token
+            ))
+
+            return {
+                "access_token": response.value.token,
+                "refresh_token": response.value.refresh_token,
+                "token_type": "bearer"
+            }
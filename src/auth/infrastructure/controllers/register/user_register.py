@@ -3,7 +3,7 @@ from src.common.infrastructure import GetPostgresqlSession
 from ...middlewares.user_role_verify import UserRoleVerify
 from src.auth.infrastructure.repositories.query.orm_user_query_repository import OrmUserQueryRepository
 from src.auth.infrastructure.repositories.command.orm_user_command_repository import OrmUserCommandRepository
-from src.auth.infrastructure.encryptor.bcrypt_encryptor import BcryptEncryptor
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
 from src.auth.application.services.user_register_service import UserRegisterService
 from src.common.infrastructure import UuidGenerator
 from ...dtos.request.user_register_request_inf_dto import UserRegisterRequestInfDto
@@ -12,6 +12,8 @@ from src.common.application import ExceptionDecorator
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from ...routers.auth_router import auth_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 class UserRegisterController:
     def __init__(self, app: FastAPI):
@@ -20,10 +22,11 @@ class UserRegisterController:
         app.include_router(auth_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        encryptor = BcryptEncryptor()
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        encryptor = PooledBcryptEncryptor()
         id_generator = UuidGenerator()
-        orm_user_query_repository = OrmUserQueryRepository(postgres_session)
-        orm_user_command_repository = OrmUserCommandRepository(postgres_session)
+        orm_user_query_repository = uow.repository(OrmUserQueryRepository)
+        orm_user_command_repository = uow.repository(OrmUserCommandRepository)
 
         user_register_service = UserRegisterService(
             orm_user_query_repository,
@@ -32,7 +35,7 @@ class UserRegisterController:
             id_generator
         )
 
-        return user_register_service
+        return UnitOfWorkDecorator(user_register_service, uow)
 
     def setup_routes(self):
         @auth_router.post(
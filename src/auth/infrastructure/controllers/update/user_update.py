@@ -3,7 +3,8 @@ from src.common.infrastructure import GetPostgresqlSession
 from ...middlewares.user_role_verify import UserRoleVerify
 from src.auth.infrastructure.repositories.query.orm_user_query_repository import OrmUserQueryRepository
 from src.auth.infrastructure.repositories.command.orm_user_command_repository import OrmUserCommandRepository
-from src.auth.infrastructure.encryptor.bcrypt_encryptor import BcryptEncryptor
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
+from src.auth.infrastructure.principal_cache.lru_principal_cache import LruPrincipalCache
 from src.auth.application.services.user_update_service import UserUpdateService
 from ...dtos.request.user_update_request_inf_dto import UserUpdateRequestInfDto
 from src.auth.application.dtos.request.user_update_request_dto import UserUpdateRequestDto
@@ -11,6 +12,8 @@ from src.common.application import ExceptionDecorator
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from ...routers.auth_router import auth_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 class UserUpdateController:
     def __init__(self, app: FastAPI):
@@ -19,17 +22,19 @@ class UserUpdateController:
         app.include_router(auth_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        encryptor = BcryptEncryptor()
-        orm_user_query_repository = OrmUserQueryRepository(postgres_session)
-        orm_user_command_repository = OrmUserCommandRepository(postgres_session)
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        encryptor = PooledBcryptEncryptor()
+        orm_user_query_repository = uow.repository(OrmUserQueryRepository)
+        orm_user_command_repository = uow.repository(OrmUserCommandRepository)
 
         user_update_service = UserUpdateService(
             orm_user_query_repository,
             orm_user_command_repository,
-            encryptor
+            encryptor,
+            LruPrincipalCache()
         )
 
-        return user_update_service
+        return UnitOfWorkDecorator(user_update_service, uow)
 
     def setup_routes(self):
         @auth_router.patch(
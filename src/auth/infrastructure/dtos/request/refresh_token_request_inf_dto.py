@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+class RefreshTokenRequestInfDto(BaseModel):
+    refresh_token: str = Field(..., description="Refresh token")
+
+    class Config:
+        extra = "forbid"
@@ -0,0 +1,91 @@
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+from src.auth.application.encryptor.async_encryptor import IAsyncEncryptor
+from src.auth.application.encryptor.encryptor import IEncryptor
+from src.auth.infrastructure.encryptor.bcrypt_encryptor import BcryptEncryptor
+from src.auth.infrastructure.exceptions.encryptor_saturated_exception import EncryptorSaturatedException
+from src.common.utils import Result
+
+T = TypeVar("T")
+
+class PooledBcryptEncryptor(IAsyncEncryptor):
+    """
+    Ejecuta bcrypt en un pool de workers compartido por todo el proceso para no bloquear el event loop.
+    Como mucho hay WORKERS operaciones en curso y MAX_QUEUE esperando; por encima se rechaza al instante
+    con 503 en lugar de encolar sin limite. POOL elige "thread" (bcrypt libera el GIL) o "process".
+    """
+
+    POOL = os.getenv("BCRYPT_POOL", "thread")
+    WORKERS = int(os.getenv("BCRYPT_WORKERS", str(min(4, os.cpu_count() or 1))))
+    MAX_QUEUE = int(os.getenv("BCRYPT_MAX_QUEUE", "64"))
+    LATENCY_SAMPLES = 1024
+
+    _executor: Optional[Executor] = None
+    _in_flight: int = 0
+    _latencies: "deque[float]" = deque(maxlen=LATENCY_SAMPLES)
+    _stats: dict[str, int] = {"completed": 0, "rejected": 0}
+
+    def __init__(self, encryptor: IEncryptor = BcryptEncryptor()):
+        self.encryptor = encryptor
+
+    @classmethod
+    def _pool(cls) -> Executor:
+        if cls._executor is None:
+            if cls.POOL == "process":
+                cls._executor = ProcessPoolExecutor(max_workers=cls.WORKERS)
+            else:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.WORKERS, thread_name_prefix="bcrypt")
+        return cls._executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._latencies.clear()
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        samples = sorted(cls._latencies)
+        p50 = samples[len(samples) // 2] if samples else 0.0
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] if samples else 0.0
+        return {
+            **cls._stats,
+            "in_flight": cls._in_flight,
+            "queue_depth": max(0, cls._in_flight - cls.WORKERS),
+            "latency_p50_ms": p50 * 1000,
+            "latency_p99_ms": p99 * 1000
+        }
+
+    async def encrypt(self, plain_data: str) -> Result[str]:
+        return await self._submit(self.encryptor.encrypt, plain_data)
+
+    async def verify_password(self, plain_data: str, hashed_data: str) -> Result[bool]:
+        return await self._submit(self.encryptor.verify_password, plain_data, hashed_data)
+
+    async def _submit(self, fn: Callable[..., T], *args: str) -> Result[T]:
+        cls = type(self)
+        if cls._in_flight >= cls.WORKERS + cls.MAX_QUEUE:
+            cls._stats["rejected"] += 1
+            return Result.fail(EncryptorSaturatedException())
+
+        cls._in_flight += 1
+        started = time.perf_counter()
+        try:
+            value = await asyncio.get_running_loop().run_in_executor(cls._pool(), fn, *args)
+        finally:
+            cls._in_flight -= 1
+
+        # Incluye la espera en cola: es lo que percibe la peticion
+        cls._latencies.append(time.perf_counter() - started)
+        cls._stats["completed"] += 1
+        return Result.success(value)
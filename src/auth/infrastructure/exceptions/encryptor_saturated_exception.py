@@ -0,0 +1,6 @@
+from src.common.infrastructure import InfrastructureException, ExceptionInfrastructureType
+
+class EncryptorSaturatedException(InfrastructureException):
+
+    def __init__(self, ):
+        super().__init__("Too many password operations in progress, try again later", ExceptionInfrastructureType.SERVICE_UNAVAILABLE)
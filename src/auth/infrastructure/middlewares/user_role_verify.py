@@ -2,30 +2,39 @@ from fastapi import Depends, HTTPException
 from fastapi.security import SecurityScopes
 from src.common.infrastructure import GetPostgresqlSession
 from .jwt_transformer import JwtTransformer
+from ..principal_cache.lru_principal_cache import LruPrincipalCache
 from ..repositories.query.orm_user_query_repository import OrmUserQueryRepository
 from sqlalchemy.ext.asyncio import AsyncSession
 
 class UserRoleVerify:
+
+    def __init__(self):
+        self.principal_cache = LruPrincipalCache()
+
     async def __call__(self,
                        scopes: SecurityScopes,
                        decoded: dict = Depends(JwtTransformer()),
                        db: AsyncSession = Depends(GetPostgresqlSession())):
 
-        repo = OrmUserQueryRepository(db)
-        res  = await repo.get_user_email(decoded["sub"])
-        
-        user=res.value
-        
-        
-        if res.is_error:
-            raise HTTPException(status_code=404, detail="User not found")
+        # La sesion de la peticion es perezosa: con el principal en cache no se toca la BD
+        user = self.principal_cache.get(decoded["sub"])
+
+        if user is None:
+            repo = OrmUserQueryRepository(db)
+            res  = await repo.get_principal(decoded["sub"])
+
+            if res.is_error:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            user = res.value
+            self.principal_cache.put(user, expires_at=decoded["exp"])
                 
         if not set(scopes.scopes).intersection(set(decoded["scopes"])):
-            raise HTTPException(status_code=403, detail=f"Forbidden: {user.role.role.value.capitalize()} attempts to access in invalid role endpoint.")
+            raise HTTPException(status_code=403, detail=f"Forbidden: {user.role.value.capitalize()} attempts to access in invalid role endpoint.")
         
 
         return {
-            "user_id":   user.id.user_id,
-            "email":     user.email.email,
+            "user_id":   user.user_id,
+            "email":     user.email,
             "scopes":    decoded["scopes"]
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,15 @@
+from datetime import datetime
+from sqlalchemy import DateTime
+from sqlmodel import Field, SQLModel
+
+class OrmRefreshTokenModel(SQLModel, table=True):
+
+    __tablename__ = "refresh_token" # type: ignore
+
+    # Solo se guarda el HMAC del token; el valor en claro lo tiene unicamente el cliente
+    token_hash: str = Field(nullable=False, primary_key=True)
+    family_id: str = Field(nullable=False, index=True)
+    user_id: str = Field(nullable=False, foreign_key="user.id")
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), nullable=False)
+    used: bool = Field(default=False, nullable=False)
+    revoked: bool = Field(default=False, nullable=False)
@@ -0,0 +1,10 @@
+from datetime import datetime
+from sqlalchemy import DateTime
+from sqlmodel import Field, SQLModel
+
+class OrmRevokedSessionModel(SQLModel, table=True):
+
+    __tablename__ = "revoked_session" # type: ignore
+
+    family_id: str = Field(nullable=False, primary_key=True)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,66 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
+from src.auth.application.principal_cache.principal_cache import IPrincipalCache
+from src.common.infrastructure import InvalidationBus
+
+class LruPrincipalCache(IPrincipalCache):
+    """
+    Principales autenticados por email, compartidos por todo el proceso.
+    Cada entrada vence en TTL_SECONDS o al expirar el token que la cargo, lo que ocurra primero;
+    al superar MAX_ENTRIES se descarta la usada hace mas tiempo. Los cambios hechos desde otro
+    worker llegan por InvalidationBus; TTL_SECONDS acota el caso en que el aviso se pierda.
+    """
+
+    TOPIC = "principal"
+    MAX_ENTRIES = 10_000
+    TTL_SECONDS = 60
+
+    _entries: "OrderedDict[str, tuple[float, PrincipalResponseDto]]" = OrderedDict()
+    _stats: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries.clear()
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {**cls._stats, "size": len(cls._entries)}
+
+    @classmethod
+    def evict(cls, email: Optional[str]) -> None:
+        if email is None:
+            cls._entries.clear()
+        elif cls._entries.pop(email, None) is not None:
+            cls._stats["invalidations"] += 1
+
+    def get(self, email: str) -> Optional[PrincipalResponseDto]:
+        entry = self._entries.get(email)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        if entry[0] <= time.time():
+            del self._entries[email]
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(email)
+        self._stats["hits"] += 1
+        return entry[1]
+
+    def put(self, principal: PrincipalResponseDto, expires_at: float) -> None:
+        deadline = min(time.time() + self.TTL_SECONDS, expires_at)
+        self._entries[principal.email] = (deadline, principal)
+        self._entries.move_to_end(principal.email)
+        while len(self._entries) > self.MAX_ENTRIES:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def invalidate(self, email: str) -> None:
+        self.evict(email)
+
+InvalidationBus.subscribe(LruPrincipalCache.TOPIC, LruPrincipalCache.evict)
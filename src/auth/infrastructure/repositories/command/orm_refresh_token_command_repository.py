@@ -0,0 +1,60 @@
+from datetime import datetime
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.application.repositories.command.refresh_token_command_repository import IRefreshTokenCommandRepository
+from src.auth.infrastructure.models.orm_refresh_token_model import OrmRefreshTokenModel
+from src.auth.infrastructure.models.orm_revoked_session_model import OrmRevokedSessionModel
+from src.common.infrastructure import InfrastructureException, InvalidationBus, RevocationFilter
+from src.common.utils import Result
+
+class OrmRefreshTokenCommandRepository(IRefreshTokenCommandRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def save(self, token_hash: str, family_id: str, user_id: str, expires_at: datetime) -> Result[None]:
+        try:
+            self.session.add(OrmRefreshTokenModel(
+                token_hash=token_hash,
+                family_id=family_id,
+                user_id=user_id,
+                expires_at=expires_at
+            ))
+            await self.session.flush()
+            return Result.success(None)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def mark_used(self, token_hash: str) -> Result[bool]:
+        try:
+            # Condicional: de dos renovaciones simultaneas con el mismo token solo una lo consume
+            result = await self.session.execute(
+                update(OrmRefreshTokenModel)
+                .where(
+                    OrmRefreshTokenModel.token_hash == token_hash,
+                    OrmRefreshTokenModel.used == False,
+                    OrmRefreshTokenModel.revoked == False
+                )
+                .values(used=True)
+            )
+            return Result.success(result.rowcount == 1)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def revoke_family(self, family_id: str, until: datetime) -> Result[None]:
+        try:
+            await self.session.execute(
+                update(OrmRefreshTokenModel)
+                .where(OrmRefreshTokenModel.family_id == family_id)
+                .values(revoked=True)
+            )
+            await self.session.execute(
+                delete(OrmRevokedSessionModel).where(OrmRevokedSessionModel.family_id == family_id)
+            )
+            self.session.add(OrmRevokedSessionModel(family_id=family_id, expires_at=until))
+            await self.session.flush()
+            # Este proceso la agrega al filtro en after_commit: si se deshace, nadie la rechaza
+            await InvalidationBus.publish(self.session, RevocationFilter.TOPIC, f"{family_id}|{until.timestamp()}")
+            return Result.success(None)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
@@ -2,7 +2,8 @@ from src.auth.application.repositories.command.user_command_repository import IU
 from src.auth.domain.aggregate.user import User
 from src.auth.infrastructure.models.orm_user_model import OrmUserModel
 from src.common.utils import Result
-from src.common.infrastructure import InfrastructureException
+from src.common.infrastructure import InfrastructureException, InvalidationBus
+from ...principal_cache.lru_principal_cache import LruPrincipalCache
 from ...exceptions.user_not_found_exception import UserNotFoundException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
@@ -22,11 +23,10 @@ class OrmUserCommandRepository(IUserCommandRepository):
             )
             
             self.session.add(orm_user)
-            await self.session.commit()
+            await self.session.flush()
             return Result.success(user)
         
         except Exception as e:
-            await self.session.rollback()
             err = InfrastructureException(str(e))
             return Result.fail(err)
         
@@ -41,6 +41,11 @@ class OrmUserCommandRepository(IUserCommandRepository):
                 err = UserNotFoundException()
                 return Result.fail(err)
 
+            # Los principales cacheados en todos los workers, con el email anterior y el nuevo
+            await InvalidationBus.publish(self.session, LruPrincipalCache.TOPIC, orm_user_to_update.email)
+            if orm_user_to_update.email != user.email.email:
+                await InvalidationBus.publish(self.session, LruPrincipalCache.TOPIC, user.email.email)
+
             orm_user_to_update.email = user.email.email
             orm_user_to_update.name = user.name.name
             orm_user_to_update.password = user.password.password
@@ -48,12 +53,11 @@ class OrmUserCommandRepository(IUserCommandRepository):
             
             self.session.add(orm_user_to_update)
             
-            await self.session.commit()
+            await self.session.flush()
             
             return Result.success(user)
 
         except Exception as e:
-            await self.session.rollback()
             err = InfrastructureException(str(e))
             
             return Result.fail(err)
\ No newline at end of file
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.auth.application.dtos.response.stored_refresh_token_dto import StoredRefreshTokenDto
+from src.auth.application.exceptions.invalid_refresh_token_exception import InvalidRefreshTokenException
+from src.auth.application.repositories.query.refresh_token_query_repository import IRefreshTokenQueryRepository
+from src.auth.infrastructure.models.orm_refresh_token_model import OrmRefreshTokenModel
+from src.auth.infrastructure.models.orm_revoked_session_model import OrmRevokedSessionModel
+from src.auth.infrastructure.models.orm_user_model import OrmUserModel
+from src.common.infrastructure import InfrastructureException
+from src.common.utils import Result
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite devuelve la fecha sin zona horaria; se guarda siempre en UTC
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+class OrmRefreshTokenQueryRepository(IRefreshTokenQueryRepository):
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_hash(self, token_hash: str) -> Result[StoredRefreshTokenDto]:
+        try:
+            result = await self.session.execute(
+                select(
+                    OrmRefreshTokenModel.token_hash,
+                    OrmRefreshTokenModel.family_id,
+                    OrmRefreshTokenModel.user_id,
+                    OrmRefreshTokenModel.expires_at,
+                    OrmRefreshTokenModel.used,
+                    OrmRefreshTokenModel.revoked,
+                    OrmUserModel.email,
+                    OrmUserModel.role
+                )
+                .join(OrmUserModel, OrmUserModel.id == OrmRefreshTokenModel.user_id)
+                .where(OrmRefreshTokenModel.token_hash == token_hash)
+            )
+            row = result.first()
+
+            if row is None:
+                return Result.fail(InvalidRefreshTokenException())
+
+            return Result.success(StoredRefreshTokenDto(
+                token_hash=row.token_hash,
+                family_id=row.family_id,
+                user_id=row.user_id,
+                email=row.email,
+                role=row.role,
+                expires_at=as_utc(row.expires_at),
+                used=row.used,
+                revoked=row.revoked
+            ))
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def get_revoked_sessions(self) -> Result[list[tuple[str, datetime]]]:
+        try:
+            now = datetime.now(timezone.utc)
+            result = await self.session.execute(
+                select(OrmRevokedSessionModel.family_id, OrmRevokedSessionModel.expires_at)
+                .where(OrmRevokedSessionModel.expires_at > now)
+            )
+            return Result.success([
+                (row.family_id, as_utc(row.expires_at))
+                for row in result
+            ])
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
@@ -2,6 +2,7 @@ from src.auth.application.repositories.query.user_query_repository import IUserQ
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth.infrastructure.models.orm_user_model import OrmUserModel
 from sqlalchemy import select, literal_column
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
 from src.auth.domain.aggregate.user import User
 from src.common.utils import Result
 from src.common.infrastructure import InfrastructureException
@@ -89,4 +90,18 @@ class OrmUserQueryRepository(IUserQueryRepository):
 
             return Result.success(orm_user is not None)
         except Exception as e:
-            return Result.fail(InfrastructureException(str(e)))
\ No newline at end of file
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def get_principal(self, email: str) -> Result[PrincipalResponseDto]:
+        try:
+            result = await self.session.execute(
+                select(OrmUserModel.id, OrmUserModel.email, OrmUserModel.role).where(OrmUserModel.email == email)
+            )
+            row = result.first()
+
+            if row is None:
+                return Result.fail(UserNotFoundException())
+
+            return Result.success(PrincipalResponseDto(user_id=row.id, email=row.email, role=row.role))
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
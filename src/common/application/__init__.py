@@ -1,10 +1,12 @@
 from .application_exception.application_exception import ApplicationException
 from .aspects.exception_decorator.exception_decorator import ExceptionDecorator
 from .aspects.logger_decorator.logger_decorator import LoggerDecorator
+from .aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
 from .decorators.base_service_decorator import BaseServiceDecorator
 from .id_generator.id_generator import IIdGenerator
 from .service.service import IService
 from .logger.logger import ILogger
 from .timer.timer import ITimer
 from .token.token_generator import ITokenGenerator
+from .unit_of_work.unit_of_work import IUnitOfWork
 from .application_exception.enum.application_exception_type import ExceptionApplicationType
\ No newline at end of file
@@ -3,5 +3,6 @@ from enum import Enum
 class ExceptionApplicationType(Enum):
     CONFLICT = "CONFLICT",
     FORBIDDEN = "FORBIDDEN",
+    UNAUTHORIZED = "UNAUTHORIZED",
     NOT_FOUND = "NOT_FOUND",
     APPLICATION_ERROR = "APPLICATION_ERROR"
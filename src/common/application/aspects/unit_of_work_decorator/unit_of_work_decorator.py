@@ -0,0 +1,32 @@
+from typing import Generic, TypeVar
+from src.common.utils import Result
+from ...decorators.base_service_decorator import BaseServiceDecorator
+from ...service.service import IService
+from ...unit_of_work.unit_of_work import IUnitOfWork
+
+I = TypeVar('I')
+O = TypeVar('O')
+
+class UnitOfWorkDecorator(BaseServiceDecorator[I, O], Generic[I, O]):
+    """
+    Confirma la unidad de trabajo una sola vez al terminar el servicio, o la revierte si fallo.
+    """
+    def __init__(self, service: IService[I, O], unit_of_work: IUnitOfWork):
+        super().__init__(service)
+        self.unit_of_work = unit_of_work
+
+    async def execute(self, value: I) -> Result[O]:
+        try:
+            response = await self.service.execute(value)
+        except Exception:
+            await self.unit_of_work.rollback()
+            raise
+
+        if response.is_error:
+            await self.unit_of_work.rollback()
+            return response
+
+        committed = await self.unit_of_work.commit()
+        if committed.is_error:
+            return Result.fail(committed.error)
+        return response
@@ -4,4 +4,9 @@ class Notifier(ABC):
 
     @abstractmethod
     def notify(self,message:str) -> None:
-        pass
\ No newline at end of file
+        pass
+
+    def notify_many(self, messages: list[str]) -> None:
+        # Los notificadores con envio por lotes lo sobrescriben
+        for message in messages:
+            self.notify(message)
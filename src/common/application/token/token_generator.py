@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from src.auth.domain.enum.user_role_enum import UserRoleEnum
 
 class ITokenGenerator(ABC):
@@ -9,4 +10,16 @@ class ITokenGenerator(ABC):
 
     @abstractmethod
     def decode_token(self, token: str) -> dict:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def generate_refresh_token(self) -> tuple[str, datetime]:
+        pass
+
+    @abstractmethod
+    def hash_refresh_token(self, token: str) -> str:
+        pass
+
+    @abstractmethod
+    def revoke_session(self, session_id: str) -> datetime:
+        pass
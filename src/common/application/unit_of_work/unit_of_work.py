@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from src.common.utils import Result
+
+class IUnitOfWork(ABC):
+
+    @abstractmethod
+    async def commit(self) -> Result[None]:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
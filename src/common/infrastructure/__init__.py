@@ -4,7 +4,17 @@ from .id_generator.uuid_generator import UuidGenerator
 from .logger.fastapi_logger import FastAPILogger
 from .timer.timer_timestamp import TimerTimestamp
 from .middlewares.get_postgresql_session import GetPostgresqlSession
+from .middlewares.request_session import RequestSession, RequestSessionMiddleware
+from .unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from .invalidation_bus.invalidation_bus import InvalidationBus
+from .invalidation_bus.postgres_invalidation_listener import PostgresInvalidationListener
+from .response_cache.response_cache import ResponseCache
+from .response_cache.response_cache_decorator import ResponseCacheDecorator
+from .invalidated_cache.invalidated_cache import InvalidatedCache
+from .conditional_get.entity_tag import EntityTag
+from .conditional_get.version_stamps import VersionStamps
 from .jwt.jwt_generator import JwtGenerator
+from .jwt.revocation_filter import RevocationFilter
 from .infrastructure_exception.infrastructure_exception import InfrastructureException
 from .infrastructure_exception.enum.infraestructure_exception_type import ExceptionInfrastructureType
 from .roles.role_scopes import ROLE_SCOPES, ALL_KNOWN_SCOPES
\ No newline at end of file
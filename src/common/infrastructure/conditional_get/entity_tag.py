@@ -0,0 +1,19 @@
+from typing import Optional
+
+class EntityTag:
+    """
+    ETags fuertes a partir de la marca de version de un agregado y comparacion con If-None-Match.
+    """
+
+    @staticmethod
+    def strong(stamp: str) -> str:
+        return f'"{stamp}"'
+
+    @staticmethod
+    def matches(if_none_match: Optional[str], etag: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match usa la comparacion debil (RFC 9110): se ignora el prefijo W/
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
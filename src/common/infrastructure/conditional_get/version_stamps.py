@@ -0,0 +1,9 @@
+from ..invalidated_cache.invalidated_cache import InvalidatedCache
+
+class VersionStamps(InvalidatedCache[str]):
+    """
+    Marcas de version de agregados por clave para responder GETs condicionales sin cargar el
+    agregado. Con la cache caliente no se consulta nada; si falta, load hace una lectura por
+    indice y devuelve None si el agregado no existe. Los repositorios de comandos publican la
+    clave en el topic al subir la version.
+    """
@@ -42,6 +42,11 @@ class PostgresDatabase:
             await conn.run_sync(SQLModel.metadata.create_all)
             print("Tablas de base de datos creadas/actualizadas.")
 
+    def create_session(self) -> AsyncSession:
+        if PostgresDatabase._async_session_factory is None:
+            raise RuntimeError("La fábrica de sesiones no está inicializada.")
+        return PostgresDatabase._async_session_factory()
+
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         if PostgresDatabase._async_session_factory is None:
@@ -36,6 +36,8 @@ class FastApiErrorHandler(IErrorHandler):
             code = status.HTTP_409_CONFLICT
         elif app_type == ExceptionApplicationType.FORBIDDEN:
             code = status.HTTP_403_FORBIDDEN
+        elif app_type == ExceptionApplicationType.UNAUTHORIZED:
+            code = status.HTTP_401_UNAUTHORIZED
         else:
             return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=message)
         
@@ -63,6 +65,8 @@ class FastApiErrorHandler(IErrorHandler):
             code = status.HTTP_500_INTERNAL_SERVER_ERROR
         elif infra_type == ExceptionInfrastructureType.USER_NOT_FOUND:
             code = status.HTTP_404_NOT_FOUND
+        elif infra_type == ExceptionInfrastructureType.SERVICE_UNAVAILABLE:
+            code = status.HTTP_503_SERVICE_UNAVAILABLE
         else:
             code = status.HTTP_500_INTERNAL_SERVER_ERROR
             message = "Unexpected infrastructure error"
@@ -0,0 +1,9 @@
+from typing import Any
+from fastapi.exceptions import RequestValidationError
+
+def invalid_query(name: str, message: str, value: Any) -> RequestValidationError:
+    """
+    422 con la misma forma que las validaciones de FastAPI, para las reglas de la query que no
+    caben en Query(...). Un validador del modelo de Depends() acabaria en 500.
+    """
+    return RequestValidationError([{"type": "value_error", "loc": ("query", name), "msg": message, "input": value}])
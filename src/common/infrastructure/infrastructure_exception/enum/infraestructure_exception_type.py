@@ -9,4 +9,5 @@ class ExceptionInfrastructureType(Enum):
     NOT_REGISTERED = "NOT_REGISTERED"
     INTERNAL_SERVER_ERROR="INTERNAL_SERVER_ERROR"
     USER_NOT_FOUND = "USER_NOT_FOUND"
+    SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
     UNKNOWN = "UNKNOWN"
@@ -0,0 +1,85 @@
+import time as clock
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..invalidation_bus.invalidation_bus import InvalidationBus
+
+V = TypeVar('V')
+
+class InvalidatedCache(Generic[V]):
+    """
+    Valores por clave compartidos por el proceso y descartados via InvalidationBus: los
+    repositorios de comandos publican en el topic name la clave que cambiaron, o None para
+    vaciarlo todo. Si falta o vencio ttl_seconds (por si se pierde un aviso), load lo lee;
+    una carga que se cruza con una invalidacion se entrega pero no se guarda. None no se
+    guarda: la siguiente lectura vuelve a mirar. Pasado max_entries sale el menos usado.
+    """
+
+    _instances: dict[str, "InvalidatedCache"] = {}
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[AsyncSession, str], Awaitable[Optional[V]]],
+        ttl_seconds: float = 60,
+        max_entries: int = 10_000
+    ):
+        self.name = name
+        self.load = load
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # clave -> (instante de la carga, valor)
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._generation = 0
+        self._stats: dict[str, int] = {"hits": 0, "loads": 0, "invalidations": 0}
+        InvalidatedCache._instances[name] = self
+        InvalidationBus.subscribe(name, self.receive)
+
+    @property
+    def topic(self) -> str:
+        return self.name
+
+    @property
+    def generation(self) -> int:
+        # Sube con cada invalidacion
+        return self._generation
+
+    @classmethod
+    def all_stats(cls) -> dict[str, dict[str, Any]]:
+        return {name: cache.stats() for name, cache in cls._instances.items()}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+
+    def receive(self, key: Optional[str]) -> None:
+        self._generation += 1
+        self._stats["invalidations"] += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {**self._stats, "entries": len(self._entries)}
+
+    def values(self) -> list[V]:
+        return [value for _, value in self._entries.values()]
+
+    async def get(self, session: AsyncSession, key: str) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is not None and clock.monotonic() - entry[0] < self.ttl_seconds:
+            self._stats["hits"] += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        generation = self._generation
+        value = await self.load(session, key)
+        self._stats["loads"] += 1
+        if value is not None and generation == self._generation:
+            self._entries[key] = (clock.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
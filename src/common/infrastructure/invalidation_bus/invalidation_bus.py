@@ -0,0 +1,113 @@
+import logging
+import uuid
+from typing import Awaitable, Callable, Optional
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+class InvalidationBus:
+    """
+    Invalida caches en memoria de todos los workers. Los repositorios de comandos publican dentro
+    de su transaccion con pg_notify, que Postgres solo entrega si hay commit; el propio proceso se
+    invalida en after_commit y PostgresInvalidationListener reparte lo que llega de los demas.
+    Cada cache se suscribe a un topic con un handler que recibe la clave a descartar, o None
+    para vaciarse completa (se usa al reconectar, cuando pudieron perderse mensajes).
+    """
+
+    CHANNEL = "cache_invalidation"
+    INSTANCE_ID = uuid.uuid4().hex
+    PENDING_KEY = "pending_invalidations"
+
+    _handlers: dict[str, Callable[[Optional[str]], None]] = {}
+    _resyncs: list[Callable[[], Awaitable[None]]] = []
+    _stats: dict[str, int] = {"published": 0, "received": 0, "dispatched": 0, "flushes": 0}
+
+    @classmethod
+    def subscribe(cls, topic: str, handler: Callable[[Optional[str]], None]) -> None:
+        cls._handlers[topic] = handler
+
+    @classmethod
+    def on_resync(cls, resync: Callable[[], Awaitable[None]]) -> None:
+        # Para estado que no se puede vaciar sin mas (p.ej. revocaciones): se recarga desde la BD
+        if resync not in cls._resyncs:
+            cls._resyncs.append(resync)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {**cls._stats, "topics": len(cls._handlers)}
+
+    @classmethod
+    def clear(cls) -> None:
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+    @classmethod
+    async def publish(cls, session: AsyncSession, topic: str, key: Optional[str] = None, local: bool = True) -> None:
+        """
+        local=False cuando el proceso ya aplico el cambio en su cache antes del commit.
+        """
+        sync_session = session.sync_session
+        # Sin transaccion abierta un rollback no dispara eventos y lo pendiente sobreviviria
+        if not sync_session.in_transaction():
+            sync_session.begin()
+        pending: list[tuple[str, Optional[str], bool]] = sync_session.info.setdefault(cls.PENDING_KEY, [])
+        pending.append((topic, key, local))
+        if not event.contains(sync_session, "after_commit", _dispatch_pending):
+            event.listen(sync_session, "after_commit", _dispatch_pending)
+            event.listen(sync_session, "after_soft_rollback", _discard_pending)
+
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(select(func.pg_notify(cls.CHANNEL, cls._encode(topic, key))))
+        cls._stats["published"] += 1
+
+    @classmethod
+    def receive(cls, payload: str) -> None:
+        try:
+            origin, topic, key = cls._decode(payload)
+        except ValueError:
+            logging.warning(f"Invalidation payload ignored: {payload!r}")
+            return
+
+        cls._stats["received"] += 1
+        # Lo propio ya se aplico en after_commit
+        if origin != cls.INSTANCE_ID:
+            cls.dispatch(topic, key)
+
+    @classmethod
+    def dispatch(cls, topic: str, key: Optional[str]) -> None:
+        handler = cls._handlers.get(topic)
+        if handler is None:
+            return
+        try:
+            handler(key)
+            cls._stats["dispatched"] += 1
+        except Exception as e:
+            logging.error(f"Invalidation handler for {topic!r} failed: {e}")
+
+    @classmethod
+    async def flush_all(cls) -> None:
+        for topic in list(cls._handlers):
+            cls.dispatch(topic, None)
+        for resync in cls._resyncs:
+            try:
+                await resync()
+            except Exception as e:
+                logging.error(f"Invalidation resync failed: {e}")
+        cls._stats["flushes"] += 1
+
+    @classmethod
+    def _encode(cls, topic: str, key: Optional[str]) -> str:
+        # El payload de NOTIFY admite hasta 8000 bytes; las claves son ids o emails
+        return f"{cls.INSTANCE_ID}|{topic}|{'' if key is None else key}"
+
+    @staticmethod
+    def _decode(payload: str) -> tuple[str, str, Optional[str]]:
+        origin, topic, key = payload.split("|", 2)
+        return origin, topic, key or None
+
+def _dispatch_pending(session) -> None:
+    for topic, key, local in session.info.pop(InvalidationBus.PENDING_KEY, []):
+        if local:
+            InvalidationBus.dispatch(topic, key)
+
+def _discard_pending(session, previous_transaction) -> None:
+    session.info.pop(InvalidationBus.PENDING_KEY, None)
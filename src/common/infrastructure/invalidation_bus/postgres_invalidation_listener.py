@@ -0,0 +1,63 @@
+import asyncio
+import logging
+import asyncpg
+from .invalidation_bus import InvalidationBus
+
+class PostgresInvalidationListener:
+    """
+    Conexion dedicada con LISTEN sobre InvalidationBus.CHANNEL. NOTIFY no se reencola: lo enviado
+    mientras la conexion estaba caida se pierde, asi que tras cada reconexion se vacian todas las
+    caches. Con eso cada invalidacion llega al menos una vez (como mensaje o como vaciado).
+    """
+
+    KEEPALIVE_SECONDS = 15
+    RECONNECT_SECONDS = 1
+    MAX_RECONNECT_SECONDS = 30
+
+    def __init__(self, url: str):
+        # asyncpg no entiende el prefijo de dialecto de SQLAlchemy
+        self.dsn = url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self.connected = asyncio.Event()
+        self.reconnects = 0
+
+    async def run(self) -> None:
+        delay = self.RECONNECT_SECONDS
+        first = True
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(InvalidationBus.CHANNEL, self._on_notify)
+
+                if not first:
+                    self.reconnects += 1
+                    await InvalidationBus.flush_all()
+                first = False
+                delay = self.RECONNECT_SECONDS
+                self.connected.set()
+
+                await self._wait_until_lost(connection, lost)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.warning(f"Invalidation listener disconnected: {e}")
+            finally:
+                self.connected.clear()
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RECONNECT_SECONDS)
+
+    async def _wait_until_lost(self, connection: asyncpg.Connection, lost: asyncio.Event) -> None:
+        # Una conexion medio abierta no avisa: se comprueba con un SELECT periodico
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), timeout=self.KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                await asyncio.wait_for(connection.fetchval("SELECT 1"), timeout=self.KEEPALIVE_SECONDS)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        InvalidationBus.receive(payload)
@@ -0,0 +1,27 @@
+import hashlib
+import math
+
+class BloomFilter:
+    """
+    Conjunto probabilistico: `in` nunca da falsos negativos y da falsos positivos con
+    probabilidad ~error_rate mientras no se superen `capacity` elementos.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str) -> list[int]:
+        # Doble hashing: h1 + i*h2 con las dos mitades de un unico blake2b
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, value: str) -> None:
+        for p in self._positions(value):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[p >> 3] >> (p & 7) & 1 for p in self._positions(value))
@@ -1,16 +1,23 @@
 from src.common.application import ITokenGenerator
+import hashlib
+import hmac
 import os
+import secrets
 from dotenv import load_dotenv
 from datetime import datetime, timedelta, timezone
 from jose import jwt, JWTError
 from fastapi import HTTPException
 from src.auth.domain.enum.user_role_enum import UserRoleEnum
 from ..roles.role_scopes import ROLE_SCOPES
+from .revocation_filter import RevocationFilter
 
 load_dotenv()
 
 class JwtGenerator(ITokenGenerator):
 
+    ACCESS_TOKEN_MINUTES = 15
+    REFRESH_TOKEN_DAYS = 7
+
     def __init__(self):
         secret = os.getenv("JWT_SECRET")
         assert secret is not None, "La variable JWT_SECRET no está definida"
@@ -18,7 +25,7 @@ class JwtGenerator(ITokenGenerator):
 
     def generate_token(self, data: dict, role: UserRoleEnum) -> str:
         data_copy = data.copy()
-        expires = datetime.now(timezone.utc) + timedelta(minutes=15)
+        expires = datetime.now(timezone.utc) + timedelta(minutes=self.ACCESS_TOKEN_MINUTES)
 
         data_copy.update({"exp": expires})
 
@@ -40,6 +47,22 @@ class JwtGenerator(ITokenGenerator):
             if token_decode["sub"] is None or token_decode["scopes"] is None:
                 raise HTTPException(status_code=401, detail="Unauthorized: Invalid token.", headers={"WWW-Authenticate": "Bearer"})
 
+            if "sid" in token_decode and RevocationFilter.is_revoked(token_decode["sid"]):
+                raise HTTPException(status_code=401, detail="Unauthorized: Session revoked.", headers={"WWW-Authenticate": "Bearer"})
+
             return token_decode
         except JWTError:
-            raise HTTPException(status_code=401, detail="Unauthorized: Invalid token.", headers={"WWW-Authenticate": "Bearer"})
\ No newline at end of file
+            raise HTTPException(status_code=401, detail="Unauthorized: Invalid token.", headers={"WWW-Authenticate": "Bearer"})
+
+    def generate_refresh_token(self) -> tuple[str, datetime]:
+        expires = datetime.now(timezone.utc) + timedelta(days=self.REFRESH_TOKEN_DAYS)
+        return secrets.token_urlsafe(32), expires
+
+    def hash_refresh_token(self, token: str) -> str:
+        # HMAC con el secreto del JWT: la tabla filtrada no sirve para fabricar tokens validos
+        return hmac.new(self.secret.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def revoke_session(self, session_id: str) -> datetime:
+        # Basta con recordarla mientras viva el ultimo access token emitido para la sesion. El
+        # filtro la recibe del repositorio por InvalidationBus, solo si la revocacion se confirma
+        return datetime.now(timezone.utc) + timedelta(minutes=self.ACCESS_TOKEN_MINUTES)
@@ -0,0 +1,82 @@
+import time
+from datetime import datetime
+from typing import Optional
+from .bloom_filter import BloomFilter
+from ..invalidation_bus.invalidation_bus import InvalidationBus
+
+class RevocationFilter:
+    """
+    Sesiones revocadas cuyos access tokens aun no han expirado, compartidas por todo el proceso.
+    El Bloom filter responde sin tocar el diccionario para casi todos los tokens validos; solo un
+    positivo se confirma contra las entradas exactas. Se carga desde la tabla revoked_session al
+    arrancar, recibe las revocaciones de otros workers por InvalidationBus y se reconstruye al
+    llenarse descartando las entradas vencidas.
+    """
+
+    TOPIC = "revoked_session"
+    CAPACITY = 100_000
+    ERROR_RATE = 0.001
+
+    _capacity: int = CAPACITY
+    _bloom: BloomFilter = BloomFilter(CAPACITY, ERROR_RATE)
+    _revoked: dict[str, float] = {}
+    _stats: dict[str, int] = {"negatives": 0, "false_positives": 0, "revoked_hits": 0, "rebuilds": 0}
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._capacity = cls.CAPACITY
+        cls._bloom = BloomFilter(cls.CAPACITY, cls.ERROR_RATE)
+        cls._revoked.clear()
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {**cls._stats, "size": len(cls._revoked)}
+
+    @classmethod
+    def load(cls, sessions: list[tuple[str, datetime]]) -> None:
+        for session_id, expires_at in sessions:
+            cls.add(session_id, expires_at.timestamp())
+
+    @classmethod
+    def add(cls, session_id: str, expires_at: float) -> None:
+        if len(cls._revoked) >= cls._capacity:
+            cls._rebuild()
+        cls._revoked[session_id] = expires_at
+        cls._bloom.add(session_id)
+
+    @classmethod
+    def receive(cls, key: Optional[str]) -> None:
+        # Revocacion hecha en otro worker: "session_id|expires_at"; el vaciado no aplica aqui
+        if key is None:
+            return
+        session_id, expires_at = key.rsplit("|", 1)
+        cls.add(session_id, float(expires_at))
+
+    @classmethod
+    def is_revoked(cls, session_id: str) -> bool:
+        if session_id not in cls._bloom:
+            cls._stats["negatives"] += 1
+            return False
+
+        expires_at = cls._revoked.get(session_id)
+        if expires_at is None or expires_at <= time.time():
+            cls._stats["false_positives"] += 1
+            return False
+
+        cls._stats["revoked_hits"] += 1
+        return True
+
+    @classmethod
+    def _rebuild(cls) -> None:
+        now = time.time()
+        alive = {sid: exp for sid, exp in cls._revoked.items() if exp > now}
+        cls._capacity = max(cls.CAPACITY, 2 * len(alive))
+        cls._bloom = BloomFilter(cls._capacity, cls.ERROR_RATE)
+        for sid in alive:
+            cls._bloom.add(sid)
+        cls._revoked = alive
+        cls._stats["rebuilds"] += 1
+
+InvalidationBus.subscribe(RevocationFilter.TOPIC, RevocationFilter.receive)
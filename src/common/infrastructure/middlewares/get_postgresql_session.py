@@ -1,9 +1,16 @@
+from fastapi import Request
 from ..database.postgres.postgres_database import PostgresDatabase
 
 class GetPostgresqlSession:
     
-    async def __call__(self):
+    async def __call__(self, request: Request):
+        # Con RequestSessionMiddleware todas las dependencias de la peticion comparten la sesion
+        shared = getattr(request.state, "db", None)
+        if shared is not None:
+            yield shared.session
+            return
+
         temp_db_instance = PostgresDatabase() 
     
         async with temp_db_instance.get_session() as session: 
-            yield session
\ No newline at end of file
+            yield session
@@ -0,0 +1,62 @@
+from typing import Optional
+from sqlalchemy import event
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ..database.postgres.postgres_database import PostgresDatabase
+
+class RequestSession:
+    """
+    Sesion de la peticion, creada en el primer uso y compartida por la verificacion de
+    roles, los repositorios y los decoradores. Cuenta cuantas conexiones saco del pool.
+    """
+
+    def __init__(self):
+        self._session: Optional[AsyncSession] = None
+        self.checkouts = 0
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = PostgresDatabase().create_session()
+            # Cada transaccion de la sesion toma una conexion del pool hasta el commit/rollback
+            event.listen(self._session.sync_session, "after_begin", self._on_begin)
+        return self._session
+
+    def _on_begin(self, session, transaction, connection) -> None:
+        self.checkouts += 1
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class RequestSessionMiddleware:
+    """
+    Deja un RequestSession en request.state.db, lo cierra al terminar la peticion y
+    reporta las conexiones usadas en la cabecera X-DB-Checkouts.
+    """
+
+    HEADER = "X-DB-Checkouts"
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_session = RequestSession()
+        scope.setdefault("state", {})["db"] = request_session
+
+        async def send_with_checkouts(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.HEADER] = str(request_session.checkouts)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_checkouts)
+        finally:
+            await request_session.close()
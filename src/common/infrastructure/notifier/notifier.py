@@ -30,3 +30,8 @@ class RichLoggerNotifier(Notifier):
                 padding=(1, 2)
             )
         )
+
+    def notify_many(self, messages: list[str]) -> None:
+        # Un solo panel por lote: imprimir miles de paneles bloquea la consola
+        if messages:
+            self.notify("\n".join(messages))
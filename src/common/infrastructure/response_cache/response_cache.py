@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time as clock
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Generic, Optional, TypeVar
+from src.common.utils import Result
+
+T = TypeVar('T')
+
+class ResponseCache(Generic[T]):
+    """
+    Cache de respuestas con TTL. Dentro de ttl_seconds la entrada se sirve tal cual; hasta
+    stale_seconds despues se sirve vieja mientras una sola tarea la refresca en segundo plano.
+    Los fallos simultaneos de una misma clave esperan a una unica carga (single-flight).
+    Solo se guardan los resultados exitosos.
+    """
+
+    _instances: dict[str, "ResponseCache"] = {}
+
+    def __init__(self, name: str, ttl_seconds: float = 30, stale_seconds: float = 300, max_entries: int = 256):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        # clave -> (instante de la carga, resultado)
+        self._entries: OrderedDict[str, tuple[float, Result[T]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._latencies: deque[float] = deque(maxlen=1024)
+        self._stats: dict[str, int] = {"hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "refreshes": 0, "load_errors": 0}
+        ResponseCache._instances[name] = self
+
+    @classmethod
+    def all_stats(cls) -> dict[str, dict[str, Any]]:
+        return {name: cache.stats() for name, cache in cls._instances.items()}
+
+    @staticmethod
+    def key(value: Any) -> str:
+        # Los DTOs de peticion son objetos planos: su tipo y sus atributos identifican la consulta
+        return f"{type(value).__name__}:{sorted(vars(value).items())!r}"
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for key in self._stats:
+            self._stats[key] = 0
+        self._latencies.clear()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        served = self._stats["hits"] + self._stats["stale_hits"] + self._stats["misses"] + self._stats["coalesced"]
+        latencies = sorted(self._latencies)
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "hit_ratio": round((self._stats["hits"] + self._stats["stale_hits"]) / served, 4) if served else 0.0,
+            "refresh_p50_ms": round(latencies[len(latencies) // 2] * 1000, 2) if latencies else 0.0,
+            "refresh_p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2) if latencies else 0.0
+        }
+
+    async def get(self, key: str, load: Callable[[], Awaitable[Result[T]]]) -> Result[T]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = clock.monotonic() - entry[0]
+            if age < self.ttl_seconds:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._stats["stale_hits"] += 1
+                self._entries.move_to_end(key)
+                if key not in self._in_flight:
+                    self._stats["refreshes"] += 1
+                    self._start(key, load)
+                return entry[1]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._stats["coalesced"] += 1
+        else:
+            self._stats["misses"] += 1
+            task = self._start(key, load)
+        # shield: si esta peticion se cancela, la carga compartida sigue para los demas
+        return await asyncio.shield(task)
+
+    def _start(self, key: str, load: Callable[[], Awaitable[Result[T]]]) -> asyncio.Task:
+        task = asyncio.create_task(self._load(key, load))
+        self._in_flight[key] = task
+
+        def done(finished: asyncio.Task) -> None:
+            if self._in_flight.get(key) is finished:
+                del self._in_flight[key]
+            # Un refresco que falla no tiene quien lo espere: se marca como recuperado
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(done)
+        return task
+
+    async def _load(self, key: str, load: Callable[[], Awaitable[Result[T]]]) -> Result[T]:
+        started = clock.monotonic()
+        try:
+            result = await load()
+        except Exception as e:
+            self._stats["load_errors"] += 1
+            logging.error(f"Response cache {self.name!r} load failed: {e}")
+            raise
+        self._latencies.append(clock.monotonic() - started)
+
+        if result.is_error:
+            self._stats["load_errors"] += 1
+            return result
+        self._entries[key] = (clock.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
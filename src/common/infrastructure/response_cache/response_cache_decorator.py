@@ -0,0 +1,28 @@
+from typing import Callable, Generic, TypeVar
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.common.application import IService
+from src.common.utils import Result
+from ..database.postgres.postgres_database import PostgresDatabase
+from .response_cache import ResponseCache
+
+I = TypeVar('I')
+O = TypeVar('O')
+
+class ResponseCacheDecorator(IService[I, O], Generic[I, O]):
+    """
+    Sirve un servicio de solo lectura desde un ResponseCache, con el DTO de peticion como clave.
+    Cada carga arma el servicio con una sesion propia: un refresco en segundo plano sigue vivo
+    despues de que termina la peticion que lo disparo.
+    """
+
+    def __init__(self, cache: ResponseCache[O], service_factory: Callable[[AsyncSession], IService[I, O]]):
+        super().__init__()
+        self.cache = cache
+        self.service_factory = service_factory
+
+    async def execute(self, value: I) -> Result[O]:
+        return await self.cache.get(ResponseCache.key(value), lambda: self._load(value))
+
+    async def _load(self, value: I) -> Result[O]:
+        async with PostgresDatabase().get_session() as session:
+            return await self.service_factory(session).execute(value)
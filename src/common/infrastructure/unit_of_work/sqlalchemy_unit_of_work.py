@@ -0,0 +1,32 @@
+from typing import Any, Callable, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.application.unit_of_work.unit_of_work import IUnitOfWork
+from src.common.utils import Result
+from ..infrastructure_exception.infrastructure_exception import InfrastructureException
+
+T = TypeVar('T')
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """
+    Dueña de la AsyncSession de la peticion. Los repositorios que entrega comparten la sesion
+    y solo hacen flush; el commit (o rollback) ocurre una vez, al final del servicio.
+    """
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._repositories: dict[Callable[[AsyncSession], Any], Any] = {}
+
+    def repository(self, repository_class: Callable[[AsyncSession], T]) -> T:
+        if repository_class not in self._repositories:
+            self._repositories[repository_class] = repository_class(self.session)
+        return self._repositories[repository_class]
+
+    async def commit(self) -> Result[None]:
+        try:
+            await self.session.commit()
+            return Result.success(None)
+        except Exception as e:
+            await self.session.rollback()
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
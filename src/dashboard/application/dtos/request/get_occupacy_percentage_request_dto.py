@@ -1,17 +1,33 @@
+import calendar
+from datetime import date
+from typing import Optional
+
 class GetOccupancyPercentageRequestDto:
     def __init__(
         self,
         page: int = 1,
-        per_page: int = 10
+        per_page: int = 10,
+        restaurant_ids: Optional[list[str]] = None,
+        month: Optional[date] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
     ):
         """
         DTO for paginating the list of restaurants.
 
         :param page: Page number (1-indexed).
         :param per_page: Number of items per page.
+        :param restaurant_ids: Only these restaurants (all when None).
+        :param month: Any day of the month to report.
+        :param date_from: Start of a custom range (inclusive), together with date_to.
+        :param date_to: End of a custom range (inclusive).
         """
         self.page = page
         self.per_page = per_page
+        self.restaurant_ids = restaurant_ids
+        self.month = month
+        self.date_from = date_from
+        self.date_to = date_to
 
     @property
     def offset(self) -> int:
@@ -23,11 +39,24 @@ class GetOccupancyPercentageRequestDto:
         """Number of records to fetch: per_page."""
         return self.per_page
 
+    @property
+    def period(self) -> tuple[date, date]:
+        """Days covered: the custom range, the whole month, or the current month up to today."""
+        if self.date_from is not None and self.date_to is not None:
+            return self.date_from, self.date_to
+        if self.month is not None:
+            last_day = calendar.monthrange(self.month.year, self.month.month)[1]
+            return self.month.replace(day=1), self.month.replace(day=last_day)
+        today = date.today()
+        return today.replace(day=1), today
+
     def __repr__(self):
         return (
             f"OcupacyRequestDTO("
             f"page={self.page!r}, "
             f"per_page={self.per_page!r}, "
             f"offset={self.offset!r}, "
-            f"limit={self.limit!r})"
+            f"limit={self.limit!r}, "
+            f"restaurant_ids={self.restaurant_ids!r}, "
+            f"period={self.period!r})"
         )
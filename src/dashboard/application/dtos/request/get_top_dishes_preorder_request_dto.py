@@ -2,11 +2,24 @@ from typing import Optional
 
 class GetTopDishesPreorderRequestDTO:
     """
-    DTO to obtain the most preordered dishes
+    DTO to obtain the most preordered dishes, overall or for one restaurant,
+    optionally limited to a TopDishesWindow. `exact` skips the in-memory estimate.
     """
 
-    def __init__(self, top_n: Optional[int] = 5):
+    def __init__(
+        self,
+        top_n: Optional[int] = 5,
+        restaurant_id: Optional[str] = None,
+        window: Optional[str] = None,
+        exact: bool = False
+    ):
         self.top_n = top_n
+        self.restaurant_id = restaurant_id
+        self.window = window
+        self.exact = exact
 
     def __repr__(self):
-        return f"DishPreorderRequestDTO(top_n={self.top_n!r})"
+        return (
+            f"DishPreorderRequestDTO(top_n={self.top_n!r}, restaurant_id={self.restaurant_id!r}, "
+            f"window={self.window!r}, exact={self.exact!r})"
+        )
@@ -0,0 +1,6 @@
+from enum import Enum
+
+class TopDishesWindow(Enum):
+    TODAY = "today"
+    WEEK  = "7d"
+    MONTH = "30d"
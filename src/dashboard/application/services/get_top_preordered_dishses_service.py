@@ -29,6 +29,6 @@ class GetTopPreorderedDishesService(
         )
         
         if dishes.is_error:
-            return Result.fail(dishes.fail)
+            return Result.fail(dishes.error)
 
         return Result.success(dishes.value)
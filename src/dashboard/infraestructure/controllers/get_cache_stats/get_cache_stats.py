@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi import FastAPI, Security, status
+
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.infrastructure import ResponseCache
+from src.dashboard.infraestructure.routers.dashboard_router import dashboard_router
+
+
+class GetDashboardCacheStatsController:
+    def __init__(self, app: FastAPI):
+        self.setup_routes()
+        app.include_router(dashboard_router)
+
+    def setup_routes(self):
+        @dashboard_router.get(
+            "/cache",
+            status_code=status.HTTP_200_OK,
+            summary="Get dashboard cache stats",
+            description="Hit ratio, refresh latency and counters of the dashboard response caches in this worker",
+            response_description="Stats per cache"
+        )
+        async def get_cache_stats(
+            token = Security(UserRoleVerify(), scopes=["admin:manage"])
+        ) -> dict[str, dict[str, Any]]:
+            return {
+                name: stats
+                for name, stats in ResponseCache.all_stats().items()
+                if name.startswith("dashboard.")
+            }
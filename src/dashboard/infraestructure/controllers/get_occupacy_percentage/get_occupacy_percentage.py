@@ -1,12 +1,11 @@
 from typing import List
 
 from fastapi import Depends, FastAPI, Security, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
 from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
-from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.infrastructure import ResponseCache, ResponseCacheDecorator
 
 
 from src.dashboard.application.services.get_occupacy_percentage_service import GetOccupancyPercentageService
@@ -17,16 +16,18 @@ from src.dashboard.infraestructure.routers.dashboard_router import dashboard_rou
 
 
 class GetOccupancyPercentageController:
+    # Compartida por todas las peticiones del proceso
+    cache: ResponseCache = ResponseCache("dashboard.occupancy")
+
     def __init__(self, app: FastAPI):
         self.setup_routes()
         app.include_router(dashboard_router)
 
-    async def get_query_service(
-        self,
-        session: AsyncSession = Depends(GetPostgresqlSession()),
-    ) -> GetOccupancyPercentageService:
-        repo = OrmDashboardQueryRepository(session)
-        return GetOccupancyPercentageService(dashboard_query_repository=repo)
+    async def get_query_service(self) -> ResponseCacheDecorator:
+        return ResponseCacheDecorator(
+            cache=self.cache,
+            service_factory=lambda session: GetOccupancyPercentageService(dashboard_query_repository=OrmDashboardQueryRepository(session))
+        )
 
     def setup_routes(self):
         @dashboard_router.get(
@@ -39,7 +40,7 @@ class GetOccupancyPercentageController:
         )
         async def get_occupancy(
             input_dto: GetOccupancyPercentageRequestInfDTO = Depends(),
-            service: GetOccupancyPercentageService = Depends(self.get_query_service),
+            service: ResponseCacheDecorator = Depends(self.get_query_service),
             token = Security(UserRoleVerify(), scopes=["admin:manage"])
         ):
             decorated = ExceptionDecorator(
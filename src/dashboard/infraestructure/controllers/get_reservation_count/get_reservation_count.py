@@ -1,10 +1,9 @@
 from fastapi import Depends, FastAPI, Security, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
 from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
-from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.infrastructure import ResponseCache, ResponseCacheDecorator
 
 from src.dashboard.application.services.get_reservation_count_service import GetReservationCountService
 from src.dashboard.infraestructure.dtos.request.get_reservation_count_request_inf_dto import (
@@ -18,16 +17,18 @@ from src.dashboard.infraestructure.routers.dashboard_router import dashboard_rou
 
 
 class GetReservationCountController:
+    # Compartida por todas las peticiones del proceso
+    cache: ResponseCache = ResponseCache("dashboard.reservation_count")
+
     def __init__(self, app: FastAPI):
         self.setup_routes()
         app.include_router(dashboard_router)
 
-    async def get_query_service(
-        self,
-        session: AsyncSession = Depends(GetPostgresqlSession()),
-    ) -> GetReservationCountService:
-        repo = OrmDashboardQueryRepository(session)
-        return GetReservationCountService(dashboard_query_repository=repo)
+    async def get_query_service(self) -> ResponseCacheDecorator:
+        return ResponseCacheDecorator(
+            cache=self.cache,
+            service_factory=lambda session: GetReservationCountService(dashboard_query_repository=OrmDashboardQueryRepository(session))
+        )
 
     def setup_routes(self):
         @dashboard_router.get(
@@ -40,7 +41,7 @@ class GetReservationCountController:
         )
         async def get_reservation_count(
             input_dto: GetReservationCountRequestInfDTO = Depends(),
-            service: GetReservationCountService = Depends(self.get_query_service),
+            service: ResponseCacheDecorator = Depends(self.get_query_service),
             token = Security(UserRoleVerify(), scopes=["admin:manage"])
         ):
             decorated = ExceptionDecorator(
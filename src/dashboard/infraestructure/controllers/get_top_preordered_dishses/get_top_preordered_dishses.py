@@ -1,12 +1,11 @@
 from typing import List
 
 from fastapi import Depends, FastAPI, Security, status
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
 from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
-from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.infrastructure import ResponseCache, ResponseCacheDecorator
 
 from src.dashboard.application.services.get_top_preordered_dishses_service import GetTopPreorderedDishesService
 from src.dashboard.infraestructure.dtos.request.get_top_dishes_preorder_request_dto import GetTopDishesPreorderRequestInfDTO
@@ -16,16 +15,18 @@ from src.dashboard.infraestructure.routers.dashboard_router import dashboard_rou
 
 
 class GetTopPreorderedDishesController:
+    # Compartida por todas las peticiones del proceso
+    cache: ResponseCache = ResponseCache("dashboard.top_dishes")
+
     def __init__(self, app: FastAPI):
         self.setup_routes()
         app.include_router(dashboard_router)
 
-    async def get_query_service(
-        self,
-        session: AsyncSession = Depends(GetPostgresqlSession()),
-    ) -> GetTopPreorderedDishesService:
-        repo = OrmDashboardQueryRepository(session)
-        return GetTopPreorderedDishesService(dashboard_query_repository=repo)
+    async def get_query_service(self) -> ResponseCacheDecorator:
+        return ResponseCacheDecorator(
+            cache=self.cache,
+            service_factory=lambda session: GetTopPreorderedDishesService(dashboard_query_repository=OrmDashboardQueryRepository(session))
+        )
 
     def setup_routes(self):
         @dashboard_router.get(
@@ -38,7 +39,7 @@ class GetTopPreorderedDishesController:
         )
         async def get_top_preordered_dishes(
             input_dto: GetTopDishesPreorderRequestInfDTO = Depends(),
-            service: GetTopPreorderedDishesService = Depends(self.get_query_service),
+            service: ResponseCacheDecorator = Depends(self.get_query_service),
             token = Security(UserRoleVerify(), scopes=["admin:manage"])
         ):
             app_dto = input_dto.to_dto()
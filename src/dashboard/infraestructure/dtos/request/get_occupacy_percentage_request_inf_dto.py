@@ -1,29 +1,76 @@
-from pydantic import BaseModel, Field
+from datetime import date
+from typing import Optional
 
+from fastapi import Query
+from pydantic import BaseModel
+
+from src.common.infrastructure.error_handler.query_validation_error import invalid_query
 from src.dashboard.application.dtos.request.get_occupacy_percentage_request_dto import GetOccupancyPercentageRequestDto
 
 
 class GetOccupancyPercentageRequestInfDTO(BaseModel):
     """
-    Infra DTO to parse pagination query params for occupancy endpoint.
+    Infra DTO to parse pagination, filter and period query params for occupancy endpoint.
     """
 
-    page: int = Field(
+    page: int = Query(
         1,
         ge=1,
         description="Page number (1-indexed)"
     )
-    per_page: int = Field(
+    per_page: int = Query(
         10,
         ge=1,
+        le=500,
         description="Number of items per page"
     )
+    restaurant_ids: Optional[str] = Query(
+        None,
+        description="Comma-separated restaurant ids to include (all by default)"
+    )
+    month: Optional[str] = Query(
+        None,
+        pattern=r"^\d{4}-(0[1-9]|1[0-2])$",
+        description="Month to report as YYYY-MM (current month to date by default)"
+    )
+    date_from: Optional[date] = Query(
+        None,
+        description="Start of a custom range (inclusive); requires date_to"
+    )
+    date_to: Optional[date] = Query(
+        None,
+        description="End of a custom range (inclusive); requires date_from"
+    )
+
+    def check_period(self) -> None:
+        """
+        Cross-field rules of the period; raised as 422 before the cached service runs.
+        """
+        if (self.date_from is None) != (self.date_to is None):
+            missing = "date_to" if self.date_to is None else "date_from"
+            raise invalid_query(missing, "date_from and date_to must be sent together", None)
+        if self.date_from is not None and self.month is not None:
+            raise invalid_query("month", "Use either month or date_from/date_to, not both", self.month)
+        if self.date_from is not None and self.date_from > self.date_to:
+            raise invalid_query("date_from", "date_from must not be after date_to", str(self.date_from))
 
     def to_dto(self) -> GetOccupancyPercentageRequestDto:
         """
         Convert infra DTO into application-layer DTO.
         """
+        self.check_period()
+        restaurant_ids = None
+        if self.restaurant_ids:
+            restaurant_ids = [r.strip() for r in self.restaurant_ids.split(",") if r.strip()]
+        month = None
+        if self.month is not None:
+            year, number = self.month.split("-")
+            month = date(int(year), int(number), 1)
         return GetOccupancyPercentageRequestDto(
             page=self.page,
-            per_page=self.per_page
+            per_page=self.per_page,
+            restaurant_ids=restaurant_ids,
+            month=month,
+            date_from=self.date_from,
+            date_to=self.date_to
         )
@@ -1,24 +1,45 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from src.dashboard.application.dtos.request.get_top_dishes_preorder_request_dto import (
     GetTopDishesPreorderRequestDTO,
 )
+from src.dashboard.application.enum.top_dishes_window import TopDishesWindow
 
 
 class GetTopDishesPreorderRequestInfDTO(BaseModel):
     """
-    Infrastructure DTO to parse the `top_n` query param 
+    Infrastructure DTO to parse the query params
     for the top pre-ordered dishes endpoint.
     """
 
     top_n: int = Field(
         5,
         ge=1,
+        le=100,
         description="Number of top pre-ordered dishes to retrieve"
     )
+    restaurant_id: Optional[str] = Field(
+        None,
+        description="Only count preorders of this restaurant"
+    )
+    window: Optional[TopDishesWindow] = Field(
+        None,
+        description="Reservation days to count: today, 7d or 30d (all history by default)"
+    )
+    exact: bool = Field(
+        False,
+        description="Compute exact counts in the database instead of the in-memory estimate"
+    )
 
     def to_dto(self) -> GetTopDishesPreorderRequestDTO:
         """
         Convert infra-layer DTO into application-layer DTO.
         """
-        return GetTopDishesPreorderRequestDTO(top_n=self.top_n)
+        return GetTopDishesPreorderRequestDTO(
+            top_n=self.top_n,
+            restaurant_id=self.restaurant_id,
+            window=self.window.value if self.window is not None else None,
+            exact=self.exact
+        )
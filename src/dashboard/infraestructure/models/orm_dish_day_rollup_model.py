@@ -0,0 +1,11 @@
+from datetime import date
+from sqlmodel import Field, SQLModel
+
+class OrmDishDayRollupModel(SQLModel, table=True):
+
+    __tablename__ = "dish_day_rollup" # type: ignore
+
+    restaurant_id: str = Field(nullable=False, primary_key=True)
+    day: date = Field(nullable=False, primary_key=True, index=True)
+    dish_id: str = Field(nullable=False, primary_key=True)
+    preorders: int = Field(nullable=False, default=0)
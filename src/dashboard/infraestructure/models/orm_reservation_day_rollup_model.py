@@ -0,0 +1,11 @@
+from datetime import date
+from sqlmodel import Field, SQLModel
+
+class OrmReservationDayRollupModel(SQLModel, table=True):
+
+    __tablename__ = "reservation_day_rollup" # type: ignore
+
+    restaurant_id: str = Field(nullable=False, primary_key=True)
+    day: date = Field(nullable=False, primary_key=True, index=True)
+    status: str = Field(nullable=False, primary_key=True)
+    reservations: int = Field(nullable=False, default=0)
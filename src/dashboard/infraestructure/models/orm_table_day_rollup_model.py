@@ -0,0 +1,12 @@
+from datetime import date
+from sqlmodel import Field, SQLModel
+
+class OrmTableDayRollupModel(SQLModel, table=True):
+
+    __tablename__ = "table_day_rollup" # type: ignore
+
+    restaurant_id: str = Field(nullable=False, primary_key=True)
+    day: date = Field(nullable=False, primary_key=True, index=True)
+    table_id: str = Field(nullable=False, primary_key=True)
+    # Reservas activas de la mesa ese dia; la mesa cuenta como ocupada mientras sea > 0
+    reservations: int = Field(nullable=False, default=0)
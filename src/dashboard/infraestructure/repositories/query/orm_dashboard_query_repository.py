@@ -1,7 +1,7 @@
 from datetime import date, timedelta
 from typing import List
 
-from sqlalchemy import select, func, case
+from sqlalchemy import select, func, case, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.common.infrastructure.infrastructure_exception.enum.infraestructure_exception_type import (
@@ -33,8 +33,10 @@ from src.dashboard.application.dtos.response.get_occupacy_percentage_response_dt
 from src.dashboard.application.repositories.query.dashboard_query_repository import (
     IDashboardQueryRepository,
 )
-from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
-from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.dashboard.infraestructure.top_dishes.top_dishes_tracker import TopDishesTracker
 from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
 from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
 from src.menu.infrastructure.models.menu_model import DishModel  # placeholder
@@ -42,7 +44,8 @@ from src.menu.infrastructure.models.menu_model import DishModel  # placeholder
 
 class OrmDashboardQueryRepository(IDashboardQueryRepository):
     """
-    SQLAlchemy implementation of dashboard queries.
+    SQLAlchemy implementation of dashboard queries. Reads only the per-day rollups kept by
+    ReservationRollups, so the cost does not grow with the reservation history.
     """
 
     def __init__(self, session: AsyncSession):
@@ -65,10 +68,10 @@ class OrmDashboardQueryRepository(IDashboardQueryRepository):
                 end_date   = today + timedelta(days=6)  
 
             stmt = (
-                select(func.count().label("cnt"))
+                select(func.coalesce(func.sum(OrmReservationDayRollupModel.reservations), 0).label("cnt"))
                 .where(
-                    OrmReservationModel.reservation_date >= start_date,
-                    OrmReservationModel.reservation_date <= end_date,
+                    OrmReservationDayRollupModel.day >= start_date,
+                    OrmReservationDayRollupModel.day <= end_date,
                 )
             )
             result = await self.session.execute(stmt)
@@ -89,22 +92,33 @@ class OrmDashboardQueryRepository(IDashboardQueryRepository):
         self, dto: GetTopDishesPreorderRequestDTO
     ) -> Result[list[GetTopDishesPreorderResponseDTO]]:
         try:
+            # Por defecto responde desde memoria; exact (o un tracker sin cargar) va a la BD
+            if not dto.exact and TopDishesTracker.is_loaded():
+                return Result.success(await self._top_dishes_from_tracker(dto))
+
             stmt = (
                 select(
                     DishModel.id.label("dish_id"),
                     DishModel.name.label("dish_name"),
-                    func.count(OrmReservationDishModel.dish_id)
+                    func.sum(OrmDishDayRollupModel.preorders)
                         .label("total_preorders"),
                 )
-                # 1) Arrancamos de la tabla de asociación:
-                .select_from(OrmReservationDishModel)
+                # 1) Arrancamos del rollup diario de pre-ordenes:
+                .select_from(OrmDishDayRollupModel)
                 # 2) Unimos al modelo de platos para nombre e id
-                .join(DishModel, DishModel.id == OrmReservationDishModel.dish_id)
+                .join(DishModel, DishModel.id == OrmDishDayRollupModel.dish_id)
                 # 3) Agrupamos y ordenamos
                 .group_by(DishModel.id, DishModel.name)
-                .order_by(func.count(OrmReservationDishModel.dish_id).desc())
+                .having(func.sum(OrmDishDayRollupModel.preorders) > 0)
+                .order_by(func.sum(OrmDishDayRollupModel.preorders).desc(), DishModel.id.desc())
                 .limit(dto.top_n)
             )
+            if dto.restaurant_id is not None:
+                stmt = stmt.where(OrmDishDayRollupModel.restaurant_id == dto.restaurant_id)
+            if dto.window is not None:
+                today = date.today()
+                first_day = today - timedelta(days=TopDishesTracker.WINDOW_DAYS[dto.window] - 1)
+                stmt = stmt.where(OrmDishDayRollupModel.day.between(first_day, today))
 
             result = await self.session.execute(stmt)
             rows = result.all()
@@ -126,71 +140,91 @@ class OrmDashboardQueryRepository(IDashboardQueryRepository):
                 )
             )
 
-    # Asume que existe un modelo como este para los restaurantes
-    # from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+    async def _top_dishes_from_tracker(
+        self, dto: GetTopDishesPreorderRequestDTO
+    ) -> list[GetTopDishesPreorderResponseDTO]:
+        ranked = TopDishesTracker.top(dto.top_n, dto.restaurant_id, dto.window)
+        if not ranked:
+            return []
+        # Solo los nombres de los top_n, por clave primaria; los platos borrados se omiten
+        names = dict((await self.session.execute(
+            select(DishModel.id, DishModel.name).where(DishModel.id.in_([dish_id for dish_id, _ in ranked]))
+        )).all())
+        return [
+            GetTopDishesPreorderResponseDTO(dish_id=dish_id, dish_name=names[dish_id], total_preorders=count)
+            for dish_id, count in ranked
+            if dish_id in names
+        ]
 
     async def get_occupancy_percentage_by_restaurant(
         self, dto: GetOccupancyPercentageRequestDto
     ) -> Result[List[GetOccupancyPercentageResponseDto]]:
         """
-        Calculates occupancy percent per restaurant for the current month.
+        Calculates occupancy percent per restaurant for the requested period in a single
+        statement: the page of restaurants is chosen first and only its tables and rollup
+        rows are aggregated.
         """
         try:
-            today = date.today()
-            first_of_month = today.replace(day=1)
+            start_date, end_date = dto.period
+
+            # CTE: the requested page of restaurants that have tables, with their names
+            page_query = (
+                select(OrmRestaurantModel.id, OrmRestaurantModel.name)
+                .where(exists().where(OrmTableModel.restaurant_id == OrmRestaurantModel.id))
+            )
+            if dto.restaurant_ids is not None:
+                page_query = page_query.where(OrmRestaurantModel.id.in_(dto.restaurant_ids))
+            page = (
+                page_query
+                .order_by(OrmRestaurantModel.name, OrmRestaurantModel.id)
+                .offset(dto.offset)
+                .limit(dto.limit)
+                .cte("page")
+            )
+            page_ids = select(page.c.id)
 
-            # Subquery: total tables and name per restaurant
-            # Se une con la tabla de restaurantes para obtener el nombre directamente
+            # Subquery: total tables per restaurant of the page
             tables_subq = (
                 select(
                     OrmTableModel.restaurant_id.label("id"),
-                    # Asumiendo que OrmRestaurantModel existe y tiene un campo 'name'
-                    # OrmRestaurantModel.name.label("restaurant_name"),
                     func.count().label("total_tables"),
                 )
-                # .join(
-                #     OrmRestaurantModel,
-                #     OrmTableModel.restaurant_id == OrmRestaurantModel.id,
-                # )
-                .group_by(
-                    OrmTableModel.restaurant_id,
-                    # OrmRestaurantModel.name
-                )
+                .where(OrmTableModel.restaurant_id.in_(page_ids))
+                .group_by(OrmTableModel.restaurant_id)
                 .subquery()
             )
 
-            # Subquery: distinct occupied tables (via reservations) per restaurant
+            # Subquery: distinct tables with an active reservation in the period, from the rollup
             occ_subq = (
                 select(
-                    OrmReservationModel.restaurant_id.label("id"),
-                    func.count(func.distinct(OrmReservationModel.table_number_id)).label(
+                    OrmTableDayRollupModel.restaurant_id.label("id"),
+                    func.count(func.distinct(OrmTableDayRollupModel.table_id)).label(
                         "occupied_tables"
                     ),
                 )
                 .where(
-                    OrmReservationModel.reservation_date.between(first_of_month, today)
+                    OrmTableDayRollupModel.restaurant_id.in_(page_ids),
+                    OrmTableDayRollupModel.day.between(start_date, end_date),
+                    OrmTableDayRollupModel.reservations > 0,
                 )
-                .group_by(OrmReservationModel.restaurant_id)
+                .group_by(OrmTableDayRollupModel.restaurant_id)
                 .subquery()
             )
-            
-            print(f"offset: {dto.offset}")
 
-            # Join restaurants + aggregates
             stmt = (
                 select(
-                    tables_subq.c.id,
-                    # tables_subq.c.restaurant_name,
+                    page.c.id,
+                    page.c.name,
                     tables_subq.c.total_tables,
                     func.coalesce(occ_subq.c.occupied_tables, 0).label("occupied_tables"),
                 )
+                .join(tables_subq, tables_subq.c.id == page.c.id)
                 .join(
                     occ_subq,
-                    tables_subq.c.id == occ_subq.c.id,
+                    occ_subq.c.id == page.c.id,
                     isouter=True,  # Outer join para incluir restaurantes sin reservaciones
                 )
-                .offset(dto.offset)
-                .limit(dto.limit)
+                .order_by(page.c.name, page.c.id)
             )
             result = await self.session.execute(stmt)
             rows = result.all()
@@ -202,21 +236,10 @@ class OrmDashboardQueryRepository(IDashboardQueryRepository):
                     if row.total_tables > 0
                     else 0.0
                 )
-                
-                # En lugar de OrmReservationModel, usa OrmRestaurantModel:
-                name_stmt = (
-                    select(OrmRestaurantModel.name)           # columna "name" de restaurants
-                    .where(OrmRestaurantModel.id == row.id)   # empareja por su PK
-                    .limit(1)
-                )
-                name_res = await self.session.execute(name_stmt)
-                restaurant_name = name_res.scalar_one_or_none() or "Nombre no encontrado"
-
-
                 response.append(
                     GetOccupancyPercentageResponseDto(
                         restaurant_id=row.id,
-                        restaurant_name=restaurant_name, # Usamos el nombre de la consulta principal
+                        restaurant_name=row.name,
                         occupied_tables=row.occupied_tables,
                         total_tables=row.total_tables,
                         occupancy_percent=round(percent, 2), # Redondear el porcentaje es una buena práctica
@@ -226,8 +249,6 @@ class OrmDashboardQueryRepository(IDashboardQueryRepository):
             return Result.success(response)
 
         except Exception as e:
-            # Es útil imprimir el error para depurar
-            print(f"Error en el repositorio: {e}")
             return Result.fail(
-                InfrastructureException(str(e), infra_type=ExceptionInfrastructureType.BAD_REQUEST) # Cambiado a UNKNOWN para ser más genérico
+                InfrastructureException(str(e), infra_type=ExceptionInfrastructureType.BAD_REQUEST)
             )
@@ -0,0 +1,23 @@
+"""
+Rellena (o recalcula) los rollups del dashboard desde el historial de reservas.
+
+    python -m src.dashboard.infraestructure.rollups.rebuild_rollups
+"""
+import asyncio
+from src.common.infrastructure import PostgresDatabase
+from src.dashboard.infraestructure.rollups.reservation_rollups import ReservationRollups
+# Fuera de la app nadie mas registra estos modelos en el metadata
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel  # noqa: F401
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel  # noqa: F401
+
+async def main() -> None:
+    database = PostgresDatabase()
+    await database.create_db_and_tables()
+    async with database.get_session() as session:
+        rows = await ReservationRollups.rebuild(session)
+        await session.commit()
+    print(f"Rollups reconstruidos: {rows}")
+    await PostgresDatabase._engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+from collections import Counter
+from typing import Iterable
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+
+class ReservationRollups:
+    """
+    Agregados por restaurante y dia que leen los dashboards: reservas por estado, reservas no
+    canceladas por mesa (la mesa esta ocupada mientras sea > 0) y pre-ordenes por plato.
+    OrmReservationCommandRepository los actualiza en la misma transaccion que crea o cambia
+    el estado de la reserva, con upserts que suman deltas y no pisan escrituras concurrentes.
+    """
+
+    UPSERT_BATCH = 1000
+
+    @classmethod
+    async def record_created(cls, session: AsyncSession, reservation: OrmReservationModel, dish_ids: Iterable[str]) -> None:
+        row = {
+            "id": reservation.id,
+            "restaurant_id": reservation.restaurant_id,
+            "reservation_date": reservation.reservation_date,
+            "status": reservation.status,
+            "table_number_id": reservation.table_number_id
+        }
+        await cls.record_created_many(session, [row], [{"reservation_id": reservation.id, "dish_id": dish_id} for dish_id in dish_ids])
+
+    @classmethod
+    async def record_created_many(cls, session: AsyncSession, rows: list[dict], dish_rows: list[dict]) -> None:
+        """
+        rows y dish_rows son las filas insertadas en reservation y reservation_dishes; se suman
+        antes de escribir para que cada clave reciba un solo upsert.
+        """
+        statuses = Counter((r["restaurant_id"], r["reservation_date"], r["status"]) for r in rows)
+        tables = Counter(
+            (r["restaurant_id"], r["reservation_date"], r["table_number_id"])
+            for r in rows if r["status"] in ReservationStatusVo.ESTADOS_OCUPAN_MESA
+        )
+        by_id = {r["id"]: r for r in rows}
+        dishes = Counter(
+            (by_id[d["reservation_id"]]["restaurant_id"], by_id[d["reservation_id"]]["reservation_date"], d["dish_id"])
+            for d in dish_rows
+        )
+
+        await cls._increment(session, OrmReservationDayRollupModel, "reservations", [
+            {"restaurant_id": restaurant_id, "day": day, "status": status, "reservations": count}
+            for (restaurant_id, day, status), count in statuses.items()
+        ])
+        await cls._increment(session, OrmTableDayRollupModel, "reservations", [
+            {"restaurant_id": restaurant_id, "day": day, "table_id": table_id, "reservations": count}
+            for (restaurant_id, day, table_id), count in tables.items()
+        ])
+        await cls._increment(session, OrmDishDayRollupModel, "preorders", [
+            {"restaurant_id": restaurant_id, "day": day, "dish_id": dish_id, "preorders": count}
+            for (restaurant_id, day, dish_id), count in dishes.items()
+        ])
+
+    @classmethod
+    async def record_status_change(cls, session: AsyncSession, reservation: OrmReservationModel, previous_status: str) -> None:
+        row = {
+            "restaurant_id": reservation.restaurant_id,
+            "reservation_date": reservation.reservation_date,
+            "table_number_id": reservation.table_number_id
+        }
+        await cls.record_status_change_many(session, [row], previous_status, reservation.status)
+
+    @classmethod
+    async def record_status_change_many(cls, session: AsyncSession, rows: list[dict], previous_status: str, status: str) -> None:
+        """
+        rows son reservas que pasaron de previous_status a status, con restaurant_id,
+        reservation_date y table_number_id.
+        """
+        if previous_status == status or not rows:
+            return
+        days = Counter((r["restaurant_id"], r["reservation_date"]) for r in rows)
+        await cls._increment(session, OrmReservationDayRollupModel, "reservations", [
+            {"restaurant_id": restaurant_id, "day": day, "status": s, "reservations": delta * count}
+            for (restaurant_id, day), count in days.items()
+            for s, delta in ((previous_status, -1), (status, 1))
+        ])
+
+        # Completar o marcar no presentada no cambia la ocupacion del dia; cancelar si
+        was_occupying = previous_status in ReservationStatusVo.ESTADOS_OCUPAN_MESA
+        is_occupying = status in ReservationStatusVo.ESTADOS_OCUPAN_MESA
+        if was_occupying != is_occupying:
+            tables = Counter((r["restaurant_id"], r["reservation_date"], r["table_number_id"]) for r in rows)
+            await cls._increment(session, OrmTableDayRollupModel, "reservations", [
+                {"restaurant_id": restaurant_id, "day": day, "table_id": table_id, "reservations": count if is_occupying else -count}
+                for (restaurant_id, day, table_id), count in tables.items()
+            ])
+
+    @classmethod
+    async def rebuild(cls, session: AsyncSession) -> dict[str, int]:
+        """
+        Vacia y recalcula los rollups desde el historial. En Postgres bloquea las escrituras de
+        reservas hasta el commit para que ninguna quede fuera del recalculo.
+        """
+        if session.get_bind().dialect.name == "postgresql":
+            await session.execute(text("LOCK TABLE reservation IN SHARE MODE"))
+
+        reservation = OrmReservationModel
+        for model in (OrmReservationDayRollupModel, OrmTableDayRollupModel, OrmDishDayRollupModel):
+            await session.execute(delete(model))
+
+        statuses = await session.execute(insert(OrmReservationDayRollupModel).from_select(
+            ["restaurant_id", "day", "status", "reservations"],
+            select(reservation.restaurant_id, reservation.reservation_date, reservation.status, func.count())
+            .group_by(reservation.restaurant_id, reservation.reservation_date, reservation.status)
+        ))
+        tables = await session.execute(insert(OrmTableDayRollupModel).from_select(
+            ["restaurant_id", "day", "table_id", "reservations"],
+            select(reservation.restaurant_id, reservation.reservation_date, reservation.table_number_id, func.count())
+            .where(reservation.status.in_(ReservationStatusVo.ESTADOS_OCUPAN_MESA))
+            .group_by(reservation.restaurant_id, reservation.reservation_date, reservation.table_number_id)
+        ))
+        dishes = await session.execute(insert(OrmDishDayRollupModel).from_select(
+            ["restaurant_id", "day", "dish_id", "preorders"],
+            select(reservation.restaurant_id, reservation.reservation_date, OrmReservationDishModel.dish_id, func.count())
+            .join(OrmReservationDishModel, OrmReservationDishModel.reservation_id == reservation.id)
+            .group_by(reservation.restaurant_id, reservation.reservation_date, OrmReservationDishModel.dish_id)
+        ))
+        return {"status_rows": statuses.rowcount, "table_rows": tables.rowcount, "dish_rows": dishes.rowcount}
+
+    @classmethod
+    async def _increment(cls, session: AsyncSession, model, column: str, rows: list[dict]) -> None:
+        # INSERT ... ON CONFLICT DO UPDATE column = column + delta (Postgres y SQLite)
+        table = model.__table__
+        dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+        # Por tandas: asyncpg admite hasta 32767 parametros por sentencia
+        for start in range(0, len(rows), cls.UPSERT_BATCH):
+            stmt = dialect.insert(table).values(rows[start:start + cls.UPSERT_BATCH])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in table.primary_key],
+                set_={column: table.c[column] + stmt.excluded[column]}
+            )
+            await session.execute(stmt)
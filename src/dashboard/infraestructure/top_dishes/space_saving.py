@@ -0,0 +1,65 @@
+import heapq
+from collections import Counter
+from typing import Iterable
+
+class SpaceSaving:
+    """
+    Resumen Space-Saving (Metwally et al.): guarda como mucho `capacity` contadores. Al llegar un
+    elemento nuevo con el resumen lleno reemplaza al minimo y hereda su cuenta como error, asi que
+    toda cuenta sobreestima la real en a lo sumo `error` y cualquier elemento con frecuencia mayor
+    que el minimo esta garantizado en el resumen.
+    """
+
+    __slots__ = ("capacity", "_counts", "_errors", "_heap")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        # Min-heap con entradas perezosas: las obsoletas se descartan al sacar el minimo
+        self._heap: list[tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, item: str, count: int = 1) -> None:
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+            self._errors[item] = 0
+        else:
+            victim, floor = self._pop_min()
+            del counts[victim]
+            del self._errors[victim]
+            counts[item] = floor + count
+            self._errors[item] = floor
+
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i) for i, c in counts.items()]
+            heapq.heapify(self._heap)
+
+    def counts(self) -> dict[str, int]:
+        return self._counts
+
+    def error(self, item: str) -> int:
+        return self._errors.get(item, 0)
+
+    def top(self, n: int) -> list[tuple[str, int]]:
+        return heapq.nlargest(n, self._counts.items(), key=lambda entry: (entry[1], entry[0]))
+
+    @staticmethod
+    def merge(summaries: Iterable["SpaceSaving"], n: int) -> list[tuple[str, int]]:
+        # Las cuentas de varios resumenes se suman; el error de cada una tambien
+        totals: Counter[str] = Counter()
+        for summary in summaries:
+            totals.update(summary._counts)
+        return heapq.nlargest(n, totals.items(), key=lambda entry: (entry[1], entry[0]))
+
+    def _pop_min(self) -> tuple[str, int]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return item, count
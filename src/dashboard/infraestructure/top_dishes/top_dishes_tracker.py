@@ -0,0 +1,140 @@
+from datetime import date, timedelta
+from typing import Iterable, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import InvalidationBus
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel
+from src.dashboard.infraestructure.top_dishes.space_saving import SpaceSaving
+
+Scope = Optional[str]
+
+class TopDishesTracker:
+    """
+    Platos mas pre-ordenados en memoria: un resumen Space-Saving global y uno por restaurante,
+    historicos y por dia de reserva (los ultimos MAX_DAYS) para las ventanas de hoy, 7 y 30 dias.
+    OrmReservationCommandRepository publica cada pre-orden en InvalidationBus, asi que los
+    resumenes se alimentan solo tras el commit, en este worker y en los demas. Se reconstruyen
+    desde dish_day_rollup al arrancar y al reconectar el listener; las cuentas son estimaciones
+    (exactas mientras haya menos platos que CAPACITY).
+    """
+
+    TOPIC = "dish_preorders"
+    CAPACITY = 128
+    MAX_DAYS = 30
+    WINDOW_DAYS = {"today": 1, "7d": 7, "30d": 30}
+
+    _all: dict[Scope, SpaceSaving] = {}
+    _days: dict[Scope, dict[date, SpaceSaving]] = {}
+    _loaded: bool = False
+    _stats: dict[str, int] = {"recorded": 0, "reads": 0, "rebuilds": 0}
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._all = {}
+        cls._days = {}
+        cls._loaded = False
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        return cls._loaded
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        return {
+            **cls._stats,
+            "scopes": len(cls._all),
+            "day_summaries": sum(len(days) for days in cls._days.values()),
+            "counters": sum(len(s) for s in cls._all.values()) + sum(len(s) for days in cls._days.values() for s in days.values())
+        }
+
+    @staticmethod
+    def key(restaurant_id: str, day: date, dish_ids: Iterable[str]) -> str:
+        return f"{restaurant_id}|{day.isoformat()}|{','.join(dish_ids)}"
+
+    @classmethod
+    def receive(cls, key: Optional[str]) -> None:
+        # None llega al reconectar: la reconstruccion la hace el resync registrado en main
+        if key is None:
+            return
+        restaurant_id, day, dish_ids = key.split("|", 2)
+        cls.record(restaurant_id, date.fromisoformat(day), [d for d in dish_ids.split(",") if d])
+
+    @classmethod
+    def record(cls, restaurant_id: str, day: date, dish_ids: Iterable[str], count: int = 1) -> None:
+        for scope in (None, restaurant_id):
+            overall = cls._all.setdefault(scope, SpaceSaving(cls.CAPACITY))
+            daily = cls._day(scope, day)
+            for dish_id in dish_ids:
+                overall.add(dish_id, count)
+                if daily is not None:
+                    daily.add(dish_id, count)
+        cls._stats["recorded"] += 1
+
+    @classmethod
+    def top(cls, n: int, restaurant_id: Scope = None, window: Optional[str] = None) -> list[tuple[str, int]]:
+        cls._stats["reads"] += 1
+        if window is None:
+            summary = cls._all.get(restaurant_id)
+            return summary.top(n) if summary is not None else []
+
+        today = date.today()
+        first = today - timedelta(days=cls.WINDOW_DAYS[window] - 1)
+        days = cls._days.get(restaurant_id, {})
+        return SpaceSaving.merge((s for d, s in days.items() if first <= d <= today), n)
+
+    @classmethod
+    async def rebuild(cls, session: AsyncSession) -> None:
+        """
+        Recalcula los resumenes desde el rollup diario: los totales historicos por plato y las
+        filas de los ultimos MAX_DAYS. Se cargan de mayor a menor para que el top salga exacto.
+        """
+        rollup = OrmDishDayRollupModel
+        preorders = func.sum(rollup.preorders).label("preorders")
+        overall = await session.execute(
+            select(rollup.restaurant_id, rollup.dish_id, preorders)
+            .group_by(rollup.restaurant_id, rollup.dish_id)
+            .order_by(preorders.desc())
+        )
+        recent = await session.execute(
+            select(rollup.restaurant_id, rollup.day, rollup.dish_id, rollup.preorders)
+            .where(rollup.day >= date.today() - timedelta(days=cls.MAX_DAYS - 1), rollup.preorders > 0)
+            .order_by(rollup.preorders.desc())
+        )
+
+        all_summaries: dict[Scope, SpaceSaving] = {None: SpaceSaving(cls.CAPACITY)}
+        global_totals: dict[str, int] = {}
+        for row in overall.all():
+            if row.preorders <= 0:
+                continue
+            all_summaries.setdefault(row.restaurant_id, SpaceSaving(cls.CAPACITY)).add(row.dish_id, row.preorders)
+            global_totals[row.dish_id] = global_totals.get(row.dish_id, 0) + row.preorders
+        for dish_id, count in sorted(global_totals.items(), key=lambda entry: entry[1], reverse=True):
+            all_summaries[None].add(dish_id, count)
+
+        cls._all = all_summaries
+        cls._days = {}
+        for row in recent.all():
+            for scope in (None, row.restaurant_id):
+                daily = cls._day(scope, row.day)
+                if daily is not None:
+                    daily.add(row.dish_id, row.preorders)
+        cls._loaded = True
+        cls._stats["rebuilds"] += 1
+
+    @classmethod
+    def _day(cls, scope: Scope, day: date) -> Optional[SpaceSaving]:
+        days = cls._days.setdefault(scope, {})
+        summary = days.get(day)
+        if summary is None:
+            oldest = date.today() - timedelta(days=cls.MAX_DAYS - 1)
+            if day < oldest:
+                return None
+            # Al abrir un dia nuevo se descartan los que ya salieron de la ultima ventana
+            for stale in [d for d in days if d < oldest]:
+                del days[stale]
+            summary = days[day] = SpaceSaving(cls.CAPACITY)
+        return summary
+
+InvalidationBus.subscribe(TopDishesTracker.TOPIC, TopDishesTracker.receive)
@@ -1,18 +1,34 @@
 from fastapi import FastAPI
 from src.common.infrastructure import CorsConfig
 from src.common.infrastructure import PostgresDatabase
+from src.common.infrastructure import RequestSessionMiddleware
+from src.common.infrastructure import RevocationFilter
+from src.common.infrastructure import InvalidationBus, PostgresInvalidationListener
+import asyncio
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
 from contextlib import asynccontextmanager
+import contextlib
 from src.auth.infrastructure.controllers.register.user_register import UserRegisterController
 from src.auth.infrastructure.controllers.login.user_login import UserLoginController
 from src.auth.infrastructure.controllers.update.user_update import UserUpdateController
+from src.auth.infrastructure.controllers.refresh.refresh_token import RefreshTokenController
+from src.auth.infrastructure.repositories.query.orm_refresh_token_query_repository import OrmRefreshTokenQueryRepository
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import RestaurantCatalogSnapshot
+from src.reservation.infraestructure.lifecycle.reservation_lifecycle_sweeper import ReservationLifecycleSweeper
+from src.dashboard.infraestructure.top_dishes.top_dishes_tracker import TopDishesTracker
 from src.dashboard.infraestructure.controllers.get_occupacy_percentage.get_occupacy_percentage import GetOccupancyPercentageController
 from src.dashboard.infraestructure.controllers.get_reservation_count.get_reservation_count import GetReservationCountController
 from src.dashboard.infraestructure.controllers.get_top_preordered_dishses.get_top_preordered_dishses import GetTopPreorderedDishesController
+from src.dashboard.infraestructure.controllers.get_cache_stats.get_cache_stats import GetDashboardCacheStatsController
 from src.reservation.infraestructure.controllers.admin_cancel_reservation import AdminCancelReservationController
+from src.reservation.infraestructure.controllers.bulk_cancel_reservations import BulkCancelReservationsController
+from src.reservation.infraestructure.controllers.bulk_create_reservation import BulkCreateReservationController
 from src.reservation.infraestructure.controllers.cancel_reservation import CancelReservationController
 from src.reservation.infraestructure.controllers.create_reservation import CreateReservationController
 from src.reservation.infraestructure.controllers.find_active_reservation_by_client import FindActiveReservationController
 from src.reservation.infraestructure.controllers.find_reservation import FindReservationController
+from src.reservation.infraestructure.controllers.export_reservations import ExportReservationsController
+from src.reservation.infraestructure.controllers.search_free_tables import SearchFreeTablesController
 from src.restaurant.infraestructure.controllers.create_restaurant.create_restaurant import CreateRestaurantController
 from src.restaurant.infraestructure.controllers.create_table.create_table import CreateTableController
 from src.restaurant.infraestructure.controllers.delete_restaurant_by_id.delete_restaurant_by_id import DeleteRestaurantByIdController
@@ -26,10 +42,25 @@ from src.menu.infrastructure.controllers.add_dish_to_menu.add_dish_to_menu impor
 from src.menu.infrastructure.controllers.get_dishes_by_restaurant.get_dishes_by_restaurant import GetDishesByRestaurantController
 from src.menu.infrastructure.controllers.remove_dish_from_menu.remove_dish_from_menu import RemoveDishFromMenuController
 from src.menu.infrastructure.controllers.update_dish_in_menu.update_dish_in_menu import UpdateDishInMenuController
+from src.menu.infrastructure.controllers.search_dishes.search_dishes import SearchDishesController
 
 faulthandler.enable()           # colócalo en tu módulo principal, p.ej. src/main.py
 
 
+async def load_revoked_sessions() -> None:
+    # Sesiones revocadas cuyos access tokens siguen vigentes
+    async with PostgresDatabase().get_session() as session:
+        revoked = await OrmRefreshTokenQueryRepository(session).get_revoked_sessions()
+        if revoked.is_error:
+            raise RuntimeError(str(revoked.error))
+        RevocationFilter.load(revoked.value)
+
+
+async def rebuild_top_dishes() -> None:
+    async with PostgresDatabase().get_session() as session:
+        await TopDishesTracker.rebuild(session)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Esta llamada asegura que el _engine y _async_session_factory se inicialicen
@@ -39,8 +70,33 @@ async def lifespan(app: FastAPI):
     initial_db_instance = PostgresDatabase()
     await initial_db_instance.create_db_and_tables()
     print("Base de datos y tablas creadas.")
+
+    # Invalidaciones de los demas workers; al reconectar se vacian las caches y se recargan las revocaciones
+    listener_task = None
+    if PostgresDatabase._url is not None and PostgresDatabase._url.startswith("postgresql"):
+        InvalidationBus.on_resync(load_revoked_sessions)
+        InvalidationBus.on_resync(rebuild_top_dishes)
+        listener_task = asyncio.create_task(PostgresInvalidationListener(PostgresDatabase._url).run())
+
+    await load_revoked_sessions()
+
+    async with initial_db_instance.get_session() as session:
+        await RestaurantCatalogSnapshot.warm(session)
+        print(f"Catalogo de restaurantes cargado: {RestaurantCatalogSnapshot.stats()}")
+
+    await rebuild_top_dishes()
+    print(f"Top de platos cargado: {TopDishesTracker.stats()}")
+
+    # Cierra las reservas vencidas; con varios workers solo barre el que tiene el advisory lock
+    sweeper_task = asyncio.create_task(ReservationLifecycleSweeper(PostgresDatabase._engine).run())
     
     yield
+    for task in (listener_task, sweeper_task):
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    PooledBcryptEncryptor.shutdown()
     if PostgresDatabase._engine:
         await PostgresDatabase._engine.dispose()
         print("Motor de base de datos dispuesto en el shutdown de la app.")
@@ -48,6 +104,7 @@ async def lifespan(app: FastAPI):
 app = FastAPI(lifespan=lifespan)
 
 CorsConfig.setup_cors(app)
+app.add_middleware(RequestSessionMiddleware)
 
 @app.get("/")
 def root():
@@ -57,6 +114,7 @@ def root():
 UserRegisterController(app)
 UserUpdateController(app)
 UserLoginController(app)
+RefreshTokenController(app)
 
 # Restaurants Controllers
 CreateRestaurantController(app)
@@ -64,10 +122,14 @@ GetAllRestaurantController(app)
 
 # Reservation Controllers
 CreateReservationController(app)
+BulkCreateReservationController(app)
 CancelReservationController(app)
 FindActiveReservationController(app)
 FindReservationController(app)
+ExportReservationsController(app)
 AdminCancelReservationController(app)
+BulkCancelReservationsController(app)
+SearchFreeTablesController(app)
 
 # Restaurnat
 GetRestaurantByIdController(app)
@@ -84,8 +146,10 @@ AddDishToMenuController(app)
 GetDishesByRestaurantController(app)
 RemoveDishFromMenuController(app)
 UpdateDishInMenuController(app)
+SearchDishesController(app)
 
 # Dashboard Controllers
 GetOccupancyPercentageController(app)
 GetReservationCountController(app)
 GetTopPreorderedDishesController(app)
+GetDashboardCacheStatsController(app)
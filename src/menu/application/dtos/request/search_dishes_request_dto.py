@@ -0,0 +1,25 @@
+from typing import Optional
+
+class SearchDishesRequestDto:
+    """
+    Texto y filtros de la busqueda de platos. La pagina sigue al ultimo plato visto
+    (after = (rank, id)), en orden de rank descendente y luego por id.
+    """
+
+    def __init__(
+            self,
+            text: str,
+            limit: int = 20,
+            after: Optional[tuple[float, str]] = None,
+            restaurant_id: Optional[str] = None,
+            min_price: Optional[float] = None,
+            max_price: Optional[float] = None,
+            only_available: bool = True
+            ) -> None:
+        self.text = text
+        self.limit = limit
+        self.after = after
+        self.restaurant_id = restaurant_id
+        self.min_price = min_price
+        self.max_price = max_price
+        self.only_available = only_available
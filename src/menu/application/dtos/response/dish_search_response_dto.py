@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class DishSearchHitDto(BaseModel):
+    id: str
+    restaurant_id: str
+    name: str
+    description: str
+    price: float
+    category: str
+    image: str | None = None
+    is_available: bool
+    rank: float
+
+class DishSearchResponseDto(BaseModel):
+    dishes: List[DishSearchHitDto]
+    next_after: Optional[tuple[float, str]] = None
@@ -13,3 +13,24 @@ class MenuQueryRepository(ABC):
     @abstractmethod
     async def find_by_dish_id(self, dish_id_vo: DishIdVo) -> Optional[Menu]:
         pass
+
+    @abstractmethod
+    async def valid_dish_ids(self, restaurant_id: RestaurantIdVo, dish_ids: list[str]) -> frozenset[str]:
+        """
+        Los de dish_ids que estan en el menu del restaurante y disponibles.
+        """
+        pass
+
+    @abstractmethod
+    async def exists_preorders(self, dish_id: DishIdVo, only_future: bool = True) -> bool:
+        """
+        Si el plato esta pre-ordenado en alguna reserva activa (por defecto, de hoy en adelante).
+        """
+        pass
+
+    @abstractmethod
+    async def exists_preorders_many(self, dish_ids: list[str], only_future: bool = True) -> frozenset[str]:
+        """
+        Los de dish_ids con pre-ordenes en reservas activas, en una consulta.
+        """
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from src.common.utils import Result
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.application.dtos.response.dish_search_response_dto import DishSearchHitDto
+
+class IDishSearch(ABC):
+    """
+    Busqueda de texto libre y aproximada sobre los platos de todos los menus.
+    """
+
+    @abstractmethod
+    async def search(self, request: SearchDishesRequestDto, limit: int) -> Result[list[DishSearchHitDto]]:
+        """
+        Hasta limit platos tras request.after, de mayor a menor rank y luego por id.
+        """
+        pass
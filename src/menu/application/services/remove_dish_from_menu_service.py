@@ -16,8 +16,8 @@ class RemoveDishFromMenuService(IService[str, None]):
         if not menu:
             return Result.fail(ApplicationException("Menu not found for the given dish"))
 
-        # This is a simulation, in a real scenario we would check for pre-orders
-        has_preorders = False
+        # Con pre-ordenes pendientes el plato solo se marca como no disponible
+        has_preorders = await self.menu_query_repository.exists_preorders(dish_id_vo)
 
         menu.remove_dish(value, has_preorders)
         await self.menu_command_repository.update(menu)
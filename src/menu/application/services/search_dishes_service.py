@@ -0,0 +1,24 @@
+from src.common.application import IService
+from src.common.utils import Result
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.application.dtos.response.dish_search_response_dto import DishSearchResponseDto
+from src.menu.application.search.dish_search import IDishSearch
+
+class SearchDishesService(IService[SearchDishesRequestDto, DishSearchResponseDto]):
+
+    def __init__(self, dish_search: IDishSearch):
+        super().__init__()
+        self.dish_search = dish_search
+
+    async def execute(self, value: SearchDishesRequestDto) -> Result[DishSearchResponseDto]:
+        # Una fila de mas indica si hay otra pagina sin contar el total
+        found = await self.dish_search.search(value, value.limit + 1)
+        if found.is_error:
+            return Result.fail(found.error)
+
+        dishes = found.value[:value.limit]
+        next_after = None
+        if len(found.value) > value.limit:
+            next_after = (dishes[-1].rank, dishes[-1].id)
+
+        return Result.success(DishSearchResponseDto(dishes=dishes, next_after=next_after))
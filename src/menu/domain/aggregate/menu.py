@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, NamedTuple, Optional
 from src.common.domain.aggregate.aggregate_root import AggregateRoot
 from src.common.domain.domain_event.domain_event_root import DomainEventRoot
 from src.menu.domain.entities.dish import Dish
@@ -7,23 +7,34 @@ from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
 from src.menu.domain.domain_exceptions.dish_already_exists_exception import DishAlreadyExistsException
 from src.menu.domain.domain_exceptions.dish_not_found_exception import DishNotFoundException
 
+class MenuChanges(NamedTuple):
+    added: List[Dish]
+    updated: List[Dish]
+    removed: List[str]
+
 class Menu(AggregateRoot[MenuIdVo]):
-    def __init__(self, id: MenuIdVo, restaurant_id: RestaurantIdVo, dishes: List[Dish] = [], categories: List[str] = []):
+    def __init__(self, id: MenuIdVo, restaurant_id: RestaurantIdVo, dishes: Optional[List[Dish]] = None, categories: Optional[List[str]] = None):
         super().__init__(id)
         self.restaurant_id = restaurant_id
-        self.dishes = dishes
-        self.categories = categories
+        self.dishes = dishes if dishes is not None else []
+        self.categories = categories if categories is not None else []
+        # Platos tocados desde que se cargo o se guardo el menu: el repositorio persiste solo esos
+        self._added: dict[str, Dish] = {}
+        self._updated: dict[str, Dish] = {}
+        self._removed: set[str] = set()
 
     def add_dish(self, dish: Dish):
         for existing_dish in self.dishes:
             if existing_dish.name.equals(dish.name):
                 raise DishAlreadyExistsException(dish.name.value)
         self.dishes.append(dish)
+        self._added[str(dish.id.value)] = dish
 
     def update_dish(self, dish_to_update: Dish):
         for i, dish in enumerate(self.dishes):
             if dish.id.equals(dish_to_update.id):
                 self.dishes[i] = dish_to_update
+                self._track_update(dish_to_update)
                 return
         raise DishNotFoundException(dish_to_update.id.value)
 
@@ -32,11 +43,24 @@ class Menu(AggregateRoot[MenuIdVo]):
             if dish.id.value == dish_id:
                 if has_preorders:
                     dish.set_unavailable()
+                    self._track_update(dish)
                 else:
                     self.dishes.pop(i)
+                    self._updated.pop(dish_id, None)
+                    # Agregado y quitado antes de guardar: no hay nada que persistir
+                    if self._added.pop(dish_id, None) is None:
+                        self._removed.add(dish_id)
                 return
         raise DishNotFoundException(dish_id)
 
+    def changes(self) -> MenuChanges:
+        return MenuChanges(list(self._added.values()), list(self._updated.values()), sorted(self._removed))
+
+    def clear_changes(self) -> None:
+        self._added.clear()
+        self._updated.clear()
+        self._removed.clear()
+
     def add_category(self, category: str):
         if category not in self.categories:
             self.categories.append(category)
@@ -45,6 +69,13 @@ class Menu(AggregateRoot[MenuIdVo]):
         if category in self.categories:
             self.categories.remove(category)
 
+    def _track_update(self, dish: Dish) -> None:
+        # Un plato nuevo se inserta ya con sus ultimos valores
+        if str(dish.id.value) in self._added:
+            self._added[str(dish.id.value)] = dish
+        else:
+            self._updated[str(dish.id.value)] = dish
+
     def when(self, event: DomainEventRoot) -> None:
         pass
 
@@ -0,0 +1,16 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import InvalidatedCache
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+
+async def load_available_dish_ids(session: AsyncSession, restaurant_id: str) -> frozenset[str]:
+    result = await session.execute(
+        select(DishModel.id)
+        .join(MenuModel, DishModel.menu_id == MenuModel.id)
+        .where(MenuModel.restaurant_id == restaurant_id, DishModel.is_available)
+    )
+    return frozenset(result.scalars().all())
+
+# Ids de los platos disponibles de cada restaurante: validar k platos de una pre-orden cuesta
+# k busquedas en un conjunto, sin cargar el menu. OrmMenuCommandRepository publica el restaurante
+AVAILABLE_DISH_IDS: InvalidatedCache[frozenset[str]] = InvalidatedCache("menu_dish_ids", load_available_dish_ids)
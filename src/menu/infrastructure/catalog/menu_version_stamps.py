@@ -0,0 +1,15 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import VersionStamps
+from src.menu.infrastructure.models.menu_model import MenuModel
+
+async def load_menu_stamp(session: AsyncSession, restaurant_id: str) -> Optional[str]:
+    # Por ix_menus_restaurant_id; el id del menu distingue un menu recreado con la version reiniciada
+    row = (await session.execute(
+        select(MenuModel.id, MenuModel.version).where(MenuModel.restaurant_id == restaurant_id).limit(1)
+    )).first()
+    return f"{row.id}.{row.version}" if row is not None else None
+
+# Marca del menu de cada restaurante, por restaurant_id
+MENU_VERSIONS = VersionStamps("menu_version", load_menu_stamp)
@@ -1,5 +1,5 @@
-from fastapi import FastAPI, Depends, status, Security
-from typing import List
+from fastapi import FastAPI, Depends, Header, Response, status, Security
+from typing import List, Optional
 from src.menu.application.dtos.response.dish_response_dto import DishResponseDto
 from src.menu.application.services.get_dishes_by_restaurant_service import GetDishesByRestaurantService
 from src.common.application import ExceptionDecorator
@@ -8,7 +8,8 @@ from ...routers.menu_router import menu_router
 from sqlalchemy.ext.asyncio import AsyncSession
 from ...repositories.command.orm_menu_command_repository import OrmMenuCommandRepository
 from ...repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
-from src.common.infrastructure import GetPostgresqlSession
+from src.common.infrastructure import EntityTag, GetPostgresqlSession
+from ...catalog.menu_version_stamps import MENU_VERSIONS
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
 
 class GetDishesByRestaurantController:
@@ -35,10 +36,26 @@ class GetDishesByRestaurantController:
             status_code=status.HTTP_200_OK,
             summary="Get dishes by restaurant",
         )
-        async def get_dishes_by_restaurant(restaurant_id: str, token = Security(UserRoleVerify(), scopes=["client:view_menu"]), menu_service: GetDishesByRestaurantService = Depends(self.get_service)):
+        async def get_dishes_by_restaurant(
+            restaurant_id: str,
+            response: Response,
+            if_none_match: Optional[str] = Header(None),
+            session: AsyncSession = Depends(GetPostgresqlSession()),
+            token = Security(UserRoleVerify(), scopes=["client:view_menu"]),
+            menu_service: GetDishesByRestaurantService = Depends(self.get_service)
+            ):
+            # La marca se lee antes que el menu: si cambia entre medias, el ETag queda viejo y el
+            # siguiente GET condicional vuelve a descargar, nunca al reves
+            stamp = await MENU_VERSIONS.get(session, restaurant_id)
+            etag = EntityTag.strong(stamp) if stamp is not None else None
+            if etag is not None and EntityTag.matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
 
             service = ExceptionDecorator(menu_service, FastApiErrorHandler())
             menu = await service.execute(restaurant_id)
+            if etag is not None:
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = "private, no-cache"
             if not menu.value:
                 return []
             return [DishResponseDto.from_domain(dish) for dish in menu.value.dishes]
@@ -8,6 +8,8 @@ from ...repositories.command.orm_menu_command_repository import OrmMenuCommandRe
 from ...repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
 from src.common.infrastructure import GetPostgresqlSession
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 class RemoveDishFromMenuController:
     def __init__(self, app: FastAPI):
@@ -16,15 +18,16 @@ class RemoveDishFromMenuController:
         app.include_router(menu_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        orm_menu_query_repository = OrmMenuQueryRepository(postgres_session)
-        orm_menu_command_repository = OrmMenuCommandRepository(postgres_session)
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        orm_menu_query_repository = uow.repository(OrmMenuQueryRepository)
+        orm_menu_command_repository = uow.repository(OrmMenuCommandRepository)
 
         remove_dish_from_menu_service = RemoveDishFromMenuService(
             orm_menu_command_repository,
             orm_menu_query_repository
         )
 
-        return remove_dish_from_menu_service
+        return UnitOfWorkDecorator(remove_dish_from_menu_service, uow)
 
     def setup_routes(self):
         @menu_router.delete(
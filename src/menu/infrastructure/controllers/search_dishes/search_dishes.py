@@ -0,0 +1,55 @@
+from fastapi import FastAPI, Depends, status, Security
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.application.services.search_dishes_service import SearchDishesService
+from src.common.application import ExceptionDecorator
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from ...routers.menu_router import menu_router
+from sqlalchemy.ext.asyncio import AsyncSession
+from ...dtos.request.search_dishes_request_inf_dto import SearchDishesRequestInfDto
+from ...pagination.dish_search_cursor import DishSearchCursor
+from ...search.in_memory_dish_search import InMemoryDishSearch
+from ...search.postgres_dish_search import PostgresDishSearch
+from src.common.infrastructure import GetPostgresqlSession
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+
+class SearchDishesController:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.setup_routes()
+        app.include_router(menu_router)
+
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
+        # Los indices de texto y trigramas solo existen en Postgres
+        if postgres_session.get_bind().dialect.name == "postgresql":
+            dish_search = PostgresDishSearch(postgres_session)
+        else:
+            dish_search = InMemoryDishSearch(postgres_session)
+
+        return SearchDishesService(dish_search)
+
+    def setup_routes(self):
+        @menu_router.get(
+            "/search",
+            response_model=None,
+            status_code=status.HTTP_200_OK,
+            summary="Search dishes",
+            description="Busca platos de todos los menus por texto, con errores de escritura, filtrando por restaurante, precio y disponibilidad",
+            response_description="Devuelve una pagina de platos ordenada por relevancia y el cursor de la siguiente"
+        )
+        async def search_dishes(entry: SearchDishesRequestInfDto = Depends(), token = Security(UserRoleVerify(), scopes=["client:view_menu"]), menu_service: SearchDishesService = Depends(self.get_service)):
+            entry.check_range()
+            service = ExceptionDecorator(menu_service, FastApiErrorHandler())
+            result = await service.execute(SearchDishesRequestDto(
+                text=entry.q,
+                limit=entry.limit,
+                after=entry.after(),
+                restaurant_id=entry.restaurant_id,
+                min_price=entry.min_price,
+                max_price=entry.max_price,
+                only_available=entry.only_available
+            ))
+            page = result.value
+            return {
+                "dishes": page.dishes,
+                "next_cursor": DishSearchCursor.encode(page.next_after) if page.next_after else None
+            }
@@ -11,6 +11,8 @@ from ...repositories.command.orm_menu_command_repository import OrmMenuCommandRe
 from ...repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
 from src.common.infrastructure import GetPostgresqlSession
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 class UpdateDishInMenuController:
     def __init__(self, app: FastAPI):
@@ -19,15 +21,16 @@ class UpdateDishInMenuController:
         app.include_router(menu_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        orm_menu_query_repository = OrmMenuQueryRepository(postgres_session)
-        orm_menu_command_repository = OrmMenuCommandRepository(postgres_session)
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        orm_menu_query_repository = uow.repository(OrmMenuQueryRepository)
+        orm_menu_command_repository = uow.repository(OrmMenuCommandRepository)
 
         update_dish_in_menu_service = UpdateDishInMenuService(
             orm_menu_command_repository,
             orm_menu_query_repository
         )
 
-        return update_dish_in_menu_service
+        return UnitOfWorkDecorator(update_dish_in_menu_service, uow)
 
     def setup_routes(self):
         @menu_router.put(
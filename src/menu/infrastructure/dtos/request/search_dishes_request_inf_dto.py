@@ -0,0 +1,27 @@
+from typing import Annotated, Optional
+from fastapi import Query
+from pydantic import BaseModel, StringConstraints
+from src.common.infrastructure.error_handler.query_validation_error import invalid_query
+from src.menu.infrastructure.pagination.dish_search_cursor import DishSearchCursor
+
+class SearchDishesRequestInfDto(BaseModel):
+    # Se recorta antes de medir: un texto en blanco no llega al buscador
+    q: Annotated[str, StringConstraints(strip_whitespace=True)] = Query(..., min_length=1, max_length=200, description="Texto a buscar en nombre, categoria y descripcion")
+    limit: int = Query(20, ge=1, le=100)
+    cursor: Optional[str] = Query(None, description="next_cursor de la pagina anterior")
+    restaurant_id: Optional[str] = Query(None)
+    min_price: Optional[float] = Query(None, ge=0)
+    max_price: Optional[float] = Query(None, ge=0)
+    only_available: bool = Query(True)
+
+    def after(self) -> Optional[tuple[float, str]]:
+        if self.cursor is None:
+            return None
+        try:
+            return DishSearchCursor.decode(self.cursor)
+        except Exception:
+            raise invalid_query("cursor", "Invalid cursor", self.cursor)
+
+    def check_range(self) -> None:
+        if self.min_price is not None and self.max_price is not None and self.min_price > self.max_price:
+            raise invalid_query("min_price", "min_price must not be greater than max_price", self.min_price)
@@ -15,22 +15,26 @@ class DishModel(SQLModel, table=True):
     category: str
     image: Optional[str] = None
     is_available: bool = Field(default=True)
-    menu_id: Optional[str] = Field(default=None, foreign_key="menus.id")
+    menu_id: Optional[str] = Field(default=None, foreign_key="menus.id", index=True)
 
     menu: "MenuModel" = Relationship(back_populates="dishes")
     reservations: List["OrmReservationDishModel"] = Relationship(back_populates="dish")
 
     @staticmethod
     def from_domain(dish: "Dish"):
-        return DishModel(
-            id=str(dish.id.value),
-            name=dish.name.value,
-            description=dish.description.value,
-            price=dish.price.value,
-            category=dish.category.value,
-            image=dish.image.value if dish.image else None,
-            is_available=dish.is_available
-        )
+        return DishModel(**DishModel.values_from_domain(dish))
+
+    @staticmethod
+    def values_from_domain(dish: "Dish") -> dict:
+        return {
+            "id": str(dish.id.value),
+            "name": dish.name.value,
+            "description": dish.description.value,
+            "price": dish.price.value,
+            "category": dish.category.value,
+            "image": dish.image.value if dish.image else None,
+            "is_available": dish.is_available
+        }
 
     def to_domain(self) -> "Dish":
         from src.menu.domain.value_objects.dish_id_vo import DishIdVo
@@ -54,7 +58,9 @@ class MenuModel(SQLModel, table=True):
     __tablename__ = 'menus'
 
     id: str = Field(primary_key=True, index=True)
-    restaurant_id: str = Field(foreign_key='restaurant.id')
+    restaurant_id: str = Field(foreign_key='restaurant.id', index=True)
+    # Sube con cada cambio de platos; es la marca del ETag del menu
+    version: int = Field(default=1, nullable=False, sa_column_kwargs={"server_default": "1"})
 
     dishes: List["DishModel"] = Relationship(back_populates="menu")
 
@@ -74,28 +80,3 @@ class MenuModel(SQLModel, table=True):
             dishes=[dish.to_domain() for dish in self.dishes],
             categories=[] # Categories are not persisted in this example
         )
-
-    def update_from_domain(self, menu: "Menu"):
-        incoming_dish_map = {str(d.id.value): d for d in menu.dishes}
-        
-        dishes_to_remove = []
-        for db_dish in self.dishes:
-            if db_dish.id not in incoming_dish_map:
-                dishes_to_remove.append(db_dish)
-
-        for dish_to_del in dishes_to_remove:
-            self.dishes.remove(dish_to_del)
-
-        for domain_dish_id, domain_dish_data in incoming_dish_map.items():
-            found_existing_dish = next((d for d in self.dishes if d.id == domain_dish_id), None)
-
-            if found_existing_dish:
-                found_existing_dish.name = domain_dish_data.name.value
-                found_existing_dish.description = domain_dish_data.description.value
-                found_existing_dish.price = domain_dish_data.price.value
-                found_existing_dish.category = domain_dish_data.category.value
-                found_existing_dish.image = domain_dish_data.image.value if domain_dish_data.image else None
-                found_existing_dish.is_available = domain_dish_data.is_available
-            else:
-                new_dish_model = DishModel.from_domain(domain_dish_data)
-                self.dishes.append(new_dish_model)
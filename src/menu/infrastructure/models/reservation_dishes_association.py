@@ -1,7 +1,10 @@
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 class OrmReservationDishModel(SQLModel, table=True):
     __tablename__ = 'reservation_dish_association'
+    # La PK empieza por reservation_id; para buscar pre-ordenes de un plato hace falta este
+    __table_args__ = (Index("ix_reservation_dish_dish_id", "dish_id", "reservation_id"),)
 
     reservation_id: str = Field(primary_key=True, foreign_key="reservation.id")
     dish_id: str = Field(primary_key=True, foreign_key="dishes.id")
@@ -0,0 +1,18 @@
+import base64
+
+class DishSearchCursor:
+    """
+    Cursor opaco de la busqueda de platos: (rank, id) del ultimo plato entregado en base64
+    url-safe. El rank va con repr para que la comparacion de la pagina siguiente sea exacta.
+    """
+
+    @staticmethod
+    def encode(after: tuple[float, str]) -> str:
+        raw = f"{after[0]!r}|{after[1]}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> tuple[float, str]:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, dish_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|", 1)
+        return float(rank), dish_id
@@ -1,9 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import insert, update
 from src.menu.application.repositories.command.menu_command_repository import MenuCommandRepository
+from src.common.infrastructure import InvalidationBus
 from src.menu.domain.aggregate.menu import Menu
-from src.menu.infrastructure.models.menu_model import MenuModel
+from src.menu.infrastructure.catalog.available_dish_ids_cache import AVAILABLE_DISH_IDS
+from src.menu.infrastructure.catalog.menu_version_stamps import MENU_VERSIONS
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.search.in_memory_dish_search import DISH_SEARCH_INDEX
 
 class OrmMenuCommandRepository(MenuCommandRepository):
     def __init__(self, session: AsyncSession):
@@ -12,15 +15,37 @@ class OrmMenuCommandRepository(MenuCommandRepository):
     async def save(self, menu: Menu) -> None:
         menu_model = MenuModel.from_domain(menu)
         self.session.add(menu_model)
-        await self.session.commit()
+        await self.session.flush()
+        menu.clear_changes()
+        await self._publish(menu)
 
     async def update(self, menu: Menu) -> None:
-        menu_model = await self.session.execute(
-                select(MenuModel).where(MenuModel.id == menu.id.value).options(joinedload(MenuModel.dishes))
+        # Solo los platos que el agregado marco como cambiados, sin recargar el menu
+        changes = menu.changes()
+        if changes.added:
+            await self.session.execute(insert(DishModel), [
+                {**DishModel.values_from_domain(dish), "menu_id": str(menu.id.value)} for dish in changes.added
+            ])
+        if changes.updated:
+            # Lista de filas con la clave primaria: UPDATE por id con executemany
+            await self.session.execute(update(DishModel), [DishModel.values_from_domain(dish) for dish in changes.updated])
+        if changes.removed:
+            # Como al quitarlo de la relacion: el plato queda fuera del menu, sus pre-ordenes se conservan
+            await self.session.execute(
+                update(DishModel).where(DishModel.id.in_(changes.removed)).values(menu_id=None)
+                .execution_options(synchronize_session=False)
             )
-        result = menu_model.scalars().first()
-        if result:
-            result.update_from_domain(menu)
-            self.session.add(result)
-            await self.session.commit()
+        if changes.added or changes.updated or changes.removed:
+            await self.session.execute(
+                update(MenuModel).where(MenuModel.id == str(menu.id.value)).values(version=MenuModel.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+        menu.clear_changes()
+        await self._publish(menu)
 
+    async def _publish(self, menu: Menu) -> None:
+        restaurant_id = str(menu.restaurant_id.restaurant_id)
+        await InvalidationBus.publish(self.session, AVAILABLE_DISH_IDS.topic, restaurant_id)
+        # El indice de busqueda cubre todos los restaurantes: se descarta completo
+        await InvalidationBus.publish(self.session, DISH_SEARCH_INDEX.topic)
+        await InvalidationBus.publish(self.session, MENU_VERSIONS.topic, restaurant_id)
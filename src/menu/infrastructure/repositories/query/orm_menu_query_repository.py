@@ -1,14 +1,22 @@
+from datetime import date
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, literal_column
+from sqlalchemy import exists, select, literal_column
 from sqlalchemy.orm import joinedload
 from src.menu.application.repositories.query.menu_query_repository import MenuQueryRepository
 from src.menu.domain.aggregate.menu import Menu
 from src.menu.domain.value_objects.dish_id_vo import DishIdVo
+from src.menu.infrastructure.catalog.available_dish_ids_cache import AVAILABLE_DISH_IDS
 from src.menu.infrastructure.models.menu_model import MenuModel, DishModel
+from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
 from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
 
 class OrmMenuQueryRepository(MenuQueryRepository):
+    # Validar platos contra AVAILABLE_DISH_IDS; sin ella, una consulta por los platos pedidos
+    CACHE_DISH_IDS = True
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -32,4 +40,43 @@ class OrmMenuQueryRepository(MenuQueryRepository):
 
         if menu_model:
             return menu_model.to_domain()
-        return None
\ No newline at end of file
+        return None
+
+    async def valid_dish_ids(self, restaurant_id: RestaurantIdVo, dish_ids: list[str]) -> frozenset[str]:
+        if not dish_ids:
+            return frozenset()
+        if self.CACHE_DISH_IDS:
+            available = await AVAILABLE_DISH_IDS.get(self.session, restaurant_id.restaurant_id)
+            return available.intersection(dish_ids)
+
+        # Sin cache: solo los k platos pedidos, por la clave primaria de dishes
+        result = await self.session.execute(
+            select(DishModel.id)
+            .join(MenuModel, DishModel.menu_id == MenuModel.id)
+            .where(MenuModel.restaurant_id == restaurant_id.restaurant_id, DishModel.id.in_(dish_ids), DishModel.is_available)
+        )
+        return frozenset(result.scalars().all())
+
+    async def exists_preorders(self, dish_id: DishIdVo, only_future: bool = True) -> bool:
+        statement = select(exists().where(*self._preorder_filters(only_future), OrmReservationDishModel.dish_id == dish_id.value))
+        return bool((await self.session.execute(statement)).scalar())
+
+    async def exists_preorders_many(self, dish_ids: list[str], only_future: bool = True) -> frozenset[str]:
+        if not dish_ids:
+            return frozenset()
+        result = await self.session.execute(
+            select(OrmReservationDishModel.dish_id).distinct()
+            .where(*self._preorder_filters(only_future), OrmReservationDishModel.dish_id.in_(dish_ids))
+        )
+        return frozenset(result.scalars().all())
+
+    @staticmethod
+    def _preorder_filters(only_future: bool) -> list:
+        # Entra por ix_reservation_dish_dish_id, que ya trae el reservation_id para el join
+        filters = [
+            OrmReservationDishModel.reservation_id == OrmReservationModel.id,
+            OrmReservationModel.status.in_(ReservationStatusVo.ESTADOS_ACTIVOS),
+        ]
+        if only_future:
+            filters.append(OrmReservationModel.reservation_date >= date.today())
+        return filters
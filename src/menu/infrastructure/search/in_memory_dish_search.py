@@ -0,0 +1,170 @@
+import heapq
+import re
+from collections import Counter
+from typing import NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import InfrastructureException, InvalidatedCache
+from src.common.utils import Result
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.application.dtos.response.dish_search_response_dto import DishSearchHitDto
+from src.menu.application.search.dish_search import IDishSearch
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+
+# Pesos de ts_rank_cd para A (nombre), B (categoria) y C (descripcion)
+NAME_WEIGHT = 1.0
+CATEGORY_WEIGHT = 0.4
+DESCRIPTION_WEIGHT = 0.2
+# Umbrales por defecto de pg_trgm.similarity_threshold y pg_trgm.word_similarity_threshold
+SIMILARITY_THRESHOLD = 0.3
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+def tokenize(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+def trigrams(text: str) -> set[str]:
+    # Como pg_trgm: cada palabra con dos espacios delante y uno detras
+    grams: set[str] = set()
+    for word in tokenize(text):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class IndexedDish(NamedTuple):
+    id: str
+    restaurant_id: str
+    name: str
+    description: str
+    price: float
+    category: str
+    image: Optional[str]
+    is_available: bool
+
+class DishSearchIndex(NamedTuple):
+    dishes: dict[str, IndexedDish]
+    terms: dict[str, dict[str, float]]
+    # Los trigramas se cuentan por nombre distinto, no por plato: muchos restaurantes repiten nombres
+    name_trigrams: dict[str, list[str]]
+    trigram_counts: dict[str, int]
+    names: dict[str, list[str]]
+    # Trigramas de cada palabra de terms, para las erratas en categoria y descripcion
+    word_trigrams: dict[str, list[str]]
+    word_trigram_counts: dict[str, int]
+
+def similarities(query: set[str], postings: dict[str, list[str]], counts: dict[str, int]) -> dict[str, float]:
+    # Similitud de trigramas con cada texto indexado, contando solo los que comparte con la consulta
+    shared: Counter[str] = Counter()
+    for gram in query:
+        shared.update(postings.get(gram, ()))
+    return {text: common / (len(query) + counts[text] - common) for text, common in shared.items()}
+
+async def load_dish_search_index(session: AsyncSession, key: str) -> DishSearchIndex:
+    result = await session.execute(
+        select(
+            DishModel.id, MenuModel.restaurant_id, DishModel.name, DishModel.description, DishModel.price,
+            DishModel.category, DishModel.image, DishModel.is_available
+        ).join(MenuModel, DishModel.menu_id == MenuModel.id)
+    )
+
+    dishes: dict[str, IndexedDish] = {}
+    terms: dict[str, dict[str, float]] = {}
+    name_trigrams: dict[str, list[str]] = {}
+    trigram_counts: dict[str, int] = {}
+    names: dict[str, list[str]] = {}
+    for row in result.all():
+        dish = IndexedDish(*row)
+        dishes[dish.id] = dish
+        for text, weight in ((dish.name, NAME_WEIGHT), (dish.category, CATEGORY_WEIGHT), (dish.description, DESCRIPTION_WEIGHT)):
+            for token in tokenize(text):
+                posting = terms.setdefault(token, {})
+                posting[dish.id] = max(posting.get(dish.id, 0.0), weight)
+        if dish.name not in names:
+            names[dish.name] = []
+            grams = trigrams(dish.name)
+            trigram_counts[dish.name] = len(grams)
+            for gram in grams:
+                name_trigrams.setdefault(gram, []).append(dish.name)
+        names[dish.name].append(dish.id)
+
+    word_trigrams: dict[str, list[str]] = {}
+    word_trigram_counts: dict[str, int] = {}
+    for word in terms:
+        grams = trigrams(word)
+        word_trigram_counts[word] = len(grams)
+        for gram in grams:
+            word_trigrams.setdefault(gram, []).append(word)
+
+    return DishSearchIndex(dishes, terms, name_trigrams, trigram_counts, names, word_trigrams, word_trigram_counts)
+
+# Un solo indice con todos los platos, bajo la clave ALL_DISHES
+ALL_DISHES = "all"
+DISH_SEARCH_INDEX: InvalidatedCache[DishSearchIndex] = InvalidatedCache("dish_search", load_dish_search_index, max_entries=1)
+
+class InMemoryDishSearch(IDishSearch):
+    """
+    Respaldo de PostgresDishSearch para SQLite y los tests: indice invertido de palabras con los
+    mismos pesos por campo; las erratas se buscan por trigramas del nombre completo y de cada
+    palabra, que cuenta con su peso por la similitud. El indice vive en
+    DISH_SEARCH_INDEX y cualquier escritura del menu lo descarta completo.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(self, request: SearchDishesRequestDto, limit: int) -> Result[list[DishSearchHitDto]]:
+        try:
+            index = await DISH_SEARCH_INDEX.get(self.session, ALL_DISHES)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+        ranks = self._rank(index, request.text)
+        hits = []
+        for dish_id, rank in ranks.items():
+            dish = index.dishes[dish_id]
+            if request.restaurant_id is not None and dish.restaurant_id != request.restaurant_id:
+                continue
+            if request.min_price is not None and dish.price < request.min_price:
+                continue
+            if request.max_price is not None and dish.price > request.max_price:
+                continue
+            if request.only_available and not dish.is_available:
+                continue
+            if request.after is not None and (-rank, dish_id) <= (-request.after[0], request.after[1]):
+                continue
+            hits.append((-rank, dish_id))
+
+        return Result.success([
+            DishSearchHitDto(**index.dishes[dish_id]._asdict(), rank=-negative_rank)
+            for negative_rank, dish_id in heapq.nsmallest(limit, hits)
+        ])
+
+    @staticmethod
+    def _rank(index: DishSearchIndex, text: str) -> dict[str, float]:
+        # Palabras: como websearch_to_tsquery, el plato debe tener todas
+        ranks: dict[str, float] = {}
+        tokens = tokenize(text)
+        if tokens:
+            postings = sorted((InMemoryDishSearch._posting(index, token) for token in tokens), key=len)
+            for dish_id in postings[0]:
+                if all(dish_id in p for p in postings[1:]):
+                    ranks[dish_id] = sum(p[dish_id] for p in postings)
+
+        # Erratas: similitud de trigramas de cada nombre distinto
+        by_name = similarities(trigrams(text), index.name_trigrams, index.trigram_counts)
+        matched = {dish_id: by_name.get(index.dishes[dish_id].name, 0.0) + rank for dish_id, rank in ranks.items()}
+        for name, similarity in by_name.items():
+            if similarity >= SIMILARITY_THRESHOLD:
+                for dish_id in index.names[name]:
+                    matched.setdefault(dish_id, similarity)
+        return matched
+
+    @staticmethod
+    def _posting(index: DishSearchIndex, token: str) -> dict[str, float]:
+        # Como word_similarity: la palabra exacta y las parecidas, con su peso por la similitud
+        posting = dict(index.terms.get(token, {}))
+        for word, similarity in similarities(trigrams(token), index.word_trigrams, index.word_trigram_counts).items():
+            if word == token or similarity < WORD_SIMILARITY_THRESHOLD:
+                continue
+            for dish_id, weight in index.terms[word].items():
+                posting[dish_id] = max(posting.get(dish_id, 0.0), weight * similarity)
+        return posting
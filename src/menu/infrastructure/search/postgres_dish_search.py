@@ -0,0 +1,68 @@
+from sqlalchemy import Float, and_, cast, func, literal, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import InfrastructureException
+from src.common.utils import Result
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.application.dtos.response.dish_search_response_dto import DishSearchHitDto
+from src.menu.application.search.dish_search import IDishSearch
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+
+class PostgresDishSearch(IDishSearch):
+    """
+    Busqueda en Postgres con los indices GIN de las migraciones b5f2d8e4a9c1 y c4e9a2f7b3d6:
+    dishes.search_vector (nombre con peso A, categoria B y descripcion C) para las palabras y
+    pg_trgm sobre los tres campos para las erratas. El rank suma ts_rank_cd y la similitud de
+    cada campo con el texto, con los mismos pesos relativos.
+    """
+
+    CONFIG = "simple"
+    CATEGORY_WEIGHT = 0.4
+    DESCRIPTION_WEIGHT = 0.2
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search(self, request: SearchDishesRequestDto, limit: int) -> Result[list[DishSearchHitDto]]:
+        try:
+            # Columna generada que no esta en el modelo, como reservation.period
+            vector = literal_column("dishes.search_vector", TSVECTOR)
+            query = func.websearch_to_tsquery(self.CONFIG, request.text)
+            # La descripcion es larga: word_similarity (y <%) compara el texto con su mejor tramo
+            rank = cast(
+                func.ts_rank_cd(vector, query)
+                + func.similarity(DishModel.name, request.text)
+                + self.CATEGORY_WEIGHT * func.similarity(DishModel.category, request.text)
+                + self.DESCRIPTION_WEIGHT * func.word_similarity(request.text, DishModel.description),
+                Float
+            )
+
+            stmt = (
+                select(
+                    DishModel.id, MenuModel.restaurant_id, DishModel.name, DishModel.description, DishModel.price,
+                    DishModel.category, DishModel.image, DishModel.is_available, rank.label("rank")
+                )
+                .join(MenuModel, DishModel.menu_id == MenuModel.id)
+                .where(or_(
+                    vector.op("@@")(query),
+                    DishModel.name.op("%")(request.text),
+                    DishModel.category.op("%")(request.text),
+                    literal(request.text).op("<%")(DishModel.description)
+                ))
+            )
+            if request.restaurant_id is not None:
+                stmt = stmt.where(MenuModel.restaurant_id == request.restaurant_id)
+            if request.min_price is not None:
+                stmt = stmt.where(DishModel.price >= request.min_price)
+            if request.max_price is not None:
+                stmt = stmt.where(DishModel.price <= request.max_price)
+            if request.only_available:
+                stmt = stmt.where(DishModel.is_available)
+            if request.after is not None:
+                after_rank, after_id = request.after
+                stmt = stmt.where(or_(rank < after_rank, and_(rank == after_rank, DishModel.id > after_id)))
+
+            result = await self.session.execute(stmt.order_by(rank.desc(), DishModel.id).limit(limit))
+            return Result.success([DishSearchHitDto(**row._mapping) for row in result.all()])
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from src.common.utils import Result
+
+class IBookingGuard(ABC):
+    """
+    Serializa las altas que compiten por la misma mesa y dia: quien llega segundo espera a que
+    termine la transaccion del primero y su comprobacion de solapes ya ve lo que este guardo.
+    """
+
+    @abstractmethod
+    async def hold(self, slots: list[tuple[str, str, date]]) -> Result[None]:
+        """
+        Toma (restaurant_id, table_id, reservation_date) hasta el fin de la transaccion en curso.
+        """
+        pass
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date, time
+from typing import Optional
+from src.common.utils import Result
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.domain.aggregate.reservation import Reservation
+
+class IFreeTableIndex(ABC):
+    """
+    Busca mesas libres con capacidad suficiente en un intervalo de un dia.
+    """
+
+    @abstractmethod
+    async def search(self, reservation_date: date, date_start: time, date_end: time, people: int, restaurant_id: Optional[str] = None) -> Result[list[tuple[str, str, int]]]:
+        """
+        Devuelve (restaurant_id, table_id, capacity) de cada mesa libre. Sin restaurant_id busca en todos los restaurantes.
+        """
+        pass
+
+    @abstractmethod
+    def book(self, reservation: Reservation) -> None:
+        pass
+
+    @abstractmethod
+    def book_many(self, entries: list[tuple[str, CreateReservationRequest]]) -> None:
+        """
+        Marca como ocupadas las peticiones recien guardadas como pendientes, cada una con el id de su reserva.
+        """
+        pass
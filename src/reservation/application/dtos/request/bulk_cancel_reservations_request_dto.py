@@ -0,0 +1,23 @@
+from datetime import date, time
+from typing import Optional
+
+class BulkCancelReservationsRequest:
+    """
+    Reservas pendientes de un restaurante entre date_from y date_to (inclusive). Con time_from y
+    time_to solo las que se solapan con esa franja horaria; con table_number_id, solo esa mesa.
+    """
+    def __init__(
+        self,
+        restaurant_id: str,
+        date_from: date,
+        date_to: date,
+        time_from: Optional[time] = None,
+        time_to: Optional[time] = None,
+        table_number_id: Optional[str] = None
+    ):
+        self.restaurant_id = restaurant_id
+        self.date_from = date_from
+        self.date_to = date_to
+        self.time_from = time_from
+        self.time_to = time_to
+        self.table_number_id = table_number_id
@@ -0,0 +1,5 @@
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+
+class BulkCreateReservationRequest:
+    def __init__(self, items: list[CreateReservationRequest]):
+        self.items = items
@@ -1,4 +1,23 @@
+from datetime import date
+from typing import Optional
 
 class FindReservationRequest:
-    def __init__(self):
-        pass        
\ No newline at end of file
+    """
+    Filtros y pagina del listado de reservas. La pagina sigue a la ultima reserva vista
+    (after = (reservation_date, id)), en orden ascendente por esa misma pareja.
+    """
+    def __init__(
+        self,
+        limit: int = 50,
+        after: Optional[tuple[date, str]] = None,
+        restaurant_id: Optional[str] = None,
+        status: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ):
+        self.limit = limit
+        self.after = after
+        self.restaurant_id = restaurant_id
+        self.status = status
+        self.date_from = date_from
+        self.date_to = date_to
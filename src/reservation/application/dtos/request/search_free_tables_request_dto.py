@@ -0,0 +1,10 @@
+from datetime import time, date
+from typing import Optional
+
+class SearchFreeTablesRequest:
+    def __init__(self, reservation_date: date, date_start: time, duration_minutes: int, people: int, restaurant_id: Optional[str] = None):
+        self.reservation_date = reservation_date
+        self.date_start = date_start
+        self.duration_minutes = duration_minutes
+        self.people = people
+        self.restaurant_id = restaurant_id
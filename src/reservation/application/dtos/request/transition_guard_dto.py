@@ -0,0 +1,12 @@
+from datetime import datetime
+from typing import Optional
+
+class TransitionGuard:
+    """
+    Condiciones extra de un cambio de estado que el repositorio evalua en el mismo UPDATE.
+    """
+    def __init__(self, client_id: Optional[str] = None, starts_not_before: Optional[datetime] = None):
+        # Solo el cliente duenio de la reserva
+        self.client_id = client_id
+        # La reserva debe empezar en este momento o despues
+        self.starts_not_before = starts_not_before
@@ -0,0 +1,60 @@
+from typing import List, Optional
+from src.common.application import ApplicationException
+from src.reservation.application.exceptions.active_reservation_conflict_exception import ActiveReservationConflictException
+from src.reservation.application.exceptions.outside_opening_hours_exception import OutsideOpeningHoursException
+from src.reservation.application.exceptions.restaurant_not_found_exception import RestaurantNotFoundException
+from src.reservation.application.exceptions.table_not_available_exception import TableNotAvailableException
+from src.reservation.application.exceptions.table_not_found_exception import TableNotFoundException
+
+class AdmissionVerdict:
+    """
+    Resultado de evaluar en una sola consulta si una reserva puede crearse.
+    """
+    def __init__(
+        self,
+        restaurant_found: bool,
+        table_found: bool,
+        within_hours: bool,
+        table_conflict: bool,
+        client_conflict: bool,
+        menu_found: bool,
+        invalid_dish_ids: List[str]
+    ):
+        self.restaurant_found = restaurant_found
+        self.table_found = table_found
+        self.within_hours = within_hours
+        self.table_conflict = table_conflict
+        self.client_conflict = client_conflict
+        self.menu_found = menu_found
+        self.invalid_dish_ids = invalid_dish_ids
+
+    def rejection(self) -> Optional[ApplicationException]:
+        """
+        Primera regla incumplida, en el orden en que se reportan al cliente, o None si se admite.
+        """
+        # MESA DISPONIBLE. No pueden haber dos reservas activas solapadas para la misma mesa
+        if self.table_conflict:
+            return TableNotAvailableException()
+
+        # Cliente reserva activa en un horario solapado, incluso si son en diferentes restaurantes
+        if self.client_conflict:
+            return ActiveReservationConflictException()
+
+        if not self.restaurant_found:
+            return RestaurantNotFoundException()
+
+        if not self.table_found:
+            return TableNotFoundException()
+
+        # Horario de reserva debe estar dentro del horario de apertura, cierre del restarurante
+        if not self.within_hours:
+            return OutsideOpeningHoursException()
+
+        # Los platos deben pertenecer al menu del restaurante de la mesa reservada
+        if not self.menu_found:
+            return ApplicationException("Menu not found")
+
+        if self.invalid_dish_ids:
+            return ApplicationException("One or more dishes entered are not part of the menu")
+
+        return None
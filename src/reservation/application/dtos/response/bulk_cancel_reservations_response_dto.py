@@ -0,0 +1,16 @@
+from datetime import date
+from typing import List
+
+class CancelledReservation:
+    """
+    Lo que devuelve el UPDATE ... RETURNING de una cancelacion masiva.
+    """
+    def __init__(self, id: str, client_id: str, reservation_date: date, table_number_id: str):
+        self.id = id
+        self.client_id = client_id
+        self.reservation_date = reservation_date
+        self.table_number_id = table_number_id
+
+class BulkCancelReservationsResponse:
+    def __init__(self, cancelled: List[CancelledReservation]):
+        self.cancelled = cancelled
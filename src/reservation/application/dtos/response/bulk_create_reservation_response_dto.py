@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+class BulkReservationItemResult:
+    """
+    Resultado de una fila del lote: id de la reserva creada o el motivo del rechazo.
+    """
+    def __init__(self, index: int, id: Optional[str] = None, error: Optional[str] = None):
+        self.index = index
+        self.id = id
+        self.error = error
+
+class BulkCreateReservationResponse:
+    def __init__(self, results: List[BulkReservationItemResult]):
+        self.results = results
+        self.created = sum(1 for r in results if r.id is not None)
+        self.rejected = len(results) - self.created
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional
 
 from src.reservation.domain.aggregate.reservation import Reservation
 
@@ -40,15 +40,16 @@ class ReservationResponse:
             status=r.status.reservation_status,
             table_number_id=r.table_number_id.table_number_id,
             restaurant_id=r.restaurant_id.restaurant_id,
-            dishes=[d.__value for d in r.dish] or [],
+            dishes=[d.value for d in r.dish] or [],
         )
 
 class FindReservationResponse:
     """
-    Envuelve una lista de entidades Reservation y las convierte
-    a DTOs de solo primitivos.
+    Envuelve una pagina de entidades Reservation convertidas a DTOs de solo primitivos
+    y la posicion desde la que sigue la siguiente pagina (None si no hay mas).
     """
-    def __init__(self, reservations: List[Reservation]):
+    def __init__(self, reservations: List[Reservation], next_after: Optional[tuple[date, str]] = None):
         self.reservations: List[ReservationResponse] = [
             ReservationResponse.from_domain(r) for r in reservations
         ]
+        self.next_after = next_after
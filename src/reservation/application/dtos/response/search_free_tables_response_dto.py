@@ -0,0 +1,15 @@
+from datetime import time, date
+from typing import List
+
+class FreeTableResponse:
+    def __init__(self, restaurant_id: str, table_id: str, capacity: int):
+        self.restaurant_id = restaurant_id
+        self.table_id = table_id
+        self.capacity = capacity
+
+class SearchFreeTablesResponse:
+    def __init__(self, reservation_date: date, date_start: time, date_end: time, tables: List[FreeTableResponse]):
+        self.reservation_date = reservation_date
+        self.date_start = date_start
+        self.date_end = date_end
+        self.tables = tables
@@ -0,0 +1,41 @@
+from typing import Optional
+from src.common.application import ApplicationException
+from src.reservation.application.exceptions.cancel_order_not_owned_exception import CancelOrderNotOwnedExeption
+from src.reservation.application.exceptions.cancel_order_not_pending_exception import CancelOrderNotPendingException
+from src.reservation.application.exceptions.cancel_order_not_time_allowed_exception import CancelOrderTooLateException
+from src.reservation.domain.aggregate.reservation import Reservation
+
+class TransitionOutcome:
+    """
+    Resultado de un cambio de estado condicional: la reserva ya actualizada si el UPDATE la
+    alcanzo o, si no, que condicion fallo sobre la fila tal como esta en la BD.
+    """
+    def __init__(
+        self,
+        reservation: Optional[Reservation],
+        owned: bool = True,
+        in_time: bool = True,
+        status_matched: bool = True
+    ):
+        self.reservation = reservation
+        self.owned = owned
+        self.in_time = in_time
+        self.status_matched = status_matched
+
+    def rejection(self) -> Optional[ApplicationException]:
+        """
+        Primera condicion incumplida, en el orden en que se reportan al cliente, o None si se aplico.
+        """
+        if self.reservation is not None:
+            return None
+
+        # UN cliente solo puede cancelar sus reservas
+        if not self.owned:
+            return CancelOrderNotOwnedExeption()
+
+        # CLiente no puede cancelar 1 hora antes
+        if not self.in_time:
+            return CancelOrderTooLateException()
+
+        # Otra peticion la cambio antes (o nunca estuvo en el estado de origen)
+        return CancelOrderNotPendingException()
@@ -0,0 +1,10 @@
+from src.common.application import ApplicationException
+
+class InvalidCancelWindowException(ApplicationException):
+    """
+    Raised when a bulk cancellation range ends before it starts.
+    """
+    def __init__(self):
+        super().__init__(
+            message="The cancellation range must end after it starts."
+        )
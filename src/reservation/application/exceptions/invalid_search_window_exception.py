@@ -0,0 +1,10 @@
+from src.common.application import ApplicationException
+
+class InvalidSearchWindowException(ApplicationException):
+    """
+    Raised when the requested search window is empty or ends after midnight.
+    """
+    def __init__(self):
+        super().__init__(
+            message="The reservation window must be positive and end on the same day."
+        )
@@ -0,0 +1,10 @@
+from src.common.application import ApplicationException
+
+class OutsideOpeningHoursException(ApplicationException):
+    """
+    Raised when the reservation starts before opening time or ends after closing time.
+    """
+    def __init__(self):
+        super().__init__(
+            message="Reservation time is outside the restaurant opening hours."
+        )
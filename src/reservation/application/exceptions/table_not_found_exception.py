@@ -0,0 +1,11 @@
+from src.common.application import ApplicationException, ExceptionApplicationType
+
+class TableNotFoundException(ApplicationException):
+    """
+    Raised when the reserved table does not belong to the restaurant.
+    """
+    def __init__(self):
+        super().__init__(
+            message="Table not found.",
+            app_type=ExceptionApplicationType.NOT_FOUND
+        )
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from src.common.utils import Result
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.transition_guard_dto import TransitionGuard
+from src.reservation.application.dtos.response.bulk_cancel_reservations_response_dto import CancelledReservation
+from src.reservation.application.dtos.response.transition_outcome_dto import TransitionOutcome
 from src.reservation.domain.aggregate.reservation import Reservation
 
 class IReservationCommandRepository(ABC):
@@ -11,5 +17,38 @@ class IReservationCommandRepository(ABC):
     @abstractmethod
     async def update(self, entry: Reservation) -> Result[Reservation]:
         pass
-    
-    
\ No newline at end of file
+
+    @abstractmethod
+    async def transition(self, id: str, from_status: str, to_status: str, guard: Optional[TransitionGuard] = None) -> Result[TransitionOutcome]:
+        """
+        Pasa la reserva de from_status a to_status solo si sigue en from_status y cumple el guard,
+        de forma atomica: entre peticiones concurrentes con el mismo origen gana una sola.
+        """
+        pass
+
+    @abstractmethod
+    async def save_many(self, entries: List[Reservation]) -> Result[List[Reservation]]:
+        pass
+
+    @abstractmethod
+    async def insert_pending(self, entries: List[tuple[str, CreateReservationRequest]]) -> Result[List[str]]:
+        """
+        Guarda como pendientes las peticiones ya validadas, cada una con el id de su reserva, sin
+        pasar por el agregado. Devuelve los ids guardados.
+        """
+        pass
+
+    @abstractmethod
+    async def cancel_pending(self, filters: BulkCancelReservationsRequest) -> Result[List[CancelledReservation]]:
+        """
+        Cancela en una sola sentencia las reservas pendientes que cumplen los filtros y devuelve las afectadas.
+        """
+        pass
+
+    @abstractmethod
+    async def expire(self, from_status: str, to_status: str, ended_before: datetime, limit: int) -> Result[int]:
+        """
+        Pasa a to_status hasta limit reservas en from_status que terminaron antes de ended_before.
+        Devuelve cuantas cambio; menos de limit indica que no quedan.
+        """
+        pass
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
 from datetime import date, time
+from typing import AsyncIterator
 from src.common.utils import Result
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.dtos.response.find_reservation_response_dto import ReservationResponse
+from src.reservation.application.dtos.response.admission_verdict_dto import AdmissionVerdict
 from src.reservation.domain.aggregate.reservation import Reservation
 
 class IReservationQueryRepository(ABC):
@@ -21,10 +26,42 @@ class IReservationQueryRepository(ABC):
     async def get_active_by_client_id(self, client_id: str) -> Result[list[Reservation]]:
         pass
 
+    @abstractmethod
+    async def get_active_by_client_date(self, client_id: str, reservation_date: date) -> Result[list[Reservation]]:
+        pass
+
+    @abstractmethod
+    async def get_active_by_date(self, reservation_date: date) -> Result[list[Reservation]]:
+        pass
+
     @abstractmethod
     async def get_all_by_date_restaurant(self, restaurant_id: str, reservation_date: date,) -> Result[list[Reservation]]:
         pass
 
     @abstractmethod
-    async def get_all(self) -> Result[list[Reservation]]:
+    async def find_page(self, filters: FindReservationRequest, limit: int) -> Result[list[Reservation]]:
+        """
+        Hasta `limit` reservas que cumplen los filtros, ordenadas por (reservation_date, id)
+        y posteriores a filters.after.
+        """
+        pass
+
+    @abstractmethod
+    async def stream(self, filters: FindReservationRequest, chunk_size: int) -> Result[AsyncIterator[list[ReservationResponse]]]:
+        """
+        Todas las reservas que cumplen los filtros, en el mismo orden, en bloques de chunk_size
+        leidos bajo demanda.
+        """
+        pass
+
+    @abstractmethod
+    async def check_admission(self, restaurant_id: str, table_id: str, client_id: str, reservation_date: date, date_start: time, date_end: time, dish_ids: list[str]) -> Result[AdmissionVerdict]:
+        pass
+
+    @abstractmethod
+    async def check_admission_many(self, items: list[CreateReservationRequest]) -> Result[list[AdmissionVerdict]]:
+        """
+        Un veredicto por item, en el mismo orden, evaluando todo el lote a la vez. Los conflictos
+        son solo contra reservas ya guardadas: los del propio lote los resuelve el servicio.
+        """
         pass
@@ -0,0 +1,30 @@
+from src.common.application import IService
+from src.common.utils import Result
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.reservation.application.dtos.response.bulk_cancel_reservations_response_dto import BulkCancelReservationsResponse
+from src.reservation.application.exceptions.invalid_cancel_window_exception import InvalidCancelWindowException
+from src.reservation.application.repositories.command.reservation_command_repository import IReservationCommandRepository
+
+class BulkCancelReservationsService(IService[BulkCancelReservationsRequest, BulkCancelReservationsResponse]):
+    """
+    Cancela de una vez las reservas pendientes de un restaurante en un rango de fechas, por
+    ejemplo ante un cierre imprevisto. No reconstruye agregados: el repositorio hace un unico
+    UPDATE y devuelve lo cancelado para avisar a los clientes.
+    """
+
+    def __init__(self, command_reser: IReservationCommandRepository):
+        super().__init__()
+        self.command_repository = command_reser
+
+    async def execute(self, value: BulkCancelReservationsRequest) -> Result[BulkCancelReservationsResponse]:
+        if value.date_to < value.date_from:
+            return Result.fail(InvalidCancelWindowException())
+
+        if value.time_from is not None and value.time_to is not None and value.time_to <= value.time_from:
+            return Result.fail(InvalidCancelWindowException())
+
+        cancelled = await self.command_repository.cancel_pending(value)
+        if cancelled.is_error:
+            return Result.fail(cancelled.error)
+
+        return Result.success(BulkCancelReservationsResponse(cancelled=cancelled.value))
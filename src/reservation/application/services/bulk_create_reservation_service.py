@@ -0,0 +1,146 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.common.application import ApplicationException, IService
+from src.common.application.id_generator.id_generator import IIdGenerator
+from src.common.domain import DomainException
+from src.common.utils import Result
+from src.reservation.application.availability.booking_guard import IBookingGuard
+from src.reservation.application.availability.free_table_index import IFreeTableIndex
+from src.reservation.application.dtos.request.bulk_create_reservation_request_dto import BulkCreateReservationRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.response.bulk_create_reservation_response_dto import BulkCreateReservationResponse, BulkReservationItemResult
+from src.reservation.application.exceptions.active_reservation_conflict_exception import ActiveReservationConflictException
+from src.reservation.application.exceptions.pre_order_limit_exceeded_exception import PreorderLimitExceededException
+from src.reservation.application.exceptions.reservation_duration_exceeded_exception import ReservationDurationExceededException
+from src.reservation.application.exceptions.table_not_available_exception import TableNotAvailableException
+from src.reservation.application.repositories.command.reservation_command_repository import IReservationCommandRepository
+from src.reservation.application.repositories.query.reservation_query_repository import IReservationQueryRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+class BulkCreateReservationService(IService[BulkCreateReservationRequest, BulkCreateReservationResponse]):
+    """
+    Crea un lote de reservas con las mismas reglas que CreateReservationService, resolviendo
+    cada fila por separado: las rechazadas no impiden guardar las demas. El lote se evalua
+    contra la BD en una consulta y se guarda en un solo INSERT multi-fila.
+    """
+
+    def __init__(
+        self,
+        query_reser: IReservationQueryRepository,
+        command_reser: IReservationCommandRepository,
+        id_generator: IIdGenerator,
+        free_tables: IFreeTableIndex,
+        booking_guard: IBookingGuard
+        ):
+        super().__init__()
+        self.query_repository = query_reser
+        self.command_repository = command_reser
+        self.id_generator = id_generator
+        self.free_tables = free_tables
+        self.booking_guard = booking_guard
+
+    async def execute(self, value: BulkCreateReservationRequest) -> Result[BulkCreateReservationResponse]:
+        items = value.items
+        rejected: dict[int, Exception] = {}
+
+        # Reglas que no dependen de la BD; cada fila valida pasa a la lista con el id de su reserva
+        accepted: dict[int, str] = {}
+        valid_ids: set[tuple[type, object]] = set()
+        for i, item in enumerate(items):
+            rejection = self._check_item(item) or self._check_ids(item, valid_ids)
+            if rejection is not None:
+                rejected[i] = rejection
+                continue
+            accepted[i] = self.id_generator.generate_id()
+
+        # Mesa, cliente, horario y platos de todo el lote contra lo ya guardado
+        pending = list(accepted)
+        guard = await self.booking_guard.hold([
+            (items[i].restaurant_id, str(items[i].table_number_id), items[i].reservation_date) for i in pending
+        ])
+        if guard.is_error:
+            return Result.fail(guard.error)
+
+        admission = await self.query_repository.check_admission_many([items[i] for i in pending])
+        if admission.is_error:
+            return Result.fail(admission.error)
+
+        for i, verdict in zip(pending, admission.value):
+            rejection = verdict.rejection()
+            if rejection is not None:
+                rejected[i] = rejection
+                del accepted[i]
+
+        conflicts = self._sweep(items, list(accepted))
+        for i, conflict in conflicts.items():
+            rejected[i] = conflict
+            del accepted[i]
+
+        if accepted:
+            entries = [(reservation_id, items[i]) for i, reservation_id in accepted.items()]
+            save_result = await self.command_repository.insert_pending(entries)
+            if save_result.is_error:
+                return Result.fail(save_result.error)
+
+            self.free_tables.book_many(entries)
+
+        return Result.success(BulkCreateReservationResponse([
+            BulkReservationItemResult(index=i, id=accepted[i])
+            if i in accepted
+            else BulkReservationItemResult(index=i, error=str(rejected[i]))
+            for i in range(len(items))
+        ]))
+
+    @staticmethod
+    def _check_item(item: CreateReservationRequest) -> Optional[ApplicationException]:
+        date_base = date.today()
+        if datetime.combine(date_base, item.date_end) - datetime.combine(date_base, item.date_start) > timedelta(hours=4):
+            return ReservationDurationExceededException()
+        if len(item.dish_id) > 5:
+            return PreorderLimitExceededException()
+        return None
+
+    @staticmethod
+    def _check_ids(item: CreateReservationRequest, valid: set[tuple[type, object]]) -> Optional[DomainException]:
+        """
+        Los value objects del agregado que validan algo, sin construir el agregado por fila: cada
+        valor se valida una vez por lote (los restaurantes y las mesas se repiten mucho). El resto
+        de campos y el id generado no tienen reglas.
+        """
+        try:
+            for vo, value in ((UserIdVo, item.client_id), (RestaurantIdVo, item.restaurant_id), (TableNumberId, item.table_number_id)):
+                if (vo, value) not in valid:
+                    vo(value)
+                    valid.add((vo, value))
+        except DomainException as e:
+            return e
+        return None
+
+    @staticmethod
+    def _sweep(items: list[CreateReservationRequest], candidates: list[int]) -> dict[int, ApplicationException]:
+        """
+        Conflictos dentro del lote: ordena por (dia, inicio) y recorre una sola vez. Lo admitido
+        para cada mesa y cada cliente queda sin solapes y ordenado, asi que basta comparar con el
+        fin de la ultima fila admitida. Entre dos filas que chocan gana la que empieza antes
+        (y a igual inicio, la que va primero en el lote).
+        """
+        table_free_at: dict[tuple[str, str, date], time] = {}
+        client_free_at: dict[tuple[str, date], time] = {}
+        conflicts: dict[int, ApplicationException] = {}
+
+        for i in sorted(candidates, key=lambda i: (items[i].reservation_date, items[i].date_start, i)):
+            item = items[i]
+            table_key = (item.restaurant_id, str(item.table_number_id), item.reservation_date)
+            client_key = (item.client_id, item.reservation_date)
+
+            if table_key in table_free_at and item.date_start < table_free_at[table_key]:
+                conflicts[i] = TableNotAvailableException()
+            elif client_key in client_free_at and item.date_start < client_free_at[client_key]:
+                conflicts[i] = ActiveReservationConflictException()
+            else:
+                table_free_at[table_key] = item.date_end
+                client_free_at[client_key] = item.date_end
+
+        return conflicts
@@ -0,0 +1,25 @@
+from typing import AsyncIterator
+from src.common.application import IService
+from src.common.utils import Result
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.dtos.response.find_reservation_response_dto import ReservationResponse
+from src.reservation.application.repositories.query.reservation_query_repository import IReservationQueryRepository
+
+class ExportReservationsService(IService[FindReservationRequest, AsyncIterator[list[ReservationResponse]]]):
+    """
+    Todas las reservas que cumplen los filtros como bloques de chunk_size, para exportarlas
+    sin tenerlas completas en memoria. limit y after no aplican.
+    """
+
+    def __init__(self, query_reser: IReservationQueryRepository, chunk_size: int = 1000):
+        super().__init__()
+        self.query_repository = query_reser
+        self.chunk_size = chunk_size
+
+    async def execute(self, value: FindReservationRequest) -> Result[AsyncIterator[list[ReservationResponse]]]:
+        chunks = await self.query_repository.stream(value, self.chunk_size)
+
+        if chunks.is_error:
+            return Result.fail(chunks.error)
+
+        return Result.success(chunks.value)
@@ -14,12 +14,18 @@ class FindReservationService(IService[FindReservationRequest, FindReservationRes
         self.query_repository = query_reser
         
     async def execute(self, value: FindReservationRequest) -> Result[FindReservationResponse]:
-        find = await self.query_repository.get_all()
+        # Una fila de mas indica si hay otra pagina sin contar el total
+        find = await self.query_repository.find_page(value, value.limit + 1)
         
         if find.is_error:
             return Result.fail(find.error)
+
+        reservations = find.value[:value.limit]
+        next_after = None
+        if len(find.value) > value.limit:
+            last = reservations[-1]
+            next_after = (last.date.reservation_date, last.id.reservation_id)
         
-        response = FindReservationResponse(reservations=find.value)
+        response = FindReservationResponse(reservations=reservations, next_after=next_after)
         
         return Result.success(response)
-
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+from src.common.application import IService
+from src.common.utils import Result
+from src.reservation.application.availability.free_table_index import IFreeTableIndex
+from src.reservation.application.dtos.request.search_free_tables_request_dto import SearchFreeTablesRequest
+from src.reservation.application.dtos.response.search_free_tables_response_dto import FreeTableResponse, SearchFreeTablesResponse
+from src.reservation.application.exceptions.invalid_search_window_exception import InvalidSearchWindowException
+from src.reservation.application.exceptions.reservation_duration_exceeded_exception import ReservationDurationExceededException
+
+class SearchFreeTablesService(IService[SearchFreeTablesRequest, SearchFreeTablesResponse]):
+
+    def __init__(self, free_tables: IFreeTableIndex):
+        super().__init__()
+        self.free_tables = free_tables
+
+    async def execute(self, value: SearchFreeTablesRequest) -> Result[SearchFreeTablesResponse]:
+
+        # Mismo limite que al crear una reserva
+        if value.duration_minutes > 4 * 60:
+            return Result.fail(ReservationDurationExceededException())
+
+        start_dt = datetime.combine(value.reservation_date, value.date_start)
+        end_dt = start_dt + timedelta(minutes=value.duration_minutes)
+
+        if value.duration_minutes <= 0 or end_dt.date() != value.reservation_date:
+            return Result.fail(InvalidSearchWindowException())
+
+        found = await self.free_tables.search(
+            reservation_date=value.reservation_date,
+            date_start=value.date_start,
+            date_end=end_dt.time(),
+            people=value.people,
+            restaurant_id=value.restaurant_id
+        )
+
+        if found.is_error:
+            return Result.fail(found.error)
+
+        response = SearchFreeTablesResponse(
+            reservation_date=value.reservation_date,
+            date_start=value.date_start,
+            date_end=end_dt.time(),
+            tables=[
+                FreeTableResponse(restaurant_id=restaurant_id, table_id=table_id, capacity=capacity)
+                for restaurant_id, table_id, capacity in found.value
+            ]
+        )
+        return Result.success(response)
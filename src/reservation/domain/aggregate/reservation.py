@@ -55,6 +55,9 @@ class Reservation(AggregateRoot["ReservationIdVo"]):
 
     def update_status_completada(self) -> None:
         self.__status = ReservationStatusVo("completada")
+
+    def update_status_no_presentada(self) -> None:
+        self.__status = ReservationStatusVo("no_presentada")
     
     @property
     def date_start(self) -> ReservationDateStartVo:
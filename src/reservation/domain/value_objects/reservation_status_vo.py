@@ -6,8 +6,14 @@ class ReservationStatusVo(ValueObjectRoot["ReservationStatusVo"]):
     COMPLETADA = "completada"
     CANCELADA = "cancelada"
     CONFIRMADA = "confirmada"
+    # Cliente que no se presento; aun no lo asigna ningun flujo
+    NO_PRESENTADA = "no_presentada"
 
-    ESTADOS_VALIDOS = {PENDIENTE, COMPLETADA, CANCELADA, CONFIRMADA}
+    ESTADOS_VALIDOS = {PENDIENTE, COMPLETADA, CANCELADA, CONFIRMADA, NO_PRESENTADA}
+    # Estados que ocupan la mesa y el horario del cliente
+    ESTADOS_ACTIVOS = {PENDIENTE, CONFIRMADA}
+    # Estados que cuentan como mesa ocupada ese dia: solo la cancelacion la libera
+    ESTADOS_OCUPAN_MESA = ESTADOS_ACTIVOS | {COMPLETADA, NO_PRESENTADA}
     
     def __init__(self, reservation_status: str):
         if reservation_status not in self.ESTADOS_VALIDOS:
@@ -0,0 +1,127 @@
+from bisect import bisect_left
+from datetime import time
+
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+
+def time_to_minutes(value: time, round_up: bool = False) -> int:
+    minutes = value.hour * 60 + value.minute
+    if round_up and (value.second or value.microsecond):
+        minutes += 1
+    return minutes
+
+def slot_mask(start_minutes: int, end_minutes: int) -> int:
+    """
+    Bits de los slots que toca el intervalo [start, end). Un slot ocupado parcialmente cuenta como ocupado.
+    """
+    first = start_minutes // SLOT_MINUTES
+    last = min(-(-end_minutes // SLOT_MINUTES), SLOTS_PER_DAY)
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+def opening_mask(opening_time: time, closing_time: time) -> int:
+    """
+    Slots completos dentro del horario del restaurante.
+    """
+    open_slot = -(-time_to_minutes(opening_time, round_up=True) // SLOT_MINUTES)
+    close_slot = time_to_minutes(closing_time) // SLOT_MINUTES
+    if close_slot <= open_slot:
+        return 0
+    return ((1 << (close_slot - open_slot)) - 1) << open_slot
+
+def slots_of(mask: int) -> list[int]:
+    return [s for s in range(SLOTS_PER_DAY) if mask >> s & 1]
+
+class DaySlotBitmap:
+    """
+    Mapa de slots de 15 minutos libres por mesa en un dia, para uno o varios restaurantes.
+    Las mesas se numeran 0..n-1 ordenadas por capacidad y se guardan dos vistas:
+    - free[i]: bit s en 1 si la mesa i esta libre en el slot s (fuera de horario nunca lo esta).
+    - slot_tables[s]: bit i en 1 si la mesa i esta libre en el slot s.
+    Una busqueda es el AND de slot_tables sobre los slots pedidos, recortado por capacidad.
+    """
+
+    def __init__(
+        self,
+        restaurants: list[tuple[str, time, time, list[tuple[str, int]]]],
+        bookings: list[tuple[str, str, str, int, int]] = []
+    ):
+        rows: list[tuple[int, str, str, int]] = []
+        for restaurant_id, opening_time, closing_time, tables in restaurants:
+            mask = opening_mask(opening_time, closing_time)
+            for table_id, capacity in tables:
+                rows.append((capacity, restaurant_id, table_id, mask))
+        rows.sort(key=lambda row: row[0])
+
+        self.capacities: list[int] = [row[0] for row in rows]
+        self.restaurant_ids: list[str] = [row[1] for row in rows]
+        self.table_ids: list[str] = [row[2] for row in rows]
+        self.open_masks: list[int] = [row[3] for row in rows]
+        self.free: list[int] = list(self.open_masks)
+        self._position: dict[tuple[str, str], int] = {(row[1], row[2]): i for i, row in enumerate(rows)}
+        self._bookings: list[dict[str, int]] = [{} for _ in rows]
+
+        # Reservas iniciales (restaurant_id, table_id, reservation_id, inicio, fin) antes de transponer
+        for restaurant_id, table_id, reservation_id, start_minutes, end_minutes in bookings:
+            i = self._position.get((restaurant_id, table_id))
+            if i is None:
+                continue
+            mask = slot_mask(start_minutes, end_minutes)
+            self._bookings[i][reservation_id] = mask
+            self.free[i] &= ~mask
+
+        self.slot_tables: list[int] = self._transpose(self.free)
+
+    @staticmethod
+    def _transpose(free: list[int]) -> list[int]:
+        if not free:
+            return [0] * SLOTS_PER_DAY
+        # format(..., '096b')[k] es el slot 95-k; zip(*) arma por slot la columna de todas las mesas
+        columns = zip(*(format(mask, f"0{SLOTS_PER_DAY}b") for mask in free))
+        by_slot = [int("".join(column)[::-1], 2) for column in columns]
+        by_slot.reverse()
+        return by_slot
+
+    def book(self, restaurant_id: str, table_id: str, reservation_id: str, start_minutes: int, end_minutes: int) -> None:
+        i = self._position.get((restaurant_id, table_id))
+        if i is None:
+            return
+        mask = slot_mask(start_minutes, end_minutes)
+        self._bookings[i][reservation_id] = mask
+        self._set_free(i, self.free[i] & ~mask)
+
+    def release(self, restaurant_id: str, table_id: str, reservation_id: str) -> None:
+        i = self._position.get((restaurant_id, table_id))
+        if i is None or self._bookings[i].pop(reservation_id, None) is None:
+            return
+        # Otra reserva puede compartir un slot parcial, por eso se recalcula la mesa completa
+        free = self.open_masks[i]
+        for mask in self._bookings[i].values():
+            free &= ~mask
+        self._set_free(i, free)
+
+    def _set_free(self, i: int, free: int) -> None:
+        changed = self.free[i] ^ free
+        self.free[i] = free
+        bit = 1 << i
+        for s in slots_of(changed):
+            self.slot_tables[s] ^= bit
+
+    def find_free(self, wanted: int, people: int) -> list[tuple[str, str, int]]:
+        if wanted == 0 or not self.capacities:
+            return []
+        first = bisect_left(self.capacities, people)
+        candidates = ((1 << len(self.capacities)) - 1) >> first << first
+        for s in slots_of(wanted):
+            candidates &= self.slot_tables[s]
+            if not candidates:
+                return []
+
+        found: list[tuple[str, str, int]] = []
+        bits = format(candidates, "b")[::-1]
+        i = bits.find("1")
+        while i != -1:
+            found.append((self.restaurant_ids[i], self.table_ids[i], self.capacities[i]))
+            i = bits.find("1", i + 1)
+        return found
@@ -0,0 +1,168 @@
+import time as clock
+from datetime import date, time
+from typing import Optional
+from src.common.infrastructure import InvalidationBus
+from src.common.utils import Result
+from src.reservation.application.availability.free_table_index import IFreeTableIndex
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.repositories.query.reservation_query_repository import IReservationQueryRepository
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.availability.slot_bitmap import DaySlotBitmap, slot_mask, time_to_minutes
+from src.restaurant.application.repositories.query.restaurant_query_repository import IRestaurantQueryRepository
+from src.restaurant.domain.aggregate.restaurant import Restaurant
+
+class SlotBitmapIndex(IFreeTableIndex):
+    """
+    Bitmaps de slots libres por (restaurante, dia) y de toda la ciudad por dia, compartidos por
+    todo el proceso. Se actualizan en caliente con book/release; las reservas hechas en otros
+    workers llegan por InvalidationBus y descartan el dia afectado. Cada bitmap se reconstruye
+    tras TTL_SECONDS para recoger cambios de mesas y horarios.
+    """
+
+    TOPIC = "reservation_day"
+    TTL_SECONDS = 60
+
+    _restaurants: dict[tuple[str, date], tuple[float, DaySlotBitmap]] = {}
+    _cities: dict[date, tuple[float, DaySlotBitmap]] = {}
+
+    def __init__(self, reservation_query: IReservationQueryRepository, restaurant_query: IRestaurantQueryRepository):
+        self.reservation_query = reservation_query
+        self.restaurant_query = restaurant_query
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._restaurants.clear()
+        cls._cities.clear()
+
+    @classmethod
+    def key(cls, restaurant_id: str, reservation_date: date) -> str:
+        return f"{restaurant_id}|{reservation_date.isoformat()}"
+
+    @classmethod
+    def evict(cls, key: Optional[str]) -> None:
+        if key is None:
+            cls.clear()
+            return
+        restaurant_id, day = key.rsplit("|", 1)
+        reservation_date = date.fromisoformat(day)
+        cls._restaurants.pop((restaurant_id, reservation_date), None)
+        cls._cities.pop(reservation_date, None)
+
+    async def search(self, reservation_date: date, date_start: time, date_end: time, people: int, restaurant_id: Optional[str] = None) -> Result[list[tuple[str, str, int]]]:
+        if restaurant_id is not None:
+            loaded = await self._restaurant_day(restaurant_id, reservation_date)
+        else:
+            loaded = await self._city_day(reservation_date)
+
+        if loaded.is_error:
+            return Result.fail(loaded.error)
+
+        wanted = slot_mask(time_to_minutes(date_start), time_to_minutes(date_end, round_up=True))
+        return Result.success(loaded.value.find_free(wanted, people))
+
+    def book(self, reservation: Reservation) -> None:
+        if reservation.status.reservation_status not in ReservationStatusVo.ESTADOS_ACTIVOS:
+            return
+        for bitmap in self._bitmaps_for(reservation):
+            bitmap.book(
+                reservation.restaurant_id.restaurant_id,
+                str(reservation.table_number_id.table_number_id),
+                reservation.id.reservation_id,
+                time_to_minutes(reservation.date_start.reservation_date_start),
+                time_to_minutes(reservation.date_end.reservation_date_end, round_up=True)
+            )
+
+    def book_many(self, entries: list[tuple[str, CreateReservationRequest]]) -> None:
+        for reservation_id, item in entries:
+            for bitmap in self._bitmaps_at(item.restaurant_id, item.reservation_date):
+                bitmap.book(
+                    item.restaurant_id,
+                    str(item.table_number_id),
+                    reservation_id,
+                    time_to_minutes(item.date_start),
+                    time_to_minutes(item.date_end, round_up=True)
+                )
+
+    def _bitmaps_for(self, reservation: Reservation) -> list[DaySlotBitmap]:
+        return self._bitmaps_at(reservation.restaurant_id.restaurant_id, reservation.date.reservation_date)
+
+    def _bitmaps_at(self, restaurant_id: str, reservation_date: date) -> list[DaySlotBitmap]:
+        cached = [
+            self._restaurants.get((restaurant_id, reservation_date)),
+            self._cities.get(reservation_date)
+        ]
+        return [entry[1] for entry in cached if entry is not None]
+
+    def _is_fresh(self, entry: Optional[tuple[float, DaySlotBitmap]]) -> bool:
+        return entry is not None and clock.monotonic() - entry[0] < self.TTL_SECONDS
+
+    async def _restaurant_day(self, restaurant_id: str, reservation_date: date) -> Result[DaySlotBitmap]:
+        entry = self._restaurants.get((restaurant_id, reservation_date))
+        if self._is_fresh(entry):
+            return Result.success(entry[1])
+
+        restaurant = await self.restaurant_query.get_by_id(restaurant_id)
+        if restaurant.is_error:
+            return Result.fail(restaurant.error)
+
+        reservations = await self.reservation_query.get_all_by_date_restaurant(restaurant_id, reservation_date)
+        if reservations.is_error:
+            return Result.fail(reservations.error)
+
+        self._evict_past_days()
+        bitmap = self._build([restaurant.value], reservations.value or [])
+        self._restaurants[(restaurant_id, reservation_date)] = (clock.monotonic(), bitmap)
+        return Result.success(bitmap)
+
+    async def _city_day(self, reservation_date: date) -> Result[DaySlotBitmap]:
+        entry = self._cities.get(reservation_date)
+        if self._is_fresh(entry):
+            return Result.success(entry[1])
+
+        # Dos consultas para todos los restaurantes del dia en lugar de una por restaurante
+        restaurants = await self.restaurant_query.get_all_with_tables()
+        if restaurants.is_error:
+            return Result.fail(restaurants.error)
+
+        reservations = await self.reservation_query.get_active_by_date(reservation_date)
+        if reservations.is_error:
+            return Result.fail(reservations.error)
+
+        self._evict_past_days()
+        bitmap = self._build(restaurants.value, reservations.value)
+        self._cities[reservation_date] = (clock.monotonic(), bitmap)
+        return Result.success(bitmap)
+
+    def _build(self, restaurants: list[Restaurant], reservations: list[Reservation]) -> DaySlotBitmap:
+        return DaySlotBitmap(
+            restaurants=[
+                (
+                    restaurant.id.restaurant_id,
+                    restaurant.opening_time.opening_time,
+                    restaurant.closing_time.closing_time,
+                    [(str(t.id.table_number_id), t.capacity.capacity) for t in restaurant.tables]
+                )
+                for restaurant in restaurants
+            ],
+            bookings=[
+                (
+                    r.restaurant_id.restaurant_id,
+                    str(r.table_number_id.table_number_id),
+                    r.id.reservation_id,
+                    time_to_minutes(r.date_start.reservation_date_start),
+                    time_to_minutes(r.date_end.reservation_date_end, round_up=True)
+                )
+                for r in reservations
+                if r.status.reservation_status in ReservationStatusVo.ESTADOS_ACTIVOS
+            ]
+        )
+
+    def _evict_past_days(self) -> None:
+        today = date.today()
+        for key in [k for k in self._restaurants if k[1] < today]:
+            del self._restaurants[key]
+        for day in [d for d in self._cities if d < today]:
+            del self._cities[day]
+
+InvalidationBus.subscribe(SlotBitmapIndex.TOPIC, SlotBitmapIndex.evict)
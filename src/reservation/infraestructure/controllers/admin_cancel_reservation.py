@@ -9,7 +9,8 @@ from src.reservation.application.services.admin_cancel_reservation_service impor
 from src.reservation.application.services.cancel_reservation_service import CancelReservationService
 from src.reservation.infraestructure.dtos.admin_cancel_reservation_inf_request_dto import AdminCancelReservationInfRequestDto
 from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
-from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 reservation_router = APIRouter(
     prefix="/reservation",
@@ -22,13 +23,12 @@ class AdminCancelReservationController:
         app.include_router(reservation_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        query_repository = OrmReservationQueryRepository(postgres_session)
-        command_repository = OrmReservationCommandRepository(postgres_session)
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        command_repository = uow.repository(OrmReservationCommandRepository)
         service = AdminCancelReservationService(
-            query_reser=query_repository,
-            command_reser=command_repository,
+            command_reser=command_repository
         )
-        return service
+        return UnitOfWorkDecorator(service, uow)
 
     def setup_routes(self):
         @reservation_router.post(
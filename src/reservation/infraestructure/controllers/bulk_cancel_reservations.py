@@ -0,0 +1,75 @@
+from collections import Counter
+from fastapi import BackgroundTasks, FastAPI, Depends, Security, status, APIRouter
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.application.notifier.notifier import Notifier
+from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.infrastructure.notifier.notifier import RichLoggerNotifier
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from src.reservation.application.services.bulk_cancel_reservations_service import BulkCancelReservationsService
+from src.reservation.infraestructure.dtos.bulk_cancel_reservations_inf_request_dto import BulkCancelReservationsInfRequestDto
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+
+reservation_router = APIRouter(
+    prefix="/reservation",
+    tags=["Reservation"],
+)
+class BulkCancelReservationsController:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.setup_routes()
+        app.include_router(reservation_router)
+
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        service = BulkCancelReservationsService(
+            command_reser=uow.repository(OrmReservationCommandRepository)
+        )
+        return UnitOfWorkDecorator(service, uow)
+
+    def setup_routes(self):
+        @reservation_router.post(
+            "/admin/cancel/bulk",
+            response_model=None,
+            status_code=status.HTTP_200_OK,
+            summary="Cancelar reservaciones en lote",
+            description=("Cancela las reservaciones pendientes de un restaurante en un rango de fechas, opcionalmente en una franja horaria o una mesa"),
+            response_description="Devuelve cuantas reservaciones se cancelaron y sus ids"
+        )
+        async def bulk_cancel(
+            entry: BulkCancelReservationsInfRequestDto,
+            background_tasks: BackgroundTasks,
+            service: BulkCancelReservationsService = Depends(self.get_service),
+            token = Security(UserRoleVerify(), scopes=["admin:manage"])
+            ):
+            if service is None:
+                raise RuntimeError("BulkCancelReservationsService not initialized. Did you forget to call init()?")
+            service = ExceptionDecorator(service, FastApiErrorHandler())
+            result = await service.execute(
+                BulkCancelReservationsRequest(
+                    restaurant_id=entry.restaurant_id,
+                    date_from=entry.date_from,
+                    date_to=entry.date_to or entry.date_from,
+                    time_from=entry.time_from,
+                    time_to=entry.time_to,
+                    table_number_id=entry.table_number_id
+                )
+            )
+            cancelled = result.value.cancelled
+
+            # Un aviso por cliente, enviados juntos cuando ya salio la respuesta
+            notifier: Notifier = RichLoggerNotifier()
+            per_client = Counter(c.client_id for c in cancelled)
+            background_tasks.add_task(notifier.notify_many, [
+                f"Notificación: {count} reserva(s) del cliente {client_id} en {entry.restaurant_id} canceladas por el restaurante."
+                for client_id, count in per_client.items()
+            ])
+
+            return {
+                "cancelled": len(cancelled),
+                "reservation_ids": [c.id for c in cancelled]
+            }
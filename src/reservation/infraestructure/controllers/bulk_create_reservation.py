@@ -0,0 +1,80 @@
+from fastapi import FastAPI, Depends, Security, status, APIRouter
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.reservation.application.dtos.request.bulk_create_reservation_request_dto import BulkCreateReservationRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from src.common.infrastructure.id_generator.uuid_generator import UuidGenerator
+from src.reservation.application.services.bulk_create_reservation_service import BulkCreateReservationService
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.dtos.bulk_create_reservation_inf_request_dto import BulkCreateReservationInfRequestDto
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+
+reservation_router = APIRouter(
+    prefix="/reservation",
+    tags=["Reservation"],
+)
+class BulkCreateReservationController:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.setup_routes()
+        app.include_router(reservation_router)
+
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        query_repository = uow.repository(OrmReservationQueryRepository)
+        command_repository = uow.repository(OrmReservationCommandRepository)
+        query_restau = uow.repository(OrmRestaurantQueryRepository)
+        service = BulkCreateReservationService(
+            query_reser=query_repository,
+            command_reser=command_repository,
+            id_generator=UuidGenerator(),
+            free_tables=SlotBitmapIndex(query_repository, query_restau),
+            booking_guard=uow.repository(AdvisoryLockBookingGuard)
+        )
+        return UnitOfWorkDecorator(service, uow)
+
+    def setup_routes(self):
+        @reservation_router.post(
+            "/bulk",
+            response_model=None,
+            status_code=status.HTTP_200_OK,
+            summary="Crear reservaciones en lote",
+            description=("Crea hasta 10000 reservaciones; cada fila se admite o se rechaza por separado"),
+            response_description="Devuelve el resultado de cada fila en el orden recibido"
+        )
+        async def bulk_create(
+            entry: BulkCreateReservationInfRequestDto,
+            service: BulkCreateReservationService = Depends(self.get_service),
+            token = Security(UserRoleVerify(), scopes=["admin:manage"])
+            ):
+            if service is None:
+                raise RuntimeError("BulkCreateReservationService not initialized. Did you forget to call init()?")
+            service = ExceptionDecorator(service, FastApiErrorHandler())
+            result = await service.execute(
+                BulkCreateReservationRequest(items=[
+                    CreateReservationRequest(
+                        client_id=item.client_id,
+                        date_start=item.date_start,
+                        date_end=item.date_end,
+                        restaurant_id=item.restaurant_id,
+                        table_number_id=item.table_number_id,
+                        reservation_date=item.reservation_date,
+                        dish_id=item.dish_id
+                    )
+                    for item in entry.items
+                ])
+            )
+            response = result.value
+            return {
+                "created": response.created,
+                "rejected": response.rejected,
+                "results": [vars(r) for r in response.results]
+            }
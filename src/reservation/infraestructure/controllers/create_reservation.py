@@ -9,11 +9,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from src.common.infrastructure.id_generator.uuid_generator import UuidGenerator
 from src.reservation.application.services.create_reservation_service import CreateReservationService
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
 from src.reservation.infraestructure.dtos.create_reservation_inf_request_dto import CreateReservationInfRequestDto
 from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
 from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
 from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
-from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 reservation_router = APIRouter(
     prefix="/reservation",
@@ -26,20 +29,21 @@ class CreateReservationController:
         app.include_router(reservation_router)
 
     async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
-        query_repository = OrmReservationQueryRepository(postgres_session)
-        command_repository = OrmReservationCommandRepository(postgres_session)
-        query_restau = OrmRestaurantQueryRepository(postgres_session)
+        uow = SqlAlchemyUnitOfWork(postgres_session)
+        query_repository = uow.repository(OrmReservationQueryRepository)
+        command_repository = uow.repository(OrmReservationCommandRepository)
+        query_restau = uow.repository(OrmRestaurantQueryRepository)
         id_generator = UuidGenerator()
-        menu_repo = OrmMenuQueryRepository(postgres_session)
+        free_tables = SlotBitmapIndex(query_repository, query_restau)
         
         service = CreateReservationService(
             query_reser=query_repository,
             command_reser=command_repository,
             id_generator=id_generator,
-            query_restau=query_restau,
-            menu_repo=menu_repo
+            free_tables=free_tables,
+            booking_guard=uow.repository(AdvisoryLockBookingGuard)
         )
-        return service
+        return UnitOfWorkDecorator(service, uow)
 
     def setup_routes(self):
         @reservation_router.post(
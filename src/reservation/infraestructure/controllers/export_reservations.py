@@ -0,0 +1,73 @@
+import json
+import logging
+from fastapi import FastAPI, Depends, Security, status, APIRouter
+from fastapi.responses import StreamingResponse
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.services.export_reservations_service import ExportReservationsService
+from src.reservation.infraestructure.dtos.find_reservation_inf_request_dto import FindReservationInfRequestDto
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+
+reservation_router = APIRouter(
+    prefix="/reservation",
+    tags=["Reservation"],
+)
+
+class ExportReservationsController:
+    CHUNK_SIZE = 1000
+
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.setup_routes()
+        app.include_router(reservation_router)
+
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
+        query_repository = OrmReservationQueryRepository(postgres_session)
+        service = ExportReservationsService(
+            query_reser=query_repository,
+            chunk_size=self.CHUNK_SIZE
+        )
+        return service
+
+    def setup_routes(self):
+        @reservation_router.get(
+            "/export",
+            response_model=None,
+            status_code=status.HTTP_200_OK,
+            summary="Exportar reservaciones",
+            description=("Todas las reservaciones que cumplen los filtros como NDJSON (una por linea), leidas por bloques; limit y cursor no aplican"),
+            response_description="Flujo application/x-ndjson de reservaciones"
+        )
+        async def export(
+            entry: FindReservationInfRequestDto = Depends(),
+            service: ExportReservationsService = Depends(self.get_service),
+            token = Security(UserRoleVerify(), scopes=["admin:manage"])
+            ):
+            if service is None:
+                raise RuntimeError("ExportReservationsService not initialized. Did you forget to call init()?")
+            entry.check_range()
+            service = ExceptionDecorator(service, FastApiErrorHandler())
+            result = await service.execute(
+                FindReservationRequest(
+                    restaurant_id=entry.restaurant_id,
+                    status=entry.status,
+                    date_from=entry.date_from,
+                    date_to=entry.date_to
+                )
+            )
+
+            async def lines():
+                try:
+                    async for chunk in result.value:
+                        # Un bloque por escritura: fechas y horas en ISO
+                        yield "".join(json.dumps(vars(r), default=str) + "\n" for r in chunk)
+                except Exception as e:
+                    # Las cabeceras ya salieron: el error va como ultima linea
+                    logging.error(f"Reservation export failed: {e}")
+                    yield json.dumps({"error": "export interrupted"}) + "\n"
+
+            return StreamingResponse(lines(), media_type="application/x-ndjson")
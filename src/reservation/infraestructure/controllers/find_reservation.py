@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
 from src.reservation.application.services.find_reservation_service import FindReservationService
+from src.reservation.infraestructure.dtos.find_reservation_inf_request_dto import FindReservationInfRequestDto
+from src.reservation.infraestructure.pagination.reservation_cursor import ReservationCursor
 from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
 
 reservation_router = APIRouter(
@@ -32,15 +34,30 @@ class FindReservationController:
             response_model=None,
             status_code=status.HTTP_200_OK,
             summary="Encontrar reservaciones",
-            description=("Encontrar reservaciones"),
-            response_description="Devuelve una lista de reservaciones"
+            description=("Encontrar reservaciones por restaurante, estado y rango de fechas, paginadas por cursor"),
+            response_description="Devuelve una pagina de reservaciones y el cursor de la siguiente"
         )
         async def find(
+            entry: FindReservationInfRequestDto = Depends(),
             service: FindReservationService = Depends(self.get_service),
             token = Security(UserRoleVerify(), scopes=["admin:manage"])
             ):
             if service is None:
                 raise RuntimeError("FindReservationService not initialized. Did you forget to call init()?")
-            result = service = ExceptionDecorator(service, FastApiErrorHandler())
-            result = await service.execute(FindReservationRequest())
-            return result.value
\ No newline at end of file
+            entry.check_range()
+            service = ExceptionDecorator(service, FastApiErrorHandler())
+            result = await service.execute(
+                FindReservationRequest(
+                    limit=entry.limit,
+                    after=entry.after(),
+                    restaurant_id=entry.restaurant_id,
+                    status=entry.status,
+                    date_from=entry.date_from,
+                    date_to=entry.date_to
+                )
+            )
+            page = result.value
+            return {
+                "reservations": page.reservations,
+                "next_cursor": ReservationCursor.encode(page.next_after) if page.next_after else None
+            }
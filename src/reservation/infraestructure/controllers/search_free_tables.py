@@ -0,0 +1,59 @@
+from fastapi import FastAPI, Depends, Security, status, APIRouter
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from src.reservation.application.dtos.request.search_free_tables_request_dto import SearchFreeTablesRequest
+from src.reservation.application.services.search_free_tables_service import SearchFreeTablesService
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.dtos.search_free_tables_inf_request_dto import SearchFreeTablesInfRequestDto
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+
+reservation_router = APIRouter(
+    prefix="/reservation",
+    tags=["Reservation"],
+)
+
+class SearchFreeTablesController:
+    def __init__(self, app: FastAPI):
+        self.app = app
+        self.setup_routes()
+        app.include_router(reservation_router)
+
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())):
+        query_repository = OrmReservationQueryRepository(postgres_session)
+        restaurant_repository = OrmRestaurantQueryRepository(postgres_session)
+        service = SearchFreeTablesService(
+            free_tables=SlotBitmapIndex(query_repository, restaurant_repository)
+        )
+        return service
+
+    def setup_routes(self):
+        @reservation_router.get(
+            "/free-tables",
+            response_model=None,
+            status_code=status.HTTP_200_OK,
+            summary="Buscar mesas libres",
+            description=("Mesas libres con capacidad para N personas desde date_start durante duration_minutes, en un restaurante o en todos"),
+            response_description="Devuelve la lista de mesas libres"
+        )
+        async def search(
+            entry: SearchFreeTablesInfRequestDto = Depends(),
+            service: SearchFreeTablesService = Depends(self.get_service),
+            token = Security(UserRoleVerify(), scopes=["client:reserve_table"])
+            ):
+            if service is None:
+                raise RuntimeError("SearchFreeTablesService not initialized. Did you forget to call init()?")
+            service = ExceptionDecorator(service, FastApiErrorHandler())
+            result = await service.execute(
+                SearchFreeTablesRequest(
+                    reservation_date=entry.reservation_date,
+                    date_start=entry.date_start,
+                    duration_minutes=entry.duration_minutes,
+                    people=entry.people,
+                    restaurant_id=entry.restaurant_id
+                )
+            )
+            return result.value
@@ -0,0 +1,11 @@
+from datetime import date, time
+from typing import Optional
+from pydantic import BaseModel, Field
+
+class BulkCancelReservationsInfRequestDto(BaseModel):
+    restaurant_id: str = Field(...)
+    date_from: date = Field(...)
+    date_to: Optional[date] = Field(default=None, description="Por defecto, solo date_from")
+    time_from: Optional[time] = Field(default=None)
+    time_to: Optional[time] = Field(default=None)
+    table_number_id: Optional[str] = Field(default=None)
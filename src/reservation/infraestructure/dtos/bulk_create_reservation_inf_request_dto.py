@@ -0,0 +1,14 @@
+from datetime import time, date
+from pydantic import BaseModel, Field
+
+class BulkReservationItemInfDto(BaseModel):
+    client_id: str = Field(...)
+    date_start: time = Field(...)
+    date_end: time = Field(...)
+    reservation_date: date = Field(...)
+    table_number_id: str = Field(...)
+    restaurant_id: str = Field(...)
+    dish_id: list[str] = Field(default_factory=list)
+
+class BulkCreateReservationInfRequestDto(BaseModel):
+    items: list[BulkReservationItemInfDto] = Field(..., min_length=1, max_length=10000)
@@ -0,0 +1,31 @@
+from datetime import date
+from typing import Optional
+from fastapi import Query
+from pydantic import BaseModel
+from src.common.infrastructure.error_handler.query_validation_error import invalid_query
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.pagination.reservation_cursor import ReservationCursor
+
+class FindReservationInfRequestDto(BaseModel):
+    limit: int = Query(50, ge=1, le=500)
+    cursor: Optional[str] = Query(None, description="next_cursor de la pagina anterior")
+    restaurant_id: Optional[str] = Query(None)
+    status: Optional[str] = Query(
+        None,
+        pattern=f"^({'|'.join(sorted(ReservationStatusVo.ESTADOS_VALIDOS))})$",
+        description="pendiente, confirmada, completada, cancelada o no_presentada"
+    )
+    date_from: Optional[date] = Query(None)
+    date_to: Optional[date] = Query(None)
+
+    def after(self) -> Optional[tuple[date, str]]:
+        if self.cursor is None:
+            return None
+        try:
+            return ReservationCursor.decode(self.cursor)
+        except Exception:
+            raise invalid_query("cursor", "Invalid cursor", self.cursor)
+
+    def check_range(self) -> None:
+        if self.date_from is not None and self.date_to is not None and self.date_from > self.date_to:
+            raise invalid_query("date_from", "date_from must not be after date_to", str(self.date_from))
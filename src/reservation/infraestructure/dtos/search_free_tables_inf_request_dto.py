@@ -0,0 +1,9 @@
+from datetime import time, date
+from typing import Optional
+from pydantic import BaseModel, Field
+class SearchFreeTablesInfRequestDto(BaseModel):
+    reservation_date: date = Field(...)
+    date_start: time = Field(...)
+    duration_minutes: int = Field(..., ge=1, le=240)
+    people: int = Field(..., ge=1)
+    restaurant_id: Optional[str] = Field(None, description="Sin restaurant_id se busca en todos los restaurantes")
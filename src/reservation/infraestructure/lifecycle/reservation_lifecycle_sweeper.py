@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time as clock
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+
+class ReservationLifecycleSweeper:
+    """
+    Cierra las reservas cuyo horario ya paso pasandolas a completada, para que el conjunto
+    activo no crezca sin limite.
+    Corre en todos los workers, pero en Postgres solo barre el que obtiene el advisory lock.
+    Cada lote es un UPDATE acotado con su propio commit: un atraso grande no abre una
+    transaccion larga ni bloquea muchas filas a la vez.
+    """
+
+    LOCK_KEY = 7_302_019
+    INTERVAL_SECONDS = 60
+    BATCH_SIZE = 1000
+    # Margen tras la hora de fin antes de cerrar la reserva
+    GRACE = timedelta(minutes=30)
+    # Ningun flujo confirma todavia la llegada del cliente: una pendiente vencida se da por
+    # cumplida. Con un flujo de confirmacion, las pendientes pasarian a no_presentada
+    TRANSITIONS = (
+        (ReservationStatusVo.CONFIRMADA, ReservationStatusVo.COMPLETADA),
+        (ReservationStatusVo.PENDIENTE, ReservationStatusVo.COMPLETADA),
+    )
+
+    _stats: dict[str, float] = {
+        "runs": 0, "skipped": 0, "errors": 0, "batches": 0, "swept": 0,
+        "completada": 0, "last_swept": 0, "last_ms": 0.0, "last_rows_per_second": 0.0
+    }
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    @classmethod
+    def stats(cls) -> dict[str, float]:
+        return dict(cls._stats)
+
+    @classmethod
+    def clear(cls) -> None:
+        for key in cls._stats:
+            cls._stats[key] = 0
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["errors"] += 1
+                logging.error(f"Reservation sweep failed: {e}")
+            await asyncio.sleep(self.INTERVAL_SECONDS)
+
+    async def sweep(self, now: Optional[datetime] = None) -> int:
+        """
+        Una vuelta completa. Devuelve cuantas reservas cerro; 0 tambien si otro worker tenia el lock.
+        """
+        ended_before = (now or datetime.now()) - self.GRACE
+        # Una conexion propia: el advisory lock es de sesion y debe liberarse en la misma
+        async with self.engine.connect() as connection:
+            postgres = connection.dialect.name == "postgresql"
+            if postgres:
+                locked = (await connection.execute(select(func.pg_try_advisory_lock(self.LOCK_KEY)))).scalar()
+                await connection.commit()
+                if not locked:
+                    self._stats["skipped"] += 1
+                    return 0
+            try:
+                return await self._sweep(connection, ended_before)
+            finally:
+                if postgres:
+                    await connection.execute(select(func.pg_advisory_unlock(self.LOCK_KEY)))
+                    await connection.commit()
+
+    async def _sweep(self, connection: AsyncConnection, ended_before: datetime) -> int:
+        t0 = clock.perf_counter()
+        swept = 0
+        async with AsyncSession(bind=connection, expire_on_commit=False) as session:
+            repository = OrmReservationCommandRepository(session)
+            for from_status, to_status in self.TRANSITIONS:
+                while True:
+                    result = await repository.expire(from_status, to_status, ended_before, self.BATCH_SIZE)
+                    if result.is_error:
+                        await session.rollback()
+                        raise result.error
+                    await session.commit()
+
+                    swept += result.value
+                    self._stats["batches"] += 1
+                    self._stats[to_status] += result.value
+                    if result.value < self.BATCH_SIZE:
+                        break
+
+        elapsed = clock.perf_counter() - t0
+        self._stats["runs"] += 1
+        self._stats["swept"] += swept
+        self._stats["last_swept"] = swept
+        self._stats["last_ms"] = round(elapsed * 1000, 1)
+        self._stats["last_rows_per_second"] = round(swept / elapsed, 1) if elapsed > 0 else 0.0
+        if swept:
+            logging.info(f"Reservation sweep: {swept} closed in {self._stats['last_ms']}ms")
+        return swept
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel, Relationship
 from datetime import time, date
 from typing import List
@@ -6,6 +7,20 @@ from src.menu.infrastructure.models.reservation_dishes_association import OrmRes
 class OrmReservationModel(SQLModel, table=True):
 
     __tablename__ = "reservation"
+    # Paginacion keyset por (reservation_date, id), con y sin filtro de restaurante
+    __table_args__ = (
+        Index("ix_reservation_date_id", "reservation_date", "id"),
+        Index("ix_reservation_restaurant_date_id", "restaurant_id", "reservation_date", "id"),
+        # Solapes de una mesa y de un cliente en un dia (admision individual y por lotes)
+        Index("ix_reservation_table_date", "restaurant_id", "table_number_id", "reservation_date"),
+        Index("ix_reservation_client_date", "client_id", "reservation_date"),
+        # Solo reservas activas: el barrido de vencidas no recorre el historial cerrado
+        Index(
+            "ix_reservation_active_end", "status", "reservation_date", "date_end",
+            postgresql_where=text("status IN ('pendiente', 'confirmada')"),
+            sqlite_where=text("status IN ('pendiente', 'confirmada')")
+        ),
+    )
 
     id: str = Field(nullable=False, primary_key=True, unique=True)
     date_start: time = Field(nullable=False, index=True)
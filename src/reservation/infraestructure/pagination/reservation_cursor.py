@@ -0,0 +1,19 @@
+import base64
+from datetime import date
+
+class ReservationCursor:
+    """
+    Cursor opaco del listado de reservas: (reservation_date, id) de la ultima fila entregada
+    en base64 url-safe, para que el cliente no dependa del formato.
+    """
+
+    @staticmethod
+    def encode(after: tuple[date, str]) -> str:
+        raw = f"{after[0].isoformat()}|{after[1]}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> tuple[date, str]:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        day, reservation_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|", 1)
+        return date.fromisoformat(day), reservation_id
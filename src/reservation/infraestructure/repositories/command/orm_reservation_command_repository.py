@@ -1,14 +1,35 @@
+from datetime import date, datetime
+from typing import Optional
 from src.common.utils import Result
-from src.common.infrastructure import InfrastructureException
+from src.common.infrastructure import InfrastructureException, ExceptionInfrastructureType, InvalidationBus
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, insert, or_, update
 from sqlmodel import select
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.transition_guard_dto import TransitionGuard
+from src.reservation.application.dtos.response.bulk_cancel_reservations_response_dto import CancelledReservation
+from src.reservation.application.dtos.response.transition_outcome_dto import TransitionOutcome
 from src.reservation.application.repositories.command.reservation_command_repository import IReservationCommandRepository
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
 from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
 from src.reservation.infraestructure.exceptions.reservation_not_found_exception import ReservationNotFoundException
 from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
 from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.dashboard.infraestructure.rollups.reservation_rollups import ReservationRollups
+from src.dashboard.infraestructure.top_dishes.top_dishes_tracker import TopDishesTracker
 
 class OrmReservationCommandRepository(IReservationCommandRepository):
+    DISHES_PER_NOTIFY = 150
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -25,28 +46,241 @@ class OrmReservationCommandRepository(IReservationCommandRepository):
                 reservation_date=entry.date.reservation_date
             )
             self.session.add(orm)
-            await self.session.commit()
-
-            for domain_dish in entry.dish:
-                    # Aquí asumes que DishModel ya existe en la base de datos o lo recuperas.
-                    # Si no, deberías tener un método para guardar el DishModel también.
+            await self.session.flush()
 
-                orm_reservation_dish = OrmReservationDishModel(
-                    reservation_id=orm.id, # Usamos el ID de la reserva guardada
-                    dish_id=domain_dish.value       # Usamos el ID del plato del dominio
-                        # quantity=domain_dish.quantity # Ejemplo si tuvieras más campos
+            # Los platos de la pre-orden van en un unico INSERT multi-fila
+            if entry.dish:
+                await self.session.execute(
+                    insert(OrmReservationDishModel).values([
+                        {"reservation_id": orm.id, "dish_id": domain_dish.value}
+                        for domain_dish in entry.dish
+                    ])
                 )
-                    # Usar 'await' para añadir cada enlace
-                self.session.add(orm_reservation_dish)
+            dish_ids = [domain_dish.value for domain_dish in entry.dish or []]
+            await ReservationRollups.record_created(self.session, orm, dish_ids)
+            if dish_ids:
+                await InvalidationBus.publish(self.session, TopDishesTracker.TOPIC, TopDishesTracker.key(orm.restaurant_id, orm.reservation_date, dish_ids))
 
-                # 3. 'await' para el commit de las entradas de la tabla intermedia
-                await self.session.commit() 
+            # Este proceso ya la marco con free_tables.book; los demas descartan ese dia
+            await InvalidationBus.publish(self.session, SlotBitmapIndex.TOPIC, SlotBitmapIndex.key(orm.restaurant_id, orm.reservation_date), local=False)
 
             return Result.success(entry)
         except Exception as e:
-            await self.session.rollback()
-            err = InfrastructureException(str(e))
-            return Result.fail(err)
+            return Result.fail(self._save_error(e))
+
+    async def save_many(self, entries: list[Reservation]) -> Result[list[Reservation]]:
+        try:
+            rows = [
+                {
+                    "id": entry._id.reservation_id,
+                    "date_end": entry.date_end.reservation_date_end,
+                    "date_start": entry.date_start.reservation_date_start,
+                    "status": entry.status.reservation_status,
+                    "client_id": entry.client_id.user_id,
+                    "table_number_id": str(entry.table_number_id.table_number_id),
+                    "restaurant_id": entry.restaurant_id.restaurant_id,
+                    "reservation_date": entry.date.reservation_date
+                }
+                for entry in entries
+            ]
+            dish_rows = [
+                {"reservation_id": entry._id.reservation_id, "dish_id": domain_dish.value}
+                for entry in entries for domain_dish in entry.dish or []
+            ]
+            await self._insert_many(rows, dish_rows)
+            return Result.success(entries)
+        except Exception as e:
+            return Result.fail(self._save_error(e))
+
+    async def insert_pending(self, entries: list[tuple[str, CreateReservationRequest]]) -> Result[list[str]]:
+        try:
+            rows = [
+                {
+                    "id": reservation_id,
+                    "date_end": item.date_end,
+                    "date_start": item.date_start,
+                    "status": "pendiente",
+                    "client_id": item.client_id,
+                    "table_number_id": str(item.table_number_id),
+                    "restaurant_id": item.restaurant_id,
+                    "reservation_date": item.reservation_date
+                }
+                for reservation_id, item in entries
+            ]
+            dish_rows = [
+                {"reservation_id": reservation_id, "dish_id": dish_id}
+                for reservation_id, item in entries for dish_id in item.dish_id or []
+            ]
+            await self._insert_many(rows, dish_rows)
+            return Result.success([reservation_id for reservation_id, _ in entries])
+        except Exception as e:
+            return Result.fail(self._save_error(e))
+
+    async def _insert_many(self, rows: list[dict], dish_rows: list[dict]) -> None:
+        # Una lista de filas sobre la tabla se envia como INSERT multi-fila (insertmanyvalues), sin el bulk insert del ORM
+        await self.session.execute(insert(OrmReservationModel.__table__), rows)
+        if dish_rows:
+            await self.session.execute(insert(OrmReservationDishModel.__table__), dish_rows)
+        await ReservationRollups.record_created_many(self.session, rows, dish_rows)
+
+        days: dict[tuple[str, date], list[str]] = {}
+        day_of: dict[str, tuple[str, date]] = {}
+        for row in rows:
+            day_of[row["id"]] = (row["restaurant_id"], row["reservation_date"])
+            days.setdefault(day_of[row["id"]], [])
+        for dish_row in dish_rows:
+            days[day_of[dish_row["reservation_id"]]].append(dish_row["dish_id"])
+        for (restaurant_id, reservation_date), dish_ids in days.items():
+            # El payload de NOTIFY tiene un limite de 8000 bytes
+            for start in range(0, len(dish_ids), self.DISHES_PER_NOTIFY):
+                await InvalidationBus.publish(self.session, TopDishesTracker.TOPIC, TopDishesTracker.key(restaurant_id, reservation_date, dish_ids[start:start + self.DISHES_PER_NOTIFY]))
+            await InvalidationBus.publish(self.session, SlotBitmapIndex.TOPIC, SlotBitmapIndex.key(restaurant_id, reservation_date), local=False)
+
+    async def cancel_pending(self, filters: BulkCancelReservationsRequest) -> Result[list[CancelledReservation]]:
+        try:
+            reservation = OrmReservationModel
+            stmt = update(reservation).where(
+                reservation.restaurant_id == filters.restaurant_id,
+                reservation.reservation_date >= filters.date_from,
+                reservation.reservation_date <= filters.date_to,
+                reservation.status == "pendiente",
+            )
+            # Franja horaria: se cancela todo lo que se solape con ella
+            if filters.time_from is not None:
+                stmt = stmt.where(reservation.date_end > filters.time_from)
+            if filters.time_to is not None:
+                stmt = stmt.where(reservation.date_start < filters.time_to)
+            if filters.table_number_id is not None:
+                stmt = stmt.where(reservation.table_number_id == str(filters.table_number_id))
+
+            # Una sola sentencia: sin cargar ni reconstruir cada reserva
+            result = await self.session.execute(
+                stmt.values(status="cancelada")
+                .returning(reservation.id, reservation.client_id, reservation.reservation_date, reservation.table_number_id)
+            )
+            cancelled = [
+                CancelledReservation(id=row.id, client_id=row.client_id, reservation_date=row.reservation_date, table_number_id=row.table_number_id)
+                for row in result.all()
+            ]
+
+            await ReservationRollups.record_status_change_many(self.session, [
+                {"restaurant_id": filters.restaurant_id, "reservation_date": c.reservation_date, "table_number_id": c.table_number_id}
+                for c in cancelled
+            ], "pendiente", "cancelada")
+            # Sin agregados que liberar mesa a mesa: cada dia afectado se descarta tambien en este proceso
+            for reservation_date in sorted({c.reservation_date for c in cancelled}):
+                await InvalidationBus.publish(self.session, SlotBitmapIndex.TOPIC, SlotBitmapIndex.key(filters.restaurant_id, reservation_date))
+
+            return Result.success(cancelled)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def transition(self, id: str, from_status: str, to_status: str, guard: Optional[TransitionGuard] = None) -> Result[TransitionOutcome]:
+        try:
+            reservation = OrmReservationModel
+            conditions = [reservation.id == id, reservation.status == from_status]
+            if guard is not None and guard.client_id is not None:
+                conditions.append(reservation.client_id == guard.client_id)
+            if guard is not None and guard.starts_not_before is not None:
+                moment = guard.starts_not_before
+                conditions.append(or_(
+                    reservation.reservation_date > moment.date(),
+                    and_(reservation.reservation_date == moment.date(), reservation.date_start >= moment.time())
+                ))
+
+            # Comprobacion y escritura en la misma sentencia: la fila queda bloqueada hasta el commit
+            # y un segundo UPDATE concurrente ya no la encuentra en from_status
+            result = await self.session.execute(
+                update(reservation).where(*conditions)
+                .values(status=to_status)
+                .returning(
+                    reservation.id, reservation.date_start, reservation.date_end, reservation.client_id,
+                    reservation.table_number_id, reservation.reservation_date, reservation.restaurant_id
+                )
+                .execution_options(synchronize_session=False)
+            )
+            row = result.one_or_none()
+            if row is None:
+                return await self._rejected_transition(id, from_status, guard)
+
+            await ReservationRollups.record_status_change_many(self.session, [
+                {"restaurant_id": row.restaurant_id, "reservation_date": row.reservation_date, "table_number_id": row.table_number_id}
+            ], from_status, to_status)
+            # Tambien este proceso descarta el dia en after_commit: si se deshace, la mesa sigue ocupada
+            await InvalidationBus.publish(self.session, SlotBitmapIndex.TOPIC, SlotBitmapIndex.key(row.restaurant_id, row.reservation_date))
+
+            return Result.success(TransitionOutcome(Reservation(
+                id=ReservationIdVo(row.id),
+                date_end=ReservationDateEndVo(row.date_end),
+                date_start=ReservationDateStartVo(row.date_start),
+                reservation_date=ReservationDateVo(row.reservation_date),
+                status=ReservationStatusVo(to_status),
+                client_id=UserIdVo(row.client_id),
+                table_number_id=TableNumberId(row.table_number_id),
+                restaurant_id=RestaurantIdVo(row.restaurant_id),
+                dish=[]
+            )))
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def expire(self, from_status: str, to_status: str, ended_before: datetime, limit: int) -> Result[int]:
+        try:
+            reservation = OrmReservationModel
+            batch = select(reservation.id).where(
+                reservation.status == from_status,
+                or_(
+                    reservation.reservation_date < ended_before.date(),
+                    and_(reservation.reservation_date == ended_before.date(), reservation.date_end <= ended_before.time())
+                )
+            ).order_by(reservation.reservation_date).limit(limit)
+            if self.session.get_bind().dialect.name == "postgresql":
+                # Filas que otra transaccion esta cambiando se dejan para la siguiente vuelta
+                batch = batch.with_for_update(skip_locked=True)
+
+            result = await self.session.execute(
+                update(reservation)
+                .where(reservation.id.in_(batch.scalar_subquery()), reservation.status == from_status)
+                .values(status=to_status)
+                .returning(reservation.restaurant_id, reservation.reservation_date, reservation.table_number_id)
+                .execution_options(synchronize_session=False)
+            )
+            rows = [row._asdict() for row in result.all()]
+
+            await ReservationRollups.record_status_change_many(self.session, rows, from_status, to_status)
+            # Los dias anteriores ya no se consultan; hoy puede seguir cacheado
+            for restaurant_id in sorted({r["restaurant_id"] for r in rows if r["reservation_date"] == date.today()}):
+                await InvalidationBus.publish(self.session, SlotBitmapIndex.TOPIC, SlotBitmapIndex.key(restaurant_id, date.today()))
+
+            return Result.success(len(rows))
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def _rejected_transition(self, id: str, from_status: str, guard: Optional[TransitionGuard]) -> Result[TransitionOutcome]:
+        # Solo en el camino de rechazo: una lectura para saber que condicion fallo
+        stmt = select(
+            OrmReservationModel.client_id, OrmReservationModel.status,
+            OrmReservationModel.reservation_date, OrmReservationModel.date_start
+        ).where(OrmReservationModel.id == id)
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return Result.fail(ReservationNotFoundException())
+
+        moment = guard.starts_not_before if guard is not None else None
+        return Result.success(TransitionOutcome(
+            reservation=None,
+            owned=guard is None or guard.client_id is None or row.client_id == guard.client_id,
+            in_time=moment is None or (row.reservation_date, row.date_start) >= (moment.date(), moment.time()),
+            status_matched=row.status == from_status
+        ))
+
+    @staticmethod
+    def _save_error(e: Exception) -> InfrastructureException:
+        # Restricciones de exclusion GiST (ver migracion reservation_period_exclusion)
+        if "reservation_table_no_overlap" in str(e):
+            return InfrastructureException("Table not available.", ExceptionInfrastructureType.CONFLICT)
+        if "reservation_client_no_overlap" in str(e):
+            return InfrastructureException("Client already has an active reservation at the same time.", ExceptionInfrastructureType.CONFLICT)
+        return InfrastructureException(str(e))
         
     async def update(self, entry: Reservation) -> Result[Reservation]:
         try:
@@ -56,12 +290,14 @@ class OrmReservationCommandRepository(IReservationCommandRepository):
             if to_update is None:
                 err = ReservationNotFoundException()
                 return Result.fail(err)
+            previous_status = to_update.status
             to_update.status = entry.status.reservation_status
             self.session.add(to_update)
-            await self.session.commit()
+            await self.session.flush()
+            await ReservationRollups.record_status_change(self.session, to_update, previous_status)
+            await InvalidationBus.publish(self.session, SlotBitmapIndex.TOPIC, SlotBitmapIndex.key(to_update.restaurant_id, to_update.reservation_date))
             return Result.success(entry)
 
         except Exception as e:
-            await self.session.rollback()
             err = InfrastructureException(str(e))
             return Result.fail(err)
\ No newline at end of file
@@ -1,10 +1,17 @@
+import json
 from datetime import date, time
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, select, literal_column
+from sqlalchemy import Date, Integer, String, Time, and_, cast, column, exists, false, func, select, literal_column, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
 from src.auth.domain.value_objects.user_id_vo import UserIdVo
 from src.common.infrastructure.infrastructure_exception.enum.infraestructure_exception_type import ExceptionInfrastructureType
 from src.common.utils import Result
 from src.common.infrastructure import InfrastructureException
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.dtos.response.admission_verdict_dto import AdmissionVerdict
+from src.reservation.application.dtos.response.find_reservation_response_dto import ReservationResponse
 from src.reservation.application.repositories.query.reservation_query_repository import IReservationQueryRepository
 from src.reservation.domain.aggregate.reservation import Reservation
 from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
@@ -13,11 +20,18 @@ from src.reservation.domain.value_objects.reservation_date_vo import Reservation
 from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
 from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
 from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
 from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
 from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
 
 class OrmReservationQueryRepository(IReservationQueryRepository):
 
+    # Filas de lote por consulta; acota tambien el IN de platos
+    ADMISSION_BATCH = 2000
+
     def __init__(self, session: AsyncSession):
         self.session = session
         
@@ -43,11 +57,12 @@ class OrmReservationQueryRepository(IReservationQueryRepository):
                 select(OrmReservationModel).where(
                     and_(
                         literal_column("client_id") == client_id,
-                        literal_column("date_start") == date_start,
-                        literal_column("date_end") == date_end,
+                        literal_column("date_start") < date_end,
+                        literal_column("date_end") > date_start,
                         literal_column("reservation_date") == reservation_date,
+                        literal_column("status").in_(ReservationStatusVo.ESTADOS_ACTIVOS),
                     )
-                )
+                ).limit(1)
             )
             oorm = result.scalars().first()
             if oorm is None:
@@ -78,16 +93,16 @@ class OrmReservationQueryRepository(IReservationQueryRepository):
             result = await self.session.execute(
                 select(OrmReservationModel).where(
                     and_(
-                        literal_column("table_number_id") == table_id,
-                        literal_column("date_start") == date_start,
-                        literal_column("date_end") == date_end,
+                        literal_column("table_number_id") == str(table_id),
+                        literal_column("date_start") < date_end,
+                        literal_column("date_end") > date_start,
                         literal_column("reservation_date") == reservation_date,
                         literal_column("restaurant_id") == restaurant_id,
+                        literal_column("status").in_(ReservationStatusVo.ESTADOS_ACTIVOS),
                     )
-                )
+                ).limit(1)
             )
             oorm = result.scalars().first()
-            print(oorm, flush=True)
             if oorm is None:
                return Result.success(False)
             return Result.success(True)
@@ -113,13 +128,14 @@ class OrmReservationQueryRepository(IReservationQueryRepository):
         except Exception as e:
             return Result.fail(InfrastructureException(str(e)))
     
-    async def get_all_by_date_restaurant(self, restaurant_id: str, reservation_date: date) -> Result[list[Reservation]]:
+    async def get_active_by_client_date(self, client_id: str, reservation_date: date) -> Result[list[Reservation]]:
         try:
             result = await self.session.execute(
                 select(OrmReservationModel).where(
                     and_(
+                        literal_column("client_id") == client_id,
                         literal_column("reservation_date") == reservation_date,
-                        literal_column("restaurant_id") == restaurant_id,
+                        literal_column("status").in_(ReservationStatusVo.ESTADOS_ACTIVOS),
                     )
                 )
             )
@@ -131,10 +147,17 @@ class OrmReservationQueryRepository(IReservationQueryRepository):
             return Result.success(resers)
         except Exception as e:
             return Result.fail(InfrastructureException(str(e)))
-
-    async def get_all(self) -> Result[list[Reservation]]:
+    
+    async def get_active_by_date(self, reservation_date: date) -> Result[list[Reservation]]:
         try:
-            result = await self.session.execute(select(OrmReservationModel))
+            result = await self.session.execute(
+                select(OrmReservationModel).where(
+                    and_(
+                        literal_column("reservation_date") == reservation_date,
+                        literal_column("status").in_(ReservationStatusVo.ESTADOS_ACTIVOS),
+                    )
+                )
+            )
             orms = result.scalars().all()
             resers: list[Reservation] = []
             for orm in orms:
@@ -142,5 +165,239 @@ class OrmReservationQueryRepository(IReservationQueryRepository):
                 resers.append(v)
             return Result.success(resers)
         except Exception as e:
-            print(e,flush=True)
             return Result.fail(InfrastructureException(str(e)))
+    
+    async def get_all_by_date_restaurant(self, restaurant_id: str, reservation_date: date) -> Result[list[Reservation]]:
+        try:
+            result = await self.session.execute(
+                select(OrmReservationModel).where(
+                    and_(
+                        literal_column("reservation_date") == reservation_date,
+                        literal_column("restaurant_id") == restaurant_id,
+                    )
+                )
+            )
+            orms = result.scalars().all()
+            resers: list[Reservation] = []
+            for orm in orms:
+                v = self._map_orm_to_domain(orm=orm)
+                resers.append(v)
+            return Result.success(resers)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    def _filtered(self, stmt, filters: FindReservationRequest):
+        if filters.restaurant_id is not None:
+            stmt = stmt.where(OrmReservationModel.restaurant_id == filters.restaurant_id)
+        if filters.status is not None:
+            stmt = stmt.where(OrmReservationModel.status == filters.status)
+        if filters.date_from is not None:
+            stmt = stmt.where(OrmReservationModel.reservation_date >= filters.date_from)
+        if filters.date_to is not None:
+            stmt = stmt.where(OrmReservationModel.reservation_date <= filters.date_to)
+        return stmt.order_by(OrmReservationModel.reservation_date, OrmReservationModel.id)
+
+    async def find_page(self, filters: FindReservationRequest, limit: int) -> Result[list[Reservation]]:
+        try:
+            stmt = self._filtered(select(OrmReservationModel), filters)
+            if filters.after is not None:
+                # Keyset: sigue tras la ultima fila vista usando el indice (reservation_date, id)
+                stmt = stmt.where(tuple_(OrmReservationModel.reservation_date, OrmReservationModel.id) > tuple_(*filters.after))
+            result = await self.session.execute(stmt.limit(limit))
+            return Result.success([self._map_orm_to_domain(orm=orm) for orm in result.scalars().all()])
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def stream(self, filters: FindReservationRequest, chunk_size: int) -> Result[AsyncIterator[list[ReservationResponse]]]:
+        try:
+            # Columnas sueltas y cursor del lado del servidor: ni entidades ORM ni el resultado completo en memoria
+            columns = OrmReservationModel.__table__.c
+            stmt = self._filtered(select(
+                columns.id, columns.client_id, columns.date_start, columns.date_end, columns.reservation_date,
+                columns.status, columns.table_number_id, columns.restaurant_id
+            ), filters)
+            result = await self.session.stream(stmt.execution_options(yield_per=chunk_size))
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+        async def chunks() -> AsyncIterator[list[ReservationResponse]]:
+            try:
+                async for partition in result.partitions(chunk_size):
+                    yield [
+                        ReservationResponse(
+                            id=row.id,
+                            client_id=row.client_id,
+                            date_start=row.date_start,
+                            date_end=row.date_end,
+                            reservation_date=row.reservation_date,
+                            status=row.status,
+                            table_number_id=row.table_number_id,
+                            restaurant_id=row.restaurant_id,
+                            dishes=[]
+                        )
+                        for row in partition
+                    ]
+            finally:
+                await result.close()
+
+        return Result.success(chunks())
+
+    async def check_admission(self, restaurant_id: str, table_id: str, client_id: str, reservation_date: date, date_start: time, date_end: time, dish_ids: list[str]) -> Result[AdmissionVerdict]:
+        """
+        Evalua las reglas de creacion en un solo viaje a la BD y devuelve el veredicto. Los platos
+        se comprueban con AVAILABLE_DISH_IDS, que solo consulta si el restaurante no esta cargado.
+        """
+        try:
+            overlap = and_(
+                OrmReservationModel.reservation_date == reservation_date,
+                OrmReservationModel.date_start < date_end,
+                OrmReservationModel.date_end > date_start,
+                OrmReservationModel.status.in_(ReservationStatusVo.ESTADOS_ACTIVOS),
+            )
+            restaurant = (
+                select(OrmRestaurantModel.opening_time, OrmRestaurantModel.closing_time)
+                .where(OrmRestaurantModel.id == restaurant_id)
+                .cte("admission_restaurant")
+            )
+
+            # La mesa se guarda como texto en reservation pero su PK es entera
+            table_pk = str(table_id)
+            table_found = false()
+            if table_pk.isdigit():
+                table_found = exists().where(OrmTableModel.id == int(table_pk), OrmTableModel.restaurant_id == restaurant_id)
+
+            stmt = select(
+                exists().select_from(restaurant).label("restaurant_found"),
+                table_found.label("table_found"),
+                exists().select_from(restaurant).where(
+                    restaurant.c.opening_time <= date_start,
+                    restaurant.c.closing_time >= date_end,
+                ).label("within_hours"),
+                exists().where(
+                    OrmReservationModel.restaurant_id == restaurant_id,
+                    OrmReservationModel.table_number_id == table_pk,
+                    overlap,
+                ).label("table_conflict"),
+                exists().where(OrmReservationModel.client_id == client_id, overlap).label("client_conflict"),
+                exists().where(MenuModel.restaurant_id == restaurant_id).label("menu_found"),
+            )
+            row = (await self.session.execute(stmt)).one()
+
+            # Los platos contra el conjunto en memoria del restaurante; solo se consulta si no esta cargado
+            valid = await OrmMenuQueryRepository(self.session).valid_dish_ids(RestaurantIdVo(restaurant_id), dish_ids)
+            return Result.success(AdmissionVerdict(
+                restaurant_found=bool(row.restaurant_found),
+                table_found=bool(row.table_found),
+                within_hours=bool(row.within_hours),
+                table_conflict=bool(row.table_conflict),
+                client_conflict=bool(row.client_conflict),
+                menu_found=bool(row.menu_found),
+                invalid_dish_ids=[d for d in dish_ids if d not in valid]
+            ))
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def check_admission_many(self, items: list[CreateReservationRequest]) -> Result[list[AdmissionVerdict]]:
+        try:
+            verdicts: list[AdmissionVerdict] = []
+            for start in range(0, len(items), self.ADMISSION_BATCH):
+                verdicts.extend(await self._check_admission_batch(items[start:start + self.ADMISSION_BATCH]))
+            return Result.success(verdicts)
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def _check_admission_batch(self, items: list[CreateReservationRequest]) -> list[AdmissionVerdict]:
+        """
+        Las mismas reglas que check_admission para todo el lote: una consulta en la que cada regla
+        es un EXISTS correlacionado con su fila del lote y otra para los platos.
+        """
+        batch = self._admission_batch(items)
+        b = batch.c
+        reservation = OrmReservationModel
+        overlap = and_(
+            reservation.reservation_date == b.reservation_date,
+            reservation.date_start < b.date_end,
+            reservation.date_end > b.date_start,
+            reservation.status.in_(ReservationStatusVo.ESTADOS_ACTIVOS),
+        )
+        stmt = select(
+            b.idx,
+            exists().where(OrmRestaurantModel.id == b.restaurant_id).label("restaurant_found"),
+            exists().where(OrmTableModel.id == b.table_pk, OrmTableModel.restaurant_id == b.restaurant_id).label("table_found"),
+            exists().where(
+                OrmRestaurantModel.id == b.restaurant_id,
+                OrmRestaurantModel.opening_time <= b.date_start,
+                OrmRestaurantModel.closing_time >= b.date_end,
+            ).label("within_hours"),
+            exists().where(
+                reservation.restaurant_id == b.restaurant_id,
+                reservation.table_number_id == b.table_id,
+                overlap,
+            ).label("table_conflict"),
+            exists().where(reservation.client_id == b.client_id, overlap).label("client_conflict"),
+            exists().where(MenuModel.restaurant_id == b.restaurant_id).label("menu_found"),
+        ).select_from(batch)
+        rows = {row.idx: row for row in (await self.session.execute(stmt)).all()}
+
+        # Platos del lote que si estan, disponibles, en el menu de su restaurante, en una consulta agrupada
+        valid: dict[str, set[str]] = {}
+        dish_ids = {d for item in items for d in item.dish_id}
+        if dish_ids:
+            menu_dishes = await self.session.execute(
+                select(MenuModel.restaurant_id, DishModel.id)
+                .join(MenuModel, DishModel.menu_id == MenuModel.id)
+                .where(MenuModel.restaurant_id.in_({item.restaurant_id for item in items}), DishModel.id.in_(dish_ids), DishModel.is_available)
+            )
+            for restaurant_id, dish_id in menu_dishes.all():
+                valid.setdefault(restaurant_id, set()).add(dish_id)
+
+        verdicts: list[AdmissionVerdict] = []
+        for idx, item in enumerate(items):
+            row = rows[idx]
+            menu = valid.get(item.restaurant_id, set())
+            verdicts.append(AdmissionVerdict(
+                restaurant_found=bool(row.restaurant_found),
+                table_found=bool(row.table_found),
+                within_hours=bool(row.within_hours),
+                table_conflict=bool(row.table_conflict),
+                client_conflict=bool(row.client_conflict),
+                menu_found=bool(row.menu_found),
+                invalid_dish_ids=[d for d in item.dish_id if d not in menu]
+            ))
+        return verdicts
+
+    def _admission_batch(self, items: list[CreateReservationRequest]):
+        """
+        El lote como tabla (idx, restaurant_id, table_id, table_pk, client_id, reservation_date,
+        date_start, date_end) a partir de un unico parametro JSON: la sentencia no cambia con el
+        tamaño del lote, asi que se compila una vez y no choca con el limite de parametros.
+        """
+        payload = json.dumps([
+            {
+                "idx": idx,
+                "restaurant_id": item.restaurant_id,
+                "table_id": str(item.table_number_id),
+                # La mesa se guarda como texto en reservation pero su PK es entera
+                "table_pk": int(item.table_number_id) if str(item.table_number_id).isdigit() else None,
+                "client_id": item.client_id,
+                # Mismo formato con el que SQLite guarda fechas y horas, para comparar como texto
+                "reservation_date": item.reservation_date.isoformat(),
+                "date_start": item.date_start.isoformat(timespec="microseconds"),
+                "date_end": item.date_end.isoformat(timespec="microseconds")
+            }
+            for idx, item in enumerate(items)
+        ])
+        columns = [
+            column("idx", Integer), column("restaurant_id", String), column("table_id", String), column("table_pk", Integer),
+            column("client_id", String), column("reservation_date", Date), column("date_start", Time), column("date_end", Time)
+        ]
+
+        # MATERIALIZED: se decodifica una vez y no en cada subconsulta que lo referencia
+        if self.session.get_bind().dialect.name == "postgresql":
+            records = func.jsonb_to_recordset(cast(payload, JSONB)).table_valued(*columns).render_derived(with_types=True)
+            return select(records).cte("admission_batch").prefix_with("MATERIALIZED")
+
+        entry = func.json_each(payload).table_valued("value")
+        return select(*(
+            func.json_extract(entry.c.value, f"$.{c.name}").label(c.name) for c in columns
+        )).cte("admission_batch").prefix_with("MATERIALIZED")
@@ -11,4 +11,7 @@ class IRestaurantQueryRepository(ABC):
     @abstractmethod
     async def get_all_restaurants(self,dto:GetAllRestaurantRequestDTO) -> Result[list[Restaurant]]:
         pass
-    
\ No newline at end of file
+
+    @abstractmethod
+    async def get_all_with_tables(self) -> Result[list[Restaurant]]:
+        pass
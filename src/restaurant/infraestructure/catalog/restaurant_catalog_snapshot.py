@@ -0,0 +1,121 @@
+import sys
+from datetime import time
+from typing import NamedTuple, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import InvalidatedCache
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+class CatalogTable(NamedTuple):
+    id: int
+    location: str
+    capacity: int
+
+class CatalogRestaurant(NamedTuple):
+    id: str
+    name: str
+    lat: float
+    lng: float
+    opening_time: time
+    closing_time: time
+    tables: tuple[CatalogTable, ...]
+    # restaurant.version al cargar: la marca del ETag sale de la misma lectura que los datos
+    version: int
+
+async def load_restaurant_catalog(session: AsyncSession, key: str) -> dict[str, CatalogRestaurant]:
+    orm_restaurants = (await session.execute(select(OrmRestaurantModel))).scalars().all()
+    orm_tables = (await session.execute(select(OrmTableModel).order_by(OrmTableModel.capacity))).scalars().all()
+
+    tables_by_restaurant: dict[str, list[CatalogTable]] = {}
+    for t in orm_tables:
+        tables_by_restaurant.setdefault(t.restaurant_id, []).append(
+            CatalogTable(id=t.id, location=t.location.value, capacity=t.capacity)
+        )
+
+    return {
+        r.id: CatalogRestaurant(
+            id=r.id,
+            name=r.name,
+            lat=r.lat,
+            lng=r.lng,
+            opening_time=r.opening_time,
+            closing_time=r.closing_time,
+            tables=tuple(tables_by_restaurant.get(r.id, [])),
+            version=r.version
+        )
+        for r in orm_restaurants
+    }
+
+# Todo el catalogo bajo una sola clave; cualquier escritura lo descarta completo
+ALL_RESTAURANTS = "all"
+RESTAURANT_CATALOG: InvalidatedCache[dict[str, CatalogRestaurant]] = InvalidatedCache(
+    "restaurant_catalog", load_restaurant_catalog, max_entries=1
+)
+
+class RestaurantCatalogSnapshot:
+    """
+    Copia en memoria de restaurantes y mesas compartida por todo el proceso. Guarda tuplas
+    inmutables, no agregados: cada lectura arma un Restaurant nuevo que el servicio puede mutar.
+    OrmRestaurantCommandRepository la descarta al escribir y, via RESTAURANT_CATALOG, otra vez
+    tras el commit en este y en los demas workers; la siguiente lectura recarga el catalogo
+    completo en dos consultas.
+    """
+
+    TOPIC = RESTAURANT_CATALOG.topic
+
+    @classmethod
+    def clear(cls) -> None:
+        RESTAURANT_CATALOG.clear()
+
+    @classmethod
+    def bump(cls) -> None:
+        RESTAURANT_CATALOG.receive(None)
+
+    @classmethod
+    def version(cls) -> int:
+        return RESTAURANT_CATALOG.generation
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        cached = RESTAURANT_CATALOG.stats()
+        restaurants = next(iter(RESTAURANT_CATALOG.values()), {})
+        return {
+            "hits": cached["hits"],
+            "reloads": cached["loads"],
+            "version": RESTAURANT_CATALOG.generation,
+            "restaurants": len(restaurants),
+            "tables": sum(len(r.tables) for r in restaurants.values()),
+            "bytes": cls._footprint(restaurants)
+        }
+
+    @classmethod
+    async def warm(cls, session: AsyncSession) -> None:
+        await cls.restaurants(session)
+
+    @classmethod
+    async def restaurants(cls, session: AsyncSession) -> dict[str, CatalogRestaurant]:
+        return await RESTAURANT_CATALOG.get(session, ALL_RESTAURANTS)
+
+    @classmethod
+    async def restaurant(cls, session: AsyncSession, restaurant_id: str) -> Optional[CatalogRestaurant]:
+        return (await cls.restaurants(session)).get(restaurant_id)
+
+    @staticmethod
+    def _footprint(restaurants: dict[str, CatalogRestaurant]) -> int:
+        # Tamaño aproximado: diccionario, tuplas y sus valores (los objetos compartidos cuentan una vez)
+        seen: set[int] = set()
+
+        def size(value) -> int:
+            if id(value) in seen:
+                return 0
+            seen.add(id(value))
+            total = sys.getsizeof(value)
+            if isinstance(value, tuple):
+                total += sum(size(v) for v in value)
+            return total
+
+        total = sys.getsizeof(restaurants)
+        for key, restaurant in restaurants.items():
+            total += size(key) + size(restaurant)
+        return total
@@ -19,15 +19,18 @@ from src.restaurant.infraestructure.repositories.command.orm_restaurant_command_
 from ...routers.restaurant_router import restaurant_router
 from ...dtos.request.create_restaurant_request_inf_dto import CreateRestaurantRequestInfDTO
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 class CreateRestaurantController:
     def __init__(self, app: FastAPI):
         self.setup_routes()
         app.include_router(restaurant_router)
         
-    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession()))->CreateRestaurantService:
+    async def get_service(self, postgres_session: AsyncSession = Depends(GetPostgresqlSession())) -> UnitOfWorkDecorator:
+        uow = SqlAlchemyUnitOfWork(postgres_session)
         id_generator = UuidGenerator()
-        orm_restaurant_command_repository = OrmRestaurantCommandRepository(postgres_session)
+        orm_restaurant_command_repository = uow.repository(OrmRestaurantCommandRepository)
         tables_id_generator=SequentialIntegerGenerator()
         user_create_restaurant_service = CreateRestaurantService(
             id_generator=id_generator,
@@ -35,7 +38,7 @@ class CreateRestaurantController:
             tables_id_generator=tables_id_generator
         )
 
-        return user_create_restaurant_service
+        return UnitOfWorkDecorator(user_create_restaurant_service, uow)
 
     def setup_routes(self):
         @restaurant_router.post(
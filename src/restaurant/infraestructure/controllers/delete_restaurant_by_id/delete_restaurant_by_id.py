@@ -12,6 +12,8 @@ from src.restaurant.infraestructure.dtos.response.delete_restaurant_by_id_respon
 from src.restaurant.infraestructure.repositories.command.orm_restaurant_command_repository import OrmRestaurantCommandRepository
 from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
 from ...routers.restaurant_router import restaurant_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 
 class DeleteRestaurantByIdController:
@@ -22,12 +24,14 @@ class DeleteRestaurantByIdController:
     async def get_delete_service(
         self,
         session: AsyncSession = Depends(GetPostgresqlSession()),
-    ) -> DeleteRestaurantByIdService:
-        repo_query = OrmRestaurantQueryRepository(session)
-        repo_command = OrmRestaurantCommandRepository(session)
+    ) -> UnitOfWorkDecorator:
+        uow = SqlAlchemyUnitOfWork(session)
+        repo_query = uow.repository(OrmRestaurantQueryRepository)
+        repo_command = uow.repository(OrmRestaurantCommandRepository)
         
-        return DeleteRestaurantByIdService(restaurant_query_repository=repo_query,
-                                           restaurant_command_repository=repo_command)
+        service = DeleteRestaurantByIdService(restaurant_query_repository=repo_query,
+                                              restaurant_command_repository=repo_command)
+        return UnitOfWorkDecorator(service, uow)
 
     def setup_routes(self):
         @restaurant_router.delete(
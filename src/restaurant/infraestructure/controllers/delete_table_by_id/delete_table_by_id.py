@@ -15,6 +15,8 @@ from src.restaurant.infraestructure.repositories.command.orm_restaurant_command_
 from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
 
 from ...routers.restaurant_router import restaurant_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 
 class DeleteTableByIdController:
@@ -25,13 +27,15 @@ class DeleteTableByIdController:
     async def get_delete_service(
         self,
         session: AsyncSession = Depends(GetPostgresqlSession()),
-    ) -> DeleteTableByIdService:
-        repo_query   = OrmRestaurantQueryRepository(session)
-        repo_command = OrmRestaurantCommandRepository(session)
-        return DeleteTableByIdService(
+    ) -> UnitOfWorkDecorator:
+        uow = SqlAlchemyUnitOfWork(session)
+        repo_query   = uow.repository(OrmRestaurantQueryRepository)
+        repo_command = uow.repository(OrmRestaurantCommandRepository)
+        service = DeleteTableByIdService(
             restaurant_query_repository=repo_query,
             restaurant_command_repository=repo_command
         )
+        return UnitOfWorkDecorator(service, uow)
 
     def setup_routes(self):
         @restaurant_router.delete(
@@ -1,11 +1,13 @@
 # app/controllers/get_restaurant_by_id_controller.py
-from fastapi import Depends, FastAPI, Path, Security, status
+from typing import Optional
+from fastapi import Depends, FastAPI, Header, Path, Response, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
 from src.common.application.aspects.exception_decorator.exception_decorator import ExceptionDecorator
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from src.common.infrastructure.middlewares.get_postgresql_session import GetPostgresqlSession
+from src.common.infrastructure import EntityTag
 
 from src.restaurant.application.dtos.request.get_restaurant_by_id_request_dto import GetRestaurantByIdRequestDTO
 from src.restaurant.application.dtos.response.create_table_response_dto import CreateTableResponseDTO
@@ -14,6 +16,7 @@ from src.restaurant.application.services.get_restaurant_by_id_service import Get
 
 from src.restaurant.infraestructure.dtos.response.create_table_response_inf_dto import CreateTableResponseInfDTO
 from src.restaurant.infraestructure.dtos.response.get_restaurant_by_id_response_inf_dto import GetRestaurantByIdResponseInfDTO
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import RestaurantCatalogSnapshot
 from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
 from ...routers.restaurant_router import restaurant_router
 
@@ -40,10 +43,20 @@ class GetRestaurantByIdController:
             response_description="Datos del restaurante"
         )
         async def get_restaurant_by_id(
+            response: Response,
             restaurant_id: str = Path(..., description="ID del restaurante"),
+            if_none_match: Optional[str] = Header(None),
+            session: AsyncSession = Depends(GetPostgresqlSession()),
             service: GetRestaurantByIdService = Depends(self.get_by_id_service),
             token = Security(UserRoleVerify(), scopes=["admin:manage","client:view_restaurants","client:read_user"])
         ):
+            # 304 sin armar el agregado. La marca sale del mismo catalogo en memoria que los datos y
+            # se lee antes: una recarga entre medias solo puede dejar el ETag mas viejo, nunca al reves
+            entry = await RestaurantCatalogSnapshot.restaurant(session, restaurant_id)
+            etag = EntityTag.strong(f"{entry.id}.{entry.version}") if entry is not None else None
+            if etag is not None and EntityTag.matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
             decorated = ExceptionDecorator(
                 service=service,
                 error_handler=FastApiErrorHandler()
@@ -51,6 +64,9 @@ class GetRestaurantByIdController:
             # Ejecuta la consulta por ID
             result = await decorated.execute(GetRestaurantByIdRequestDTO(restaurant_id))
             restaurant = result.value
+            if etag is not None:
+                response.headers["ETag"] = etag
+                response.headers["Cache-Control"] = "private, no-cache"
                         
             return GetRestaurantByIdResponseInfDTO(
                 id=restaurant.id,
@@ -17,6 +17,8 @@ from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repo
 from src.restaurant.infraestructure.repositories.command.orm_restaurant_command_repository import OrmRestaurantCommandRepository
 
 from ...routers.restaurant_router import restaurant_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 
 class UpdateRestaurantController:
@@ -27,13 +29,15 @@ class UpdateRestaurantController:
     async def get_service(
         self,
         session: AsyncSession = Depends(GetPostgresqlSession())
-    ) -> UpdateRestaurantService:
-        repo_query   = OrmRestaurantQueryRepository(session)
-        repo_command = OrmRestaurantCommandRepository(session)
-        return UpdateRestaurantService(
+    ) -> UnitOfWorkDecorator:
+        uow = SqlAlchemyUnitOfWork(session)
+        repo_query   = uow.repository(OrmRestaurantQueryRepository)
+        repo_command = uow.repository(OrmRestaurantCommandRepository)
+        service = UpdateRestaurantService(
             restaurant_query_repository=repo_query,
             restaurant_command_repository=repo_command
         )
+        return UnitOfWorkDecorator(service, uow)
 
     def setup_routes(self):
         @restaurant_router.patch(
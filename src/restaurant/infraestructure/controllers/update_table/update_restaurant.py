@@ -18,6 +18,8 @@ from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repo
 
 
 from ...routers.restaurant_router import restaurant_router
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 
 class UpdateTableController:
@@ -28,13 +30,15 @@ class UpdateTableController:
     async def get_service(
         self,
         session: AsyncSession = Depends(GetPostgresqlSession())
-    ) -> UpdateTableService:
-        repo_query   = OrmRestaurantQueryRepository(session)
-        repo_command = OrmRestaurantCommandRepository(session)
-        return UpdateTableService(
+    ) -> UnitOfWorkDecorator:
+        uow = SqlAlchemyUnitOfWork(session)
+        repo_query   = uow.repository(OrmRestaurantQueryRepository)
+        repo_command = uow.repository(OrmRestaurantCommandRepository)
+        service = UpdateTableService(
             restaurant_query_repository=repo_query,
             restaurant_command_repository=repo_command
         )
+        return UnitOfWorkDecorator(service, uow)
 
     def setup_routes(self):
         @restaurant_router.patch(
@@ -18,3 +18,6 @@ class OrmRestaurantModel(SQLModel, table=True):
     # Para campos de tipo time SQLModel crea automáticamente TIME
     opening_time: time = Field(nullable=False)
     closing_time: time = Field(nullable=False)
+
+    # Sube con cada cambio del restaurante o de sus mesas; es la marca del ETag del restaurante
+    version: int = Field(default=1, nullable=False, sa_column_kwargs={"server_default": "1"})
@@ -11,4 +11,4 @@ class OrmTableModel(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     capacity: int = Field(ge=2, le=12, nullable=False)
     location: TableLocationEnum = Field(nullable=False)
-    restaurant_id: str = Field(foreign_key="restaurant.id", nullable=False)
\ No newline at end of file
+    restaurant_id: str = Field(foreign_key="restaurant.id", nullable=False, index=True)
\ No newline at end of file
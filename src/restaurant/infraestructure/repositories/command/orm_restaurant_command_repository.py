@@ -3,7 +3,7 @@ from typing import List
 from sqlalchemy import delete, insert, select, update
 from src.common.infrastructure.infrastructure_exception.enum.infraestructure_exception_type import ExceptionInfrastructureType
 from src.common.utils import Result
-from src.common.infrastructure import InfrastructureException
+from src.common.infrastructure import InfrastructureException, InvalidationBus
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.restaurant.application.dtos.request.delete_table_by_id_request_dto import DeleteTableByIdRequestDTO
@@ -14,10 +14,24 @@ from src.restaurant.domain.entities.value_objects.table_number_id_vo import Tabl
 from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
 from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
 from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import RestaurantCatalogSnapshot
 
 class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
+
+    async def _touch_catalog(self, restaurant_id: str) -> None:
+        # Se sube ahora y otra vez tras el commit (el bus la entrega tambien aqui): una recarga
+        # hecha entre la escritura y el commit leyo datos viejos
+        RestaurantCatalogSnapshot.bump()
+        await InvalidationBus.publish(self.session, RestaurantCatalogSnapshot.TOPIC)
+        # Nueva marca para el ETag del restaurante, que la recarga del catalogo trae con los datos
+        # (sin efecto si se acaba de borrar)
+        await self.session.execute(
+            update(OrmRestaurantModel).where(OrmRestaurantModel.id == restaurant_id)
+            .values(version=OrmRestaurantModel.version + 1)
+            .execution_options(synchronize_session=False)
+        )
         
     async def save(self, restaurant: Restaurant) -> Result[Restaurant]:
         try:
@@ -42,11 +56,11 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
             
             self.session.add(orm_restaurant)
             self.session.add_all(orm_tables)
-            await self.session.commit()
+            await self.session.flush()
+            await self._touch_catalog(restaurant.id.restaurant_id)
             return Result.success(restaurant)
         
         except Exception as e:
-            await self.session.rollback()
             err = InfrastructureException(str(e))
             return Result.fail(err)
 
@@ -64,12 +78,12 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
 
             # 2) Márcalo para borrado
             await self.session.delete(existing)
-            await self.session.commit()
+            await self.session.flush()
+            await self._touch_catalog(restaurant.id.restaurant_id)
 
             return Result.success(restaurant)
 
         except Exception as e:
-            await self.session.rollback()
             err = InfrastructureException(str(e))
             return Result.fail(err)
         
@@ -93,11 +107,11 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
                     )
                 )
 
-            await self.session.commit()
+            await self.session.flush()
+            await self._touch_catalog(data.restaurant_id)
             return Result.success(data)
 
         except Exception as e:
-            await self.session.rollback()
             return Result.fail(InfrastructureException(str(e),ExceptionInfrastructureType.BAD_REQUEST))
         
     async def add_table(
@@ -115,14 +129,14 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
 
             # 3) INSERT en BD
             self.session.add(orm_data)
-            await self.session.commit()
+            await self.session.flush()
+            await self._touch_catalog(restaurant.id.restaurant_id)
 
             # 4) Devolver el agregado con éxito
             return Result.success(restaurant)
 
         except Exception as e:
             # Cualquier otro error de infraestructura
-            await self.session.rollback()
             return Result.fail(
                 InfrastructureException(
                     str(e),
@@ -154,12 +168,12 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
             orm_rest.closing_time = restaurant.closing_time.closing_time
 
             self.session.add(orm_rest)
-            await self.session.commit()
+            await self.session.flush()
+            await self._touch_catalog(restaurant.id.restaurant_id)
 
             return Result.success(restaurant)
 
         except Exception as e:
-            await self.session.rollback()
             return Result.fail(
                 InfrastructureException(
                     str(e),
@@ -188,7 +202,6 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
 
             # 2) Verificar que realmente actualizó 1 sola fila
             if result.rowcount != 1:
-                await self.session.rollback()
                 return Result.fail(
                     InfrastructureException(
                         f"Expected to update 1 row, updated {result.rowcount}",
@@ -196,12 +209,12 @@ class OrmRestaurantCommandRepository(IRestaurantCommandRepository):
                     )
                 )
 
-            await self.session.commit()
+            await self.session.flush()
+            await self._touch_catalog(restaurant.id.restaurant_id)
             return Result.success(None)
 
         except Exception as e:
             print(f"error del update: {e}")
-            await self.session.rollback()
             return Result.fail(
                 InfrastructureException(str(e), ExceptionInfrastructureType.BAD_REQUEST)
             )
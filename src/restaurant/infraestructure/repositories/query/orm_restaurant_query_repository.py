@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, literal_column
+from sqlalchemy import select
 from src.common.infrastructure.infrastructure_exception.enum.infraestructure_exception_type import ExceptionInfrastructureType
 from src.common.utils import Result
 from src.common.infrastructure import InfrastructureException
@@ -16,7 +16,7 @@ from src.restaurant.domain.value_objects.restaurant_location_vo import Restauran
 from src.restaurant.domain.value_objects.restaurant_name_vo import RestaurantNameVo
 from src.restaurant.domain.value_objects.restaurant_opening_time_vo import RestaurantOpeningTimeVo
 from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
-from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import CatalogRestaurant, RestaurantCatalogSnapshot
 
 class OrmRestaurantQueryRepository(IRestaurantQueryRepository):
 
@@ -25,40 +25,14 @@ class OrmRestaurantQueryRepository(IRestaurantQueryRepository):
         
     async def get_by_id(self, restaurant_id: str) -> Result[Restaurant]:
         try:
-            result = await self.session.execute(
-                select(OrmRestaurantModel).where(literal_column("id") == restaurant_id)
-            )
-            orm_restaurant = result.scalars().first()
+            # Diccionario en memoria; solo consulta la BD si el catalogo cambio o vencio
+            restaurants = await RestaurantCatalogSnapshot.restaurants(self.session)
+            entry = restaurants.get(restaurant_id)
             
-            if orm_restaurant is None:
+            if entry is None:
                 return Result.fail(InfrastructureException("Restaurant not found",ExceptionInfrastructureType.NOT_FOUND))
-            
-            # 2) Traer las mesas asociadas
-            q = (
-                select(OrmTableModel)
-                .where(OrmTableModel.restaurant_id == orm_restaurant.id)
-                .order_by(OrmTableModel.capacity)
-            )
-            tbl_res = await self.session.execute(q)
-            orm_tables = tbl_res.scalars().all()
-            
-            restaurant = Restaurant(
-                id=RestaurantIdVo(orm_restaurant.id),
-                name=RestaurantNameVo(orm_restaurant.name),
-                location=RestaurantLocationVo(orm_restaurant.lat, orm_restaurant.lng),
-                opening_time=RestaurantOpeningTimeVo(orm_restaurant.opening_time),
-                closing_time=RestaurantClosingTimeVo(orm_restaurant.closing_time),
-                tables=[
-                    Table(
-                        id=TableNumberId(orm_table.id),
-                        location=TableLocationVo(orm_table.location.value),
-                        capacity=TableCapacityVo(orm_table.capacity)
-                    )
-                    for orm_table in orm_tables
-                ]
-            )
                         
-            return Result.success(restaurant)
+            return Result.success(self._to_domain(entry))
         except Exception as e:
             return Result.fail(InfrastructureException(str(e)))
         
@@ -92,4 +66,29 @@ class OrmRestaurantQueryRepository(IRestaurantQueryRepository):
             return Result.success(restaurants)
 
         except Exception as e:
-            return Result.fail(InfrastructureException(str(e)))
\ No newline at end of file
+            return Result.fail(InfrastructureException(str(e)))
+
+    async def get_all_with_tables(self) -> Result[list[Restaurant]]:
+        try:
+            restaurants = await RestaurantCatalogSnapshot.restaurants(self.session)
+            return Result.success([self._to_domain(entry) for entry in restaurants.values()])
+
+        except Exception as e:
+            return Result.fail(InfrastructureException(str(e)))
+
+    def _to_domain(self, entry: CatalogRestaurant) -> Restaurant:
+        return Restaurant(
+            id=RestaurantIdVo(entry.id),
+            name=RestaurantNameVo(entry.name),
+            location=RestaurantLocationVo(entry.lat, entry.lng),
+            opening_time=RestaurantOpeningTimeVo(entry.opening_time),
+            closing_time=RestaurantClosingTimeVo(entry.closing_time),
+            tables=[
+                Table(
+                    id=TableNumberId(table.id),
+                    location=TableLocationVo(table.location),
+                    capacity=TableCapacityVo(table.capacity)
+                )
+                for table in entry.tables
+            ]
+        )
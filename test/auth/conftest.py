@@ -2,16 +2,26 @@ import pytest
 from test.mocks.auth.repositories.command.user_command_repository_mock import UserCommandRepositoryMock
 from test.mocks.auth.repositories.query.user_query_repository_mock import UserQueryRepositoryMock
 from src.common.infrastructure import UuidGenerator, JwtGenerator
-from src.auth.infrastructure.encryptor.bcrypt_encryptor import BcryptEncryptor
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
 from src.auth.application.services.user_register_service import UserRegisterService
 from src.auth.application.services.user_login_service import UserLoginService
+from src.auth.application.services.user_update_service import UserUpdateService
+from src.auth.infrastructure.principal_cache.lru_principal_cache import LruPrincipalCache
 from src.common.application import IService, ExceptionDecorator
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
 from src.auth.application.dtos.request.user_register_request_dto import UserRegisterRequestDto
 from src.auth.application.dtos.request.user_login_request_dto import UserLoginRequestDto
+from src.auth.application.dtos.request.user_update_request_dto import UserUpdateRequestDto
 from src.auth.application.dtos.response.user_login_response_dto import UserLoginResponseDto
 from src.auth.domain.aggregate.user import User
 from test.mocks.auth.repositories.user_store import user_store
+from test.mocks.auth.repositories.refresh_token_store import refresh_token_store
+from test.mocks.auth.repositories.query.refresh_token_query_repository_mock import RefreshTokenQueryRepositoryMock
+from test.mocks.auth.repositories.command.refresh_token_command_repository_mock import RefreshTokenCommandRepositoryMock
+from test.mocks.common.unit_of_work_mock import UnitOfWorkMock
+from src.auth.application.services.refresh_token_service import RefreshTokenService
+from src.auth.application.dtos.request.refresh_token_request_dto import RefreshTokenRequestDto
+from src.common.infrastructure import RevocationFilter
 
 @pytest.fixture(scope="session")
 def shared_user_list() -> list[User]:
@@ -24,6 +34,14 @@ def user_repositories(shared_user_list) -> tuple[UserQueryRepositoryMock, UserCo
         UserCommandRepositoryMock(shared_user_list)
     )
 
+@pytest.fixture(scope="session")
+def refresh_token_repositories(shared_user_list) -> tuple[RefreshTokenQueryRepositoryMock, RefreshTokenCommandRepositoryMock]:
+    revoked_store = {}
+    return (
+        RefreshTokenQueryRepositoryMock(refresh_token_store, revoked_store),
+        RefreshTokenCommandRepositoryMock(refresh_token_store, revoked_store, shared_user_list)
+    )
+
 @pytest.fixture(scope="function")
 def user_register_service(user_repositories) -> IService[UserRegisterRequestDto, None]:
     user_query_repository, user_command_repository = user_repositories
@@ -31,20 +49,59 @@ def user_register_service(user_repositories) -> IService[UserRegisterRequestDto,
         service=UserRegisterService(
             user_query_repository=user_query_repository,
             user_command_repository=user_command_repository,
-            encryptor=BcryptEncryptor(),
+            encryptor=PooledBcryptEncryptor(),
             id_generator=UuidGenerator()
         ),
         error_handler=FastApiErrorHandler()
     )
 
 @pytest.fixture(scope="function")
-def user_login_service(user_repositories) -> IService[UserLoginRequestDto, UserLoginResponseDto]:
+def user_login_service(user_repositories, refresh_token_repositories) -> IService[UserLoginRequestDto, UserLoginResponseDto]:
     user_query_repository, _ = user_repositories
+    _, refresh_token_command_repository = refresh_token_repositories
     return ExceptionDecorator(
         service=UserLoginService(
             user_query_repository=user_query_repository,
-            encryptor=BcryptEncryptor(),
-            token_generator=JwtGenerator()
+            encryptor=PooledBcryptEncryptor(),
+            token_generator=JwtGenerator(),
+            refresh_token_repository=refresh_token_command_repository,
+            id_generator=UuidGenerator()
         ),
         error_handler=FastApiErrorHandler()
-    )
\ No newline at end of file
+    )
+
+@pytest.fixture(scope="function")
+def principal_cache() -> LruPrincipalCache:
+    LruPrincipalCache.clear()
+    return LruPrincipalCache()
+
+@pytest.fixture(scope="function")
+def user_update_service(user_repositories, principal_cache) -> IService[UserUpdateRequestDto, None]:
+    user_query_repository, user_command_repository = user_repositories
+    return ExceptionDecorator(
+        service=UserUpdateService(
+            user_query_repository=user_query_repository,
+            user_command_repository=user_command_repository,
+            encryptor=PooledBcryptEncryptor(),
+            principal_cache=principal_cache
+        ),
+        error_handler=FastApiErrorHandler()
+    )
+
+@pytest.fixture(scope="function")
+def unit_of_work() -> UnitOfWorkMock:
+    return UnitOfWorkMock()
+
+@pytest.fixture(scope="function")
+def refresh_token_service(refresh_token_repositories, unit_of_work) -> IService[RefreshTokenRequestDto, UserLoginResponseDto]:
+    RevocationFilter.clear()
+    refresh_token_query_repository, refresh_token_command_repository = refresh_token_repositories
+    return ExceptionDecorator(
+        service=RefreshTokenService(
+            refresh_token_query_repository=refresh_token_query_repository,
+            refresh_token_command_repository=refresh_token_command_repository,
+            token_generator=JwtGenerator(),
+            unit_of_work=unit_of_work
+        ),
+        error_handler=FastApiErrorHandler()
+    )
@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from src.auth.application.dtos.request.user_register_request_dto import UserRegisterRequestDto
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
+
+@pytest.mark.asyncio
+async def test_pooled_encryptor_hashes_off_loop_and_records_latency():
+    PooledBcryptEncryptor.clear()
+    encryptor = PooledBcryptEncryptor()
+
+    hashed = await encryptor.encrypt("strongpassword123")
+    verified = await encryptor.verify_password("strongpassword123", hashed.value)
+    rejected = await encryptor.verify_password("12345", hashed.value)
+
+    assert verified.value == True
+    assert rejected.is_error == False and rejected.value == False
+    stats = PooledBcryptEncryptor.stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+    assert stats["latency_p50_ms"] > 0
+
+@pytest.mark.asyncio
+async def test_register_rejected_with_503_when_queue_is_full(user_register_service, monkeypatch):
+    PooledBcryptEncryptor.clear()
+    monkeypatch.setattr(PooledBcryptEncryptor, "WORKERS", 1)
+    monkeypatch.setattr(PooledBcryptEncryptor, "MAX_QUEUE", 0)
+
+    # Ocupa el unico hueco antes de que llegue el registro
+    busy = asyncio.create_task(PooledBcryptEncryptor().encrypt("strongpassword123"))
+    await asyncio.sleep(0)
+
+    status_code = 0
+    try:
+        await user_register_service.execute(UserRegisterRequestDto(
+            email="test.saturated@example.com",
+            name="Test User",
+            password="strongpassword123"
+        ))
+    except HTTPException as e:
+        status_code = e.status_code
+
+    await busy
+    assert status_code == 503
+    assert PooledBcryptEncryptor.stats()["rejected"] == 1
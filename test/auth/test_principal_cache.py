@@ -0,0 +1,45 @@
+import time
+import pytest
+from src.auth.application.dtos.request.user_register_request_dto import UserRegisterRequestDto
+from src.auth.application.dtos.request.user_update_request_dto import UserUpdateRequestDto
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+from src.auth.infrastructure.principal_cache.lru_principal_cache import LruPrincipalCache
+
+def principal(n: int) -> PrincipalResponseDto:
+    return PrincipalResponseDto(user_id=f"id-{n}", email=f"user{n}@example.com", role=UserRoleEnum.CLIENT)
+
+def test_principal_cache_evicts_least_recently_used(principal_cache, monkeypatch):
+    monkeypatch.setattr(LruPrincipalCache, "MAX_ENTRIES", 2)
+    expires_at = time.time() + 900
+
+    principal_cache.put(principal(1), expires_at)
+    principal_cache.put(principal(2), expires_at)
+    assert principal_cache.get("user1@example.com") is not None
+
+    principal_cache.put(principal(3), expires_at)
+
+    assert principal_cache.get("user2@example.com") is None
+    assert principal_cache.get("user1@example.com") is not None
+    assert principal_cache.get("user3@example.com") is not None
+    assert LruPrincipalCache.stats() == {"hits": 3, "misses": 1, "evictions": 1, "invalidations": 0, "size": 2}
+
+def test_principal_cache_entry_expires_with_token(principal_cache):
+    principal_cache.put(principal(1), expires_at=time.time() - 1)
+
+    assert principal_cache.get("user1@example.com") is None
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_principal(user_register_service, user_update_service, user_repositories, principal_cache):
+    user_query_repository, _ = user_repositories
+    await user_register_service.execute(UserRegisterRequestDto(
+        email="cached@example.com",
+        name="Cached User",
+        password="strongpassword123"
+    ))
+    cached = await user_query_repository.get_principal("cached@example.com")
+    principal_cache.put(cached.value, expires_at=time.time() + 900)
+
+    await user_update_service.execute(UserUpdateRequestDto(id=cached.value.user_id, password="anotherpassword123"))
+
+    assert principal_cache.get("cached@example.com") is None
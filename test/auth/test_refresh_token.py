@@ -0,0 +1,84 @@
+import time
+import pytest
+from fastapi import HTTPException
+from src.auth.application.dtos.request.refresh_token_request_dto import RefreshTokenRequestDto
+from src.auth.application.dtos.request.user_login_request_dto import UserLoginRequestDto
+from src.auth.application.dtos.request.user_register_request_dto import UserRegisterRequestDto
+from src.auth.infrastructure.repositories.command.orm_refresh_token_command_repository import OrmRefreshTokenCommandRepository
+from src.common.infrastructure import JwtGenerator, RevocationFilter
+from src.common.infrastructure.jwt.bloom_filter import BloomFilter
+
+async def login(user_register_service, user_login_service, email: str):
+    await user_register_service.execute(UserRegisterRequestDto(email=email, name="Andres", password="strongpassword123"))
+    response = await user_login_service.execute(UserLoginRequestDto(email=email, password="strongpassword123"))
+    return response.value
+
+async def refresh_status(refresh_token_service, refresh_token: str) -> int:
+    try:
+        await refresh_token_service.execute(RefreshTokenRequestDto(refresh_token=refresh_token))
+    except HTTPException as e:
+        return e.status_code
+    return 200
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_tokens_within_the_session(user_register_service, user_login_service, refresh_token_service):
+    session = await login(user_register_service, user_login_service, "test.refresh@example.com")
+
+    response = await refresh_token_service.execute(RefreshTokenRequestDto(refresh_token=session.refresh_token))
+
+    assert response.is_error == False
+    assert response.value.refresh_token != session.refresh_token
+    jwt = JwtGenerator()
+    assert jwt.decode_token(response.value.token)["sid"] == jwt.decode_token(session.token)["sid"]
+    assert jwt.decode_token(response.value.token)["sub"] == "test.refresh@example.com"
+
+@pytest.mark.asyncio
+async def test_refresh_reuse_revokes_the_whole_session(user_register_service, user_login_service, refresh_token_service, unit_of_work):
+    session = await login(user_register_service, user_login_service, "test.refresh.reuse@example.com")
+    rotated = await refresh_token_service.execute(RefreshTokenRequestDto(refresh_token=session.refresh_token))
+
+    assert await refresh_status(refresh_token_service, session.refresh_token) == 401
+    assert unit_of_work.commits == 1
+
+    # Ni el refresh token vigente ni los access tokens de la sesion sirven ya
+    assert await refresh_status(refresh_token_service, rotated.value.refresh_token) == 401
+    for token in (session.token, rotated.value.token):
+        with pytest.raises(HTTPException) as error:
+            JwtGenerator().decode_token(token)
+        assert error.value.status_code == 401
+
+@pytest.mark.asyncio
+async def test_refresh_with_unknown_token_fails(refresh_token_service):
+    assert await refresh_status(refresh_token_service, "not-a-refresh-token") == 401
+
+def test_revocation_filter_has_no_false_negatives_and_forgets_expired_sessions():
+    RevocationFilter.clear()
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    for n in range(1_000):
+        bloom.add(f"sid-{n}")
+    assert all(f"sid-{n}" in bloom for n in range(1_000))
+    assert sum(f"other-{n}" in bloom for n in range(10_000)) < 300
+
+    RevocationFilter.add("alive", time.time() + 60)
+    RevocationFilter.add("expired", time.time() - 1)
+
+    assert RevocationFilter.is_revoked("alive") == True
+    assert RevocationFilter.is_revoked("expired") == False
+    assert RevocationFilter.is_revoked("never-revoked") == False
+
+@pytest.mark.asyncio
+async def test_revocation_reaches_the_filter_only_after_commit(session):
+    RevocationFilter.clear()
+    repository = OrmRefreshTokenCommandRepository(session)
+    jwt = JwtGenerator()
+
+    assert not (await repository.revoke_family("rolled-back", jwt.revoke_session("rolled-back"))).is_error
+    assert RevocationFilter.is_revoked("rolled-back") == False
+    await session.rollback()
+    await session.commit()
+    assert RevocationFilter.is_revoked("rolled-back") == False
+
+    assert not (await repository.revoke_family("committed", jwt.revoke_session("committed"))).is_error
+    assert RevocationFilter.is_revoked("committed") == False
+    await session.commit()
+    assert RevocationFilter.is_revoked("committed") == True
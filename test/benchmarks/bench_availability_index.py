@@ -0,0 +1,152 @@
+"""
+Latencia de la regla de solapes con 10k+ reservas de un restaurante en un dia, tal como la
+aplica la creacion: los EXISTS de check_admission (una fila y por lotes) y, en Postgres, las
+restricciones de exclusion GiST al insertar (migracion 3f9a2c7d41b0).
+
+En SQLite (por defecto) solo se miden las consultas. Para medir tambien el GiST, contra una BD
+migrada con alembic upgrade head:
+
+    PYTHONPATH=. python test/benchmarks/bench_availability_index.py
+    BENCH_DATABASE_URL=postgresql+asyncpg://... PYTHONPATH=. python test/benchmarks/bench_availability_index.py
+"""
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time as clock
+import uuid
+from datetime import date, time
+
+from sqlalchemy import delete, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel  # noqa: F401
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+TABLES = 300
+SLOTS_PER_TABLE = 40   # 300 * 40 = 12.000 reservas en el dia
+SLOT_MINUTES = 30
+LOOKUPS = 2_000
+BATCH = 1_000
+INSERTS = 500
+DAY = date(2099, 1, 1)
+
+
+def minutes_to_time(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1e3
+    p99 = samples[int(len(samples) * 0.99)] * 1e3
+    print(f"{name:<34} n={len(samples):>5}  p50={p50:7.3f}ms  p99={p99:7.3f}ms  mean={statistics.mean(samples) * 1e3:7.3f}ms")
+
+
+async def seed(engine, restaurant_id: str) -> list[int]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(OrmRestaurantModel(id=restaurant_id, name="Solapes", lat=0, lng=0, opening_time=time(0, 0), closing_time=time(23, 59)))
+        tables = [OrmTableModel(capacity=4, location="terraza", restaurant_id=restaurant_id) for _ in range(TABLES)]
+        session.add_all(tables)
+        session.add(MenuModel(id=str(uuid.uuid4()), restaurant_id=restaurant_id))
+        await session.flush()
+        table_ids = [t.id for t in tables]
+        await session.execute(insert(OrmReservationModel), [
+            {
+                "id": str(uuid.uuid4()), "client_id": str(uuid.uuid4()), "status": "pendiente",
+                "restaurant_id": restaurant_id, "table_number_id": str(table_id), "reservation_date": DAY,
+                "date_start": minutes_to_time(slot * SLOT_MINUTES),
+                "date_end": minutes_to_time(slot * SLOT_MINUTES + SLOT_MINUTES - 5)
+            }
+            for table_id in table_ids for slot in range(SLOTS_PER_TABLE)
+        ])
+        await session.commit()
+        return table_ids
+
+
+def probes(restaurant_id: str, table_ids: list[int], n: int) -> list[CreateReservationRequest]:
+    # Inicio al azar en el dia: la mayoria choca con una reserva de la mesa, el resto cae en un hueco
+    items = []
+    for _ in range(n):
+        start = random.randrange(0, SLOTS_PER_TABLE * SLOT_MINUTES - 10)
+        items.append(CreateReservationRequest(
+            client_id=str(uuid.uuid4()), date_start=minutes_to_time(start), date_end=minutes_to_time(start + 5),
+            reservation_date=DAY, restaurant_id=restaurant_id, table_number_id=str(random.choice(table_ids)), dish_id=[]
+        ))
+    return items
+
+
+async def main() -> None:
+    url = os.getenv("BENCH_DATABASE_URL") or f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    postgres = url.startswith("postgresql")
+    engine = create_async_engine(url)
+    if not postgres:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+
+    random.seed(7)
+    restaurant_id = str(uuid.uuid4())
+    t0 = clock.perf_counter()
+    table_ids = await seed(engine, restaurant_id)
+    print(f"carga: {TABLES * SLOTS_PER_TABLE} reservas en un dia en {(clock.perf_counter() - t0) * 1e3:.0f}ms ({engine.dialect.name})")
+
+    try:
+        async with AsyncSession(engine) as session:
+            repository = OrmReservationQueryRepository(session)
+
+            samples, conflicts = [], 0
+            for item in probes(restaurant_id, table_ids, LOOKUPS):
+                t0 = clock.perf_counter()
+                verdict = await repository.check_admission(
+                    item.restaurant_id, item.table_number_id, item.client_id, item.reservation_date, item.date_start, item.date_end, item.dish_id
+                )
+                samples.append(clock.perf_counter() - t0)
+                conflicts += verdict.value.table_conflict
+            report("check_admission (una fila)", samples)
+            print(f"{'':<34} mesa ocupada en {conflicts} de {LOOKUPS}")
+
+            samples = []
+            for _ in range(5):
+                items = probes(restaurant_id, table_ids, BATCH)
+                t0 = clock.perf_counter()
+                await repository.check_admission_many(items)
+                samples.append((clock.perf_counter() - t0) / BATCH)
+            report(f"check_admission_many (/fila, {BATCH})", samples)
+
+            # Lo que inserta la creacion tras admitir; en Postgres el GiST rechaza los solapes
+            samples, rejected = [], 0
+            for item in probes(restaurant_id, table_ids, INSERTS):
+                t0 = clock.perf_counter()
+                try:
+                    async with session.begin_nested():
+                        await session.execute(insert(OrmReservationModel), [{
+                            "id": str(uuid.uuid4()), "client_id": item.client_id, "status": "pendiente",
+                            "restaurant_id": restaurant_id, "table_number_id": item.table_number_id,
+                            "reservation_date": DAY, "date_start": item.date_start, "date_end": item.date_end
+                        }])
+                except IntegrityError:
+                    rejected += 1
+                samples.append(clock.perf_counter() - t0)
+            await session.rollback()
+            report("INSERT con savepoint", samples)
+            if postgres:
+                print(f"{'':<34} rechazadas por reservation_table_no_overlap: {rejected} de {INSERTS}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(OrmReservationModel).where(OrmReservationModel.restaurant_id == restaurant_id))
+            await conn.execute(delete(MenuModel).where(MenuModel.restaurant_id == restaurant_id))
+            await conn.execute(delete(OrmTableModel).where(OrmTableModel.restaurant_id == restaurant_id))
+            await conn.execute(delete(OrmRestaurantModel).where(OrmRestaurantModel.id == restaurant_id))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
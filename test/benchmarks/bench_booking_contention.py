@@ -0,0 +1,136 @@
+"""
+Altas concurrentes sobre la misma mesa y sobre mesas distintas, con y sin el advisory lock por
+mesa y dia. Reporta throughput, rechazos limpios, errores y reservas solapadas que quedaron.
+Necesita Postgres (los advisory locks no existen en SQLite):
+
+    DATABASE_URL_TEST=postgresql+asyncpg://... PYTHONPATH=. python test/benchmarks/bench_booking_contention.py
+"""
+import asyncio
+import os
+import sys
+import time as clock
+import uuid
+from datetime import date, time
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import aliased
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.common.application import ApplicationException, UnitOfWorkDecorator
+from src.common.infrastructure import SqlAlchemyUnitOfWork, UuidGenerator
+from src.common.utils import Result
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel  # noqa: F401
+from src.reservation.application.availability.booking_guard import IBookingGuard
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.services.create_reservation_service import CreateReservationService
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+CLIENTS = 50
+DAY = date(2031, 3, 14)
+
+
+class NoGuard(IBookingGuard):
+
+    def __init__(self, session: AsyncSession):
+        pass
+
+    async def hold(self, slots):
+        return Result.success(None)
+
+
+class NoFreeTables:
+
+    def book(self, reservation) -> None:
+        pass
+
+
+async def seed(engine) -> tuple[str, list[int]]:
+    restaurant_id = str(uuid.uuid4())
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(OrmRestaurantModel(id=restaurant_id, name="Contencion", lat=0, lng=0, opening_time=time(9, 0), closing_time=time(23, 0)))
+        tables = [OrmTableModel(capacity=4, location="terraza", restaurant_id=restaurant_id) for _ in range(CLIENTS)]
+        session.add_all(tables)
+        session.add(MenuModel(id=str(uuid.uuid4()), restaurant_id=restaurant_id))
+        await session.commit()
+        return restaurant_id, [t.id for t in tables]
+
+
+async def create(engine, guard_class, value: CreateReservationRequest) -> str:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        uow = SqlAlchemyUnitOfWork(session)
+        service = UnitOfWorkDecorator(CreateReservationService(
+            query_reser=uow.repository(OrmReservationQueryRepository),
+            command_reser=uow.repository(OrmReservationCommandRepository),
+            id_generator=UuidGenerator(),
+            free_tables=NoFreeTables(),
+            booking_guard=uow.repository(guard_class)
+        ), uow)
+        result = await service.execute(value)
+        if not result.is_error:
+            return "creada"
+        return "rechazada" if isinstance(result.error, ApplicationException) else "error"
+
+
+async def overlapping(engine, restaurant_id: str) -> int:
+    a, b = aliased(OrmReservationModel), aliased(OrmReservationModel)
+    async with AsyncSession(engine) as session:
+        return (await session.execute(select(func.count()).where(
+            a.restaurant_id == restaurant_id, b.restaurant_id == restaurant_id, a.id < b.id,
+            a.table_number_id == b.table_number_id, a.reservation_date == b.reservation_date,
+            a.date_start < b.date_end, b.date_start < a.date_end
+        ))).scalar_one()
+
+
+async def scenario(engine, name: str, guard_class, same_table: bool) -> None:
+    restaurant_id, tables = await seed(engine)
+    values = [
+        CreateReservationRequest(
+            client_id=str(uuid.uuid4()), date_start=time(20, 0), date_end=time(22, 0), reservation_date=DAY,
+            restaurant_id=restaurant_id, table_number_id=str(tables[0] if same_table else tables[n]), dish_id=[]
+        )
+        for n in range(CLIENTS)
+    ]
+
+    t0 = clock.perf_counter()
+    outcomes = await asyncio.gather(*(create(engine, guard_class, v) for v in values))
+    elapsed = clock.perf_counter() - t0
+
+    print(
+        f"{name:<32} altas/s={CLIENTS / elapsed:7.1f}  creadas={outcomes.count('creada'):>3}  "
+        f"rechazadas={outcomes.count('rechazada'):>3}  errores={outcomes.count('error'):>3}  "
+        f"solapadas={await overlapping(engine, restaurant_id):>3}"
+    )
+
+    async with AsyncSession(engine) as session:
+        await session.execute(delete(OrmReservationModel).where(OrmReservationModel.restaurant_id == restaurant_id))
+        await session.execute(delete(MenuModel).where(MenuModel.restaurant_id == restaurant_id))
+        await session.execute(delete(OrmTableModel).where(OrmTableModel.restaurant_id == restaurant_id))
+        await session.execute(delete(OrmRestaurantModel).where(OrmRestaurantModel.id == restaurant_id))
+        await session.commit()
+
+
+async def main(url: str) -> None:
+    engine = create_async_engine(url, pool_size=CLIENTS, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    for same_table in (True, False):
+        for guard_name, guard_class in (("sin lock", NoGuard), ("advisory lock", AdvisoryLockBookingGuard)):
+            name = f"{'misma mesa' if same_table else 'mesas distintas'} / {guard_name}"
+            await scenario(engine, name, guard_class, same_table)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    url = os.getenv("DATABASE_URL_TEST", "")
+    if not url.startswith("postgresql"):
+        sys.exit("Este benchmark necesita Postgres en DATABASE_URL_TEST")
+    asyncio.run(main(url))
@@ -0,0 +1,87 @@
+"""
+Cancelar todas las reservas pendientes de un restaurante: un UPDATE ... RETURNING frente a
+AdminCancelReservationService reserva a reserva.
+
+    PYTHONPATH=. python test/benchmarks/bench_bulk_cancel.py
+"""
+import asyncio
+import os
+import tempfile
+import time as clock
+import uuid
+from datetime import date, time, timedelta
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.menu.infrastructure.models.menu_model import DishModel  # noqa: F401
+from src.reservation.application.dtos.request.admin_cancel_reservation_request_dto import AdminCancelReservationRequest
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.reservation.application.services.admin_cancel_reservation_service import AdminCancelReservationService
+from src.reservation.application.services.bulk_cancel_reservations_service import BulkCancelReservationsService
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel  # noqa: F401
+
+ROWS = 50_000
+ONE_BY_ONE = 500
+DAYS = 30
+FIRST_DAY = date(2025, 8, 1)
+
+
+async def seed(engine, restaurant_id: str) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(insert(OrmReservationModel), [
+            {
+                "id": str(uuid.uuid4()), "date_start": time(8 + n % 14, 0), "date_end": time(9 + n % 14, 0),
+                "client_id": str(uuid.uuid4()), "status": "pendiente", "table_number_id": str(n % 40 + 1),
+                "reservation_date": FIRST_DAY + timedelta(days=n % DAYS), "restaurant_id": restaurant_id
+            }
+            for n in range(ROWS)
+        ])
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    restaurant_id = str(uuid.uuid4())
+    await seed(engine, restaurant_id)
+
+    queries = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        queries[0] += 1
+
+    async with AsyncSession(engine) as session:
+        command = OrmReservationCommandRepository(session)
+
+        ids = (await session.execute(select(OrmReservationModel.id).limit(ONE_BY_ONE))).scalars().all()
+        single = AdminCancelReservationService(command)
+        queries[0] = 0
+        t0 = clock.perf_counter()
+        for reservation_id in ids:
+            await single.execute(AdminCancelReservationRequest(reservation_id=reservation_id))
+        await session.commit()
+        elapsed = clock.perf_counter() - t0
+        print(f"una a una  filas={ONE_BY_ONE:>6}  tiempo={elapsed * 1000:8.1f}ms  por {ROWS // 1000}k~{elapsed * ROWS / ONE_BY_ONE:6.1f}s  consultas={queries[0]}")
+
+        bulk = BulkCancelReservationsService(command)
+        queries[0] = 0
+        t0 = clock.perf_counter()
+        response = await bulk.execute(BulkCancelReservationsRequest(
+            restaurant_id=restaurant_id, date_from=FIRST_DAY, date_to=FIRST_DAY + timedelta(days=DAYS)
+        ))
+        await session.commit()
+        elapsed = clock.perf_counter() - t0
+        if response.is_error: raise response.error
+        print(f"por lotes  filas={len(response.value.cancelled):>6}  tiempo={elapsed * 1000:8.1f}ms  consultas={queries[0]}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+Importar 10k reservas: el servicio por lotes frente a crear una a una con CreateReservationService.
+
+    PYTHONPATH=. python test/benchmarks/bench_bulk_reservations.py
+"""
+import asyncio
+import os
+import random
+import tempfile
+import time as clock
+import uuid
+from datetime import date, time, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.common.infrastructure import UuidGenerator
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.reservation.application.dtos.request.bulk_create_reservation_request_dto import BulkCreateReservationRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.services.bulk_create_reservation_service import BulkCreateReservationService
+from src.reservation.application.services.create_reservation_service import CreateReservationService
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+
+RESTAURANTS = 50
+TABLES = 20
+ITEMS = 10_000
+ONE_BY_ONE = 1_000
+DAY = date(2025, 9, 1)
+
+
+async def seed(engine) -> list[tuple[str, list[int], str]]:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    restaurants = []
+    async with AsyncSession(engine) as session:
+        for n in range(RESTAURANTS):
+            restaurant_id, menu_id, dish_id = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+            tables = list(range(n * TABLES + 1, (n + 1) * TABLES + 1))
+            session.add(OrmRestaurantModel(id=restaurant_id, name=f"R{n}", lat=0, lng=0, opening_time=time(8, 0), closing_time=time(23, 0)))
+            session.add_all([OrmTableModel(id=t, capacity=4, location="terraza", restaurant_id=restaurant_id) for t in tables])
+            session.add(MenuModel(id=menu_id, restaurant_id=restaurant_id))
+            session.add(DishModel(id=dish_id, name="sopa", description="sopa", price=1, category="x", menu_id=menu_id))
+            restaurants.append((restaurant_id, tables, dish_id))
+        await session.commit()
+    return restaurants
+
+
+def batch(restaurants, day: date) -> list[CreateReservationRequest]:
+    # Un turno de una hora por mesa y hora; ~5% de filas repiten un turno ya pedido en el lote
+    slots = [(r, t, h) for r in restaurants for t in r[1] for h in range(8, 23)]
+    random.seed(7)
+    chosen = random.sample(slots, ITEMS)
+    chosen[::20] = [random.choice(chosen) for _ in chosen[::20]]
+    return [
+        CreateReservationRequest(
+            client_id=str(uuid.uuid4()), date_start=time(h, 0), date_end=time(h + 1, 0), reservation_date=day,
+            restaurant_id=r[0], table_number_id=str(t), dish_id=[r[2]] if h % 2 else []
+        )
+        for r, t, h in chosen
+    ]
+
+
+def services(session: AsyncSession):
+    query = OrmReservationQueryRepository(session)
+    command = OrmReservationCommandRepository(session)
+    free_tables = SlotBitmapIndex(query, OrmRestaurantQueryRepository(session))
+    return (
+        BulkCreateReservationService(query_reser=query, command_reser=command, id_generator=UuidGenerator(), free_tables=free_tables, booking_guard=AdvisoryLockBookingGuard(session)),
+        CreateReservationService(query_reser=query, command_reser=command, id_generator=UuidGenerator(), free_tables=free_tables, booking_guard=AdvisoryLockBookingGuard(session))
+    )
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    restaurants = await seed(engine)
+
+    queries = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        queries[0] += 1
+
+    async with AsyncSession(engine) as session:
+        bulk, single = services(session)
+
+        items = batch(restaurants, DAY + timedelta(days=1))
+        queries[0] = 0
+        t0 = clock.perf_counter()
+        for item in items[:ONE_BY_ONE]:
+            await single.execute(item)
+        await session.commit()
+        elapsed = clock.perf_counter() - t0
+        print(f"una a una  filas={ONE_BY_ONE:>6}  tiempo={elapsed * 1000:8.1f}ms  por 10k~{elapsed * ITEMS / ONE_BY_ONE:6.2f}s  consultas={queries[0]}")
+
+        items = batch(restaurants, DAY)
+        queries[0] = 0
+        t0 = clock.perf_counter()
+        response = await bulk.execute(BulkCreateReservationRequest(items=items))
+        await session.commit()
+        elapsed = clock.perf_counter() - t0
+        if response.is_error: raise response.error
+        print(
+            f"por lotes  filas={ITEMS:>6}  tiempo={elapsed * 1000:8.1f}ms  consultas={queries[0]}  "
+            f"creadas={response.value.created}  rechazadas={response.value.rejected}"
+        )
+
+        # Repetir el mismo lote: todo choca con lo recien guardado
+        queries[0] = 0
+        t0 = clock.perf_counter()
+        response = await bulk.execute(BulkCreateReservationRequest(items=items))
+        elapsed = clock.perf_counter() - t0
+        print(f"repetido   filas={ITEMS:>6}  tiempo={elapsed * 1000:8.1f}ms  consultas={queries[0]}  creadas={response.value.created}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,197 @@
+"""
+Latencia p50/p99 de crear una reserva: validaciones en consultas separadas (antes)
+contra el veredicto de admision en una sola consulta (despues).
+
+Cada sentencia paga un round-trip simulado (BENCH_RTT_MS, 1ms por defecto) sobre SQLite
+en memoria, para que la diferencia refleje el numero de viajes a la BD como en Postgres.
+
+    PYTHONPATH=. python test/benchmarks/bench_create_admission.py
+"""
+import asyncio
+import os
+import random
+import time as clock
+import uuid
+from datetime import date, time, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlmodel import SQLModel
+
+from src.auth.infrastructure.models.orm_user_model import OrmUserModel  # noqa: F401
+from src.common.application.aspects.unit_of_work_decorator.unit_of_work_decorator import UnitOfWorkDecorator
+from src.common.infrastructure.id_generator.uuid_generator import UuidGenerator
+from src.common.infrastructure.unit_of_work.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+from src.menu.domain.value_objects.dish_id_vo import DishIdVo
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.services.create_reservation_service import CreateReservationService
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+
+RTT = float(os.getenv("BENCH_RTT_MS", "1")) / 1000
+TABLES = 50
+DISHES = 20
+EXISTING = 5_000
+CREATES = 300
+DAY = date(2099, 1, 1)
+RESTAURANT_ID = str(uuid.uuid4())
+MENU_ID = str(uuid.uuid4())
+
+
+class RoundTripSession:
+    """
+    Envuelve la AsyncSession y agrega un round-trip por sentencia y por commit.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.statements = 0
+        self.commits = 0
+
+    async def execute(self, *args, **kwargs):
+        self.statements += 1
+        await asyncio.sleep(RTT)
+        return await self.session.execute(*args, **kwargs)
+
+    async def flush(self):
+        self.statements += 1
+        await asyncio.sleep(RTT)
+        await self.session.flush()
+
+    async def commit(self):
+        self.statements += 1
+        self.commits += 1
+        await asyncio.sleep(RTT)
+        await self.session.commit()
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+
+class NoFreeTables:
+
+    def book(self, reservation: Reservation) -> None:
+        pass
+
+
+async def seed(session: AsyncSession) -> list[str]:
+    session.add(OrmRestaurantModel(id=RESTAURANT_ID, lat=0, lng=0, name="bench", opening_time=time(9), closing_time=time(23)))
+    await session.flush()
+    for table_id in range(1, TABLES + 1):
+        session.add(OrmTableModel(id=table_id, capacity=4, location="interior", restaurant_id=RESTAURANT_ID))
+    session.add(MenuModel(id=MENU_ID, restaurant_id=RESTAURANT_ID))
+    await session.flush()
+    dish_ids = [str(uuid.uuid4()) for _ in range(DISHES)]
+    for n, dish_id in enumerate(dish_ids):
+        session.add(DishModel(id=dish_id, name=f"plato {n}", description="", price=10, category="Main", image="", menu_id=MENU_ID))
+    for n in range(EXISTING):
+        hour = 9 + n % 12
+        session.add(OrmReservationModel(
+            id=str(uuid.uuid4()), date_start=time(hour), date_end=time(hour + 1), client_id=str(uuid.uuid4()),
+            status="pendiente", table_number_id=str(random.randint(1, TABLES)),
+            reservation_date=DAY - timedelta(days=n % 30), restaurant_id=RESTAURANT_ID
+        ))
+    await session.commit()
+    return dish_ids
+
+
+async def create_before(session: RoundTripSession, value: CreateReservationRequest) -> None:
+    """
+    Las validaciones tal como las hacia CreateReservationService antes del veredicto.
+    """
+    query = OrmReservationQueryRepository(session)
+    await query.exists_by_table(value.table_number_id, value.date_start, value.date_end, value.reservation_date, value.restaurant_id)
+    await query.exists_by_date_client(value.date_start, value.date_end, value.client_id, value.reservation_date)
+    await OrmRestaurantQueryRepository(session).get_by_id(value.restaurant_id)
+    menu = await OrmMenuQueryRepository(session).find_by_restaurant_id(RestaurantIdVo(value.restaurant_id))
+    assert set(value.dish_id).issubset({d.id.value for d in menu.dishes})
+    saved = await OrmReservationCommandRepository(session).save(Reservation(
+        client_id=UserIdVo(value.client_id),
+        id=ReservationIdVo(str(uuid.uuid4())),
+        date_end=ReservationDateEndVo(value.date_end),
+        date_start=ReservationDateStartVo(value.date_start),
+        reservation_date=ReservationDateVo(value.reservation_date),
+        status=ReservationStatusVo("pendiente"),
+        table_number_id=TableNumberId(value.table_number_id),
+        restaurant_id=RestaurantIdVo(value.restaurant_id),
+        dish=[DishIdVo(d) for d in value.dish_id]
+    ))
+    assert saved.is_success
+    await session.commit()
+
+
+async def create_after(session: RoundTripSession, value: CreateReservationRequest) -> None:
+    uow = SqlAlchemyUnitOfWork(session)
+    service = UnitOfWorkDecorator(CreateReservationService(
+        query_reser=uow.repository(OrmReservationQueryRepository),
+        command_reser=uow.repository(OrmReservationCommandRepository),
+        id_generator=UuidGenerator(),
+        free_tables=NoFreeTables(),
+        booking_guard=uow.repository(AdvisoryLockBookingGuard)
+    ), uow)
+    result = await service.execute(value)
+    assert result.is_success, result.error
+
+
+def requests(dish_ids: list[str], offset: int) -> list[CreateReservationRequest]:
+    out = []
+    for n in range(CREATES):
+        hour = random.randint(9, 20)
+        out.append(CreateReservationRequest(
+            client_id=str(uuid.uuid4()),
+            date_start=time(hour, 0),
+            date_end=time(hour + 2, 0),
+            reservation_date=DAY + timedelta(days=offset + n),
+            table_number_id=str(random.randint(1, TABLES)),
+            restaurant_id=RESTAURANT_ID,
+            dish_id=random.sample(dish_ids, 2)
+        ))
+    return out
+
+
+def report(name: str, samples: list[float], statements: int, commits: int) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1e3
+    p99 = samples[int(len(samples) * 0.99)] * 1e3
+    print(f"{name:<28} p50={p50:7.2f}ms  p99={p99:7.2f}ms  sentencias/reserva={statements / len(samples):.1f}  commits/reserva={commits / len(samples):.1f}")
+
+
+async def main() -> None:
+    random.seed(3)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as raw:
+        dish_ids = await seed(raw)
+        session = RoundTripSession(raw)
+        print(f"round-trip simulado: {RTT * 1e3:.1f}ms, {EXISTING} reservas existentes, {TABLES} mesas, {DISHES} platos")
+
+        for name, create, offset in [("antes (consultas separadas)", create_before, 1), ("despues (check_admission)", create_after, 10_000)]:
+            samples = []
+            session.statements = 0
+            session.commits = 0
+            for value in requests(dish_ids, offset):
+                t0 = clock.perf_counter()
+                await create(session, value)
+                samples.append(clock.perf_counter() - t0)
+            report(name, samples, session.statements, session.commits)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
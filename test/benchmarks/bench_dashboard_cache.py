@@ -0,0 +1,99 @@
+"""
+Avalancha de paneles de administracion que refrescan la ocupacion a la vez: sin cache cada
+peticion consulta la BD; con ResponseCache una sola carga por clave y las entradas vencidas
+se sirven mientras se refrescan.
+
+    PYTHONPATH=. python test/benchmarks/bench_dashboard_cache.py
+"""
+import asyncio
+import os
+import tempfile
+import time as clock
+from datetime import date, time, timedelta
+
+PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["ENVIRONMENT"] = "test"
+os.environ["DATABASE_URL_TEST"] = f"sqlite+aiosqlite:///{PATH}"
+
+from sqlalchemy import event, insert
+from sqlmodel import SQLModel
+
+from src.common.infrastructure import PostgresDatabase, ResponseCache, ResponseCacheDecorator
+from src.dashboard.application.dtos.request.get_occupacy_percentage_request_dto import GetOccupancyPercentageRequestDto
+from src.dashboard.application.services.get_occupacy_percentage_service import GetOccupancyPercentageService
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.dashboard.infraestructure.repositories.query.orm_dashboard_query_repository import OrmDashboardQueryRepository
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel  # noqa: F401
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+RESTAURANTS = 2_000
+BROWSERS = 100
+WAVES = 6
+WAVE_EVERY = 0.5
+TTL = 0.75
+
+
+def factory(session):
+    return GetOccupancyPercentageService(dashboard_query_repository=OrmDashboardQueryRepository(session))
+
+
+class Uncached:
+    async def execute(self, value):
+        async with PostgresDatabase().get_session() as session:
+            return await factory(session).execute(value)
+
+
+async def seed() -> None:
+    start = date.today().replace(day=1)
+    restaurants, tables, rollups = [], [], []
+    for n in range(RESTAURANTS):
+        restaurant_id = f"r{n:05d}"
+        restaurants.append({"id": restaurant_id, "name": f"Local {n:05d}", "lat": 0.0, "lng": 0.0, "opening_time": time(8, 0), "closing_time": time(23, 0)})
+        tables.extend({"capacity": 4, "location": "terraza", "restaurant_id": restaurant_id} for _ in range(10))
+        rollups.extend({"restaurant_id": restaurant_id, "day": start + timedelta(days=d), "table_id": str(d % 10), "reservations": 1} for d in range(28))
+    async with PostgresDatabase._engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(insert(OrmRestaurantModel), restaurants)
+        await conn.execute(insert(OrmTableModel), tables)
+        await conn.execute(insert(OrmTableDayRollupModel), rollups)
+
+
+async def storm(name: str, service, queries: list[int]) -> None:
+    queries[0] = 0
+    latencies = []
+
+    async def browser(page: int):
+        t0 = clock.perf_counter()
+        result = await service.execute(GetOccupancyPercentageRequestDto(page=page, per_page=50))
+        assert not result.is_error
+        latencies.append(clock.perf_counter() - t0)
+
+    started = clock.perf_counter()
+    for _ in range(WAVES):
+        # Cada panel pide una de 4 paginas
+        await asyncio.gather(*(browser(1 + b % 4) for b in range(BROWSERS)))
+        await asyncio.sleep(WAVE_EVERY)
+    latencies.sort()
+    print(
+        f"{name:<10} p50={latencies[len(latencies) // 2] * 1000:8.2f}ms  p99={latencies[int(len(latencies) * 0.99)] * 1000:8.2f}ms  "
+        f"consultas={queries[0]:5d}  peticiones={len(latencies)}  duracion={clock.perf_counter() - started:5.2f}s"
+    )
+
+
+async def main() -> None:
+    PostgresDatabase()
+    await seed()
+    queries = [0]
+    event.listen(PostgresDatabase._engine.sync_engine, "before_cursor_execute", lambda *args: queries.__setitem__(0, queries[0] + 1))
+
+    await storm("sin cache", Uncached(), queries)
+    cache = ResponseCache("bench.occupancy", ttl_seconds=TTL, stale_seconds=60)
+    await storm("con cache", ResponseCacheDecorator(cache, factory), queries)
+    await asyncio.sleep(0.1)
+    print(f"cache: {cache.stats()}")
+    await PostgresDatabase._engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
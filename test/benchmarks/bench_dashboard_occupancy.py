@@ -0,0 +1,112 @@
+"""
+Ocupacion por restaurante con 5.000 locales: la consulta anterior (agregado global y un
+SELECT del nombre por fila) contra la consulta unica que pagina primero.
+
+    PYTHONPATH=. python test/benchmarks/bench_dashboard_occupancy.py
+"""
+import asyncio
+import os
+import random
+import tempfile
+import time as clock
+from datetime import date, time, timedelta
+
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.dashboard.application.dtos.request.get_occupacy_percentage_request_dto import GetOccupancyPercentageRequestDto
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.dashboard.infraestructure.repositories.query.orm_dashboard_query_repository import OrmDashboardQueryRepository
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel  # noqa: F401
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+RESTAURANTS = 5_000
+TABLES = 10
+DAYS = 30
+ROUNDS = 20
+
+
+async def occupancy_before(session: AsyncSession, dto: GetOccupancyPercentageRequestDto, start: date, end: date) -> int:
+    """
+    La consulta tal como estaba: agrega todos los restaurantes y busca cada nombre aparte.
+    """
+    tables = select(OrmTableModel.restaurant_id.label("id"), func.count().label("total_tables")).group_by(OrmTableModel.restaurant_id).subquery()
+    occ = (
+        select(OrmTableDayRollupModel.restaurant_id.label("id"), func.count(func.distinct(OrmTableDayRollupModel.table_id)).label("occupied_tables"))
+        .where(OrmTableDayRollupModel.day.between(start, end), OrmTableDayRollupModel.reservations > 0)
+        .group_by(OrmTableDayRollupModel.restaurant_id)
+        .subquery()
+    )
+    rows = (await session.execute(
+        select(tables.c.id, tables.c.total_tables, func.coalesce(occ.c.occupied_tables, 0))
+        .join(occ, tables.c.id == occ.c.id, isouter=True)
+        .offset(dto.offset).limit(dto.limit)
+    )).all()
+    for row in rows:
+        await session.execute(select(OrmRestaurantModel.name).where(OrmRestaurantModel.id == row.id).limit(1))
+    return len(rows)
+
+
+async def seed(engine, start: date) -> None:
+    rng = random.Random(7)
+    restaurants, tables, rollups = [], [], []
+    for n in range(RESTAURANTS):
+        restaurant_id = f"r{n:05d}"
+        restaurants.append({"id": restaurant_id, "name": f"Local {n:05d}", "lat": 0.0, "lng": 0.0, "opening_time": time(8, 0), "closing_time": time(23, 0)})
+        tables.extend({"capacity": 4, "location": "terraza", "restaurant_id": restaurant_id} for _ in range(TABLES))
+        for day in range(DAYS):
+            for table_id in rng.sample(range(1, TABLES + 1), 3):
+                rollups.append({"restaurant_id": restaurant_id, "day": start + timedelta(days=day), "table_id": str(table_id), "reservations": 1})
+    async with engine.begin() as conn:
+        await conn.execute(insert(OrmRestaurantModel), restaurants)
+        await conn.execute(insert(OrmTableModel), tables)
+        await conn.execute(insert(OrmTableDayRollupModel), rollups)
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    start = date(2025, 3, 1)
+    await seed(engine, start)
+    print(f"{RESTAURANTS} restaurantes, {RESTAURANTS * TABLES} mesas, {RESTAURANTS * DAYS * 3} filas de rollup")
+
+    queries = [0]
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: queries.__setitem__(0, queries[0] + 1))
+
+    async with AsyncSession(engine) as session:
+        repository = OrmDashboardQueryRepository(session)
+        for per_page, page in ((10, 1), (100, 1), (100, 50)):
+            dto = GetOccupancyPercentageRequestDto(page=page, per_page=per_page, month=start)
+            for name, run in (
+                ("antes", lambda: occupancy_before(session, dto, *dto.period)),
+                ("despues", lambda: repository.get_occupancy_percentage_by_restaurant(dto))
+            ):
+                queries[0] = 0
+                samples = []
+                for _ in range(ROUNDS):
+                    t0 = clock.perf_counter()
+                    await run()
+                    samples.append(clock.perf_counter() - t0)
+                samples.sort()
+                print(
+                    f"per_page={per_page:<4} page={page:<3} {name:<8} p50={samples[len(samples) // 2] * 1000:8.2f}ms  "
+                    f"consultas/peticion={queries[0] / ROUNDS:.0f}"
+                )
+
+        queries[0] = 0
+        t0 = clock.perf_counter()
+        filtered = await repository.get_occupancy_percentage_by_restaurant(GetOccupancyPercentageRequestDto(
+            per_page=100, restaurant_ids=[f"r{n:05d}" for n in range(0, RESTAURANTS, 50)], month=start
+        ))
+        print(f"filtro de {len(filtered.value)} ids: {(clock.perf_counter() - t0) * 1000:.2f}ms  consultas={queries[0]}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
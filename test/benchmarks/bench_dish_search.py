@@ -0,0 +1,95 @@
+"""
+Latencia de la busqueda de platos con el indice en memoria (el respaldo de SQLite) frente a
+descargar el menu de cada restaurante y filtrar en el cliente, como hasta ahora. En Postgres la
+busqueda va por los indices GIN de las migraciones b5f2d8e4a9c1 y c4e9a2f7b3d6 y no se mide aqui.
+
+    PYTHONPATH=. python test/benchmarks/bench_dish_search.py
+"""
+import asyncio
+import random
+import time as clock
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.menu.infrastructure.search.in_memory_dish_search import InMemoryDishSearch
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel  # noqa: F401
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel  # noqa: F401
+
+RESTAURANTS = 500
+DISHES_PER_RESTAURANT = 200
+SEARCHES = 200
+WORDS = [
+    "pizza", "pasta", "sopa", "ensalada", "pollo", "ternera", "salmon", "atun", "queso", "tomate", "albahaca",
+    "champiñones", "ajo", "limon", "chocolate", "fresa", "vainilla", "arroz", "gambas", "pulpo", "patatas",
+    "cebolla", "pimiento", "berenjena", "calabaza", "espinacas", "jamon", "chorizo", "lentejas", "garbanzos"
+]
+QUERIES = ["pizza", "salmon limon", "chocolat", "ensalda tomate", "gambas ajo", "queso"]
+
+
+def report(name: str, samples: list[float]) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1000
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000
+    print(f"{name:<22} p50={p50:8.2f}ms  p95={p95:8.2f}ms")
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    rng = random.Random(7)
+    restaurant_ids = [str(uuid.uuid4()) for _ in range(RESTAURANTS)]
+    async with AsyncSession(engine) as session:
+        menus = {r: str(uuid.uuid4()) for r in restaurant_ids}
+        await session.execute(insert(MenuModel), [{"id": m, "restaurant_id": r} for r, m in menus.items()])
+        await session.execute(insert(DishModel), [
+            {
+                "id": str(uuid.uuid4()),
+                "name": " ".join(rng.sample(WORDS, 2)).capitalize(),
+                "description": " ".join(rng.sample(WORDS, 5)),
+                "price": round(rng.uniform(4, 30), 2),
+                "category": rng.choice(["Main", "Dessert", "Appetizer"]),
+                "is_available": rng.random() > 0.1,
+                "menu_id": menus[r]
+            }
+            for r in restaurant_ids for _ in range(DISHES_PER_RESTAURANT)
+        ])
+        await session.commit()
+
+    async with AsyncSession(engine) as session:
+        search = InMemoryDishSearch(session)
+        t0 = clock.perf_counter()
+        await search.search(SearchDishesRequestDto(text="pizza"), 20)
+        print(f"carga del indice: {RESTAURANTS * DISHES_PER_RESTAURANT} platos en {(clock.perf_counter() - t0) * 1000:.0f}ms")
+
+        samples = []
+        for n in range(SEARCHES):
+            t0 = clock.perf_counter()
+            found = await search.search(SearchDishesRequestDto(text=QUERIES[n % len(QUERIES)]), 21)
+            samples.append(clock.perf_counter() - t0)
+        report("busqueda en memoria", samples)
+        if found.is_error: raise found.error
+
+        # Camino anterior: para buscar en todos los restaurantes el cliente descarga cada menu y filtra
+        query = OrmMenuQueryRepository(session)
+        t0 = clock.perf_counter()
+        matches = 0
+        for restaurant_id in restaurant_ids:
+            menu = await query.find_by_restaurant_id(RestaurantIdVo(restaurant_id))
+            matches += sum("pizza" in d.name.value.lower() for d in menu.dishes)
+        print(f"menus completos       {(clock.perf_counter() - t0) * 1000:8.0f}ms por busqueda ({RESTAURANTS} consultas)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Busqueda de mesas libres en toda la ciudad con SlotBitmapIndex.
+
+    PYTHONPATH=. python test/benchmarks/bench_free_table_search.py
+"""
+import asyncio
+import random
+import time as clock
+import uuid
+from datetime import date, time
+
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.common.utils import Result
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.restaurant.domain.aggregate.restaurant import Restaurant
+from src.restaurant.domain.entities.enums.table_location_enum import TableLocationEnum
+from src.restaurant.domain.entities.table import Table
+from src.restaurant.domain.entities.value_objects.table_capacity_vo import TableCapacityVo
+from src.restaurant.domain.entities.value_objects.table_location_vo import TableLocationVo
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_closing_time_vo import RestaurantClosingTimeVo
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.domain.value_objects.restaurant_location_vo import RestaurantLocationVo
+from src.restaurant.domain.value_objects.restaurant_name_vo import RestaurantNameVo
+from src.restaurant.domain.value_objects.restaurant_opening_time_vo import RestaurantOpeningTimeVo
+
+RESTAURANTS = 2_000
+TABLES_PER_RESTAURANT = 20
+RESERVATIONS_PER_TABLE = 4
+SEARCHES = 200
+DAY = date(2099, 1, 1)
+
+
+class InMemoryRepository:
+
+    def __init__(self, restaurants: list[Restaurant], reservations: list[Reservation]):
+        self.restaurants = restaurants
+        self.reservations = reservations
+
+    async def get_all_with_tables(self) -> Result[list[Restaurant]]:
+        return Result.success(self.restaurants)
+
+    async def get_active_by_date(self, reservation_date: date) -> Result[list[Reservation]]:
+        return Result.success(self.reservations)
+
+
+def build() -> tuple[list[Restaurant], list[Reservation]]:
+    random.seed(11)
+    restaurants: list[Restaurant] = []
+    reservations: list[Reservation] = []
+    table_id = 1
+    for n in range(RESTAURANTS):
+        restaurant_id = str(uuid.uuid4())
+        tables = []
+        for _ in range(TABLES_PER_RESTAURANT):
+            tables.append(Table(
+                id=TableNumberId(table_id),
+                location=TableLocationVo(TableLocationEnum.interior.value),
+                capacity=TableCapacityVo(random.randint(2, 12))
+            ))
+            for slot in range(RESERVATIONS_PER_TABLE):
+                hour = 10 + slot * 3 + random.randint(0, 1)
+                reservations.append(Reservation(
+                    id=ReservationIdVo(str(uuid.uuid4())),
+                    date_start=ReservationDateStartVo(time(hour, 0)),
+                    date_end=ReservationDateEndVo(time(hour + 1, 30)),
+                    reservation_date=ReservationDateVo(DAY),
+                    status=ReservationStatusVo("pendiente"),
+                    client_id=UserIdVo(str(uuid.uuid4())),
+                    table_number_id=TableNumberId(table_id),
+                    restaurant_id=RestaurantIdVo(restaurant_id),
+                    dish=[]
+                ))
+            table_id += 1
+        restaurants.append(Restaurant(
+            id=RestaurantIdVo(restaurant_id),
+            name=RestaurantNameVo(f"Restaurante {n}"),
+            location=RestaurantLocationVo(-0.18, -78.46),
+            opening_time=RestaurantOpeningTimeVo(time(9, 0)),
+            closing_time=RestaurantClosingTimeVo(time(23, 0)),
+            tables=tables
+        ))
+    return restaurants, reservations
+
+
+async def main() -> None:
+    restaurants, reservations = build()
+    repository = InMemoryRepository(restaurants, reservations)
+    index = SlotBitmapIndex(repository, repository)
+
+    t0 = clock.perf_counter()
+    await index.search(DAY, time(12, 0), time(13, 0), 2)
+    print(f"carga ({RESTAURANTS} restaurantes, {len(reservations)} reservas): {(clock.perf_counter() - t0) * 1e3:.1f}ms")
+
+    samples = []
+    total = 0
+    for _ in range(SEARCHES):
+        hour = random.randint(9, 20)
+        people = random.randint(2, 10)
+        t0 = clock.perf_counter()
+        found = await index.search(DAY, time(hour, 15), time(hour + 2, 0), people)
+        samples.append(clock.perf_counter() - t0)
+        total += len(found.value)
+
+    samples.sort()
+    print(f"busqueda en toda la ciudad ({RESTAURANTS * TABLES_PER_RESTAURANT} mesas): "
+          f"p50={samples[len(samples) // 2] * 1e3:.2f}ms p99={samples[int(len(samples) * 0.99)] * 1e3:.2f}ms "
+          f"(media {total // SEARCHES} mesas libres por busqueda)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
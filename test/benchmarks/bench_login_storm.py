@@ -0,0 +1,151 @@
+"""
+Latencia de un GET ajeno mientras llega una avalancha de logins: bcrypt en el event loop contra el pool.
+
+    PYTHONPATH=. python test/benchmarks/bench_login_storm.py
+"""
+import asyncio
+import contextlib
+import io
+import os
+import tempfile
+import time as clock
+import uuid
+
+import bcrypt
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.auth.application.dtos.request.user_login_request_dto import UserLoginRequestDto
+from src.auth.application.encryptor.async_encryptor import IAsyncEncryptor
+from src.auth.application.services.user_login_service import UserLoginService
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+from src.auth.infrastructure.encryptor.bcrypt_encryptor import BcryptEncryptor
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
+from src.auth.infrastructure.models.orm_user_model import OrmUserModel
+from src.auth.infrastructure.repositories.query.orm_user_query_repository import OrmUserQueryRepository
+from src.common.application import ExceptionDecorator
+from src.common.infrastructure import JwtGenerator
+from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from src.common.utils import Result
+
+LOGINS = 48
+CONCURRENCY = 16
+PING_EVERY = 0.005
+EMAIL = "bench@example.com"
+PASSWORD = "strongpassword123"
+
+
+class InlineBcryptEncryptor(IAsyncEncryptor):
+    """
+    Comportamiento anterior: bcrypt corre dentro del event loop.
+    """
+
+    def __init__(self):
+        self.encryptor = BcryptEncryptor()
+
+    async def encrypt(self, plain_data: str) -> Result[str]:
+        return Result.success(self.encryptor.encrypt(plain_data))
+
+    async def verify_password(self, plain_data: str, hashed_data: str) -> Result[bool]:
+        return Result.success(self.encryptor.verify_password(plain_data, hashed_data))
+
+
+def build_app(engine, encryptor: IAsyncEncryptor) -> FastAPI:
+    app = FastAPI()
+
+    async def session():
+        async with AsyncSession(engine) as s:
+            yield s
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/login")
+    async def login(s: AsyncSession = Depends(session)):
+        service = ExceptionDecorator(
+            UserLoginService(OrmUserQueryRepository(s), encryptor, JwtGenerator()),
+            FastApiErrorHandler()
+        )
+        response = await service.execute(UserLoginRequestDto(email=EMAIL, password=PASSWORD))
+        return {"access_token": response.value.token}
+
+    return app
+
+
+def pct(samples: list[float], q: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * q))] * 1000
+
+
+async def run(name: str, app: FastAPI, storm: bool) -> None:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/ping")
+        done = asyncio.Event()
+        statuses: dict[int, int] = {}
+        latencies: list[float] = []
+
+        async def pinger():
+            # Latencia contra el instante en que el GET debia salir: un loop bloqueado tambien cuenta
+            due = clock.perf_counter()
+            while not done.is_set():
+                await client.get("/ping")
+                latencies.append(clock.perf_counter() - due)
+                due = max(due + PING_EVERY, clock.perf_counter())
+                await asyncio.sleep(due - clock.perf_counter())
+
+        async def worker(n: int):
+            for _ in range(n):
+                r = await client.post("/login")
+                statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+
+        ping_task = asyncio.create_task(pinger())
+        started = clock.perf_counter()
+        # El error handler imprime cada rechazo
+        with contextlib.redirect_stdout(io.StringIO()):
+            if storm:
+                await asyncio.gather(*(worker(LOGINS // CONCURRENCY) for _ in range(CONCURRENCY)))
+            else:
+                await asyncio.sleep(0.5)
+        elapsed = clock.perf_counter() - started
+        done.set()
+        await ping_task
+
+    latencies.sort()
+    print(
+        f"{name:<22} GET p50={pct(latencies, 0.5):7.2f}ms p99={pct(latencies, 0.99):7.2f}ms "
+        f"max={latencies[-1] * 1000:7.2f}ms  gets={len(latencies)}  logins={statuses}  duracion={elapsed:5.2f}s"
+    )
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    hashed = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    async with AsyncSession(engine) as s:
+        s.add(OrmUserModel(id=str(uuid.uuid4()), email=EMAIL, name="Bench", password=hashed, role=UserRoleEnum.CLIENT))
+        await s.commit()
+
+    await run("sin avalancha", build_app(engine, PooledBcryptEncryptor()), storm=False)
+    await run("bcrypt en el loop", build_app(engine, InlineBcryptEncryptor()), storm=True)
+    PooledBcryptEncryptor.clear()
+    await run("bcrypt en el pool", build_app(engine, PooledBcryptEncryptor()), storm=True)
+    print(f"pool: {PooledBcryptEncryptor.stats()}")
+
+    PooledBcryptEncryptor.clear()
+    PooledBcryptEncryptor.MAX_QUEUE = 4
+    await run("pool con cola de 4", build_app(engine, PooledBcryptEncryptor()), storm=True)
+    print(f"pool: {PooledBcryptEncryptor.stats()}")
+
+    PooledBcryptEncryptor.shutdown()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
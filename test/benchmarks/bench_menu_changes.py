@@ -0,0 +1,109 @@
+"""
+Costo de persistir un cambio de un plato segun el tamaño del menu: recargar el menu y reescribir
+todos los platos (como hacia update_from_domain) frente a escribir solo lo que el agregado marco.
+
+    PYTHONPATH=. python test/benchmarks/bench_menu_changes.py
+"""
+import asyncio
+import time as clock
+import uuid
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import joinedload
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.menu.domain.aggregate.menu import Menu
+from src.menu.domain.value_objects.dish_price_vo import DishPriceVo
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.repositories.command.orm_menu_command_repository import OrmMenuCommandRepository
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel  # noqa: F401
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel  # noqa: F401
+
+SIZES = (20, 200, 2_000)
+CHANGES = 30
+
+
+async def rewrite_whole_menu(session: AsyncSession, menu: Menu) -> None:
+    # Camino anterior: recarga el menu con todos sus platos y los reescribe uno por uno
+    result = await session.execute(select(MenuModel).where(MenuModel.id == menu.id.value).options(joinedload(MenuModel.dishes)))
+    model = result.unique().scalars().first()
+    incoming = {str(d.id.value): d for d in menu.dishes}
+    for db_dish in [d for d in model.dishes if d.id not in incoming]:
+        model.dishes.remove(db_dish)
+    for dish_id, dish in incoming.items():
+        existing = next((d for d in model.dishes if d.id == dish_id), None)
+        if existing:
+            existing.name = dish.name.value
+            existing.description = dish.description.value
+            existing.price = dish.price.value
+            existing.category = dish.category.value
+            existing.image = dish.image.value if dish.image else None
+            existing.is_available = dish.is_available
+        else:
+            model.dishes.append(DishModel.from_domain(dish))
+    session.add(model)
+    await session.flush()
+
+
+async def seed(engine, size: int) -> str:
+    restaurant_id, menu_id = str(uuid.uuid4()), str(uuid.uuid4())
+    async with AsyncSession(engine) as session:
+        session.add(MenuModel(id=menu_id, restaurant_id=restaurant_id))
+        await session.flush()
+        await session.execute(insert(DishModel), [
+            {"id": str(uuid.uuid4()), "name": f"plato {n}", "description": "d", "price": 10, "category": "Main", "menu_id": menu_id}
+            for n in range(size)
+        ])
+        await session.commit()
+    return restaurant_id
+
+
+async def measure(engine, restaurant_id: str, persist, queries: list[int]) -> tuple[float, float]:
+    samples = []
+    statements = 0
+    for n in range(CHANGES):
+        async with AsyncSession(engine) as session:
+            menu = await OrmMenuQueryRepository(session).find_by_restaurant_id(RestaurantIdVo(restaurant_id))
+            dish = menu.dishes[n % len(menu.dishes)]
+            dish.update_price(DishPriceVo(11 + n))
+            menu.update_dish(dish)
+
+            before = queries[0]
+            t0 = clock.perf_counter()
+            await persist(session, menu)
+            samples.append(clock.perf_counter() - t0)
+            statements += queries[0] - before
+            await session.commit()
+    samples.sort()
+    return samples[len(samples) // 2] * 1000, statements / CHANGES
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    queries = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        queries[0] += 1
+
+    for size in SIZES:
+        restaurant_id = await seed(engine, size)
+        old_ms, old_statements = await measure(engine, restaurant_id, rewrite_whole_menu, queries)
+        new_ms, new_statements = await measure(engine, restaurant_id, lambda session, menu: OrmMenuCommandRepository(session).update(menu), queries)
+        print(
+            f"platos={size:>5}  reescribir menu p50={old_ms:8.2f}ms sentencias={old_statements:.0f}  "
+            f"solo cambios p50={new_ms:6.2f}ms sentencias={new_statements:.0f}"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""
+Costo de renovar la sesion con el refresh token frente a repetir el login con bcrypt.
+
+    PYTHONPATH=. python test/benchmarks/bench_refresh_vs_login.py
+"""
+import asyncio
+import time as clock
+import uuid
+
+import bcrypt
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.auth.application.dtos.request.refresh_token_request_dto import RefreshTokenRequestDto
+from src.auth.application.dtos.request.user_login_request_dto import UserLoginRequestDto
+from src.auth.application.services.refresh_token_service import RefreshTokenService
+from src.auth.application.services.user_login_service import UserLoginService
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+from src.auth.infrastructure.encryptor.pooled_bcrypt_encryptor import PooledBcryptEncryptor
+from src.auth.infrastructure.models.orm_user_model import OrmUserModel
+from src.auth.infrastructure.repositories.command.orm_refresh_token_command_repository import OrmRefreshTokenCommandRepository
+from src.auth.infrastructure.repositories.query.orm_refresh_token_query_repository import OrmRefreshTokenQueryRepository
+from src.auth.infrastructure.repositories.query.orm_user_query_repository import OrmUserQueryRepository
+from src.common.application import UnitOfWorkDecorator
+from src.common.infrastructure import JwtGenerator, SqlAlchemyUnitOfWork, UuidGenerator
+
+LOGINS = 20
+REFRESHES = 2_000
+EMAIL = "bench@example.com"
+PASSWORD = "strongpassword123"
+
+
+def report(name: str, samples: list[float], queries: int) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1000
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+    print(f"{name:<10} p50={p50:8.2f}ms  p99={p99:8.2f}ms  consultas/peticion={queries / len(samples):.1f}")
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    queries = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        queries[0] += 1
+
+    hashed = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(OrmUserModel(id=str(uuid.uuid4()), email=EMAIL, name="Bench", password=hashed, role=UserRoleEnum.CLIENT))
+        await session.commit()
+
+        uow = SqlAlchemyUnitOfWork(session)
+        login = UnitOfWorkDecorator(UserLoginService(
+            uow.repository(OrmUserQueryRepository),
+            PooledBcryptEncryptor(),
+            JwtGenerator(),
+            uow.repository(OrmRefreshTokenCommandRepository),
+            UuidGenerator()
+        ), uow)
+        refresh = UnitOfWorkDecorator(RefreshTokenService(
+            uow.repository(OrmRefreshTokenQueryRepository),
+            uow.repository(OrmRefreshTokenCommandRepository),
+            JwtGenerator(),
+            uow
+        ), uow)
+
+        queries[0] = 0
+        samples = []
+        for _ in range(LOGINS):
+            t0 = clock.perf_counter()
+            response = await login.execute(UserLoginRequestDto(email=EMAIL, password=PASSWORD))
+            samples.append(clock.perf_counter() - t0)
+        report("login", samples, queries[0])
+        if response.is_error: raise response.error
+
+        refresh_token = response.value.refresh_token
+        queries[0] = 0
+        samples = []
+        for _ in range(REFRESHES):
+            t0 = clock.perf_counter()
+            response = await refresh.execute(RefreshTokenRequestDto(refresh_token=refresh_token))
+            samples.append(clock.perf_counter() - t0)
+            previous, refresh_token = refresh_token, response.value.refresh_token
+        report("refresh", samples, queries[0])
+
+        # Reutilizar un token ya rotado revoca la sesion y con ella el token vigente
+        reused = await refresh.execute(RefreshTokenRequestDto(refresh_token=previous))
+        current = await refresh.execute(RefreshTokenRequestDto(refresh_token=refresh_token))
+        revoked = await OrmRefreshTokenQueryRepository(session).get_revoked_sessions()
+        print(f"reuso rechazado={reused.is_error}  vigente rechazado={current.is_error}  sesiones revocadas={len(revoked.value)}")
+
+    PooledBcryptEncryptor.shutdown()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
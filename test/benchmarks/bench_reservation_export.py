@@ -0,0 +1,89 @@
+"""
+Memoria y tiempo de exportar todas las reservas: carga completa en objetos ORM frente al stream por chunks.
+
+    PYTHONPATH=. python test/benchmarks/bench_reservation_export.py
+"""
+import asyncio
+import json
+import os
+import tempfile
+import time as clock
+import tracemalloc
+import uuid
+from datetime import date, time, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.services.export_reservations_service import ExportReservationsService
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+
+ROWS = 200_000
+BATCH = 10_000
+
+
+class Sink:
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, line: str) -> None:
+        self.bytes += len(line)
+
+
+async def measure(name: str, run) -> None:
+    tracemalloc.start()
+    t0 = clock.perf_counter()
+    written = await run()
+    elapsed = clock.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<18} tiempo={elapsed:6.2f}s  pico={peak / 2**20:7.1f}MiB  bytes={written}")
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        restaurant_id = str(uuid.uuid4())
+        for start in range(0, ROWS, BATCH):
+            await conn.execute(insert(OrmReservationModel), [
+                {
+                    "id": str(uuid.uuid4()), "date_start": time(12, 0), "date_end": time(13, 0),
+                    "client_id": str(uuid.uuid4()), "status": "pendiente", "table_number_id": "1",
+                    "reservation_date": date(2025, 1, 1) + timedelta(days=n % 365), "restaurant_id": restaurant_id
+                }
+                for n in range(start, start + BATCH)
+            ])
+
+    async def full_load() -> int:
+        # Comportamiento anterior: todas las filas como objetos ORM y luego serializadas
+        sink = Sink()
+        async with AsyncSession(engine) as session:
+            rows = (await session.execute(select(OrmReservationModel))).scalars().all()
+            for r in rows:
+                sink.write(json.dumps(r.model_dump(), default=str) + "\n")
+        return sink.bytes
+
+    async def streamed() -> int:
+        sink = Sink()
+        async with AsyncSession(engine) as session:
+            service = ExportReservationsService(query_reser=OrmReservationQueryRepository(session))
+            chunks = await service.execute(FindReservationRequest())
+            if chunks.is_error: raise chunks.error
+            async for chunk in chunks.value:
+                for r in chunk:
+                    sink.write(json.dumps(vars(r), default=str) + "\n")
+        return sink.bytes
+
+    await measure("carga completa", full_load)
+    await measure("stream por chunks", streamed)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
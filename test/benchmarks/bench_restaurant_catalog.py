@@ -0,0 +1,77 @@
+"""
+get_by_id de restaurantes: catalogo recargado en cada llamada contra el snapshot en memoria.
+
+    PYTHONPATH=. python test/benchmarks/bench_restaurant_catalog.py
+"""
+import asyncio
+import random
+import time as clock
+import uuid
+from datetime import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.restaurant.domain.entities.enums.table_location_enum import TableLocationEnum
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import RestaurantCatalogSnapshot
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+
+RESTAURANTS = 200
+TABLES = 10
+CALLS = 2_000
+
+
+def report(name: str, samples: list[float], queries: int) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1e6
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1e6
+    print(f"{name:<18} p50={p50:9.1f}us  p99={p99:9.1f}us  consultas/llamada={queries / len(samples):.2f}")
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    queries = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        queries[0] += 1
+
+    ids = [str(uuid.uuid4()) for _ in range(RESTAURANTS)]
+    async with AsyncSession(engine) as session:
+        table_id = 0
+        for restaurant_id in ids:
+            session.add(OrmRestaurantModel(id=restaurant_id, lat=0.0, lng=0.0, name="Bench", opening_time=time(9), closing_time=time(23)))
+            for _ in range(TABLES):
+                table_id += 1
+                session.add(OrmTableModel(id=table_id, capacity=random.randint(2, 12), location=TableLocationEnum.interior, restaurant_id=restaurant_id))
+        await session.commit()
+
+        repo = OrmRestaurantQueryRepository(session)
+        for name, warm in [("recarga por llamada", False), ("snapshot", True)]:
+            RestaurantCatalogSnapshot.clear()
+            await RestaurantCatalogSnapshot.warm(session)
+            queries[0] = 0
+            samples = []
+            for _ in range(CALLS if warm else CALLS // 20):
+                if not warm:
+                    RestaurantCatalogSnapshot.bump()
+                restaurant_id = random.choice(ids)
+                t0 = clock.perf_counter()
+                result = await repo.get_by_id(restaurant_id)
+                samples.append(clock.perf_counter() - t0)
+                assert len(result.value.tables) == TABLES
+            report(name, samples, queries[0])
+
+    print(f"snapshot: {RestaurantCatalogSnapshot.stats()}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Top de platos pre-ordenados: GROUP BY sobre la tabla de asociacion (antes), GROUP BY sobre el
+rollup diario (exact=True) y el resumen Space-Saving en memoria (por defecto).
+
+    PYTHONPATH=. python test/benchmarks/bench_top_dishes.py
+"""
+import asyncio
+import os
+import random
+import tempfile
+import time as clock
+from collections import Counter
+from datetime import date, time, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.dashboard.application.dtos.request.get_top_dishes_preorder_request_dto import GetTopDishesPreorderRequestDTO
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel
+from src.dashboard.infraestructure.repositories.query.orm_dashboard_query_repository import OrmDashboardQueryRepository
+from src.dashboard.infraestructure.top_dishes.top_dishes_tracker import TopDishesTracker
+from src.menu.infrastructure.models.menu_model import DishModel
+from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+
+RESTAURANTS = 100
+DISHES = 1_000
+RESERVATIONS = 200_000
+DAYS = 365
+ROUNDS = 20
+
+
+async def top_before(session: AsyncSession, top_n: int) -> list:
+    """
+    La consulta original sobre reservation_dish_association.
+    """
+    return (await session.execute(
+        select(DishModel.id, DishModel.name, func.count(OrmReservationDishModel.dish_id))
+        .select_from(OrmReservationDishModel)
+        .join(DishModel, DishModel.id == OrmReservationDishModel.dish_id)
+        .group_by(DishModel.id, DishModel.name)
+        .order_by(func.count(OrmReservationDishModel.dish_id).desc())
+        .limit(top_n)
+    )).all()
+
+
+async def seed(engine) -> None:
+    rng = random.Random(11)
+    dishes = [f"dish-{n:04d}" for n in range(DISHES)]
+    weights = [1 / (rank + 1) ** 0.8 for rank in range(DISHES)]
+    today = date.today()
+    reservations, association = [], []
+    rollup: Counter = Counter()
+    for n in range(RESERVATIONS):
+        restaurant_id = f"r{rng.randrange(RESTAURANTS):03d}"
+        day = today - timedelta(days=rng.randrange(DAYS))
+        reservations.append({
+            "id": f"res-{n}", "date_start": time(12, 0), "date_end": time(13, 0), "client_id": "c", "status": "completada",
+            "table_number_id": "1", "reservation_date": day, "restaurant_id": restaurant_id
+        })
+        for dish_id in set(rng.choices(dishes, weights=weights, k=2)):
+            association.append({"reservation_id": f"res-{n}", "dish_id": dish_id})
+            rollup[(restaurant_id, day, dish_id)] += 1
+    async with engine.begin() as conn:
+        await conn.execute(insert(DishModel), [{"id": d, "name": d, "description": d, "price": 1.0, "category": "x", "is_available": True} for d in dishes])
+        await conn.execute(insert(OrmReservationModel), reservations)
+        await conn.execute(insert(OrmReservationDishModel), association)
+        await conn.execute(insert(OrmDishDayRollupModel), [
+            {"restaurant_id": r, "day": d, "dish_id": dish, "preorders": c} for (r, d, dish), c in rollup.items()
+        ])
+    print(f"{RESERVATIONS} reservas, {len(association)} pre-ordenes, {len(rollup)} filas de rollup")
+
+
+async def timed(run) -> tuple[float, object]:
+    samples = []
+    for _ in range(ROUNDS):
+        t0 = clock.perf_counter()
+        result = await run()
+        samples.append(clock.perf_counter() - t0)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000, result
+
+
+async def main() -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    await seed(engine)
+
+    async with AsyncSession(engine) as session:
+        repository = OrmDashboardQueryRepository(session)
+        t0 = clock.perf_counter()
+        await TopDishesTracker.rebuild(session)
+        print(f"reconstruccion del tracker: {(clock.perf_counter() - t0) * 1000:.0f}ms  {TopDishesTracker.stats()}")
+
+        before_ms, before = await timed(lambda: top_before(session, 10))
+        exact_ms, exact = await timed(lambda: repository.get_top_preordered_dishes(GetTopDishesPreorderRequestDTO(top_n=10, exact=True)))
+        memory_ms, memory = await timed(lambda: repository.get_top_preordered_dishes(GetTopDishesPreorderRequestDTO(top_n=10)))
+        print(f"asociacion (antes)  p50={before_ms:8.2f}ms")
+        print(f"rollup exact=True   p50={exact_ms:8.2f}ms")
+        print(f"memoria             p50={memory_ms:8.2f}ms")
+        print(f"mismo top-10: {[r[0] for r in before] == [d.dish_id for d in exact.value] == [d.dish_id for d in memory.value]}")
+
+        for window in ("today", "7d", "30d"):
+            exact_ms, exact = await timed(lambda: repository.get_top_preordered_dishes(GetTopDishesPreorderRequestDTO(top_n=10, window=window, restaurant_id="r007", exact=True)))
+            memory_ms, memory = await timed(lambda: repository.get_top_preordered_dishes(GetTopDishesPreorderRequestDTO(top_n=10, window=window, restaurant_id="r007")))
+            hits = len({d.dish_id for d in exact.value} & {d.dish_id for d in memory.value})
+            print(f"r007 ventana={window:<5} exact p50={exact_ms:7.2f}ms  memoria p50={memory_ms:6.2f}ms  coincidencias top-10={hits}/{len(exact.value)}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""
+Costo de la dependencia UserRoleVerify por peticion: principal en cache contra consulta a la BD.
+
+    PYTHONPATH=. python test/benchmarks/bench_user_role_verify.py
+"""
+import asyncio
+import time as clock
+import uuid
+
+from fastapi.security import SecurityScopes
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+from src.auth.infrastructure.middlewares.user_role_verify import UserRoleVerify
+from src.auth.infrastructure.models.orm_user_model import OrmUserModel
+from src.auth.infrastructure.principal_cache.lru_principal_cache import LruPrincipalCache
+
+CALLS = 5_000
+EMAIL = "bench@example.com"
+
+
+def report(name: str, samples: list[float], queries: int) -> None:
+    samples.sort()
+    p50 = samples[len(samples) // 2] * 1e6
+    p99 = samples[int(len(samples) * 0.99)] * 1e6
+    print(f"{name:<22} p50={p50:8.1f}us  p99={p99:8.1f}us  consultas/peticion={queries / len(samples):.2f}")
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    queries = [0]
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def count(*args):
+        queries[0] += 1
+
+    async with AsyncSession(engine) as session:
+        session.add(OrmUserModel(id=str(uuid.uuid4()), email=EMAIL, name="Bench", password="x" * 60, role=UserRoleEnum.CLIENT))
+        await session.commit()
+
+        verify = UserRoleVerify()
+        scopes = SecurityScopes(["client:view_menu"])
+        decoded = {"sub": EMAIL, "scopes": ["client:view_menu"], "exp": clock.time() + 900}
+
+        for name, warm in [("sin cache (BD)", False), ("con cache", True)]:
+            LruPrincipalCache.clear()
+            await verify(scopes, decoded, session)
+            queries[0] = 0
+            samples = []
+            for _ in range(CALLS):
+                if not warm:
+                    LruPrincipalCache.clear()
+                t0 = clock.perf_counter()
+                await verify(scopes, decoded, session)
+                samples.append(clock.perf_counter() - t0)
+            report(name, samples, queries[0])
+
+        print(f"contadores: {LruPrincipalCache.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+import asyncio
+import uuid
+from datetime import time
+import pytest
+from src.common.infrastructure import EntityTag, InvalidationBus, VersionStamps
+from src.restaurant.domain.aggregate.restaurant import Restaurant
+from src.restaurant.domain.entities.table import Table
+from src.restaurant.domain.entities.value_objects.table_capacity_vo import TableCapacityVo
+from src.restaurant.domain.entities.value_objects.table_location_vo import TableLocationVo
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_closing_time_vo import RestaurantClosingTimeVo
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.domain.value_objects.restaurant_location_vo import RestaurantLocationVo
+from src.restaurant.domain.value_objects.restaurant_name_vo import RestaurantNameVo
+from src.restaurant.domain.value_objects.restaurant_opening_time_vo import RestaurantOpeningTimeVo
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import RestaurantCatalogSnapshot
+from src.restaurant.infraestructure.repositories.command.orm_restaurant_command_repository import OrmRestaurantCommandRepository
+
+def test_if_none_match_uses_weak_comparison():
+    etag = EntityTag.strong("menu-1.3")
+    assert etag == '"menu-1.3"'
+    assert EntityTag.matches('"menu-1.3"', etag)
+    assert EntityTag.matches('"otro", W/"menu-1.3"', etag)
+    assert EntityTag.matches("*", etag)
+    assert not EntityTag.matches('"menu-1.2"', etag)
+    assert not EntityTag.matches(None, etag)
+
+@pytest.mark.asyncio
+async def test_stamps_are_served_from_memory_until_invalidated():
+    versions = {"a": 1}
+    loads = []
+    release = asyncio.Event()
+
+    async def load(session, key):
+        loads.append(key)
+        if key == "lento":
+            await release.wait()
+        return f"{key}.{versions.get(key, 1)}" if key in versions or key == "lento" else None
+
+    stamps = VersionStamps(f"test_stamps_{uuid.uuid4().hex}", load)
+    assert await stamps.get(None, "a") == "a.1"
+    assert await stamps.get(None, "a") == "a.1"
+    assert loads == ["a"]
+
+    # Las claves sin agregado no se guardan: el siguiente GET vuelve a mirar
+    assert await stamps.get(None, "b") is None
+    versions["b"] = 1
+    assert await stamps.get(None, "b") == "b.1"
+
+    versions["a"] = 2
+    InvalidationBus.dispatch(stamps.topic, "a")
+    assert await stamps.get(None, "a") == "a.2"
+
+    # Una carga que se cruza con una invalidacion entrega su marca pero no la guarda
+    pending = asyncio.create_task(stamps.get(None, "lento"))
+    await asyncio.sleep(0)
+    InvalidationBus.dispatch(stamps.topic, "lento")
+    release.set()
+    assert await pending == "lento.1"
+    assert stamps.stats()["entries"] == 2
+
+@pytest.mark.asyncio
+async def test_restaurant_stamp_comes_from_the_catalog_read(session, statements):
+    RestaurantCatalogSnapshot.clear()
+    restaurant_id = str(uuid.uuid4())
+    restaurant = Restaurant(
+        id=RestaurantIdVo(restaurant_id),
+        name=RestaurantNameVo("Etag"),
+        location=RestaurantLocationVo(-0.18, -78.46),
+        opening_time=RestaurantOpeningTimeVo(time(9, 0)),
+        closing_time=RestaurantClosingTimeVo(time(22, 0)),
+        tables=[Table(id=TableNumberId(1), location=TableLocationVo("terraza"), capacity=TableCapacityVo(4))]
+    )
+    command = OrmRestaurantCommandRepository(session)
+    await command.save(restaurant)
+    await session.commit()
+
+    first = await RestaurantCatalogSnapshot.restaurant(session, restaurant_id)
+    statements.clear()
+    assert await RestaurantCatalogSnapshot.restaurant(session, restaurant_id) is first
+    assert statements == []
+
+    # La nueva marca llega con las mesas nuevas, en la misma recarga
+    await command.add_table(restaurant, Table(id=TableNumberId(2), location=TableLocationVo("terraza"), capacity=TableCapacityVo(2)))
+    await session.commit()
+    second = await RestaurantCatalogSnapshot.restaurant(session, restaurant_id)
+    assert second.version == first.version + 1
+    assert len(second.tables) == 2 and len(first.tables) == 1
+    assert await RestaurantCatalogSnapshot.restaurant(session, "missing") is None
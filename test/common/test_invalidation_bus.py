@@ -0,0 +1,103 @@
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.common.infrastructure import InvalidationBus
+
+TOPIC = "test_topic"
+
+@pytest.fixture(scope="function")
+def received() -> list:
+    keys: list = []
+    InvalidationBus.subscribe(TOPIC, keys.append)
+    yield keys
+    InvalidationBus._handlers.pop(TOPIC, None)
+
+@pytest.mark.asyncio
+async def test_bus_dispatches_locally_only_after_commit(received, session):
+    await InvalidationBus.publish(session, TOPIC, "a")
+    await InvalidationBus.publish(session, TOPIC, "already-applied", local=False)
+    assert received == []
+    await session.commit()
+    assert received == ["a"]
+
+    await InvalidationBus.publish(session, TOPIC, "discarded")
+    await session.rollback()
+    await session.commit()
+    assert received == ["a"]
+
+@pytest.mark.asyncio
+async def test_bus_ignores_own_notifications_and_flushes_everything(received):
+    InvalidationBus.receive(InvalidationBus._encode(TOPIC, "mine"))
+    InvalidationBus.receive(f"other-worker|{TOPIC}|theirs")
+    InvalidationBus.receive("malformed")
+    await InvalidationBus.flush_all()
+
+    assert received == ["theirs", None]
+
+
+# Cada worker es un proceso aparte con su propio listener; imprime lo que recibe
+WORKER = textwrap.dedent("""
+    import asyncio, sys
+    from src.common.infrastructure import InvalidationBus, PostgresInvalidationListener
+
+    async def main(url):
+        InvalidationBus.subscribe("test_topic", lambda key: print(f"key:{key}", flush=True))
+        listener = PostgresInvalidationListener(url)
+        listener.RECONNECT_SECONDS = 0.2
+        task = asyncio.create_task(listener.run())
+        await listener.connected.wait()
+        print("ready", flush=True)
+        await asyncio.sleep(30)
+        task.cancel()
+
+    asyncio.run(main(sys.argv[1]))
+""")
+
+POSTGRES_URL = os.getenv("DATABASE_URL_TEST", "")
+
+def read_until(worker: subprocess.Popen, expected: str) -> None:
+    for line in worker.stdout:
+        if line.strip() == expected:
+            return
+    raise AssertionError(f"worker exited before printing {expected!r}")
+
+@pytest.mark.skipif(not POSTGRES_URL.startswith("postgresql"), reason="requires a local Postgres in DATABASE_URL_TEST")
+@pytest.mark.asyncio
+async def test_bus_reaches_other_processes_and_flushes_on_reconnect():
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    workers = [
+        subprocess.Popen([sys.executable, "-c", WORKER, POSTGRES_URL], stdout=subprocess.PIPE, text=True, env=env)
+        for _ in range(2)
+    ]
+    engine = create_async_engine(POSTGRES_URL)
+    try:
+        for worker in workers:
+            await asyncio.to_thread(read_until, worker, "ready")
+
+        async with AsyncSession(engine) as session:
+            await InvalidationBus.publish(session, TOPIC, "restaurant-1")
+            await session.commit()
+
+        for worker in workers:
+            await asyncio.to_thread(read_until, worker, "key:restaurant-1")
+
+        # Cortar las conexiones LISTEN: al reconectar cada worker vacia sus caches
+        async with AsyncSession(engine) as session:
+            await session.execute(text(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                "WHERE query LIKE 'LISTEN%' AND pid <> pg_backend_pid()"
+            ))
+
+        for worker in workers:
+            await asyncio.to_thread(read_until, worker, "ready")
+            await asyncio.to_thread(read_until, worker, "key:None")
+    finally:
+        for worker in workers:
+            worker.kill()
+        await engine.dispose()
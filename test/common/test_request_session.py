@@ -0,0 +1,40 @@
+import pytest
+from fastapi import Depends, FastAPI, Security
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.infrastructure import GetPostgresqlSession, RequestSessionMiddleware
+
+class VerifyStub:
+    async def __call__(self, db: AsyncSession = Depends(GetPostgresqlSession())):
+        await db.execute(text("SELECT 1"))
+        return id(db)
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestSessionMiddleware)
+
+    @app.get("/shared")
+    async def shared(
+        auth_session: int = Security(VerifyStub(), scopes=["client:view_menu"]),
+        db: AsyncSession = Depends(GetPostgresqlSession())
+    ):
+        await db.execute(text("SELECT 1"))
+        await db.execute(text("SELECT 2"))
+        return {"same_session": auth_session == id(db)}
+
+    @app.get("/unused")
+    async def unused():
+        return {}
+
+    return app
+
+@pytest.mark.asyncio
+async def test_request_shares_one_session_and_one_checkout():
+    async with AsyncClient(transport=ASGITransport(app=build_app()), base_url="http://test") as client:
+        response = await client.get("/shared")
+        unused = await client.get("/unused")
+
+    assert response.json() == {"same_session": True}
+    assert response.headers[RequestSessionMiddleware.HEADER] == "1"
+    assert unused.headers[RequestSessionMiddleware.HEADER] == "0"
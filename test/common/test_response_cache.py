@@ -0,0 +1,73 @@
+import asyncio
+import pytest
+from src.common.infrastructure import ResponseCache
+from src.common.utils import Result
+
+class SlowLoader:
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> Result[int]:
+        self.calls += 1
+        await self.release.wait()
+        return Result.success(self.calls)
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = ResponseCache("test.single_flight")
+    load = SlowLoader()
+    waiters = [asyncio.create_task(cache.get("k", load)) for _ in range(50)]
+    await asyncio.sleep(0)
+    # Quien disparo la carga se va: los demas la siguen esperando
+    waiters[0].cancel()
+    load.release.set()
+    results = await asyncio.gather(*waiters[1:])
+
+    assert load.calls == 1
+    assert {r.value for r in results} == {1}
+    assert cache.stats()["misses"] == 1 and cache.stats()["coalesced"] == 49
+    assert (await cache.get("k", load)).value == 1
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_served_stale_while_one_refresh_runs():
+    cache = ResponseCache("test.stale", ttl_seconds=0.01, stale_seconds=60)
+    load = SlowLoader()
+    load.release.set()
+    assert (await cache.get("k", load)).value == 1
+
+    await asyncio.sleep(0.02)
+    load.release.clear()
+    stale = [await cache.get("k", load) for _ in range(5)]
+    assert [r.value for r in stale] == [1] * 5
+    await asyncio.sleep(0)
+    assert load.calls == 2
+
+    load.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert (await cache.get("k", load)).value == 2
+    stats = cache.stats()
+    assert (stats["stale_hits"], stats["refreshes"], stats["hits"]) == (5, 1, 1)
+    assert stats["hit_ratio"] == round(6 / 7, 4)
+
+@pytest.mark.asyncio
+async def test_failures_are_shared_but_not_cached():
+    cache = ResponseCache("test.errors")
+    calls = []
+
+    async def failing() -> Result[int]:
+        calls.append(1)
+        await asyncio.sleep(0)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(cache.get("k", failing), cache.get("k", failing), return_exceptions=True)
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+    assert len(calls) == 1
+
+    async def error_result() -> Result[int]:
+        return Result.fail(RuntimeError("bad request"))
+
+    assert (await cache.get("k", error_result)).is_error
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["load_errors"] == 2
@@ -0,0 +1,41 @@
+import pytest
+from src.common.application import ApplicationException, IService, UnitOfWorkDecorator
+from src.common.utils import Result
+from test.mocks.common.unit_of_work_mock import UnitOfWorkMock
+
+class EchoService(IService[str, str]):
+
+    async def execute(self, value: str) -> Result[str]:
+        if value == "fail":
+            return Result.fail(ApplicationException("failed"))
+        if value == "raise":
+            raise RuntimeError("boom")
+        return Result.success(value)
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once_on_success():
+    uow = UnitOfWorkMock()
+    service = UnitOfWorkDecorator(EchoService(), uow)
+
+    response = await service.execute("ok")
+
+    assert response.value == "ok"
+    assert uow.commits == 1
+    assert uow.rollbacks == 0
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error():
+    uow = UnitOfWorkMock()
+    service = UnitOfWorkDecorator(EchoService(), uow)
+
+    response = await service.execute("fail")
+
+    assert response.is_error
+    assert uow.commits == 0
+    assert uow.rollbacks == 1
+
+    with pytest.raises(RuntimeError):
+        await service.execute("raise")
+
+    assert uow.commits == 0
+    assert uow.rollbacks == 2
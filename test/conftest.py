@@ -0,0 +1,72 @@
+import time
+import uuid
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
+from src.auth.domain.enum.user_role_enum import UserRoleEnum
+from src.auth.infrastructure.principal_cache.lru_principal_cache import LruPrincipalCache
+from src.common.infrastructure import JwtGenerator
+
+# create_all solo crea las tablas de los modelos importados
+from src.auth.infrastructure.models.orm_refresh_token_model import OrmRefreshTokenModel  # noqa: F401
+from src.auth.infrastructure.models.orm_revoked_session_model import OrmRevokedSessionModel  # noqa: F401
+from src.auth.infrastructure.models.orm_user_model import OrmUserModel  # noqa: F401
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel  # noqa: F401
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel  # noqa: F401
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel  # noqa: F401
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel  # noqa: F401
+from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel  # noqa: F401
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel  # noqa: F401
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel  # noqa: F401
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel  # noqa: F401
+
+@pytest.fixture(scope="function")
+def database_url() -> str:
+    # Los tests con varias conexiones a la vez lo redefinen con un archivo en tmp_path
+    return "sqlite+aiosqlite:///:memory:"
+
+@pytest_asyncio.fixture(scope="function")
+async def engine(database_url):
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+@pytest_asyncio.fixture(scope="function")
+async def session(engine):
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+@pytest.fixture(scope="function")
+def statements(engine) -> list[str]:
+    """
+    Sentencias SQL que el engine envia a la base de datos. Se registra al inicio del test:
+    los tests vacian la lista tras sembrar los datos y cuentan o filtran lo que sigue.
+    """
+    sent: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: sent.append(statement))
+    return sent
+
+def bearer(role: UserRoleEnum):
+    """
+    Cabecera Authorization de un usuario con el rol dado que UserRoleVerify resuelve desde la
+    cache de principales, sin usuario en la BD: para probar los controladores por HTTP.
+    """
+    principal = PrincipalResponseDto(user_id=str(uuid.uuid4()), email=f"{role.value.lower()}@example.com", role=role)
+    LruPrincipalCache().put(principal, expires_at=time.time() + 60)
+    token = JwtGenerator().generate_token({"sub": principal.email}, role)
+    yield {"Authorization": f"Bearer {token}"}
+    LruPrincipalCache.evict(principal.email)
+
+@pytest.fixture(scope="function")
+def admin_headers():
+    yield from bearer(UserRoleEnum.ADMIN)
+
+@pytest.fixture(scope="function")
+def client_headers():
+    yield from bearer(UserRoleEnum.CLIENT)
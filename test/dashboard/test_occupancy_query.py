@@ -0,0 +1,72 @@
+import uuid
+from datetime import date, time
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.dashboard.application.dtos.request.get_occupacy_percentage_request_dto import GetOccupancyPercentageRequestDto
+from src.dashboard.infraestructure.controllers.get_occupacy_percentage.get_occupacy_percentage import GetOccupancyPercentageController
+from src.dashboard.infraestructure.dtos.request.get_occupacy_percentage_request_inf_dto import GetOccupancyPercentageRequestInfDTO
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.dashboard.infraestructure.repositories.query.orm_dashboard_query_repository import OrmDashboardQueryRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+RESTAURANTS = 120
+
+@pytest.mark.asyncio
+async def test_occupancy_page_is_a_single_query_with_filters_and_period(engine, statements):
+    ids = [f"r{n:03d}" for n in range(RESTAURANTS)]
+    async with AsyncSession(engine) as session:
+        for n, restaurant_id in enumerate(ids):
+            session.add(OrmRestaurantModel(id=restaurant_id, name=f"Local {n:03d}", lat=0, lng=0, opening_time=time(8, 0), closing_time=time(23, 0)))
+            session.add_all([OrmTableModel(capacity=4, location="terraza", restaurant_id=restaurant_id) for _ in range(4)])
+            # Dos mesas ocupadas en marzo y una en abril; la fila a cero es una reserva cancelada
+            session.add_all([
+                OrmTableDayRollupModel(restaurant_id=restaurant_id, day=date(2025, 3, 3), table_id="1", reservations=2),
+                OrmTableDayRollupModel(restaurant_id=restaurant_id, day=date(2025, 3, 20), table_id="2", reservations=1),
+                OrmTableDayRollupModel(restaurant_id=restaurant_id, day=date(2025, 3, 21), table_id="3", reservations=0),
+                OrmTableDayRollupModel(restaurant_id=restaurant_id, day=date(2025, 4, 1), table_id="1", reservations=1)
+            ])
+        # Sin mesas: no aparece en el reporte
+        session.add(OrmRestaurantModel(id=str(uuid.uuid4()), name="Sin mesas", lat=0, lng=0, opening_time=time(8, 0), closing_time=time(23, 0)))
+        await session.commit()
+
+    statements.clear()
+    async with AsyncSession(engine) as session:
+        repository = OrmDashboardQueryRepository(session)
+        march = GetOccupancyPercentageRequestInfDTO(month="2025-03", page=2, per_page=100).to_dto()
+        page = await repository.get_occupancy_percentage_by_restaurant(march)
+        assert len(statements) == 1
+        assert [o.restaurant_name for o in page.value] == [f"Local {n:03d}" for n in range(100, RESTAURANTS)]
+        assert {(o.occupied_tables, o.total_tables, o.occupancy_percent) for o in page.value} == {(2, 4, 50.0)}
+
+        selected = await repository.get_occupancy_percentage_by_restaurant(GetOccupancyPercentageRequestDto(
+            restaurant_ids=["r007", "r003", "missing"],
+            date_from=date(2025, 3, 20),
+            date_to=date(2025, 4, 1)
+        ))
+        assert [(o.restaurant_id, o.occupied_tables) for o in selected.value] == [("r003", 2), ("r007", 2)]
+
+@pytest.mark.asyncio
+async def test_occupancy_rejects_inconsistent_periods_with_422_before_the_cache(admin_headers):
+    app = FastAPI()
+    GetOccupancyPercentageController(app)
+    GetOccupancyPercentageController.cache.clear()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", headers=admin_headers) as client:
+        for query, field in (
+            ({"date_from": "2025-01-01"}, "date_to"),
+            ({"date_to": "2025-01-31"}, "date_from"),
+            ({"month": "2025-03", "date_from": "2025-03-01", "date_to": "2025-03-02"}, "month"),
+            ({"date_from": "2025-03-02", "date_to": "2025-03-01"}, "date_from"),
+            ({"month": "2025-13"}, "month"),
+        ):
+            response = await client.get("/dashboard/ocupacion", params=query)
+            assert response.status_code == 422, query
+            assert response.json()["detail"][0]["loc"] == ["query", field]
+
+    # Ninguna llego al servicio cacheado
+    stats = GetOccupancyPercentageController.cache.stats()
+    assert stats["misses"] == stats["load_errors"] == 0
+    assert GetOccupancyPercentageRequestInfDTO(month="2024-02").to_dto().period == (date(2024, 2, 1), date(2024, 2, 29))
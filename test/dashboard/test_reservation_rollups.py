@@ -0,0 +1,90 @@
+import uuid
+from datetime import date, time
+import pytest
+from sqlalchemy import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.dashboard.application.dtos.request.get_occupacy_percentage_request_dto import GetOccupancyPercentageRequestDto
+from src.dashboard.application.dtos.request.get_reservation_count_request_dto import GetReservationCountRequestDTO
+from src.dashboard.application.dtos.request.get_top_dishes_preorder_request_dto import GetTopDishesPreorderRequestDTO
+from src.dashboard.application.enum.period_type import PeriodType
+from src.dashboard.infraestructure.models.orm_dish_day_rollup_model import OrmDishDayRollupModel
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.dashboard.infraestructure.repositories.query.orm_dashboard_query_repository import OrmDashboardQueryRepository
+from src.dashboard.infraestructure.rollups.reservation_rollups import ReservationRollups
+from src.menu.domain.value_objects.dish_id_vo import DishIdVo
+from src.menu.infrastructure.models.menu_model import DishModel
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+
+def reservation(restaurant_id: str, table_id: int, start: int, dishes: list[str]) -> Reservation:
+    return Reservation(
+        id=ReservationIdVo(str(uuid.uuid4())),
+        date_end=ReservationDateEndVo(time(start + 1, 0)),
+        date_start=ReservationDateStartVo(time(start, 0)),
+        reservation_date=ReservationDateVo(date.today()),
+        status=ReservationStatusVo("pendiente"),
+        client_id=UserIdVo(str(uuid.uuid4())),
+        table_number_id=TableNumberId(table_id),
+        restaurant_id=RestaurantIdVo(restaurant_id),
+        dish=[DishIdVo(d) for d in dishes]
+    )
+
+async def rollup_rows(session: AsyncSession) -> list:
+    rows = []
+    for model in (OrmReservationDayRollupModel, OrmTableDayRollupModel, OrmDishDayRollupModel):
+        result = await session.execute(select(model))
+        # Las filas a cero que dejan las cancelaciones equivalen a no tener fila
+        rows.append(sorted(
+            tuple(getattr(r, c.name) for c in model.__table__.columns)
+            for r in result.scalars().all() if (getattr(r, "reservations", None) or getattr(r, "preorders", None))
+        ))
+    return rows
+
+@pytest.mark.asyncio
+async def test_rollups_follow_creates_and_cancels_and_feed_the_dashboard(engine, statements):
+    restaurant_id = str(uuid.uuid4())
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(OrmRestaurantModel(id=restaurant_id, name="Rollup", lat=0, lng=0, opening_time=time(8, 0), closing_time=time(23, 0)))
+        session.add_all([OrmTableModel(id=n, capacity=4, location="terraza", restaurant_id=restaurant_id) for n in (1, 2, 3, 4)])
+        session.add_all([DishModel(id=d, name=d, description=d, price=1, category="x") for d in ("sopa", "pasta")])
+        await session.commit()
+
+        repository = OrmReservationCommandRepository(session)
+        created = [
+            reservation(restaurant_id, 1, 10, ["sopa", "pasta"]),
+            reservation(restaurant_id, 1, 12, ["sopa"]),
+            reservation(restaurant_id, 2, 10, [])
+        ]
+        for entry in created:
+            assert not (await repository.save(entry)).is_error
+        created[2].update_status_cancelada()
+        assert not (await repository.update(created[2])).is_error
+        await session.commit()
+
+        incremental = await rollup_rows(session)
+        await ReservationRollups.rebuild(session)
+        await session.commit()
+        assert await rollup_rows(session) == incremental
+
+        statements.clear()
+        dashboard = OrmDashboardQueryRepository(session)
+        count = await dashboard.get_reservations_count(GetReservationCountRequestDTO(PeriodType.DAY.value))
+        top = await dashboard.get_top_preordered_dishes(GetTopDishesPreorderRequestDTO(top_n=1, exact=True))
+        occupancy = await dashboard.get_occupancy_percentage_by_restaurant(GetOccupancyPercentageRequestDto())
+
+    assert count.value.count == 3
+    assert [(d.dish_id, d.total_preorders) for d in top.value] == [("sopa", 2)]
+    # Solo la mesa 1 sigue ocupada: la reserva de la mesa 2 se cancelo
+    assert [(o.occupied_tables, o.total_tables, o.occupancy_percent) for o in occupancy.value] == [(1, 4, 25.0)]
+    assert not any("FROM reservation " in s or "reservation_dish_association" in s for s in statements)
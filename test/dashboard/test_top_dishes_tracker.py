@@ -0,0 +1,108 @@
+import random
+import uuid
+from collections import Counter
+from datetime import date, time, timedelta
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.dashboard.application.dtos.request.get_top_dishes_preorder_request_dto import GetTopDishesPreorderRequestDTO
+from src.dashboard.infraestructure.repositories.query.orm_dashboard_query_repository import OrmDashboardQueryRepository
+from src.dashboard.infraestructure.top_dishes.space_saving import SpaceSaving
+from src.dashboard.infraestructure.top_dishes.top_dishes_tracker import TopDishesTracker
+from src.menu.domain.value_objects.dish_id_vo import DishIdVo
+from src.menu.infrastructure.models.menu_model import DishModel
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+def test_space_saving_keeps_the_heavy_hitters_of_a_skewed_stream():
+    rng = random.Random(3)
+    items = [f"dish-{n}" for n in range(2_000)]
+    weights = [1 / (rank + 1) for rank in range(len(items))]
+    stream = rng.choices(items, weights=weights, k=50_000)
+
+    summary = SpaceSaving(128)
+    for item in stream:
+        summary.add(item)
+    exact = Counter(stream)
+
+    assert len(summary) == 128
+    assert [item for item, _ in summary.top(10)] == [item for item, _ in exact.most_common(10)]
+    for item, count in summary.top(10):
+        assert exact[item] <= count <= exact[item] + summary.error(item)
+
+def reservation(restaurant_id: str, day: date, dishes: list[str]) -> Reservation:
+    return Reservation(
+        id=ReservationIdVo(str(uuid.uuid4())),
+        date_end=ReservationDateEndVo(time(13, 0)),
+        date_start=ReservationDateStartVo(time(12, 0)),
+        reservation_date=ReservationDateVo(day),
+        status=ReservationStatusVo("pendiente"),
+        client_id=UserIdVo(str(uuid.uuid4())),
+        table_number_id=TableNumberId(1),
+        restaurant_id=RestaurantIdVo(restaurant_id),
+        dish=[DishIdVo(d) for d in dishes]
+    )
+
+@pytest.mark.asyncio
+async def test_tracker_follows_committed_preorders_and_matches_exact_mode(engine, statements):
+    TopDishesTracker.clear()
+
+    today = date.today()
+    norte, sur = str(uuid.uuid4()), str(uuid.uuid4())
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all([DishModel(id=d, name=d.title(), description=d, price=1, category="x") for d in ("sopa", "pasta", "flan")])
+            await session.commit()
+            await TopDishesTracker.rebuild(session)
+
+            repository = OrmReservationCommandRepository(session)
+            await repository.save(reservation(norte, today, ["sopa", "pasta"]))
+            await repository.save(reservation(norte, today - timedelta(days=10), ["flan"]))
+            await repository.save(reservation(norte, today - timedelta(days=10), ["flan"]))
+            await repository.save(reservation(sur, today, ["pasta"]))
+            # Solo cuenta lo confirmado
+            assert TopDishesTracker.top(5) == []
+            await session.commit()
+
+            await repository.save(reservation(sur, today, ["sopa"]))
+            await session.rollback()
+
+            dashboard = OrmDashboardQueryRepository(session)
+            cases = [
+                GetTopDishesPreorderRequestDTO(top_n=3),
+                GetTopDishesPreorderRequestDTO(top_n=3, window="7d"),
+                GetTopDishesPreorderRequestDTO(top_n=3, window="30d", restaurant_id=norte),
+                GetTopDishesPreorderRequestDTO(top_n=1, window="today", restaurant_id=sur)
+            ]
+            estimated = []
+            for dto in cases:
+                statements.clear()
+                result = await dashboard.get_top_preordered_dishes(dto)
+                # Una sola consulta: los nombres de los platos del top
+                assert len(statements) == 1
+                estimated.append([(d.dish_id, d.dish_name, d.total_preorders) for d in result.value])
+
+            exact = []
+            for dto in cases:
+                dto.exact = True
+                result = await dashboard.get_top_preordered_dishes(dto)
+                exact.append([(d.dish_id, d.dish_name, d.total_preorders) for d in result.value])
+
+            assert estimated == exact
+            assert estimated[0] == [("pasta", "Pasta", 2), ("flan", "Flan", 2), ("sopa", "Sopa", 1)]
+            assert estimated[1] == [("pasta", "Pasta", 2), ("sopa", "Sopa", 1)]
+            assert estimated[3] == [("pasta", "Pasta", 1)]
+
+            # Reconstruido desde el rollup da el mismo resultado que lo acumulado en vivo
+            live = [TopDishesTracker.top(3, dto.restaurant_id, dto.window) for dto in cases]
+            await TopDishesTracker.rebuild(session)
+            assert [TopDishesTracker.top(3, dto.restaurant_id, dto.window) for dto in cases] == live
+    finally:
+        TopDishesTracker.clear()
@@ -0,0 +1,98 @@
+import uuid
+import pytest
+from sqlalchemy import insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.menu.application.dtos.request.create_dish_request_dto import CreateDishRequestDto
+from src.menu.application.dtos.request.update_dish_request_dto import UpdateDishRequestDto
+from src.menu.application.services.add_dish_to_menu_service import AddDishToMenuService
+from src.menu.application.services.remove_dish_from_menu_service import RemoveDishFromMenuService
+from src.menu.application.services.update_dish_in_menu_service import UpdateDishInMenuService
+from src.menu.domain.aggregate.menu import Menu
+from src.menu.domain.entities.dish import Dish
+from src.menu.domain.value_objects.dish_category_vo import DishCategoryVo
+from src.menu.domain.value_objects.dish_description_vo import DishDescriptionVo
+from src.menu.domain.value_objects.dish_id_vo import DishIdVo
+from src.menu.domain.value_objects.dish_name_vo import DishNameVo
+from src.menu.domain.value_objects.dish_price_vo import DishPriceVo
+from src.menu.domain.value_objects.menu_id_vo import MenuIdVo
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.repositories.command.orm_menu_command_repository import OrmMenuCommandRepository
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+DISHES = 50
+
+def dish(name: str) -> Dish:
+    return Dish(DishIdVo(), DishNameVo(name), DishDescriptionVo("descripcion"), DishPriceVo(10), DishCategoryVo("Main"))
+
+def writes(statements: list[str]) -> list[str]:
+    # Escrituras sobre dishes; la subida de menus.version para el ETag va aparte
+    return [
+        s.split()[0].upper() for s in statements
+        if s.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE")) and not s.lstrip().upper().startswith("UPDATE MENUS")
+    ]
+
+def test_menu_tracks_only_the_net_changes():
+    kept, dropped = dish("sopa"), dish("pasta")
+    menu = Menu(MenuIdVo(), RestaurantIdVo(str(uuid.uuid4())), dishes=[kept, dropped])
+
+    fresh = dish("ensalada")
+    menu.add_dish(fresh)
+    fresh.update_price(DishPriceVo(12))
+    menu.update_dish(fresh)
+    menu.add_dish(dish("flan"))
+    menu.remove_dish(menu.dishes[-1].id.value, has_preorders=False)
+    menu.remove_dish(kept.id.value, has_preorders=True)
+    menu.remove_dish(dropped.id.value, has_preorders=False)
+
+    changes = menu.changes()
+    assert changes.added == [fresh]
+    assert changes.updated == [kept] and not kept.is_available
+    assert changes.removed == [dropped.id.value]
+
+    menu.clear_changes()
+    assert menu.changes() == ([], [], [])
+
+@pytest.mark.asyncio
+async def test_single_dish_changes_write_a_single_row(engine, statements):
+    restaurant_id, menu_id = str(uuid.uuid4()), str(uuid.uuid4())
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(MenuModel(id=menu_id, restaurant_id=restaurant_id))
+        await session.flush()
+        await session.execute(insert(DishModel), [
+            {"id": str(uuid.uuid4()), "name": f"plato {n}", "description": "d", "price": 10, "category": "Main", "menu_id": menu_id}
+            for n in range(DISHES)
+        ])
+        await session.commit()
+        existing = (await session.execute(select(DishModel.id).order_by(DishModel.name))).scalars().all()
+
+    statements.clear()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        command, query = OrmMenuCommandRepository(session), OrmMenuQueryRepository(session)
+
+        added = await AddDishToMenuService(command, query).execute(CreateDishRequestDto(
+            name="nuevo", restaurant_id=restaurant_id, category="Main", description="d", image=None, price=15
+        ))
+        assert not added.is_error
+        assert writes(statements) == ["INSERT"]
+
+        statements.clear()
+        updated = await UpdateDishInMenuService(command, query).execute(UpdateDishRequestDto(
+            dish_id=existing[3], name=None, description=None, price=20, category=None, image=None
+        ))
+        assert not updated.is_error
+        assert writes(statements) == ["UPDATE"]
+
+        statements.clear()
+        assert not (await RemoveDishFromMenuService(command, query).execute(existing[7])).is_error
+        assert writes(statements) == ["UPDATE"]
+        await session.commit()
+
+    async with AsyncSession(engine) as session:
+        rows = {r.id: r for r in (await session.execute(select(DishModel))).scalars()}
+        assert len(rows) == DISHES + 1
+        assert rows[existing[3]].price == 20
+        assert rows[existing[7]].menu_id is None
+        assert rows[added.value.id.value].menu_id == menu_id
+        assert sum(r.menu_id == menu_id for r in rows.values()) == DISHES
+        assert (await session.get(MenuModel, menu_id)).version == 4
@@ -0,0 +1,61 @@
+import uuid
+from datetime import date, time, timedelta
+import pytest
+from sqlalchemy import insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.menu.application.services.remove_dish_from_menu_service import RemoveDishFromMenuService
+from src.menu.domain.value_objects.dish_id_vo import DishIdVo
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.menu.infrastructure.repositories.command.orm_menu_command_repository import OrmMenuCommandRepository
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+
+@pytest.mark.asyncio
+async def test_preorders_count_only_active_reservations_from_today_on(engine):
+    restaurant_id, menu_id = str(uuid.uuid4()), str(uuid.uuid4())
+    upcoming, past, cancelled, free = (str(uuid.uuid4()) for _ in range(4))
+    today = date.today()
+    reservations = {
+        upcoming: (today + timedelta(days=2), "pendiente"),
+        past: (today - timedelta(days=2), "confirmada"),
+        cancelled: (today + timedelta(days=2), "cancelada"),
+    }
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(MenuModel(id=menu_id, restaurant_id=restaurant_id))
+        await session.flush()
+        await session.execute(insert(DishModel), [
+            {"id": d, "name": f"plato {n}", "description": "d", "price": 10, "category": "Main", "menu_id": menu_id}
+            for n, d in enumerate((upcoming, past, cancelled, free))
+        ])
+        await session.execute(insert(OrmReservationModel), [
+            {
+                "id": f"r-{dish_id}", "date_start": time(12), "date_end": time(13), "client_id": "c", "status": status,
+                "table_number_id": "1", "reservation_date": day, "restaurant_id": restaurant_id
+            }
+            for dish_id, (day, status) in reservations.items()
+        ])
+        await session.execute(insert(OrmReservationDishModel), [
+            {"reservation_id": f"r-{dish_id}", "dish_id": dish_id} for dish_id in reservations
+        ])
+        await session.commit()
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        query, command = OrmMenuQueryRepository(session), OrmMenuCommandRepository(session)
+        assert await query.exists_preorders(DishIdVo(upcoming))
+        assert not await query.exists_preorders(DishIdVo(past))
+        assert await query.exists_preorders(DishIdVo(past), only_future=False)
+        assert not await query.exists_preorders(DishIdVo(cancelled), only_future=False)
+
+        assert await query.exists_preorders_many([upcoming, past, cancelled, free]) == {upcoming}
+        assert await query.exists_preorders_many([upcoming, past, cancelled, free], only_future=False) == {upcoming, past}
+
+        # Con pre-ordenes el plato se queda en el menu como no disponible; sin ellas sale del menu
+        service = RemoveDishFromMenuService(command, query)
+        assert not (await service.execute(upcoming)).is_error
+        assert not (await service.execute(past)).is_error
+        await session.commit()
+
+        rows = {r.id: r for r in (await session.execute(select(DishModel))).scalars()}
+        assert rows[upcoming].menu_id == menu_id and not rows[upcoming].is_available
+        assert rows[past].menu_id is None
@@ -0,0 +1,115 @@
+import uuid
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.menu.application.dtos.request.create_dish_request_dto import CreateDishRequestDto
+from src.menu.application.dtos.request.search_dishes_request_dto import SearchDishesRequestDto
+from src.menu.application.services.add_dish_to_menu_service import AddDishToMenuService
+from src.menu.application.services.search_dishes_service import SearchDishesService
+from src.menu.infrastructure.controllers.search_dishes.search_dishes import SearchDishesController
+from src.menu.infrastructure.dtos.request.search_dishes_request_inf_dto import SearchDishesRequestInfDto
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.pagination.dish_search_cursor import DishSearchCursor
+from src.menu.infrastructure.repositories.command.orm_menu_command_repository import OrmMenuCommandRepository
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.menu.infrastructure.search.in_memory_dish_search import DISH_SEARCH_INDEX, InMemoryDishSearch
+
+NORTE, SUR = str(uuid.uuid4()), str(uuid.uuid4())
+DISHES = [
+    # (restaurante, nombre, descripcion, categoria, precio, disponible)
+    (NORTE, "Pizza margarita", "Tomate, mozzarella y albahaca", "Main", 9.5, True),
+    (NORTE, "Pizza cuatro quesos", "Mozzarella, gorgonzola, parmesano y fontina", "Main", 12.0, True),
+    (NORTE, "Lasaña", "Pasta al horno con carne y tomate", "Main", 11.0, True),
+    (NORTE, "Calzone", "Pizza cerrada con jamon y queso", "Main", 10.0, False),
+    (SUR, "Pizza marinera", "Tomate, ajo y oregano", "Main", 8.0, True),
+    (SUR, "Ensalada caprese", "Tomate y mozzarella fresca", "Appetizer", 7.5, True),
+    (SUR, "Tiramisu", "Postre de cafe y mascarpone", "Dessert", 6.0, True),
+]
+
+async def seed(engine) -> None:
+    menus = {NORTE: str(uuid.uuid4()), SUR: str(uuid.uuid4())}
+    async with AsyncSession(engine) as session:
+        session.add_all([MenuModel(id=menu_id, restaurant_id=restaurant_id) for restaurant_id, menu_id in menus.items()])
+        await session.flush()
+        await session.execute(insert(DishModel), [
+            {
+                "id": str(uuid.uuid4()), "name": name, "description": description, "category": category,
+                "price": price, "is_available": available, "menu_id": menus[restaurant_id]
+            }
+            for restaurant_id, name, description, category, price, available in DISHES
+        ])
+        await session.commit()
+    DISH_SEARCH_INDEX.clear()
+
+async def names(session, **filters) -> list[str]:
+    found = await InMemoryDishSearch(session).search(SearchDishesRequestDto(**filters), 100)
+    assert not found.is_error
+    return [hit.name for hit in found.value]
+
+@pytest.mark.asyncio
+async def test_search_ranks_by_field_and_tolerates_typos(engine):
+    await seed(engine)
+    async with AsyncSession(engine) as session:
+        # Solo el nombre coincide: desempata la similitud del nombre con el texto; el no disponible no sale
+        assert await names(session, text="pizza") == ["Pizza marinera", "Pizza margarita", "Pizza cuatro quesos"]
+        assert "Calzone" in await names(session, text="pizza", only_available=False)
+
+        # Todas las palabras deben aparecer, en cualquier campo
+        mozzarella = await names(session, text="mozzarella")
+        assert set(mozzarella) == {"Pizza margarita", "Pizza cuatro quesos", "Ensalada caprese"} and mozzarella[-1] == "Ensalada caprese"
+        assert await names(session, text="tomate mozzarella") == ["Pizza margarita", "Ensalada caprese"]
+        assert await names(session, text="sushi") == []
+
+        # Errores de escritura por trigramas del nombre
+        assert await names(session, text="piza margarta") == ["Pizza margarita", "Pizza marinera"]
+        assert await names(session, text="tiramisú") == ["Tiramisu"]
+        # y por trigramas de cada palabra de la categoria y la descripcion
+        assert await names(session, text="desert") == ["Tiramisu"]
+        assert await names(session, text="gorgonzla") == ["Pizza cuatro quesos"]
+
+        assert await names(session, text="pizza", restaurant_id=SUR) == ["Pizza marinera"]
+        assert set(await names(session, text="pizza", min_price=9, max_price=10)) == {"Pizza margarita"}
+
+@pytest.mark.asyncio
+async def test_search_pages_follow_the_cursor_and_see_menu_writes(engine):
+    await seed(engine)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        service = SearchDishesService(InMemoryDishSearch(session))
+        everything = (await service.execute(SearchDishesRequestDto(text="pizza", limit=3))).value
+        ranked = await names(session, text="tomate")
+
+        seen, after = [], None
+        while True:
+            page = (await service.execute(SearchDishesRequestDto(text="tomate", limit=2, after=after))).value
+            seen.extend(hit.name for hit in page.dishes)
+            if page.next_after is None:
+                break
+            after = DishSearchCursor.decode(DishSearchCursor.encode(page.next_after))
+        assert seen == ranked and len(ranked) == 4
+        assert len(everything.dishes) == 3 and everything.next_after is None
+
+        # Un plato nuevo aparece en la busqueda tras el commit
+        added = await AddDishToMenuService(OrmMenuCommandRepository(session), OrmMenuQueryRepository(session)).execute(CreateDishRequestDto(
+            name="Sopa de tomate", restaurant_id=SUR, description="Caliente", category="Appetizer", price=5
+        ))
+        assert not added.is_error
+        await session.commit()
+        assert (await names(session, text="tomate"))[0] == "Sopa de tomate"
+
+@pytest.mark.asyncio
+async def test_search_rejects_bad_queries_with_422(client_headers):
+    app = FastAPI()
+    SearchDishesController(app)
+
+    assert SearchDishesRequestInfDto(q="  pizza ").q == "pizza"
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", headers=client_headers) as client:
+        for query, field in (
+            ({"q": "   "}, "q"),
+            ({"q": "pizza", "cursor": "zzz"}, "cursor"),
+            ({"q": "pizza", "min_price": 10, "max_price": 5}, "min_price"),
+        ):
+            response = await client.get("/menu/search", params=query)
+            assert response.status_code == 422, query
+            assert response.json()["detail"][0]["loc"] == ["query", field]
@@ -0,0 +1,59 @@
+import uuid
+import pytest
+from sqlalchemy import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.menu.infrastructure.catalog.available_dish_ids_cache import AVAILABLE_DISH_IDS
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.repositories.command.orm_menu_command_repository import OrmMenuCommandRepository
+from src.menu.infrastructure.repositories.query.orm_menu_query_repository import OrmMenuQueryRepository
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+def selects(statements: list[str]) -> list[str]:
+    return [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+@pytest.mark.asyncio
+async def test_valid_dish_ids_uses_the_cached_set_until_a_menu_write(engine, statements, monkeypatch):
+    AVAILABLE_DISH_IDS.clear()
+
+    restaurant_id, other_id = RestaurantIdVo(str(uuid.uuid4())), RestaurantIdVo(str(uuid.uuid4()))
+    menu_id, other_menu_id = str(uuid.uuid4()), str(uuid.uuid4())
+    available, hidden, foreign = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all([
+            MenuModel(id=menu_id, restaurant_id=restaurant_id.restaurant_id),
+            MenuModel(id=other_menu_id, restaurant_id=other_id.restaurant_id)
+        ])
+        await session.flush()
+        await session.execute(insert(DishModel), [
+            {"id": available, "name": "sopa", "description": "d", "price": 10, "category": "Main", "menu_id": menu_id, "is_available": True},
+            {"id": hidden, "name": "flan", "description": "d", "price": 5, "category": "Dessert", "menu_id": menu_id, "is_available": False},
+            {"id": foreign, "name": "pasta", "description": "d", "price": 12, "category": "Main", "menu_id": other_menu_id, "is_available": True}
+        ])
+        await session.commit()
+
+    statements.clear()
+    wanted = [available, hidden, foreign, "no-existe"]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        query = OrmMenuQueryRepository(session)
+        assert await query.valid_dish_ids(restaurant_id, wanted) == {available}
+        assert await query.valid_dish_ids(restaurant_id, wanted) == {available}
+        assert len(selects(statements)) == 1
+        assert AVAILABLE_DISH_IDS.stats()["hits"] == 1
+
+        # Una escritura del menu descarta el conjunto del restaurante al hacer commit
+        menu = await query.find_by_restaurant_id(restaurant_id)
+        dish = next(d for d in menu.dishes if d.id.value == hidden)
+        dish.set_available()
+        menu.update_dish(dish)
+        await OrmMenuCommandRepository(session).update(menu)
+        await session.commit()
+
+        assert await query.valid_dish_ids(restaurant_id, wanted) == {available, hidden}
+
+    # Sin cache: una consulta acotada a los platos pedidos
+    monkeypatch.setattr(OrmMenuQueryRepository, "CACHE_DISH_IDS", False)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        statements.clear()
+        assert await OrmMenuQueryRepository(session).valid_dish_ids(other_id, wanted) == {foreign}
+        assert len(selects(statements)) == 1 and "IN" in selects(statements)[0]
+    AVAILABLE_DISH_IDS.clear()
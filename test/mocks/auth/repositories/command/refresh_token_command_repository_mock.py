@@ -0,0 +1,46 @@
+from datetime import datetime
+from src.auth.application.dtos.response.stored_refresh_token_dto import StoredRefreshTokenDto
+from src.auth.application.repositories.command.refresh_token_command_repository import IRefreshTokenCommandRepository
+from src.auth.domain.aggregate.user import User
+from src.auth.infrastructure.exceptions.user_not_found_exception import UserNotFoundException
+from src.common.infrastructure import InvalidationBus, RevocationFilter
+from src.common.utils import Result
+
+class RefreshTokenCommandRepositoryMock(IRefreshTokenCommandRepository):
+
+    def __init__(self, token_store: dict[str, StoredRefreshTokenDto], revoked_store: dict[str, datetime], shared_user_list: list[User]) -> None:
+        self.token_store = token_store
+        self.revoked_store = revoked_store
+        self.user_store = shared_user_list
+
+    async def save(self, token_hash: str, family_id: str, user_id: str, expires_at: datetime) -> Result[None]:
+        user = next((u for u in self.user_store if u.id.user_id == user_id), None)
+        if user is None:
+            return Result.fail(UserNotFoundException())
+        self.token_store[token_hash] = StoredRefreshTokenDto(
+            token_hash=token_hash,
+            family_id=family_id,
+            user_id=user_id,
+            email=user.email.email,
+            role=user.role.role,
+            expires_at=expires_at,
+            used=False,
+            revoked=False
+        )
+        return Result.success(None)
+
+    async def mark_used(self, token_hash: str) -> Result[bool]:
+        stored = self.token_store.get(token_hash)
+        if stored is None or stored.used or stored.revoked:
+            return Result.success(False)
+        stored.used = True
+        return Result.success(True)
+
+    async def revoke_family(self, family_id: str, until: datetime) -> Result[None]:
+        for stored in self.token_store.values():
+            if stored.family_id == family_id:
+                stored.revoked = True
+        self.revoked_store[family_id] = until
+        # Sin transaccion: se entrega como lo haria after_commit
+        InvalidationBus.dispatch(RevocationFilter.TOPIC, f"{family_id}|{until.timestamp()}")
+        return Result.success(None)
@@ -0,0 +1,20 @@
+from datetime import datetime
+from src.auth.application.dtos.response.stored_refresh_token_dto import StoredRefreshTokenDto
+from src.auth.application.exceptions.invalid_refresh_token_exception import InvalidRefreshTokenException
+from src.auth.application.repositories.query.refresh_token_query_repository import IRefreshTokenQueryRepository
+from src.common.utils import Result
+
+class RefreshTokenQueryRepositoryMock(IRefreshTokenQueryRepository):
+
+    def __init__(self, token_store: dict[str, StoredRefreshTokenDto], revoked_store: dict[str, datetime]) -> None:
+        self.token_store = token_store
+        self.revoked_store = revoked_store
+
+    async def get_by_hash(self, token_hash: str) -> Result[StoredRefreshTokenDto]:
+        stored = self.token_store.get(token_hash)
+        if stored is None:
+            return Result.fail(InvalidRefreshTokenException())
+        return Result.success(stored)
+
+    async def get_revoked_sessions(self) -> Result[list[tuple[str, datetime]]]:
+        return Result.success(list(self.revoked_store.items()))
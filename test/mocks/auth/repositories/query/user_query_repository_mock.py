@@ -1,4 +1,5 @@
 from src.auth.application.repositories.query.user_query_repository import IUserQueryRepository
+from src.auth.application.dtos.response.principal_response_dto import PrincipalResponseDto
 from src.auth.domain.aggregate.user import User
 from src.common.utils import Result
 from src.auth.infrastructure.exceptions.user_not_found_exception import UserNotFoundException
@@ -26,3 +27,9 @@ class UserQueryRepositoryMock(IUserQueryRepository):
     async def exists_user_by_email(self, email: str) -> Result[bool]:
         user = next((u for u in self.user_store if u.email.email == email), None)
         return Result.success(user is not None)
+
+    async def get_principal(self, email: str) -> Result[PrincipalResponseDto]:
+        user = next((u for u in self.user_store if u.email.email == email), None)
+        if user:
+            return Result.success(PrincipalResponseDto(user.id.user_id, user.email.email, user.role.role))
+        return Result.fail(UserNotFoundException())
@@ -0,0 +1,4 @@
+from typing import Dict
+from src.auth.application.dtos.response.stored_refresh_token_dto import StoredRefreshTokenDto
+
+refresh_token_store: Dict[str, StoredRefreshTokenDto] = {}
@@ -0,0 +1,15 @@
+from src.common.application.unit_of_work.unit_of_work import IUnitOfWork
+from src.common.utils import Result
+
+class UnitOfWorkMock(IUnitOfWork):
+
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self) -> Result[None]:
+        self.commits += 1
+        return Result.success(None)
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
@@ -8,8 +8,10 @@ class MenuCommandRepositoryMock(MenuCommandRepository):
 
     async def save(self, menu: Menu) -> None:
         self.menu_store.append(menu)
+        menu.clear_changes()
     
     async def update(self, menu: Menu) -> None:
         for i, u in enumerate(self.menu_store):
             if u.id.value == menu.id.value:
-                self.menu_store[i] = menu
\ No newline at end of file
+                self.menu_store[i] = menu
+        menu.clear_changes()
\ No newline at end of file
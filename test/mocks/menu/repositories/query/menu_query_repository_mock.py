@@ -5,8 +5,9 @@ from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
 
 class MenuQueryRepositoryMock(MenuQueryRepository):
 
-    def __init__(self, menu_store: list[Menu]) -> None:
+    def __init__(self, menu_store: list[Menu], preordered_dish_ids: set[str] | None = None) -> None:
         self.menu_store = menu_store
+        self.preordered_dish_ids = preordered_dish_ids if preordered_dish_ids is not None else set()
     
     async def find_by_dish_id(self, dish_id_vo: DishIdVo) -> Menu | None:
         for menu in self.menu_store:
@@ -20,4 +21,16 @@ class MenuQueryRepositoryMock(MenuQueryRepository):
             if menu.restaurant_id.restaurant_id == restaurant_id.restaurant_id:
                 return menu
         
-        return None
\ No newline at end of file
+        return None
+
+    async def valid_dish_ids(self, restaurant_id: RestaurantIdVo, dish_ids: list[str]) -> frozenset[str]:
+        menu = await self.find_by_restaurant_id(restaurant_id)
+        if menu is None:
+            return frozenset()
+        return frozenset(dish.id.value for dish in menu.dishes if dish.is_available and dish.id.value in dish_ids)
+
+    async def exists_preorders(self, dish_id: DishIdVo, only_future: bool = True) -> bool:
+        return dish_id.value in self.preordered_dish_ids
+
+    async def exists_preorders_many(self, dish_ids: list[str], only_future: bool = True) -> frozenset[str]:
+        return frozenset(d for d in dish_ids if d in self.preordered_dish_ids)
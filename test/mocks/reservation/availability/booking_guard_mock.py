@@ -0,0 +1,12 @@
+from datetime import date
+from src.common.utils import Result
+from src.reservation.application.availability.booking_guard import IBookingGuard
+
+class BookingGuardMock(IBookingGuard):
+
+    def __init__(self) -> None:
+        self.held: list[tuple[str, str, date]] = []
+
+    async def hold(self, slots: list[tuple[str, str, date]]) -> Result[None]:
+        self.held.extend(slots)
+        return Result.success(None)
@@ -1,7 +1,24 @@
+from datetime import datetime
+from typing import Optional
 from src.common.utils import Result
 from src.auth.infrastructure.exceptions.user_not_found_exception import UserNotFoundException
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.transition_guard_dto import TransitionGuard
+from src.reservation.application.dtos.response.bulk_cancel_reservations_response_dto import CancelledReservation
+from src.reservation.application.dtos.response.transition_outcome_dto import TransitionOutcome
 from src.reservation.application.repositories.command.reservation_command_repository import IReservationCommandRepository
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.menu.domain.value_objects.dish_id_vo import DishIdVo
 from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.reservation.infraestructure.exceptions.reservation_not_found_exception import ReservationNotFoundException
 
 class ReservationCommandRepositoryMock(IReservationCommandRepository):
     
@@ -12,9 +29,70 @@ class ReservationCommandRepositoryMock(IReservationCommandRepository):
         self.main_data.append(entry)
         return Result.success(entry)
     
+    async def save_many(self, entries: list[Reservation]) -> Result[list[Reservation]]:
+        self.main_data.extend(entries)
+        return Result.success(entries)
+
+    async def insert_pending(self, entries: list[tuple[str, CreateReservationRequest]]) -> Result[list[str]]:
+        self.main_data.extend(
+            Reservation(
+                id=ReservationIdVo(reservation_id),
+                date_end=ReservationDateEndVo(item.date_end),
+                date_start=ReservationDateStartVo(item.date_start),
+                reservation_date=ReservationDateVo(item.reservation_date),
+                status=ReservationStatusVo("pendiente"),
+                client_id=UserIdVo(item.client_id),
+                table_number_id=TableNumberId(item.table_number_id),
+                restaurant_id=RestaurantIdVo(item.restaurant_id),
+                dish=[DishIdVo(d) for d in item.dish_id]
+            )
+            for reservation_id, item in entries
+        )
+        return Result.success([reservation_id for reservation_id, _ in entries])
+
     async def update(self, entry: Reservation) -> Result[Reservation]:
         for i, u in enumerate(self.user_store):
             if u.id == entry.id:
                 self.main_data[i] = entry
                 return Result.success(entry)
         return Result.fail(UserNotFoundException())
+
+    async def transition(self, id: str, from_status: str, to_status: str, guard: Optional[TransitionGuard] = None) -> Result[TransitionOutcome]:
+        for u in self.main_data:
+            if u.id.reservation_id != id:
+                continue
+            moment = guard.starts_not_before if guard is not None else None
+            outcome = TransitionOutcome(
+                reservation=None,
+                owned=guard is None or guard.client_id is None or u.client_id.user_id == guard.client_id,
+                in_time=moment is None or (u.date.reservation_date, u.date_start.reservation_date_start) >= (moment.date(), moment.time()),
+                status_matched=u.status.reservation_status == from_status
+            )
+            if outcome.owned and outcome.in_time and outcome.status_matched:
+                getattr(u, f"update_status_{to_status}")()
+                outcome.reservation = u
+            return Result.success(outcome)
+        return Result.fail(ReservationNotFoundException())
+
+    async def cancel_pending(self, filters: BulkCancelReservationsRequest) -> Result[list[CancelledReservation]]:
+        cancelled = []
+        for u in self.main_data:
+            if (u.restaurant_id.restaurant_id == filters.restaurant_id
+                and filters.date_from <= u.date.reservation_date <= filters.date_to
+                and u.status.reservation_status == "pendiente"
+                and (filters.time_from is None or u.date_end.reservation_date_end > filters.time_from)
+                and (filters.time_to is None or u.date_start.reservation_date_start < filters.time_to)
+                and (filters.table_number_id is None or str(u.table_number_id.table_number_id) == str(filters.table_number_id))):
+                u.update_status_cancelada()
+                cancelled.append(CancelledReservation(u.id.reservation_id, u.client_id.user_id, u.date.reservation_date, str(u.table_number_id.table_number_id)))
+        return Result.success(cancelled)
+
+    async def expire(self, from_status: str, to_status: str, ended_before: datetime, limit: int) -> Result[int]:
+        expired = [
+            u for u in self.main_data
+            if u.status.reservation_status == from_status
+            and (u.date.reservation_date, u.date_end.reservation_date_end) <= (ended_before.date(), ended_before.time())
+        ][:limit]
+        for u in expired:
+            getattr(u, f"update_status_{to_status}")()
+        return Result.success(len(expired))
@@ -1,12 +1,22 @@
 from datetime import date, time
+from typing import AsyncIterator
 from src.common.utils import Result
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.dtos.response.find_reservation_response_dto import ReservationResponse
+from src.menu.domain.aggregate.menu import Menu
+from src.reservation.application.dtos.response.admission_verdict_dto import AdmissionVerdict
 from src.reservation.application.repositories.query.reservation_query_repository import IReservationQueryRepository
 from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.restaurant.domain.aggregate.restaurant import Restaurant
 
 class ReservationQueryRepositoryMock(IReservationQueryRepository):
 
-    def __init__(self, main_data: list[Reservation]) -> None:
+    def __init__(self, main_data: list[Reservation], restaurant_store: list[Restaurant] = [], menu_store: list[Menu] = []) -> None:
         self.main_data = main_data
+        self.restaurant_store = restaurant_store
+        self.menu_store = menu_store
 
     async def get_by_id(self, id: str) -> Result[Reservation]:
         res = next((u for u in self.main_data if u.id.reservation_id == id), None)
@@ -16,10 +26,11 @@ class ReservationQueryRepositoryMock(IReservationQueryRepository):
 
     async def exists_by_date_client(self, date_start: time, date_end: time, reservation_date: date, client_id: str) -> Result[bool]:
         res = next((u for u in self.main_data 
-                    if u.date_start.reservation_date_start == date_start
-                    and u.date_end.reservation_date_end == date_end
+                    if u.date_start.reservation_date_start < date_end
+                    and u.date_end.reservation_date_end > date_start
                     and u.date.reservation_date == reservation_date
                     and u.client_id.user_id == client_id
+                    and u.status.reservation_status in ReservationStatusVo.ESTADOS_ACTIVOS
                     ), None)
         if res:
             return Result.success(True)
@@ -27,11 +38,12 @@ class ReservationQueryRepositoryMock(IReservationQueryRepository):
 
     async def exists_by_table(self, table_id: str, date_start: time, date_end: time, reservation_date: date, restaurant_id: str) -> Result[bool]:
         res = next((u for u in self.main_data 
-                    if u.date_start.reservation_date_start == date_start
-                    and u.date_end.reservation_date_end == date_end
+                    if u.date_start.reservation_date_start < date_end
+                    and u.date_end.reservation_date_end > date_start
                     and u.date.reservation_date == reservation_date
                     and u.restaurant_id.restaurant_id == restaurant_id
-                    and u.table_number_id == table_id
+                    and str(u.table_number_id.table_number_id) == str(table_id)
+                    and u.status.reservation_status in ReservationStatusVo.ESTADOS_ACTIVOS
                     ), None)
         if res:
             return Result.success(True)
@@ -40,14 +52,76 @@ class ReservationQueryRepositoryMock(IReservationQueryRepository):
     async def get_active_by_client_id(self, client_id: str) -> Result[list[Reservation]]:
         res = next((u for u in self.main_data if u.client_id.user_id == client_id), None)
         return Result.success(res)
+
+    async def get_active_by_client_date(self, client_id: str, reservation_date: date) -> Result[list[Reservation]]:
+        res = [u for u in self.main_data 
+               if u.client_id.user_id == client_id
+               and u.date.reservation_date == reservation_date
+               and u.status.reservation_status in ReservationStatusVo.ESTADOS_ACTIVOS
+               ]
+        return Result.success(res)
+        
+    async def get_active_by_date(self, reservation_date: date) -> Result[list[Reservation]]:
+        res = [u for u in self.main_data 
+               if u.date.reservation_date == reservation_date
+               and u.status.reservation_status in ReservationStatusVo.ESTADOS_ACTIVOS
+               ]
+        return Result.success(res)
         
     async def get_all_by_date_restaurant(self, restaurant_id: str, reservation_date: date,) -> Result[list[Reservation]]:
-        res = next((u for u in self.main_data if 
-                    u.restaurant_id.restaurant_id == restaurant_id
-                    and u.date.reservation_date == reservation_date
-                    ), None)
+        res = [u for u in self.main_data if 
+               u.restaurant_id.restaurant_id == restaurant_id
+               and u.date.reservation_date == reservation_date
+               ]
         return Result.success(res)
         
-    async def get_all(self) -> Result[list[Reservation]]:
-        return Result.success(self.main_data)
-        
\ No newline at end of file
+    def _filtered(self, filters: FindReservationRequest) -> list[Reservation]:
+        res = [
+            u for u in self.main_data
+            if (filters.restaurant_id is None or u.restaurant_id.restaurant_id == filters.restaurant_id)
+            and (filters.status is None or u.status.reservation_status == filters.status)
+            and (filters.date_from is None or u.date.reservation_date >= filters.date_from)
+            and (filters.date_to is None or u.date.reservation_date <= filters.date_to)
+        ]
+        return sorted(res, key=lambda u: (u.date.reservation_date, u.id.reservation_id))
+
+    async def find_page(self, filters: FindReservationRequest, limit: int) -> Result[list[Reservation]]:
+        res = [
+            u for u in self._filtered(filters)
+            if filters.after is None or (u.date.reservation_date, u.id.reservation_id) > filters.after
+        ]
+        return Result.success(res[:limit])
+
+    async def stream(self, filters: FindReservationRequest, chunk_size: int) -> Result[AsyncIterator[list[ReservationResponse]]]:
+        res = [ReservationResponse.from_domain(u) for u in self._filtered(filters)]
+
+        async def chunks() -> AsyncIterator[list[ReservationResponse]]:
+            for start in range(0, len(res), chunk_size):
+                yield res[start:start + chunk_size]
+
+        return Result.success(chunks())
+
+    async def check_admission(self, restaurant_id: str, table_id: str, client_id: str, reservation_date: date, date_start: time, date_end: time, dish_ids: list[str]) -> Result[AdmissionVerdict]:
+        restaurant = next((r for r in self.restaurant_store if r.id.restaurant_id == restaurant_id), None)
+        menu = next((m for m in self.menu_store if m.restaurant_id.restaurant_id == restaurant_id), None)
+        table_conflict = await self.exists_by_table(table_id, date_start, date_end, reservation_date, restaurant_id)
+        client_conflict = await self.exists_by_date_client(date_start, date_end, reservation_date, client_id)
+        menu_dishes = {d.id.value for d in menu.dishes} if menu else set()
+        return Result.success(AdmissionVerdict(
+            restaurant_found=restaurant is not None,
+            table_found=restaurant is not None and any(str(t.id.table_number_id) == str(table_id) for t in restaurant.tables),
+            within_hours=restaurant is not None
+                and restaurant.opening_time.opening_time <= date_start
+                and date_end <= restaurant.closing_time.closing_time,
+            table_conflict=table_conflict.value,
+            client_conflict=client_conflict.value,
+            menu_found=menu is not None,
+            invalid_dish_ids=[d for d in dish_ids if d not in menu_dishes]
+        ))
+
+    async def check_admission_many(self, items: list[CreateReservationRequest]) -> Result[list[AdmissionVerdict]]:
+        verdicts = []
+        for item in items:
+            verdict = await self.check_admission(item.restaurant_id, item.table_number_id, item.client_id, item.reservation_date, item.date_start, item.date_end, item.dish_id)
+            verdicts.append(verdict.value)
+        return Result.success(verdicts)
@@ -17,4 +17,7 @@ class RestaurantQueryRepositoryMock(IRestaurantQueryRepository):
         return Result.fail(InfrastructureException("Restaurant not found",ExceptionInfrastructureType.NOT_FOUND))
     
     async def get_all_restaurants(self, dto: GetAllRestaurantRequestDTO) -> Result[list[Restaurant]]:
-        return Result.success(self.restaurant_store[dto.offset : dto.offset + dto.limit])
\ No newline at end of file
+        return Result.success(self.restaurant_store[dto.offset : dto.offset + dto.limit])
+
+    async def get_all_with_tables(self) -> Result[list[Restaurant]]:
+        return Result.success(list(self.restaurant_store))
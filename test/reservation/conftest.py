@@ -2,6 +2,7 @@ import pytest
 from src.common.infrastructure import UuidGenerator
 from src.common.application import IService, ExceptionDecorator
 from src.common.infrastructure.error_handler.fast_api_error_handler import FastApiErrorHandler
+from test.mocks.reservation.availability.booking_guard_mock import BookingGuardMock
 from test.mocks.reservation.repositories.reservation_store import reservation_store
 
 from src.reservation.application.dtos.request.cancel_reservation_request_dto import CancelReservationRequest
@@ -11,6 +12,10 @@ from src.reservation.application.dtos.response.create_reservation_response_dto i
 from src.reservation.application.services.cancel_reservation_service import CancelReservationService
 from src.reservation.application.services.create_reservation_service import CreateReservationService
 from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.application.dtos.request.search_free_tables_request_dto import SearchFreeTablesRequest
+from src.reservation.application.dtos.response.search_free_tables_response_dto import SearchFreeTablesResponse
+from src.reservation.application.services.search_free_tables_service import SearchFreeTablesService
 from test.mocks.reservation.repositories.query.reservation_query_repository_mock import ReservationQueryRepositoryMock
 from test.mocks.reservation.repositories.command.reservation_command_repository_mock import ReservationCommandRepositoryMock
 from test.mocks.restaurant.repositories.query.restaurant_query_repository_mock  import RestaurantQueryRepositoryMock
@@ -37,7 +42,7 @@ def menu_data() -> list[Menu]:
 @pytest.fixture(scope="session")
 def reser_repositories(shared_data, restau_data, menu_data) -> tuple[ReservationQueryRepositoryMock, ReservationCommandRepositoryMock, RestaurantQueryRepositoryMock, MenuQueryRepositoryMock]:
     return (
-        ReservationQueryRepositoryMock(shared_data),
+        ReservationQueryRepositoryMock(shared_data, restau_data, menu_data),
         ReservationCommandRepositoryMock(shared_data),
         RestaurantQueryRepositoryMock(restau_data),
         MenuQueryRepositoryMock(menu_data)
@@ -45,26 +50,35 @@ def reser_repositories(shared_data, restau_data, menu_data) -> tuple[Reservation
 
 @pytest.fixture(scope="function")
 def create_reservation_service(reser_repositories) -> IService[CreateReservationRequest, CreateReservationResponse]:
-    query_repo, command_repo, query_restau, query_menu = reser_repositories
+    query_repo, command_repo, query_restau, _ = reser_repositories
     return ExceptionDecorator(
         service=CreateReservationService(    
-            menu_repo=query_menu,
             query_reser=query_repo,
             command_reser=command_repo,
-            query_restau=query_restau,
-            id_generator=UuidGenerator()
+            id_generator=UuidGenerator(),
+            free_tables=SlotBitmapIndex(query_repo, query_restau),
+            booking_guard=BookingGuardMock()
         ),
         error_handler=FastApiErrorHandler()
     )
 
 @pytest.fixture(scope="function")
 def cancel_reservation(reser_repositories) -> IService[CancelReservationRequest, CancelReservationResponse]:
-    query_repo, command_repo, _ = reser_repositories
+    _, command_repo, _, _ = reser_repositories
     return ExceptionDecorator(
         service=CancelReservationService(
-            query_reser= query_repo, 
             command_reser= command_repo
         ),
         error_handler=FastApiErrorHandler()
     )
+
+@pytest.fixture(scope="function")
+def search_free_tables_service(reser_repositories) -> IService[SearchFreeTablesRequest, SearchFreeTablesResponse]:
+    query_repo, _, query_restau, _ = reser_repositories
+    return ExceptionDecorator(
+        service=SearchFreeTablesService(
+            free_tables=SlotBitmapIndex(query_repo, query_restau)
+        ),
+        error_handler=FastApiErrorHandler()
+    )
     
\ No newline at end of file
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import uuid
+from datetime import date, time
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.common.application import UnitOfWorkDecorator
+from src.common.infrastructure import SqlAlchemyUnitOfWork, UuidGenerator
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel  # noqa: F401
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.exceptions.table_not_available_exception import TableNotAvailableException
+from src.reservation.application.services.create_reservation_service import CreateReservationService
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+
+POSTGRES_URL = os.getenv("DATABASE_URL_TEST", "")
+DAY = date(2031, 3, 14)
+CLIENTS = 12
+
+def test_lock_key_identifies_the_table_day():
+    restaurant_id = str(uuid.uuid4())
+    key = AdvisoryLockBookingGuard.key(restaurant_id, "4", DAY)
+    assert key == AdvisoryLockBookingGuard.key(restaurant_id, 4, DAY)
+    assert -2**31 <= key < 2**31
+    assert key != AdvisoryLockBookingGuard.key(restaurant_id, "4", date(2031, 3, 15))
+    assert key != AdvisoryLockBookingGuard.key(str(uuid.uuid4()), "4", DAY)
+
+@pytest.mark.skipif(not POSTGRES_URL.startswith("postgresql"), reason="requires a local Postgres in DATABASE_URL_TEST")
+@pytest.mark.asyncio
+async def test_concurrent_creates_on_one_table_day_leave_a_single_reservation():
+    engine = create_async_engine(POSTGRES_URL, pool_size=CLIENTS, max_overflow=0)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    restaurant_id = str(uuid.uuid4())
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(OrmRestaurantModel(id=restaurant_id, name="Guard", lat=0, lng=0, opening_time=time(9, 0), closing_time=time(23, 0)))
+        tables = [OrmTableModel(capacity=4, location="terraza", restaurant_id=restaurant_id) for _ in range(2)]
+        session.add_all(tables)
+        session.add(MenuModel(id=str(uuid.uuid4()), restaurant_id=restaurant_id))
+        await session.commit()
+
+    async def create(table_id: int):
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            query = uow.repository(OrmReservationQueryRepository)
+            service = UnitOfWorkDecorator(CreateReservationService(
+                query_reser=query,
+                command_reser=uow.repository(OrmReservationCommandRepository),
+                id_generator=UuidGenerator(),
+                free_tables=SlotBitmapIndex(query, uow.repository(OrmRestaurantQueryRepository)),
+                booking_guard=uow.repository(AdvisoryLockBookingGuard)
+            ), uow)
+            return await service.execute(CreateReservationRequest(
+                client_id=str(uuid.uuid4()), date_start=time(20, 0), date_end=time(22, 0), reservation_date=DAY,
+                restaurant_id=restaurant_id, table_number_id=str(table_id), dish_id=[]
+            ))
+
+    try:
+        # La segunda mesa tiene un solo cliente: no espera a las altas de la primera
+        responses = await asyncio.gather(*(create(tables[0].id) for _ in range(CLIENTS - 1)), create(tables[1].id))
+
+        assert sum(not r.is_error for r in responses[:-1]) == 1
+        assert all(isinstance(r.error, TableNotAvailableException) for r in responses[:-1] if r.is_error)
+        assert not responses[-1].is_error
+        async with AsyncSession(engine) as session:
+            count = (await session.execute(
+                select(func.count()).where(OrmReservationModel.restaurant_id == restaurant_id)
+            )).scalar_one()
+            assert count == 2
+    finally:
+        async with AsyncSession(engine) as session:
+            await session.execute(delete(OrmReservationModel).where(OrmReservationModel.restaurant_id == restaurant_id))
+            await session.execute(delete(MenuModel).where(MenuModel.restaurant_id == restaurant_id))
+            await session.execute(delete(OrmTableModel).where(OrmTableModel.restaurant_id == restaurant_id))
+            await session.execute(delete(OrmRestaurantModel).where(OrmRestaurantModel.id == restaurant_id))
+            await session.commit()
+        await engine.dispose()
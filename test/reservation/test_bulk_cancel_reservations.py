@@ -0,0 +1,95 @@
+import uuid
+from datetime import date, time
+import pytest
+from sqlalchemy import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.reservation.application.dtos.request.bulk_cancel_reservations_request_dto import BulkCancelReservationsRequest
+from src.reservation.application.services.bulk_cancel_reservations_service import BulkCancelReservationsService
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+RESTAURANT = str(uuid.uuid4())
+OTHER = str(uuid.uuid4())
+
+def reservation(restaurant_id: str, day: int, table: int, start: int, status: str = "pendiente") -> Reservation:
+    return Reservation(
+        id=ReservationIdVo(str(uuid.uuid4())),
+        date_end=ReservationDateEndVo(time(start + 1, 0)),
+        date_start=ReservationDateStartVo(time(start, 0)),
+        reservation_date=ReservationDateVo(date(2025, 8, day)),
+        status=ReservationStatusVo(status),
+        client_id=UserIdVo(str(uuid.uuid4())),
+        table_number_id=TableNumberId(table),
+        restaurant_id=RestaurantIdVo(restaurant_id),
+        dish=[]
+    )
+
+@pytest.mark.asyncio
+async def test_bulk_cancel_updates_matching_rows_rollups_and_availability_in_one_statement(engine, statements):
+    entries = [
+        reservation(RESTAURANT, 1, 1, 12),
+        reservation(RESTAURANT, 1, 2, 19),
+        reservation(RESTAURANT, 2, 1, 20),
+        reservation(RESTAURANT, 2, 1, 13, "confirmada"),
+        reservation(RESTAURANT, 4, 1, 20),
+        reservation(OTHER, 1, 1, 20),
+    ]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repository = OrmReservationCommandRepository(session)
+        assert not (await repository.save_many(entries)).is_error
+        await session.commit()
+
+        # Dia cacheado en este proceso: debe descartarse tras el commit
+        SlotBitmapIndex.clear()
+        SlotBitmapIndex._restaurants[(RESTAURANT, date(2025, 8, 2))] = (0.0, None)
+
+        statements.clear()
+        service = BulkCancelReservationsService(command_reser=repository)
+        response = await service.execute(BulkCancelReservationsRequest(
+            restaurant_id=RESTAURANT, date_from=date(2025, 8, 1), date_to=date(2025, 8, 3), time_from=time(18, 0), time_to=time(23, 0)
+        ))
+        assert (RESTAURANT, date(2025, 8, 2)) in SlotBitmapIndex._restaurants
+        await session.commit()
+
+        assert not response.is_error
+        assert {c.id for c in response.value.cancelled} == {entries[1].id.reservation_id, entries[2].id.reservation_id}
+        assert sum(s.lstrip().upper().startswith("UPDATE") for s in statements) == 1
+        assert (RESTAURANT, date(2025, 8, 2)) not in SlotBitmapIndex._restaurants
+
+        statuses = dict((await session.execute(select(OrmReservationModel.id, OrmReservationModel.status))).all())
+        assert [statuses[e.id.reservation_id] for e in entries] == ["pendiente", "cancelada", "cancelada", "confirmada", "pendiente", "pendiente"]
+
+        day_rollup = {
+            (r.day.day, r.status): r.reservations
+            for r in (await session.execute(select(OrmReservationDayRollupModel).where(OrmReservationDayRollupModel.restaurant_id == RESTAURANT))).scalars()
+        }
+        assert day_rollup[(1, "pendiente")] == 1 and day_rollup[(1, "cancelada")] == 1
+        assert day_rollup[(2, "pendiente")] == 0 and day_rollup[(2, "cancelada")] == 1 and day_rollup[(2, "confirmada")] == 1
+        tables = {
+            (r.day.day, r.table_id): r.reservations
+            for r in (await session.execute(select(OrmTableDayRollupModel).where(OrmTableDayRollupModel.restaurant_id == RESTAURANT))).scalars()
+        }
+        assert tables[(1, "2")] == 0 and tables[(2, "1")] == 1
+
+        # Filtro por mesa; lo ya cancelado no se vuelve a devolver
+        response = await service.execute(BulkCancelReservationsRequest(
+            restaurant_id=RESTAURANT, date_from=date(2025, 8, 1), date_to=date(2025, 8, 4), table_number_id="1"
+        ))
+        assert {c.id for c in response.value.cancelled} == {entries[0].id.reservation_id, entries[4].id.reservation_id}
+
+        invalid = await service.execute(BulkCancelReservationsRequest(restaurant_id=RESTAURANT, date_from=date(2025, 8, 4), date_to=date(2025, 8, 1)))
+        assert invalid.is_error
+
+    SlotBitmapIndex.clear()
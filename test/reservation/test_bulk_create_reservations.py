@@ -0,0 +1,87 @@
+import uuid
+from datetime import date, time
+import pytest
+from sqlalchemy import func, select
+from src.common.infrastructure import UuidGenerator
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.menu.infrastructure.models.menu_model import DishModel, MenuModel
+from src.menu.infrastructure.models.reservation_dishes_association import OrmReservationDishModel
+from src.reservation.application.dtos.request.bulk_create_reservation_request_dto import BulkCreateReservationRequest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.services.bulk_create_reservation_service import BulkCreateReservationService
+from src.reservation.infraestructure.availability.advisory_lock_booking_guard import AdvisoryLockBookingGuard
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+from src.restaurant.infraestructure.models.orm_restaurant_model import OrmRestaurantModel
+from src.restaurant.infraestructure.models.orm_table_model import OrmTableModel
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+
+DAY = date(2025, 7, 7)
+
+def item(restaurant_id: str, table: int, client_id: str, start: int, end: int, dishes: list[str] = []) -> CreateReservationRequest:
+    return CreateReservationRequest(
+        client_id=client_id, date_start=time(start, 0), date_end=time(end, 0), reservation_date=DAY,
+        restaurant_id=restaurant_id, table_number_id=str(table), dish_id=dishes
+    )
+
+@pytest.mark.asyncio
+async def test_bulk_create_resolves_each_row_against_the_database_and_the_batch(session, statements):
+    restaurant_id, menu_id, dish_id = str(uuid.uuid4()), str(uuid.uuid4()), str(uuid.uuid4())
+    ana, bea, carla = (str(uuid.uuid4()) for _ in range(3))
+    session.add(OrmRestaurantModel(id=restaurant_id, name="Lote", lat=0, lng=0, opening_time=time(9, 0), closing_time=time(23, 0)))
+    session.add_all([OrmTableModel(id=n, capacity=4, location="terraza", restaurant_id=restaurant_id) for n in (1, 2, 3)])
+    session.add(MenuModel(id=menu_id, restaurant_id=restaurant_id))
+    session.add(DishModel(id=dish_id, name="sopa", description="sopa", price=1, category="x", menu_id=menu_id))
+    session.add(OrmReservationModel(
+        id=str(uuid.uuid4()), date_start=time(20, 0), date_end=time(22, 0), client_id=carla, status="pendiente",
+        table_number_id="3", reservation_date=DAY, restaurant_id=restaurant_id
+    ))
+    await session.commit()
+
+    query = OrmReservationQueryRepository(session)
+    service = BulkCreateReservationService(
+        query_reser=query,
+        command_reser=OrmReservationCommandRepository(session),
+        id_generator=UuidGenerator(),
+        free_tables=SlotBitmapIndex(query, OrmRestaurantQueryRepository(session)),
+        booking_guard=AdvisoryLockBookingGuard(session)
+    )
+    items = [
+        item(restaurant_id, 1, ana, 14, 16),                    # 0 se toma despues de la 1: empieza mas tarde en la misma mesa
+        item(restaurant_id, 1, bea, 12, 15, [dish_id]),         # 1 admitida
+        item(restaurant_id, 3, bea, 21, 22),                    # 2 choca con la reserva guardada
+        item(restaurant_id, 2, bea, 13, 14),                    # 3 bea ya esta en la mesa 1 a esa hora
+        item(restaurant_id, 2, ana, 12, 13, [str(uuid.uuid4())]),  # 4 plato fuera del menu
+        item(restaurant_id, 2, ana, 9, 14),                     # 5 mas de cuatro horas
+        item(restaurant_id, 9, ana, 12, 13),                    # 6 mesa inexistente
+        item(restaurant_id, 1, carla, 15, 17, [dish_id]),       # 7 empieza justo cuando termina la 1
+        item(restaurant_id, 2, "no-es-uuid", 12, 13),           # 8 value object invalido
+    ]
+
+    statements.clear()
+    response = await service.execute(BulkCreateReservationRequest(items=items))
+    await session.commit()
+
+    assert not response.is_error
+    results = response.value.results
+    assert [r.index for r in results] == list(range(len(items)))
+    assert [r.id is not None for r in results] == [False, True, False, False, False, False, False, True, False]
+    assert results[0].error == "Table not available."
+    assert results[2].error == "Table not available."
+    assert results[3].error == "Client already has an active reservation at the same time."
+    assert results[4].error == "One or more dishes entered are not part of the menu"
+    assert results[5].error == "Cannot reserve for more than four hours."
+    assert (response.value.created, response.value.rejected) == (2, 7)
+
+    # Admision y platos, un INSERT de reservas y otro de platos, y los tres rollups
+    assert len(statements) <= 7
+
+    stored = (await session.execute(select(OrmReservationModel.id).where(OrmReservationModel.id.in_([results[1].id, results[7].id])))).scalars().all()
+    assert len(stored) == 2
+    assert (await session.execute(select(func.count()).select_from(OrmReservationDishModel))).scalar_one() == 2
+    pending = (await session.execute(select(OrmReservationDayRollupModel.reservations).where(
+        OrmReservationDayRollupModel.restaurant_id == restaurant_id, OrmReservationDayRollupModel.status == "pendiente"
+    ))).scalar_one()
+    assert pending == 2
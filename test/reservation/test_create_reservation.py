@@ -43,8 +43,8 @@ async def test_reservation_create_success(create_reservation_service, create_res
 
     request = CreateReservationRequest(
         client_id="197dd255-a202-4aed-b973-bc7af39ee411",
-        date_start=datetime.strptime("00:46:53", "%H:%M:%S").time(),
-        date_end=datetime.strptime("02:46:53", "%H:%M:%S").time(),
+        date_start=datetime.strptime("12:46:53", "%H:%M:%S").time(),
+        date_end=datetime.strptime("14:46:53", "%H:%M:%S").time(),
         reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
         table_number_id=response.value.tables[0].id,
         restaurant_id=response.value.id,
@@ -93,8 +93,8 @@ async def test_reservation_create_failed_by_reservation_time_table(create_reserv
     
     request1 = CreateReservationRequest(
         client_id="197dd255-a202-4aed-b973-bc7af39ee417",
-        date_start=datetime.strptime("00:46:53", "%H:%M:%S").time(),
-        date_end=datetime.strptime("02:46:53", "%H:%M:%S").time(),
+        date_start=datetime.strptime("12:46:53", "%H:%M:%S").time(),
+        date_end=datetime.strptime("14:46:53", "%H:%M:%S").time(),
         reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
         table_number_id=response.value.tables[0].id,
         restaurant_id=response.value.id,
@@ -103,8 +103,8 @@ async def test_reservation_create_failed_by_reservation_time_table(create_reserv
 
     request2 = CreateReservationRequest(
         client_id="197dd255-a202-4aed-b973-bc7af39ee417",
-        date_start=datetime.strptime("00:46:53", "%H:%M:%S").time(),
-        date_end=datetime.strptime("02:46:53", "%H:%M:%S").time(),
+        date_start=datetime.strptime("12:46:53", "%H:%M:%S").time(),
+        date_end=datetime.strptime("14:46:53", "%H:%M:%S").time(),
         reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
         table_number_id=response.value.tables[0].id,
         restaurant_id=response.value.id,
@@ -152,8 +152,8 @@ async def test_reservation_create_failed_by_dish(create_reservation_service, cre
     
     request1 = CreateReservationRequest(
         client_id="197dd255-a202-4aed-b973-bc7af39ee418",
-        date_start=datetime.strptime("00:46:53", "%H:%M:%S").time(),
-        date_end=datetime.strptime("02:46:53", "%H:%M:%S").time(),
+        date_start=datetime.strptime("12:46:53", "%H:%M:%S").time(),
+        date_end=datetime.strptime("14:46:53", "%H:%M:%S").time(),
         reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
         table_number_id=response.value.tables[0].id,
         restaurant_id=response.value.id,
@@ -167,4 +167,142 @@ async def test_reservation_create_failed_by_dish(create_reservation_service, cre
     except HTTPException as e:
         status_code = e.status_code
     
-    assert status_code == 400
\ No newline at end of file
+    assert status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_reservation_create_failed_by_overlapping_table(create_reservation_service, create_restaurant_service, add_dish_to_menu_service):
+
+    tables: list[CreateTableDTO] = []
+
+    table = CreateTableDTO(
+        number=1,
+        capacity=5,
+        location=TableLocationEnum.parque
+    )
+    tables.append(table)
+
+    payload = CreateRestaurantRequestDTO(
+        closing_time=datetime.strptime("22:00:00", "%H:%M:%S").time(),
+        lat= -0.180653,
+        lng= -78.467834,
+        name="Restaurante test 4",
+        opening_time=datetime.strptime("09:00:00", "%H:%M:%S").time(),
+        tables=tables
+    )
+    
+    response = await create_restaurant_service.execute(payload)
+    
+    request_menu = CreateDishRequestDto(
+        category="Main",
+        description="dsfdsf",
+        image="fFffs",
+        name="plato test 4",
+        price=40,
+        restaurant_id=response.value.id
+    )
+
+    response_menu = await add_dish_to_menu_service.execute(request_menu)
+
+    request1 = CreateReservationRequest(
+        client_id="197dd255-a202-4aed-b973-bc7af39ee420",
+        date_start=datetime.strptime("12:00:00", "%H:%M:%S").time(),
+        date_end=datetime.strptime("14:00:00", "%H:%M:%S").time(),
+        reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
+        table_number_id=response.value.tables[0].id,
+        restaurant_id=response.value.id,
+        dish_id=[response_menu.value.id.value]
+    )
+
+    # Otro cliente, misma mesa, horario solapado pero no identico
+    request2 = CreateReservationRequest(
+        client_id="197dd255-a202-4aed-b973-bc7af39ee421",
+        date_start=datetime.strptime("13:30:00", "%H:%M:%S").time(),
+        date_end=datetime.strptime("15:00:00", "%H:%M:%S").time(),
+        reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
+        table_number_id=response.value.tables[0].id,
+        restaurant_id=response.value.id,
+        dish_id=[response_menu.value.id.value]
+    )
+
+    # Termina justo cuando empieza la primera: no hay solapamiento
+    request3 = CreateReservationRequest(
+        client_id="197dd255-a202-4aed-b973-bc7af39ee422",
+        date_start=datetime.strptime("10:00:00", "%H:%M:%S").time(),
+        date_end=datetime.strptime("12:00:00", "%H:%M:%S").time(),
+        reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
+        table_number_id=response.value.tables[0].id,
+        restaurant_id=response.value.id,
+        dish_id=[response_menu.value.id.value]
+    )
+
+    response1 = await create_reservation_service.execute(request1)
+    
+    assert response1.is_success == True
+
+    status_code = 0
+
+    try:
+        response2 = await create_reservation_service.execute(request2)
+    except HTTPException as e:
+        status_code = e.status_code
+    
+    assert status_code == 409
+
+    response3 = await create_reservation_service.execute(request3)
+
+    assert response3.is_success == True
+
+@pytest.mark.asyncio
+async def test_reservation_create_failed_outside_opening_hours(create_reservation_service, create_restaurant_service, add_dish_to_menu_service):
+
+    tables: list[CreateTableDTO] = []
+
+    table = CreateTableDTO(
+        number=1,
+        capacity=5,
+        location=TableLocationEnum.parque
+    )
+    tables.append(table)
+
+    payload = CreateRestaurantRequestDTO(
+        closing_time=datetime.strptime("22:00:00", "%H:%M:%S").time(),
+        lat= -0.180653,
+        lng= -78.467834,
+        name="Restaurante test 5",
+        opening_time=datetime.strptime("09:00:00", "%H:%M:%S").time(),
+        tables=tables
+    )
+    
+    response = await create_restaurant_service.execute(payload)
+    
+    request_menu = CreateDishRequestDto(
+        category="Main",
+        description="dsfdsf",
+        image="fFffs",
+        name="plato test 5",
+        price=40,
+        restaurant_id=response.value.id
+    )
+
+    response_menu = await add_dish_to_menu_service.execute(request_menu)
+
+    # Termina despues del cierre del restaurante
+    request = CreateReservationRequest(
+        client_id="197dd255-a202-4aed-b973-bc7af39ee423",
+        date_start=datetime.strptime("21:00:00", "%H:%M:%S").time(),
+        date_end=datetime.strptime("23:00:00", "%H:%M:%S").time(),
+        reservation_date=datetime.strptime("2025-07-07", "%Y-%m-%d").date(),
+        table_number_id=response.value.tables[0].id,
+        restaurant_id=response.value.id,
+        dish_id=[response_menu.value.id.value]
+    )
+
+    status_code = 0
+
+    try:
+        response = await create_reservation_service.execute(request)
+    except HTTPException as e:
+        status_code = e.status_code
+    
+    assert status_code == 400
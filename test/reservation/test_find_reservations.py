@@ -0,0 +1,85 @@
+import uuid
+from datetime import date, time, timedelta
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.reservation.application.dtos.request.find_reservation_request_dto import FindReservationRequest
+from src.reservation.application.services.export_reservations_service import ExportReservationsService
+from src.reservation.application.services.find_reservation_service import FindReservationService
+from src.reservation.infraestructure.controllers.export_reservations import ExportReservationsController
+from src.reservation.infraestructure.controllers.find_reservation import FindReservationController
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.pagination.reservation_cursor import ReservationCursor
+from src.reservation.infraestructure.repositories.query.orm_reservation_query_repository import OrmReservationQueryRepository
+
+RESTAURANT = str(uuid.uuid4())
+OTHER = str(uuid.uuid4())
+
+@pytest.mark.asyncio
+async def test_keyset_pages_and_export_cover_the_filtered_rows_once(engine):
+    async with engine.begin() as conn:
+        # Varias reservas por dia: el id desempata dentro de la misma fecha
+        rows = [
+            {
+                "id": str(uuid.uuid4()), "date_start": time(12, 0), "date_end": time(13, 0), "client_id": str(uuid.uuid4()),
+                "status": "cancelada" if n % 5 == 0 else "pendiente", "table_number_id": "1",
+                "reservation_date": date(2025, 3, 1) + timedelta(days=n % 4),
+                "restaurant_id": RESTAURANT if n % 3 else OTHER
+            }
+            for n in range(60)
+        ]
+        await conn.execute(insert(OrmReservationModel), rows)
+
+    expected = sorted(
+        ((r["reservation_date"], r["id"]) for r in rows
+         if r["restaurant_id"] == RESTAURANT and r["status"] == "pendiente" and r["reservation_date"] >= date(2025, 3, 2)),
+    )
+
+    async with AsyncSession(engine) as session:
+        repository = OrmReservationQueryRepository(session)
+        service = FindReservationService(query_reser=repository)
+        seen, after, pages = [], None, 0
+        while True:
+            page = await service.execute(FindReservationRequest(limit=7, after=after, restaurant_id=RESTAURANT, status="pendiente", date_from=date(2025, 3, 2)))
+            assert not page.is_error
+            seen.extend((r.reservation_date, r.id) for r in page.value.reservations)
+            pages += 1
+            after = page.value.next_after
+            if after is None:
+                break
+        assert seen == expected
+        assert pages == -(-len(expected) // 7)
+
+        export = await ExportReservationsService(query_reser=repository, chunk_size=4).execute(
+            FindReservationRequest(restaurant_id=RESTAURANT, status="pendiente", date_from=date(2025, 3, 2))
+        )
+        chunks = [chunk async for chunk in export.value]
+        assert [len(c) for c in chunks[:-1]] == [4] * (len(chunks) - 1)
+        assert [(r.reservation_date, r.id) for chunk in chunks for r in chunk] == expected
+
+def test_reservation_cursor_round_trips():
+    after = (date(2025, 3, 2), str(uuid.uuid4()))
+    assert ReservationCursor.decode(ReservationCursor.encode(after)) == after
+
+@pytest.mark.asyncio
+async def test_listing_and_export_reject_bad_queries_with_422(admin_headers):
+    app = FastAPI()
+    FindReservationController(app)
+    ExportReservationsController(app)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", headers=admin_headers) as client:
+        for path in ("/reservation/find", "/reservation/export"):
+            for query, field in (
+                ({"status": "borrada"}, "status"),
+                ({"limit": 0}, "limit"),
+                ({"date_from": "2025-03-05", "date_to": "2025-03-01"}, "date_from"),
+            ):
+                response = await client.get(path, params=query)
+                assert response.status_code == 422, (path, query)
+                assert response.json()["detail"][0]["loc"] == ["query", field]
+
+        response = await client.get("/reservation/find", params={"cursor": "zzz"})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["query", "cursor"]
@@ -0,0 +1,98 @@
+import uuid
+from datetime import date, datetime, time, timedelta
+import pytest
+from sqlalchemy import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.dashboard.infraestructure.models.orm_table_day_rollup_model import OrmTableDayRollupModel
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.lifecycle.reservation_lifecycle_sweeper import ReservationLifecycleSweeper
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+RESTAURANT = str(uuid.uuid4())
+NOW = datetime(2025, 8, 10, 21, 0)
+
+@pytest.fixture(scope="function")
+def database_url(tmp_path) -> str:
+    # El barrido abre sus propias conexiones: la base en memoria seria otra por conexion
+    return f"sqlite+aiosqlite:///{tmp_path / 'sweeper.db'}"
+
+def reservation(day: date, start: int, status: str, table: int = 1) -> Reservation:
+    return Reservation(
+        id=ReservationIdVo(str(uuid.uuid4())),
+        date_end=ReservationDateEndVo(time(start + 1, 0)),
+        date_start=ReservationDateStartVo(time(start, 0)),
+        reservation_date=ReservationDateVo(day),
+        status=ReservationStatusVo(status),
+        client_id=UserIdVo(str(uuid.uuid4())),
+        table_number_id=TableNumberId(table),
+        restaurant_id=RestaurantIdVo(RESTAURANT),
+        dish=[]
+    )
+
+async def table_rollup(session: AsyncSession) -> dict:
+    return {
+        (r.day, r.table_id): r.reservations
+        for r in (await session.execute(select(OrmTableDayRollupModel))).scalars()
+    }
+
+@pytest.mark.asyncio
+async def test_sweeper_closes_ended_reservations_in_bounded_batches(monkeypatch, engine, statements):
+    yesterday, today = NOW.date() - timedelta(days=1), NOW.date()
+    entries = [
+        reservation(yesterday, 12, "confirmada"),
+        reservation(yesterday, 13, "pendiente", table=2),
+        reservation(yesterday, 14, "pendiente", table=3),
+        reservation(yesterday, 15, "pendiente", table=4),
+        reservation(yesterday, 16, "cancelada"),
+        reservation(today, 18, "confirmada"),
+        # Termino hace menos que GRACE: aun no se cierra
+        reservation(today, 20, "pendiente"),
+        reservation(today + timedelta(days=1), 12, "pendiente"),
+    ]
+    async with AsyncSession(engine) as session:
+        assert not (await OrmReservationCommandRepository(session).save_many(entries)).is_error
+        await session.commit()
+
+        occupied = await table_rollup(session)
+    assert occupied[(yesterday, "1")] == 1 and occupied[(yesterday, "2")] == 1 and occupied[(today, "1")] == 2
+
+    monkeypatch.setattr(ReservationLifecycleSweeper, "BATCH_SIZE", 2)
+    ReservationLifecycleSweeper.clear()
+    statements.clear()
+
+    sweeper = ReservationLifecycleSweeper(engine)
+    assert await sweeper.sweep(NOW) == 5
+    # confirmadas: 2 filas -> 2 lotes (el segundo vacio); pendientes: 3 filas -> 2 lotes
+    assert sum(s.lstrip().upper().startswith("UPDATE RESERVATION") for s in statements) == 4
+    assert await sweeper.sweep(NOW) == 0
+
+    async with AsyncSession(engine) as session:
+        statuses = dict((await session.execute(select(OrmReservationModel.id, OrmReservationModel.status))).all())
+        assert [statuses[e.id.reservation_id] for e in entries] == [
+            "completada", "completada", "completada", "completada", "cancelada", "completada", "pendiente", "pendiente"
+        ]
+
+        day_rollup = {
+            (r.day, r.status): r.reservations
+            for r in (await session.execute(select(OrmReservationDayRollupModel))).scalars()
+        }
+        assert day_rollup[(yesterday, "pendiente")] == 0 and day_rollup[(yesterday, "completada")] == 4
+        assert day_rollup[(today, "completada")] == 1 and day_rollup[(today, "pendiente")] == 1
+        # Cerrar una reserva no libera la mesa de ese dia: la ocupacion queda igual
+        assert await table_rollup(session) == occupied
+
+    stats = ReservationLifecycleSweeper.stats()
+    assert stats["runs"] == 2 and stats["swept"] == 5 and stats["completada"] == 5
+    assert stats["last_swept"] == 0 and stats["skipped"] == 0
+
+    ReservationLifecycleSweeper.clear()
@@ -0,0 +1,136 @@
+import asyncio
+import uuid
+from datetime import date, datetime, time, timedelta
+import pytest
+from sqlalchemy import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from src.auth.domain.value_objects.user_id_vo import UserIdVo
+from src.dashboard.infraestructure.models.orm_reservation_day_rollup_model import OrmReservationDayRollupModel
+from src.reservation.application.dtos.request.admin_cancel_reservation_request_dto import AdminCancelReservationRequest
+from src.reservation.application.dtos.request.cancel_reservation_request_dto import CancelReservationRequest
+from src.reservation.application.exceptions.cancel_order_not_owned_exception import CancelOrderNotOwnedExeption
+from src.reservation.application.exceptions.cancel_order_not_pending_exception import CancelOrderNotPendingException
+from src.reservation.application.exceptions.cancel_order_not_time_allowed_exception import CancelOrderTooLateException
+from src.reservation.application.services.admin_cancel_reservation_service import AdminCancelReservationService
+from src.reservation.application.services.cancel_reservation_service import CancelReservationService
+from src.reservation.domain.aggregate.reservation import Reservation
+from src.reservation.domain.value_objects.reservation_date_end_vo import ReservationDateEndVo
+from src.reservation.domain.value_objects.reservation_date_start_vo import ReservationDateStartVo
+from src.reservation.domain.value_objects.reservation_date_vo import ReservationDateVo
+from src.reservation.domain.value_objects.reservation_id_vo import ReservationIdVo
+from src.reservation.domain.value_objects.reservation_status_vo import ReservationStatusVo
+from src.reservation.infraestructure.availability.slot_bitmap_index import SlotBitmapIndex
+from src.reservation.infraestructure.exceptions.reservation_not_found_exception import ReservationNotFoundException
+from src.reservation.infraestructure.models.orm_reservation_model import OrmReservationModel
+from src.reservation.infraestructure.repositories.command.orm_reservation_command_repository import OrmReservationCommandRepository
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+
+RESTAURANT = str(uuid.uuid4())
+CLIENT = str(uuid.uuid4())
+
+def reservation(starts: datetime, client_id: str = CLIENT) -> Reservation:
+    return Reservation(
+        id=ReservationIdVo(str(uuid.uuid4())),
+        date_end=ReservationDateEndVo((starts + timedelta(minutes=30)).time()),
+        date_start=ReservationDateStartVo(starts.time()),
+        reservation_date=ReservationDateVo(starts.date()),
+        status=ReservationStatusVo("pendiente"),
+        client_id=UserIdVo(client_id),
+        table_number_id=TableNumberId(1),
+        restaurant_id=RestaurantIdVo(RESTAURANT),
+        dish=[]
+    )
+
+@pytest.fixture(scope="function")
+def database_url(tmp_path) -> str:
+    # Archivo y no :memory: para que cada sesion tenga su propia conexion
+    return f"sqlite+aiosqlite:///{tmp_path / 'transition.db'}"
+
+async def seed(engine, entries: list[Reservation]) -> None:
+    async with AsyncSession(engine) as session:
+        assert not (await OrmReservationCommandRepository(session).save_many(entries)).is_error
+        await session.commit()
+
+@pytest.mark.asyncio
+async def test_concurrent_cancels_of_the_same_reservation_have_exactly_one_winner(engine):
+    target = reservation(datetime.combine(date.today() + timedelta(days=3), time(20, 0)))
+    await seed(engine, [target])
+
+    async def cancel(n: int):
+        async with AsyncSession(engine) as session:
+            repository = OrmReservationCommandRepository(session)
+            if n % 2:
+                service = AdminCancelReservationService(command_reser=repository)
+                response = await service.execute(AdminCancelReservationRequest(reservation_id=target.id.reservation_id))
+            else:
+                service = CancelReservationService(command_reser=repository)
+                response = await service.execute(CancelReservationRequest(reservation_id=target.id.reservation_id, client_id=CLIENT))
+            # Cede el turno antes del commit para que las demas lleguen a su UPDATE
+            await asyncio.sleep(0.01)
+            await session.commit()
+            return response
+
+    responses = await asyncio.gather(*(cancel(n) for n in range(8)))
+
+    assert sum(not r.is_error for r in responses) == 1
+    assert all(isinstance(r.error, CancelOrderNotPendingException) for r in responses if r.is_error)
+
+    async with AsyncSession(engine) as session:
+        assert (await session.execute(select(OrmReservationModel.status))).scalar_one() == "cancelada"
+        rollup = dict((await session.execute(
+            select(OrmReservationDayRollupModel.status, OrmReservationDayRollupModel.reservations)
+        )).all())
+        assert rollup["pendiente"] == 0 and rollup["cancelada"] == 1
+
+@pytest.mark.asyncio
+async def test_cancel_guards_are_part_of_the_update_and_rejections_keep_their_reason(engine, statements):
+    soon = reservation(datetime.now() + timedelta(minutes=30))
+    later = reservation(datetime.now() + timedelta(hours=3))
+    foreign = reservation(datetime.now() + timedelta(days=1), client_id=str(uuid.uuid4()))
+    await seed(engine, [soon, later, foreign])
+
+    async with AsyncSession(engine) as session:
+        service = CancelReservationService(command_reser=OrmReservationCommandRepository(session))
+
+        statements.clear()
+        response = await service.execute(CancelReservationRequest(reservation_id=later.id.reservation_id, client_id=CLIENT))
+        assert not response.is_error
+        # El camino feliz no lee la reserva antes de escribirla
+        assert statements[0].lstrip().upper().startswith("UPDATE RESERVATION")
+        assert not any(s.lstrip().upper().startswith("SELECT") and "FROM reservation" in s for s in statements)
+
+        async def error_of(reservation_id: str):
+            return (await service.execute(CancelReservationRequest(reservation_id=reservation_id, client_id=CLIENT))).error
+
+        assert isinstance(await error_of(soon.id.reservation_id), CancelOrderTooLateException)
+        assert isinstance(await error_of(foreign.id.reservation_id), CancelOrderNotOwnedExeption)
+        assert isinstance(await error_of(later.id.reservation_id), CancelOrderNotPendingException)
+        assert isinstance(await error_of(str(uuid.uuid4())), ReservationNotFoundException)
+        await session.commit()
+
+        statuses = dict((await session.execute(select(OrmReservationModel.id, OrmReservationModel.status))).all())
+        assert statuses == {soon.id.reservation_id: "pendiente", later.id.reservation_id: "cancelada", foreign.id.reservation_id: "pendiente"}
+
+@pytest.mark.asyncio
+async def test_cancel_frees_the_cached_day_only_after_the_commit(engine):
+    target = reservation(datetime.combine(date.today() + timedelta(days=2), time(20, 0)))
+    await seed(engine, [target])
+    day = (RESTAURANT, target.date.reservation_date)
+    SlotBitmapIndex.clear()
+
+    async with AsyncSession(engine) as session:
+        service = AdminCancelReservationService(command_reser=OrmReservationCommandRepository(session))
+        request = AdminCancelReservationRequest(reservation_id=target.id.reservation_id)
+
+        # Un commit fallido deja la mesa ocupada tambien en la cache de este proceso
+        SlotBitmapIndex._restaurants[day] = (0.0, object())
+        assert not (await service.execute(request)).is_error
+        await session.rollback()
+        assert day in SlotBitmapIndex._restaurants
+
+        assert not (await service.execute(request)).is_error
+        assert day in SlotBitmapIndex._restaurants
+        await session.commit()
+        assert day not in SlotBitmapIndex._restaurants
+    SlotBitmapIndex.clear()
@@ -0,0 +1,107 @@
+import pytest
+from src.reservation.application.dtos.request.create_reservation_request_dto import CreateReservationRequest
+from src.reservation.application.dtos.request.search_free_tables_request_dto import SearchFreeTablesRequest
+from src.restaurant.application.dtos.request.create_restaurant_request_dto import CreateRestaurantRequestDTO
+from src.menu.application.dtos.request.create_dish_request_dto import CreateDishRequestDto
+from src.restaurant.application.dtos.request.create_table_dto import CreateTableDTO
+from src.restaurant.domain.entities.enums.table_location_enum import TableLocationEnum
+from datetime import datetime
+from fastapi import HTTPException
+
+@pytest.mark.asyncio
+async def test_search_free_tables_after_reservation(search_free_tables_service, create_reservation_service, create_restaurant_service, add_dish_to_menu_service):
+
+    tables: list[CreateTableDTO] = [
+        CreateTableDTO(number=1, capacity=2, location=TableLocationEnum.parque),
+        CreateTableDTO(number=2, capacity=6, location=TableLocationEnum.terraza),
+        CreateTableDTO(number=3, capacity=8, location=TableLocationEnum.interior),
+    ]
+
+    payload = CreateRestaurantRequestDTO(
+        closing_time=datetime.strptime("22:00:00", "%H:%M:%S").time(),
+        lat= -0.180653,
+        lng= -78.467834,
+        name="Restaurante busqueda",
+        opening_time=datetime.strptime("09:00:00", "%H:%M:%S").time(),
+        tables=tables
+    )
+
+    restaurant = await create_restaurant_service.execute(payload)
+    restaurant_id = restaurant.value.id
+    big_table = restaurant.value.tables[1].id
+
+    search = SearchFreeTablesRequest(
+        reservation_date=datetime.strptime("2099-03-10", "%Y-%m-%d").date(),
+        date_start=datetime.strptime("20:00:00", "%H:%M:%S").time(),
+        duration_minutes=90,
+        people=5,
+        restaurant_id=restaurant_id
+    )
+
+    response = await search_free_tables_service.execute(search)
+
+    assert response.is_success == True
+    assert len(response.value.tables) == 2
+    assert all(t.capacity >= 5 for t in response.value.tables)
+
+    menu = await add_dish_to_menu_service.execute(
+        CreateDishRequestDto(
+            category="Main",
+            description="dsfdsf",
+            image="fFffs",
+            name="plato busqueda",
+            price=40,
+            restaurant_id=restaurant_id
+        )
+    )
+
+    reservation = await create_reservation_service.execute(
+        CreateReservationRequest(
+            client_id="197dd255-a202-4aed-b973-bc7af39ee430",
+            date_start=datetime.strptime("21:00:00", "%H:%M:%S").time(),
+            date_end=datetime.strptime("21:50:00", "%H:%M:%S").time(),
+            reservation_date=datetime.strptime("2099-03-10", "%Y-%m-%d").date(),
+            table_number_id=big_table,
+            restaurant_id=restaurant_id,
+            dish_id=[menu.value.id.value]
+        )
+    )
+
+    assert reservation.is_success == True
+
+    # El bitmap se actualiza al crear la reserva, sin recargar
+    response = await search_free_tables_service.execute(search)
+
+    assert [t.table_id for t in response.value.tables] == [str(restaurant.value.tables[2].id)]
+
+    # Despues del cierre no hay mesas libres
+    late = SearchFreeTablesRequest(
+        reservation_date=datetime.strptime("2099-03-10", "%Y-%m-%d").date(),
+        date_start=datetime.strptime("21:30:00", "%H:%M:%S").time(),
+        duration_minutes=60,
+        people=2,
+        restaurant_id=restaurant_id
+    )
+
+    response = await search_free_tables_service.execute(late)
+
+    assert response.value.tables == []
+
+@pytest.mark.asyncio
+async def test_search_free_tables_failed_by_duration(search_free_tables_service):
+
+    request = SearchFreeTablesRequest(
+        reservation_date=datetime.strptime("2099-03-10", "%Y-%m-%d").date(),
+        date_start=datetime.strptime("12:00:00", "%H:%M:%S").time(),
+        duration_minutes=300,
+        people=2
+    )
+
+    status_code = 0
+
+    try:
+        await search_free_tables_service.execute(request)
+    except HTTPException as e:
+        status_code = e.status_code
+
+    assert status_code == 409
@@ -0,0 +1,59 @@
+import uuid
+from datetime import time
+import pytest
+from src.restaurant.domain.aggregate.restaurant import Restaurant
+from src.restaurant.domain.entities.table import Table
+from src.restaurant.domain.entities.value_objects.table_capacity_vo import TableCapacityVo
+from src.restaurant.domain.entities.value_objects.table_location_vo import TableLocationVo
+from src.restaurant.domain.entities.value_objects.table_number_id_vo import TableNumberId
+from src.restaurant.domain.value_objects.restaurant_closing_time_vo import RestaurantClosingTimeVo
+from src.restaurant.domain.value_objects.restaurant_id_vo import RestaurantIdVo
+from src.restaurant.domain.value_objects.restaurant_location_vo import RestaurantLocationVo
+from src.restaurant.domain.value_objects.restaurant_name_vo import RestaurantNameVo
+from src.restaurant.domain.value_objects.restaurant_opening_time_vo import RestaurantOpeningTimeVo
+from src.restaurant.infraestructure.catalog.restaurant_catalog_snapshot import RestaurantCatalogSnapshot
+from src.restaurant.infraestructure.repositories.command.orm_restaurant_command_repository import OrmRestaurantCommandRepository
+from src.restaurant.infraestructure.repositories.query.orm_restaurant_query_repository import OrmRestaurantQueryRepository
+
+def table(number: int, capacity: int) -> Table:
+    return Table(id=TableNumberId(number), location=TableLocationVo("terraza"), capacity=TableCapacityVo(capacity))
+
+@pytest.mark.asyncio
+async def test_catalog_snapshot_serves_reads_from_memory_until_a_write(session, statements):
+    RestaurantCatalogSnapshot.clear()
+    restaurant_id = str(uuid.uuid4())
+    command = OrmRestaurantCommandRepository(session)
+    query = OrmRestaurantQueryRepository(session)
+    await command.save(Restaurant(
+        id=RestaurantIdVo(restaurant_id),
+        name=RestaurantNameVo("Catalogo"),
+        location=RestaurantLocationVo(-0.18, -78.46),
+        opening_time=RestaurantOpeningTimeVo(time(9, 0)),
+        closing_time=RestaurantClosingTimeVo(time(22, 0)),
+        tables=[table(1, 4)]
+    ))
+    await session.commit()
+
+    first = await query.get_by_id(restaurant_id)
+    statements.clear()
+    second = await query.get_by_id(restaurant_id)
+
+    assert statements == []
+    assert second.value is not first.value
+    assert [t.capacity.capacity for t in second.value.tables] == [4]
+
+    # Mutar el agregado devuelto no altera la copia compartida
+    second.value.tables.clear()
+    assert len((await query.get_by_id(restaurant_id)).value.tables) == 1
+
+    version = RestaurantCatalogSnapshot.version()
+    await command.add_table(second.value, table(2, 2))
+    await session.commit()
+
+    assert RestaurantCatalogSnapshot.version() == version + 2
+    reloaded = await query.get_by_id(restaurant_id)
+    assert [t.capacity.capacity for t in reloaded.value.tables] == [2, 4]
+
+    stats = RestaurantCatalogSnapshot.stats()
+    assert stats["restaurants"] == 1 and stats["tables"] == 2
+    assert stats["reloads"] == 2 and stats["bytes"] > 0